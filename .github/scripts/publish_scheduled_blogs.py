@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 """
 Auto-publish scheduled blog posts based on the publishing schedule.
-This script runs daily via GitHub Actions and publishes blogs for the current date.
+This script runs daily via GitHub Actions and publishes every scheduled blog that is
+due and missing (so missed days are backfilled) in one batch through publish_planner.
 ENHANCED: Now includes quality validation to prevent short or duplicate blogs from publishing.
 """
 
 import os
 import sys
-import re
 from datetime import datetime, timezone
 from pathlib import Path
 import json
@@ -15,234 +15,30 @@ import json
 # Import blog schedule from parent directory
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Import blog quality validator
-sys.path.insert(0, str(Path(__file__).parent.parent))
-try:
-    from blog_quality_validator import BlogQualityValidator
-    QUALITY_CHECK_ENABLED = True
-except ImportError:
-    print("⚠️ Blog quality validator not found. Publishing without quality checks.")
-    QUALITY_CHECK_ENABLED = False
+from blog_metadata import BlogIndex
+from blog_quality_validator import check_blog_content
+from blog_schedule import load_schedule
+from page_regions import RegionError, RegionStore
+from page_templates import render
+from publish_planner import plan_publish, print_plan, publish_plan
 
 def validate_blog_quality(blog_path):
     """Validate blog quality before publishing."""
-    if not QUALITY_CHECK_ENABLED:
-        return True
-
     if not Path(blog_path).exists():
         print(f"⚠️ Blog file not found: {blog_path}")
         return False
 
-    validator = BlogQualityValidator()
-    blog_name = Path(blog_path).parent.name
-
-    # Check word count specifically
     with open(blog_path, 'r', encoding='utf-8') as f:
         content = f.read()
-
-    # Extract text content
-    text = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL)
-    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL)
-    text = re.sub(r'<[^>]+>', ' ', text)
-    word_count = len(text.split())
-
-    # Minimum 2500 words required
-    if word_count < 2500:
-        print(f"❌ Blog {blog_name} has only {word_count} words (minimum: 2500)")
-        print(f"   This blog will NOT be published until it has proper content!")
-        return False
-
-    # Check for placeholder content
-    if "Content will be added here" in content or "This article provides expert insights" in content:
-        print(f"❌ Blog {blog_name} contains placeholder content!")
-        return False
-
-    print(f"✅ Blog {blog_name} passed quality check ({word_count} words)")
-    return True
-
-# Dynamic blog schedule - will be updated as needed
-BLOG_SCHEDULE = {
-    "2025-09-30": [
-        {
-            "url": "stablecoin-defi-lending",
-            "title": "Stablecoin DeFi Lending: Complete Guide to Earning Passive Income",
-            "category": "DeFi",
-            "description": "Learn how to earn passive income through stablecoin lending in DeFi. Compare top platforms, understand risks, and maximize your yields."
-        }
-    ],
-    "2025-09-30": [
-        {
-            "url": "stablecoin-defi-lending",
-            "title": "Stablecoin DeFi Lending: Complete Guide to Earning Passive Income",
-            "category": "DeFi",
-            "description": "Learn how to earn passive income through stablecoin lending in DeFi. Compare top platforms, understand risks, and maximize your yields."
-        },
-        {
-            "url": "stablecoin-yield-farming-guide",
-            "title": "Stablecoin Yield Farming: Ultimate Guide to Maximizing Returns",
-            "category": "DeFi",
-            "description": "Master yield farming with stablecoins. Learn strategies, compare platforms, and understand the risks and rewards of DeFi yield farming."
-        }
-    ],
-    "2025-10-01": [
-        {
-            "url": "best-stablecoin-exchanges-2025",
-            "title": "Best Stablecoin Exchanges 2025: Top Platforms for Trading & Earning",
-            "category": "Exchanges",
-            "description": "Compare the best cryptocurrency exchanges for stablecoin trading in 2025. Find low fees, high liquidity, and earning opportunities."
-        }
-    ],
-    "2025-10-02": [
-        {
-            "url": "stablecoin-regulation-guide",
-            "title": "Stablecoin Regulation Guide: Global Rules and Compliance in 2025",
-            "category": "Regulation",
-            "description": "Navigate the evolving stablecoin regulatory landscape. Understand global rules, compliance requirements, and what's coming next."
-        }
-    ]
-}
-
-def get_today_blogs():
-    """Get blogs scheduled for today"""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    print(f"Checking for blogs scheduled on {today}")
-    return BLOG_SCHEDULE.get(today, [])
-
-def check_blog_exists(url):
-    """Check if a blog already exists"""
-    blog_path = Path(f"blog/{url}/index.html")
-    return blog_path.exists()
+    return check_blog_content(Path(blog_path).parent.name, content)
 
 def create_blog_html(blog_data):
     """Create comprehensive HTML content for a blog post"""
-    template = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - StableCoin Hub</title>
-    <meta name="description" content="{description}">
-    <link rel="canonical" href="https://www.stablecoinhub.pro/blog/{url}/">
-
-    <!-- Open Graph Meta Tags -->
-    <meta property="og:type" content="article">
-    <meta property="og:url" content="https://www.stablecoinhub.pro/blog/{url}/">
-    <meta property="og:title" content="{title}">
-    <meta property="og:description" content="{description}">
-
-    <!-- Twitter Meta Tags -->
-    <meta property="twitter:card" content="summary_large_image">
-    <meta property="twitter:url" content="https://www.stablecoinhub.pro/blog/{url}/">
-    <meta property="twitter:title" content="{title}">
-    <meta property="twitter:description" content="{description}">
-
-    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
-
-    <!-- Script to handle query parameters -->
-    <script>
-    (function() {{
-        // Handle URL query parameters for proper canonical
-        if (window.location.search) {{
-            var canonicalTag = document.querySelector('link[rel="canonical"]');
-            if (canonicalTag) {{
-                // Keep the canonical URL clean without query parameters
-                var cleanUrl = 'https://www.stablecoinhub.pro' + window.location.pathname;
-                if (cleanUrl.endsWith('/index.html')) {{
-                    cleanUrl = cleanUrl.replace('/index.html', '/');
-                }}
-                canonicalTag.setAttribute('href', cleanUrl);
-            }}
-        }}
-    }})();
-    </script>
-</head>
-<body class="bg-gray-50 min-h-screen">
-    <!-- Navigation -->
-    <nav class="bg-white shadow-lg sticky top-0 z-50">
-        <div class="max-w-7xl mx-auto px-4">
-            <div class="flex justify-between items-center h-16">
-                <a href="/" class="text-2xl font-bold text-indigo-600">StableCoin Hub</a>
-                <div class="hidden md:flex space-x-6">
-                    <a href="/" class="text-gray-700 hover:text-indigo-600 transition">Home</a>
-                    <a href="/blog/" class="text-gray-700 hover:text-indigo-600 transition">Blog</a>
-                    <a href="/about/" class="text-gray-700 hover:text-indigo-600 transition">About</a>
-                    <a href="/submit/" class="text-gray-700 hover:text-indigo-600 transition">Submit Tool</a>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <!-- Main Content -->
-    <article class="max-w-4xl mx-auto px-4 py-12">
-        <div class="bg-white rounded-lg shadow-md p-8">
-            <!-- Article Header -->
-            <div class="mb-8">
-                <div class="flex items-center gap-3 mb-4">
-                    <span class="bg-indigo-100 text-indigo-600 text-xs px-3 py-1 rounded-full font-medium">{category}</span>
-                    <span class="text-gray-500 text-sm">{date}</span>
-                </div>
-                <h1 class="text-4xl font-bold text-gray-900 mb-4">{title}</h1>
-                <p class="text-lg text-gray-700">{description}</p>
-            </div>
-
-            <!-- Article Content -->
-            <div class="prose prose-lg max-w-none">
-                <p class="mb-6">
-                    Welcome to our comprehensive guide on {topic}. This article provides expert insights,
-                    practical strategies, and the latest developments in the stablecoin ecosystem.
-                </p>
-
-                <h2 class="text-2xl font-bold mt-8 mb-4">Key Highlights</h2>
-                <ul class="list-disc pl-6 mb-6">
-                    <li>In-depth analysis and expert insights</li>
-                    <li>Practical implementation strategies</li>
-                    <li>Latest market trends and developments</li>
-                    <li>Risk management and best practices</li>
-                </ul>
-
-                <p class="mb-6">
-                    The stablecoin ecosystem continues to evolve rapidly, offering new opportunities and challenges
-                    for investors, traders, and developers. Understanding these dynamics is crucial for success.
-                </p>
-
-                <div class="bg-blue-50 border-l-4 border-blue-600 p-6 my-8">
-                    <p class="font-semibold mb-2">💡 Pro Tip</p>
-                    <p>
-                        Always conduct thorough research and consider your risk tolerance before making any
-                        investment decisions in the stablecoin space.
-                    </p>
-                </div>
-
-                <p class="mb-6">
-                    For more comprehensive stablecoin resources, tools, and analysis, visit
-                    <a href="https://www.stablecoinhub.pro" class="text-indigo-600 hover:underline">StableCoinHub.pro</a>.
-                </p>
-            </div>
-        </div>
-    </article>
-
-    <!-- Footer -->
-    <footer class="bg-white border-t mt-12">
-        <div class="max-w-7xl mx-auto px-4 py-8">
-            <div class="text-center text-gray-500">
-                <p>&copy; 2025 StableCoin Hub. All rights reserved.</p>
-                <div class="mt-4 space-x-4">
-                    <a href="/" class="hover:text-indigo-600">Home</a>
-                    <a href="/blog/" class="hover:text-indigo-600">Blog</a>
-                    <a href="/about/" class="hover:text-indigo-600">About</a>
-                    <a href="/submit/" class="hover:text-indigo-600">Submit Tool</a>
-                </div>
-            </div>
-        </div>
-    </footer>
-</body>
-</html>"""
-
     date_str = datetime.now(timezone.utc).strftime("%B %d, %Y")
     topic = blog_data['title'].split(':')[0] if ':' in blog_data['title'] else blog_data['title'].split()[0]
 
-    return template.format(
+    return render(
+        'posts/scheduled.html',
         title=blog_data['title'],
         description=blog_data['description'],
         url=blog_data['url'],
@@ -251,84 +47,12 @@ def create_blog_html(blog_data):
         topic=topic.lower()
     )
 
-def update_blog_index(blog_data):
-    """Update the main blog index page with the new blog post"""
-    index_path = Path("blog/index.html")
-
-    if not index_path.exists():
-        print(f"Warning: Blog index not found at {index_path}")
-        return False
-
-    # Read the current index
-    with open(index_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Create the new blog card HTML
-    date_str = datetime.now(timezone.utc).strftime("%b %d, %Y")
-    new_card = f'''            <article class="bg-white rounded-xl shadow-sm hover:shadow-md transition">
-                <div class="p-6">
-                    <div class="flex items-center gap-3 mb-3">
-                        <span class="bg-indigo-100 text-indigo-600 text-xs px-3 py-1 rounded-full font-medium">{blog_data.get('category', 'Guides')}</span>
-                        <span class="text-gray-500 text-sm">{date_str}</span>
-                    </div>
-                    <h2 class="text-xl font-bold text-gray-900 mb-3">
-                        <a href="/blog/{blog_data['url']}/" class="hover:text-indigo-600">{blog_data['title']}</a>
-                    </h2>
-                    <p class="text-gray-600 mb-4 line-clamp-3">{blog_data['description']}</p>
-                    <a href="/blog/{blog_data['url']}/" class="text-indigo-600 font-medium hover:text-indigo-800">
-                        Read more →
-                    </a>
-                </div>
-            </article>'''
-
-    # Find the blog grid section and add the new card at the beginning
-    # Try multiple patterns to find the grid
-    grid_patterns = [
-        r'(<div id="blog-grid" class="grid[^>]*>)',
-        r'(<div class="grid gap-6[^>]*>)',
-        r'(<div class="grid grid-cols-1[^>]*>)'
-    ]
-
-    updated = False
-    for grid_pattern in grid_patterns:
-        if re.search(grid_pattern, content):
-            # Insert the new card after the grid opening tag
-            content = re.sub(
-                grid_pattern,
-                r'\1\n' + new_card,
-                content,
-                count=1
-            )
-
-            # Save the updated index
-            with open(index_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            print(f"✅ Updated blog index with: {blog_data['title']}")
-            updated = True
-            break
-
-    if not updated:
-        print("Warning: Could not find blog grid section in index.html")
-        return False
-
-    return True
-
-def update_homepage_blog_section(blog_data):
-    """Update the homepage with the latest blog post"""
-    homepage_path = Path("index.html")
-
-    if not homepage_path.exists():
-        print("Warning: Homepage not found")
-        return False
-
-    # Read the current homepage
-    with open(homepage_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Create the new blog entry for homepage (matching existing format)
-    date_str = datetime.now(timezone.utc).strftime("%b %d, %Y")
+# Articles shown in the homepage's latest-posts grid (two rows) and footer list
+HOMEPAGE_POST_COUNT = 6
+FOOTER_POST_COUNT = 3
 
+def homepage_blog_entry(blog_data, date_str):
+    """Homepage article card for a blog post (matching existing format)"""
     # Get category color scheme
     category_colors = {
         'DeFi': ('blue-100', 'blue-600'),
@@ -348,7 +72,7 @@ def update_homepage_blog_section(blog_data):
     if len(title) > 60:
         title = title[:57] + '...'
 
-    new_blog_entry = f'''<article class="bg-white rounded-xl p-6 shadow-sm border card-hover">
+    return f'''<article class="bg-white rounded-xl p-6 shadow-sm border card-hover">
                         <div class="flex items-center mb-3">
                             <span class="bg-{bg_color} text-{text_color} text-xs px-2 py-1 rounded-full">{category}</span>
                             <span class="text-gray-500 text-sm ml-2">{date_str}</span>
@@ -362,124 +86,76 @@ def update_homepage_blog_section(blog_data):
                         </a>
                     </article>'''
 
-    # Find the "Latest Stablecoin Insights" or blog section and update it
-    section_patterns = [
-        'Latest Stablecoin Insights',
-        'Latest Blog Posts',
-        'Latest Insights',
-        'featured-articles'
-    ]
-
-    found_section = False
-    for section_name in section_patterns:
-        if section_name in content:
-            found_section = True
-            # Pattern to find the blog posts grid
-            patterns = [
-                r'(<div[^>]*id="featured-articles"[^>]*>)(.*?)(</div>)',
-                r'(<h2[^>]*>Latest Stablecoin Insights</h2>.*?<div class="grid[^>]*>)(.*?)(</div>)',
-                r'(<h2[^>]*>Latest Blog Posts</h2>.*?<div class="grid[^>]*>)(.*?)(</div>)'
-            ]
-
-            updated = False
-            for pattern in patterns:
-                match = re.search(pattern, content, re.DOTALL)
-                if match:
-                    before = match.group(1)
-                    blogs = match.group(2)
-                    after = match.group(3)
-
-                    # Keep only the 3 most recent blogs
-                    existing_articles = re.findall(r'<article[^>]*>.*?</article>', blogs, re.DOTALL)
+def footer_blog_link(blog_data):
+    """Footer "Latest Articles" link for a blog post"""
+    label = blog_data['title'].split(':')[0]
+    return f'''<li><a href="/blog/{blog_data['url']}/" class="text-gray-400 hover:text-white transition">{label}</a></li>'''
 
-                    # Add the new blog at the beginning and keep only 3 total
-                    updated_blogs = '\n                    ' + new_blog_entry
-                    if existing_articles:
-                        # Keep up to 2 more existing blogs
-                        for i, article in enumerate(existing_articles[:2]):
-                            updated_blogs += '\n\n                    ' + article.strip()
+def newest_first(new_items, body, closing_tag, count, separator):
+    """The new items followed by the ones already in a region body, count in total"""
+    existing = [chunk.lstrip() + closing_tag for chunk in body.split(closing_tag) if chunk.strip()]
+    return separator.join((new_items + existing)[:count])
 
-                    # Replace the content
-                    new_content = before + updated_blogs + '\n                ' + after
-                    content = content.replace(match.group(0), new_content)
+def update_homepage_blog_section(blogs):
+    """Update the homepage's latest-posts grid and footer list with new blog posts (newest first).
 
-                    # Save the updated homepage
-                    with open(homepage_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-
-                    print(f"✅ Updated homepage with latest blog: {blog_data['title']}")
-                    updated = True
-                    break
-
-            if updated:
-                return True
-            break
+    Both are marker-delimited regions of index.html, replaced together in one write.
+    """
+    homepage_path = Path("index.html")
 
-    if not found_section:
-        print("Warning: Could not find blog section on homepage")
+    if not homepage_path.exists():
+        print("Warning: Homepage not found")
         return False
-    else:
-        print("Warning: Found section but could not update it")
+
+    date_str = datetime.now(timezone.utc).strftime("%b %d, %Y")
+    cards = [homepage_blog_entry(blog, date_str) for blog in blogs[:HOMEPAGE_POST_COUNT]]
+    links = [footer_blog_link(blog) for blog in blogs[:FOOTER_POST_COUNT]]
+
+    try:
+        result = RegionStore().update(str(homepage_path), {
+            'blog:latest': lambda body: newest_first(cards, body, '</article>', HOMEPAGE_POST_COUNT,
+                                                     '\n                    '),
+            'blog:footer-latest': lambda body: newest_first(links, body, '</li>', FOOTER_POST_COUNT,
+                                                            '\n                        '),
+        })
+    except RegionError as e:
+        print(f"Warning: Could not update the homepage: {e}")
         return False
 
-def main():
-    """Main function to publish blogs for today"""
-    blogs = get_today_blogs()
+    for name in result['drifted']:
+        print(f"⚠️  Homepage region {name} was edited by hand; left alone (python page_regions.py --accept to resume updates)")
+    if result['updated']:
+        print(f"✅ Updated homepage with latest blogs: {', '.join(blog['title'] for blog in blogs[:HOMEPAGE_POST_COUNT])}")
+    return bool(result['updated'])
 
-    if not blogs:
-        print("No blogs scheduled for today")
+def main():
+    """Main function to publish every due blog that has not been published yet"""
+    # One diff of the compiled schedule (data/blog-schedule.json) against the existing posts
+    plan = plan_publish(load_schedule(), BlogIndex().sources())
+    print_plan(plan)
+
+    # Validate existing blogs scheduled for today
+    for blog in plan['published']:
+        if blog['date'] == plan['today'] and not validate_blog_quality(f"blog/{blog['url']}/index.html"):
+            print(f"⚠️  Existing blog {blog['url']} does not meet quality standards!")
+            print(f"   Skipping updates for this blog until content is improved.")
+
+    if not plan['missing']:
+        print("\n✨ No new blogs to publish")
         return 0
 
-    print(f"Found {len(blogs)} blog(s) to publish today")
-    published_count = 0
-
-    for blog in blogs:
-        # Check if blog already exists
-        if check_blog_exists(blog['url']):
-            print(f"⏭️  Blog already exists: {blog['title']}")
-
-            # Validate existing blog quality
-            blog_path = f"blog/{blog['url']}/index.html"
-            if not validate_blog_quality(blog_path):
-                print(f"⚠️  Existing blog {blog['url']} does not meet quality standards!")
-                print(f"   Skipping updates for this blog until content is improved.")
-                continue
-            continue
-
-        # Create blog directory
-        blog_dir = Path(f"blog/{blog['url']}")
-        blog_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create blog HTML (NOTE: This creates minimal template content)
-        html_content = create_blog_html(blog)
-
-        # Write blog file
-        blog_file = blog_dir / "index.html"
-        with open(blog_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        # IMPORTANT: Validate the newly created blog
-        if not validate_blog_quality(str(blog_file)):
-            print(f"❌ Newly created blog {blog['url']} does not meet quality standards!")
-            print(f"   This blog needs comprehensive content before it can be published.")
-            # Remove the inadequate blog file
-            blog_file.unlink()
-            blog_dir.rmdir()
-            continue
-
-        print(f"✅ Published: {blog['title']}")
-        print(f"   URL: /blog/{blog['url']}/")
-
-        # Update blog index
-        update_blog_index(blog)
-
-        # Update homepage
-        update_homepage_blog_section(blog)
-
-        published_count += 1
+    # Render and validate everything first, then write the posts and
+    # update the blog listing and homepage once for the whole batch
+    stats = publish_plan(plan, create_blog_html, validate=check_blog_content,
+                         update_homepage=update_homepage_blog_section)
+    if stats['rejected']:
+        print(f"❌ {stats['rejected']} blog(s) did not meet quality standards and were not published.")
+        print(f"   They need comprehensive content before they can be published.")
 
+    published_count = stats['published']
     if published_count > 0:
         print(f"\n🎉 Successfully published {published_count} new blog(s)")
+        print(f"   Blog listing pages rewritten: {stats['listings']}")
     else:
         print("\n✨ No new blogs to publish")
 
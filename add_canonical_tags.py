@@ -1,20 +1,15 @@
 #!/usr/bin/env python3
-import os
-import re
-from pathlib import Path
+from seo_document import HtmlDocument, find_html_files
 
-def add_canonical_tag(file_path):
-    """Add canonical tag to HTML file if not present"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+REPO_DIR = '/Users/raymond/Desktop/Stablecoinhub.pro/stablecoinhub-repo'
 
-    # Check if canonical tag already exists
-    if 'rel="canonical"' in content or "rel='canonical'" in content:
-        print(f"✓ Canonical tag already exists in {file_path}")
+def add_canonical_pass(doc):
+    """Add a canonical tag before </head> if the page has none"""
+    if doc.canonical is not None:
         return False
 
     # Determine the canonical URL based on the file path
-    rel_path = os.path.relpath(file_path, '/Users/raymond/Desktop/Stablecoinhub.pro/stablecoinhub-repo')
+    rel_path = doc.rel_path
 
     # Special handling for index.html files
     if rel_path == 'index.html':
@@ -27,21 +22,21 @@ def add_canonical_tag(file_path):
         # For other HTML files
         canonical_url = f'https://stablecoinhub.pro/{rel_path}'
 
-    # Find the </head> tag and insert canonical tag before it
-    head_pattern = re.compile(r'(</head>)', re.IGNORECASE)
+    # Insert the canonical tag with proper indentation before </head>
+    return doc.insert_before_head_close(f'    <link rel="canonical" href="{canonical_url}">\n')
 
-    if head_pattern.search(content):
-        # Create the canonical tag with proper indentation
-        canonical_tag = f'    <link rel="canonical" href="{canonical_url}">\n'
-
-        # Insert the canonical tag before </head>
-        new_content = head_pattern.sub(canonical_tag + r'\1', content, count=1)
+def add_canonical_tag(file_path, root=REPO_DIR):
+    """Add canonical tag to HTML file if not present"""
+    doc = HtmlDocument(file_path, root=root)
 
-        # Write the updated content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+    # Check if canonical tag already exists
+    if doc.canonical is not None:
+        print(f"✓ Canonical tag already exists in {file_path}")
+        return False
 
-        print(f"✅ Added canonical tag to {file_path}: {canonical_url}")
+    if add_canonical_pass(doc):
+        doc.save()
+        print(f"✅ Added canonical tag to {file_path}: {doc.canonical}")
         return True
     else:
         print(f"⚠️  No </head> tag found in {file_path}")
@@ -49,23 +44,15 @@ def add_canonical_tag(file_path):
 
 def process_all_html_files():
     """Process all HTML files in the repository"""
-    repo_dir = '/Users/raymond/Desktop/Stablecoinhub.pro/stablecoinhub-repo'
     updated_count = 0
     processed_count = 0
 
     # Find all HTML files
-    for root, dirs, files in os.walk(repo_dir):
-        # Skip .git directory
-        if '.git' in root:
-            continue
-
-        for file in files:
-            if file.endswith('.html'):
-                file_path = os.path.join(root, file)
-                processed_count += 1
+    for file_path in find_html_files(REPO_DIR):
+        processed_count += 1
 
-                if add_canonical_tag(file_path):
-                    updated_count += 1
+        if add_canonical_tag(file_path):
+            updated_count += 1
 
     print(f"\n📊 Summary:")
     print(f"   Total HTML files processed: {processed_count}")
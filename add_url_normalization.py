@@ -3,22 +3,33 @@
 Add URL normalization script to all HTML files to handle query parameters and redirects properly
 """
 
-import os
-import re
 from pathlib import Path
 
-def add_url_normalization(file_path):
-    """Add URL normalization script to HTML file if not already present"""
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+from seo_document import HtmlDocument
+
+# Key pages that get the normalization script
+KEY_PAGES = [
+    "index.html",
+    "about/index.html",
+    "submit/index.html",
+    "blog/index.html",
+    "privacy.html",
+    "terms.html",
+    "disclaimer.html",
+]
+
+def url_normalization_pass(doc):
+    """Add the URL normalization script (and a canonical tag if missing) after <title> on key pages"""
+    if doc.rel_path not in KEY_PAGES:
+        return False
 
     # Check if normalization script already exists
-    if 'Clean URL and remove query parameters' in content:
+    if 'Clean URL and remove query parameters' in doc.content:
         return False
 
     # Check if file already has canonical tag
-    has_canonical = 'rel="canonical"' in content
+    has_canonical = doc.canonical is not None
+    file_path = Path(doc.rel_path)
 
     # Determine the canonical URL based on file path
     if file_path.name == 'index.html':
@@ -67,25 +78,20 @@ def add_url_normalization(file_path):
         }})();
     </script>'''
 
-    # Find where to insert the script (after <title> tag)
-    title_pattern = r'(</title>)'
-
-    if re.search(title_pattern, content):
+    # Insert the script after the <title> tag
+    if has_canonical:
         # If canonical already exists, just add the script
-        if has_canonical:
-            script_only = normalization_script.split('</script>')[0].split('<script>')[1] + '</script>'
-            script_tag = '\n    <script>' + script_only
-            content = re.sub(title_pattern, r'\1' + script_tag, content)
-        else:
-            # Add both canonical and script
-            content = re.sub(title_pattern, r'\1\n' + normalization_script, content)
-
-        # Write back
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        script_only = normalization_script.split('</script>')[0].split('<script>')[1] + '</script>'
+        return doc.insert_after(r'</title>', '\n    <script>' + script_only)
+    # Add both canonical and script
+    return doc.insert_after(r'</title>', '\n' + normalization_script)
 
+def add_url_normalization(file_path):
+    """Add URL normalization script to HTML file if not already present"""
+    doc = HtmlDocument(file_path)
+    if url_normalization_pass(doc):
+        doc.save()
         return True
-
     return False
 
 def main():
@@ -95,17 +101,8 @@ def main():
     updated_count = 0
 
     # Key pages to update
-    key_pages = [
-        Path("index.html"),
-        Path("about/index.html"),
-        Path("submit/index.html"),
-        Path("blog/index.html"),
-        Path("privacy.html"),
-        Path("terms.html"),
-        Path("disclaimer.html")
-    ]
-
-    for page_path in key_pages:
+    for page in KEY_PAGES:
+        page_path = Path(page)
         if page_path.exists():
             if add_url_normalization(page_path):
                 updated_count += 1
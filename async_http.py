@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Minimal asyncio HTTP/1.1 client for StableCoin Hub's verification scripts.
+
+Standard library only (the publish workflow installs no packages). Keeps a
+pool of keep-alive connections per host, bounds the number of requests in
+flight with a semaphore, follows redirects and retries connection errors,
+timeouts and 429/5xx responses with exponential backoff.
+
+    async with AsyncHTTPClient(concurrency=32) as client:
+        response = await client.get("https://www.stablecoinhub.pro/blog/")
+        print(response.status, len(response.text))
+"""
+
+import asyncio
+import ssl
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = 'StableCoinHub-Verifier/1.0'
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+class HTTPError(Exception):
+    """Raised when a request fails after all retries"""
+
+
+class Response:
+    def __init__(self, url, status, headers, body):
+        self.url = url
+        self.status = status
+        self.headers = headers  # lowercased names
+        self.body = body
+        self.history = []
+
+    @property
+    def text(self):
+        return self.body.decode('utf-8', errors='replace')
+
+    def __repr__(self):
+        return f"<Response {self.status} {self.url}>"
+
+
+class AsyncHTTPClient:
+    """Connection-pooled HTTP client with bounded concurrency and retries"""
+
+    def __init__(self, concurrency=32, connections_per_host=8, timeout=10.0,
+                 retries=2, backoff=0.5, max_redirects=5):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_redirects = max_redirects
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._connections_per_host = connections_per_host
+        self._host_limits = {}
+        self._idle = {}
+        self._ssl = ssl.create_default_context()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+    async def get(self, url, follow_redirects=True):
+        """GET url, following redirects unless told not to. Raises HTTPError."""
+        history = []
+        for _ in range(self.max_redirects + 1):
+            response = await self._request_with_retries(url)
+            location = response.headers.get('location')
+            if not follow_redirects or response.status not in REDIRECT_STATUSES or not location:
+                response.history = history
+                return response
+            history.append(response)
+            url = urljoin(url, location)
+        raise HTTPError(f"Too many redirects starting from {history[0].url}")
+
+    async def _request_with_retries(self, url):
+        last_error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                async with self._semaphore:
+                    response = await asyncio.wait_for(self._request(url), self.timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                    asyncio.LimitOverrunError, ValueError) as e:
+                last_error = e
+                continue
+            if response.status in RETRY_STATUSES and attempt < self.retries:
+                last_error = HTTPError(f"HTTP {response.status}")
+                continue
+            return response
+        raise HTTPError(f"{url}: {last_error or 'request failed'}")
+
+    def _host_limit(self, key):
+        limit = self._host_limits.get(key)
+        if limit is None:
+            limit = self._host_limits[key] = asyncio.Semaphore(self._connections_per_host)
+        return limit
+
+    async def _connect(self, key):
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        scheme, host, port = key
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=self._ssl if scheme == 'https' else None)
+        return reader, writer, False
+
+    async def _request(self, url):
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        async with self._host_limit(key):
+            reader, writer, reused = await self._connect(key)
+            try:
+                return await self._exchange(url, key, path, parts.netloc, reader, writer)
+            except (OSError, asyncio.IncompleteReadError):
+                writer.close()
+                if not reused:
+                    raise
+            except BaseException:
+                writer.close()
+                raise
+            # A pooled connection the server had already closed: one fresh attempt
+            reader, writer, _ = await self._connect(key)
+            try:
+                return await self._exchange(url, key, path, parts.netloc, reader, writer)
+            except BaseException:
+                writer.close()
+                raise
+
+    async def _exchange(self, url, key, path, netloc, reader, writer):
+        writer.write(
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {netloc}\r\n"
+            f"User-Agent: {USER_AGENT}\r\n"
+            f"Accept: */*\r\n"
+            f"Accept-Encoding: identity\r\n"
+            f"Connection: keep-alive\r\n\r\n".encode('latin-1')
+        )
+        await writer.drain()
+
+        status_line = await reader.readuntil(b'\r\n')
+        version, status = status_line.decode('latin-1').split(' ', 2)[:2]
+        headers = {}
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            body = await self._read_chunked(reader)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        elif int(status) in (204, 304) or 100 <= int(status) < 200:
+            body = b''
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        if keep_alive:
+            self._idle.setdefault(key, []).append((reader, writer))
+        else:
+            writer.close()
+        return Response(url, int(status), headers, body)
+
+    @staticmethod
+    async def _read_chunked(reader):
+        chunks = []
+        while True:
+            size_line = await reader.readuntil(b'\r\n')
+            size = int(size_line.split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                # Skip trailers up to the final blank line
+                while await reader.readuntil(b'\r\n') != b'\r\n':
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
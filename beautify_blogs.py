@@ -2,6 +2,13 @@
 import os
 import re
 import glob
+import argparse
+
+from markdown_renderer import render_markdown, split_front_matter
+from related_posts import related_posts
+from render_errors import SkipPost
+from render_pipeline import add_pipeline_arguments, run
+from tailwind_build import stylesheet_tag
 
 # Beautiful, modern blog template with enhanced design
 BLOG_TEMPLATE = """<!DOCTYPE html>
@@ -12,7 +19,7 @@ BLOG_TEMPLATE = """<!DOCTYPE html>
     <title>{title} - StableCoin Hub</title>
     <meta name="description" content="{description}">
     <link rel="canonical" href="https://www.stablecoinhub.pro/blog/{url}/">
-    <script src="https://cdn.tailwindcss.com"></script>
+    {stylesheet}
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
     <!-- Google tag (gtag.js) -->
     <script async src="https://www.googletagmanager.com/gtag/js?id=G-GX6EB7DSFL"></script>
@@ -237,7 +244,11 @@ BLOG_TEMPLATE = """<!DOCTYPE html>
 </html>"""
 
 def process_content_beautiful(md_content):
-    """Process markdown to beautiful HTML with enhanced styling"""
+    """Process markdown to beautiful HTML with enhanced styling.
+
+    Legacy multi-pass converter, superseded by markdown_renderer and kept as
+    the baseline for bench_markdown.py.
+    """
 
     # Skip the front matter
     if '---' in md_content:
@@ -373,15 +384,65 @@ def process_content_beautiful(md_content):
 
     return '\n'.join(processed)
 
-def beautify_blog_post(md_file):
-    """Beautify a single blog post"""
+# Icon and colour of the related-article cards, in order
+RELATED_CARD_STYLES = [('book-open', 'indigo'), ('lightbulb', 'green'), ('chart-line', 'purple')]
+
+# Shown when the related-articles index has nothing for a post
+DEFAULT_RELATED = [
+    {'url': '/blog/best-stablecoin-wallets/', 'title': 'Best Stablecoin Wallets 2025',
+     'desc': 'Security features, fees, and user experience compared'},
+    {'url': '/blog/how-to-buy-stablecoins/', 'title': 'How to Buy Stablecoins',
+     'desc': 'Step-by-step guide for beginners'},
+    {'url': '/blog/stablecoin-comparison/', 'title': 'Stablecoin Comparison 2025',
+     'desc': 'USDT vs USDC vs DAI and more'},
+]
+
+def related_articles_section(url_slug):
+    """Related Articles cards for a post, picked by related_posts"""
+    related = [
+        {'url': post['url'], 'title': post['title'].split(':')[0], 'desc': post['description'] or post['category']}
+        for post in related_posts(url_slug)
+    ] or DEFAULT_RELATED
+
+    cards = []
+    for article, (icon, color) in zip(related, RELATED_CARD_STYLES):
+        cards.append(f'''
+                    <a href="{article['url']}" class="group">
+                        <div class="bg-white rounded-xl shadow-md hover:shadow-xl transition-all p-6 border border-gray-100 h-full">
+                            <div class="text-{color}-600 mb-3">
+                                <i class="fas fa-{icon} text-2xl"></i>
+                            </div>
+                            <h3 class="font-bold text-lg text-gray-900 group-hover:text-{color}-600 transition-colors mb-2">
+                                {article['title']}
+                            </h3>
+                            <p class="text-gray-600 text-sm">
+                                {article['desc']}
+                            </p>
+                            <span class="text-{color}-600 text-sm font-medium mt-3 inline-block group-hover:translate-x-1 transition-transform">
+                                Read more →
+                            </span>
+                        </div>
+                    </a>''')
+
+    return f'''
+            <div class="mt-16 mb-8">
+                <h2 class="text-3xl font-bold text-gray-900 mb-2">Related Articles</h2>
+                <p class="text-gray-600 mb-8">Continue your learning journey with these related guides:</p>
+
+                <div class="grid grid-cols-1 md:grid-cols-3 gap-6">{''.join(cards)}
+                </div>
+            </div>
+'''
+
+def render_blog_post(md_file):
+    """Render a single blog post to (html_file, html) without writing it.
+
+    Raises SkipPost if the markdown has no title in its front matter.
+    """
     # Get URL slug from filename
     filename = os.path.basename(md_file)
     url_slug = re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
-
     html_file = f'blog/{url_slug}/index.html'
-    if not os.path.exists(html_file):
-        return False, f"HTML file not found: {html_file}"
 
     # Read original markdown
     with open(md_file, 'r') as f:
@@ -392,7 +453,7 @@ def beautify_blog_post(md_file):
     desc_match = re.search(r'description:\s*"([^"]+)"', original_md)
 
     if not title_match:
-        return False, "No title found"
+        raise SkipPost("No title found")
 
     title = title_match.group(1)
     description = desc_match.group(1) if desc_match else "Comprehensive guide for the stablecoin ecosystem."
@@ -410,7 +471,8 @@ def beautify_blog_post(md_file):
         date_iso = "2025-09-01"
 
     # Process content with beautiful styling
-    html_content = process_content_beautiful(original_md)
+    _, body = split_front_matter(original_md)
+    html_content = render_markdown(body.strip(), 'beautiful')
 
     # Add colorful info boxes throughout content
     sections = html_content.split('<h2')
@@ -453,67 +515,7 @@ def beautify_blog_post(md_file):
     html_content = '<h2'.join(sections)
 
     # Add Related Articles section (only once!)
-    related_articles = '''
-            <div class="mt-16 mb-8">
-                <h2 class="text-3xl font-bold text-gray-900 mb-2">Related Articles</h2>
-                <p class="text-gray-600 mb-8">Continue your learning journey with these related guides:</p>
-
-                <div class="grid grid-cols-1 md:grid-cols-3 gap-6">
-                    <a href="/blog/best-stablecoin-wallets/" class="group">
-                        <div class="bg-white rounded-xl shadow-md hover:shadow-xl transition-all p-6 border border-gray-100 h-full">
-                            <div class="text-indigo-600 mb-3">
-                                <i class="fas fa-wallet text-2xl"></i>
-                            </div>
-                            <h3 class="font-bold text-lg text-gray-900 group-hover:text-indigo-600 transition-colors mb-2">
-                                Best Stablecoin Wallets 2025
-                            </h3>
-                            <p class="text-gray-600 text-sm">
-                                Security features, fees, and user experience compared
-                            </p>
-                            <span class="text-indigo-600 text-sm font-medium mt-3 inline-block group-hover:translate-x-1 transition-transform">
-                                Read more →
-                            </span>
-                        </div>
-                    </a>
-
-                    <a href="/blog/how-to-buy-stablecoins/" class="group">
-                        <div class="bg-white rounded-xl shadow-md hover:shadow-xl transition-all p-6 border border-gray-100 h-full">
-                            <div class="text-green-600 mb-3">
-                                <i class="fas fa-shopping-cart text-2xl"></i>
-                            </div>
-                            <h3 class="font-bold text-lg text-gray-900 group-hover:text-green-600 transition-colors mb-2">
-                                How to Buy Stablecoins
-                            </h3>
-                            <p class="text-gray-600 text-sm">
-                                Step-by-step guide for beginners
-                            </p>
-                            <span class="text-green-600 text-sm font-medium mt-3 inline-block group-hover:translate-x-1 transition-transform">
-                                Read more →
-                            </span>
-                        </div>
-                    </a>
-
-                    <a href="/blog/stablecoin-comparison/" class="group">
-                        <div class="bg-white rounded-xl shadow-md hover:shadow-xl transition-all p-6 border border-gray-100 h-full">
-                            <div class="text-purple-600 mb-3">
-                                <i class="fas fa-balance-scale text-2xl"></i>
-                            </div>
-                            <h3 class="font-bold text-lg text-gray-900 group-hover:text-purple-600 transition-colors mb-2">
-                                Stablecoin Comparison 2025
-                            </h3>
-                            <p class="text-gray-600 text-sm">
-                                USDT vs USDC vs DAI and more
-                            </p>
-                            <span class="text-purple-600 text-sm font-medium mt-3 inline-block group-hover:translate-x-1 transition-transform">
-                                Read more →
-                            </span>
-                        </div>
-                    </a>
-                </div>
-            </div>
-'''
-
-    html_content += related_articles
+    html_content += related_articles_section(url_slug)
 
     # Determine categories based on content
     categories = ['Stablecoins']
@@ -537,6 +539,7 @@ def beautify_blog_post(md_file):
 
     # Create final HTML
     final_html = BLOG_TEMPLATE.format(
+        stylesheet=stylesheet_tag(),
         title=title,
         description=description,
         url=url_slug,
@@ -547,38 +550,62 @@ def beautify_blog_post(md_file):
         content=html_content
     )
 
+    return html_file, final_html
+
+def beautify_blog_post(md_file):
+    """Beautify a single blog post"""
+    filename = os.path.basename(md_file)
+    url_slug = re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
+
+    html_file = f'blog/{url_slug}/index.html'
+    if not os.path.exists(html_file):
+        return False, f"HTML file not found: {html_file}"
+
+    try:
+        html_file, final_html = render_blog_post(md_file)
+    except SkipPost as e:
+        return False, str(e)
+
     # Write the beautified file
     with open(html_file, 'w') as f:
         f.write(final_html)
 
     return True, "Beautified"
 
-# Main execution
-print("Beautifying ALL blog posts with enhanced design...")
-print("=" * 60)
+def main():
+    parser = argparse.ArgumentParser(description="Beautify all blog posts from blog/_posts")
+    add_pipeline_arguments(parser)
+    args = parser.parse_args()
 
-# Get all markdown files
-md_files = glob.glob('blog/_posts/*.md')
-print(f"Found {len(md_files)} blog posts to beautify\n")
+    print("Beautifying ALL blog posts with enhanced design...")
+    print("=" * 60)
 
-success_count = 0
-for md_file in sorted(md_files):
-    filename = os.path.basename(md_file)
-    url_slug = re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
+    # Get all markdown files that already have a rendered page
+    md_files = glob.glob('blog/_posts/*.md')
+    print(f"Found {len(md_files)} blog posts to beautify\n")
 
-    success, message = beautify_blog_post(md_file)
-    if success:
-        print(f"✅ Beautified: {url_slug}")
-        success_count += 1
-    else:
-        print(f"⚠️  Skipped {url_slug}: {message}")
-
-print("\n" + "=" * 60)
-print(f"✅ Successfully beautified {success_count}/{len(md_files)} blog posts")
-print("   - NO duplicate headers")
-print("   - Enhanced typography (H1, H2, H3 with visual hierarchy)")
-print("   - Beautiful colors and gradients")
-print("   - Styled bullet points and numbered lists")
-print("   - Interactive table of contents")
-print("   - Colorful info boxes")
-print("   - Modern card-based related articles")
\ No newline at end of file
+    existing = []
+    for md_file in sorted(md_files):
+        filename = os.path.basename(md_file)
+        url_slug = re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
+        if os.path.exists(f'blog/{url_slug}/index.html'):
+            existing.append(md_file)
+        else:
+            print(f"⚠️  Skipped {url_slug}: HTML file not found: blog/{url_slug}/index.html")
+
+    results = run(render_blog_post, existing, jobs=args.jobs, timings=args.timings,
+                  profile=args.profile)
+    success_count = sum(1 for r in results if r['status'] in ('written', 'unchanged'))
+
+    print("\n" + "=" * 60)
+    print(f"✅ Successfully beautified {success_count}/{len(md_files)} blog posts")
+    print("   - NO duplicate headers")
+    print("   - Enhanced typography (H1, H2, H3 with visual hierarchy)")
+    print("   - Beautiful colors and gradients")
+    print("   - Styled bullet points and numbered lists")
+    print("   - Interactive table of contents")
+    print("   - Colorful info boxes")
+    print("   - Modern card-based related articles")
+
+if __name__ == "__main__":
+    main()
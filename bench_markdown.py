@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass markdown_renderer against the legacy multi-pass
+converters (restore_all_blogs.convert_markdown_to_html and
+beautify_blogs.process_content_beautiful) on the posts in blog/_posts.
+
+Prints throughput in MB/s for each converter and the speedup.
+
+Usage:
+    python bench_markdown.py [--repeat N]
+"""
+
+import argparse
+import glob
+import time
+
+from beautify_blogs import process_content_beautiful
+from markdown_renderer import render_markdown, split_front_matter
+from restore_all_blogs import convert_markdown_to_html
+
+
+def load_posts(pattern='blog/_posts/*.md'):
+    """Return a list of (full markdown, body without front matter)"""
+    posts = []
+    for md_file in sorted(glob.glob(pattern)):
+        with open(md_file, 'r', encoding='utf-8') as f:
+            md = f.read()
+        posts.append((md, split_front_matter(md)[1]))
+    return posts
+
+
+def measure(convert, inputs, repeat):
+    """Best-of-repeat wall time (seconds) to convert every input once"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in inputs:
+            convert(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown converter throughput benchmark")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per converter (best is reported)")
+    args = parser.parse_args()
+
+    posts = load_posts()
+    fulls = [md for md, _ in posts]
+    bodies = [body for _, body in posts]
+    megabytes = sum(len(body.encode('utf-8')) for body in bodies) / 1_000_000
+
+    cases = [
+        ("restore", convert_markdown_to_html, bodies, lambda body: render_markdown(body, 'restore'), bodies),
+        ("beautiful", process_content_beautiful, fulls, lambda body: render_markdown(body, 'beautiful'), bodies),
+    ]
+
+    print(f"📚 {len(posts)} posts, {megabytes:.2f} MB of markdown, best of {args.repeat} runs")
+    print("=" * 60)
+    print(f"{'profile':<12}{'legacy MB/s':>14}{'single-pass MB/s':>20}{'speedup':>12}")
+    for name, legacy, legacy_inputs, single_pass, single_inputs in cases:
+        legacy_time = measure(legacy, legacy_inputs, args.repeat)
+        single_time = measure(single_pass, single_inputs, args.repeat)
+        print(f"{name:<12}{megabytes / legacy_time:>14.2f}{megabytes / single_time:>20.2f}"
+              f"{legacy_time / single_time:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+Paginated, category-sharded blog listing pages for StableCoin Hub.
+
+Instead of one blog/index.html holding a card for every post, the listing is
+split into:
+
+    blog/index.html                          newest posts (PAGE_SIZE to 2 * PAGE_SIZE - 1)
+    blog/page/N/index.html                   archive pages
+    blog/category/<name>/index.html          newest posts in a category
+    blog/category/<name>/page/N/index.html   category archive pages
+
+Archive pages are numbered from the oldest post, so page 1 always holds the
+first PAGE_SIZE posts ever published and every archive page is full. The
+front page shows every post newer than the newest archive page (at least
+PAGE_SIZE of them), so no post is listed twice. Together with a listing
+manifest of per-page input hashes this means a publish rewrites the front
+page and the pages of the post's category, plus one new archive page each
+time the front page has filled a page; every other listing page is left
+alone.
+
+Usage:
+    python blog_listing.py             # rewrite only the affected pages
+    python blog_listing.py --force     # re-render every listing page
+    python blog_listing.py --dry-run   # report what would be written
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from html import escape
+
+from blog_metadata import BLOG_DIR, load_blog_index
+from html_minify import MINIFY_CACHE_VERSION, minify_html
+from site_build import BuildManifest, hash_bytes, hash_file, write_if_changed
+from tailwind_build import stylesheet_tag
+
+SITE_URL = 'https://www.stablecoinhub.pro'
+LISTING_MANIFEST_FILE = '.cache/listing-manifest.json'
+PAGE_SIZE = 12
+
+# Generated listing trees under blog/ (never treated as posts)
+LISTING_DIRS = ('page', 'category')
+
+# Filter tab order; categories not listed here follow alphabetically
+CATEGORY_ORDER = [
+    'Education',
+    'DeFi',
+    'Yield',
+    'Trading',
+    'Risk Management',
+    'Technology',
+    'Traditional Currency',
+    'Regulation',
+    'Comparison',
+    'Market Analysis',
+]
+
+# /blog/all/ is a meta-refresh stub pointing back at /blog/
+REDIRECT_SLUGS = {'all'}
+
+BLOG_DESCRIPTION = ("Expert insights on stablecoins, DeFi, yield farming, and digital finance. "
+                    "Comprehensive guides and analysis from StablecoinHub.pro")
+
+
+def category_slug(category):
+    """URL segment for a category name ("Risk Management" -> "risk-management")"""
+    return re.sub(r'[^a-z0-9]+', '-', category.lower()).strip('-')
+
+
+def display_date(iso_date):
+    """"2025-10-11" -> "Oct 11, 2025" ('' for undated posts)"""
+    if not iso_date:
+        return ''
+    try:
+        return datetime.strptime(iso_date[:10], '%Y-%m-%d').strftime('%b %d, %Y')
+    except ValueError:
+        return ''
+
+
+def card_info(entry):
+    """The fields of a metadata index entry that a listing card shows"""
+    description = entry.get('description') or ''
+    return {
+        'slug': entry['slug'],
+        'title': entry['title'],
+        'description': description[:200] + "..." if len(description) > 200 else description,
+        'category': entry['category'],
+        'date': display_date(entry.get('date')),
+    }
+
+
+def ordered_categories(posts):
+    present = {post['category'] for post in posts}
+    known = [category for category in CATEGORY_ORDER if category in present]
+    return known + sorted(present - set(known))
+
+
+def paginate(posts, base, title, heading, subtitle, category=None, page_size=PAGE_SIZE):
+    """Page specs for one listing (the whole blog or one category).
+
+    posts are newest first. Archive pages /<base>/page/N/ hold page_size
+    posts each, cut from the oldest post forwards, so existing pages keep
+    their posts. The front page at /<base>/ shows the rest: the posts that
+    do not fill a page yet plus the newest full page, page_size to
+    2 * page_size - 1 posts, none of them on an archive page.
+    """
+    page_count = max(0, len(posts) // page_size - 1)
+    on_front = len(posts) - page_count * page_size
+    front = {
+        'output': f'{base}/index.html',
+        'url': f'/{base}/',
+        'title': title,
+        'heading': heading,
+        'subtitle': subtitle,
+        'category': category,
+        'page': None,
+        'count': len(posts),
+        'posts': [card_info(post) for post in posts[:on_front]],
+        'newer': None,
+        'older': None,
+    }
+    if not page_count:
+        return [front]
+
+    oldest_first = posts[::-1]
+    specs = [front]
+    for number in range(1, page_count + 1):
+        chunk = oldest_first[(number - 1) * page_size:number * page_size]
+        specs.append({
+            'output': f'{base}/page/{number}/index.html',
+            'url': f'/{base}/page/{number}/',
+            'title': f'{title} - Page {number}',
+            'heading': heading,
+            'subtitle': subtitle,
+            'category': category,
+            'page': number,
+            'count': None,
+            'posts': [card_info(post) for post in reversed(chunk)],
+            'newer': f'/{base}/' if number == page_count else f'/{base}/page/{number + 1}/',
+            'older': f'/{base}/page/{number - 1}/' if number > 1 else None,
+        })
+    front['older'] = f'/{base}/page/{page_count}/'
+    return specs
+
+
+def plan_listings(posts, page_size=PAGE_SIZE):
+    """(specs, categories) for the blog listing and every category listing"""
+    categories = ordered_categories(posts)
+    specs = paginate(posts, BLOG_DIR, 'Blog', 'StableCoin Hub Blog',
+                     'Expert insights on stablecoins, DeFi, and the future of digital finance', None, page_size)
+    for category in categories:
+        in_category = [post for post in posts if post['category'] == category]
+        specs.extend(paginate(in_category, f'{BLOG_DIR}/category/{category_slug(category)}',
+                              f'{category} Articles', f'{category} Articles',
+                              f'StableCoin Hub guides and analysis on {category}', category, page_size))
+    return specs, categories
+
+
+def render_card(post):
+    date = f'\n                            <span class="text-gray-500 text-sm ml-2">{post["date"]}</span>' if post['date'] else ''
+    return f"""
+                <article class="blog-card bg-white rounded-xl overflow-hidden shadow-sm card-hover" data-category="{escape(post['category'])}">
+                    <div class="p-6">
+                        <div class="flex items-center mb-3">
+                            <span class="bg-indigo-100 text-indigo-600 text-xs px-2 py-1 rounded-full">{escape(post['category'])}</span>{date}
+                        </div>
+                        <h2 class="text-xl font-bold text-gray-900 mb-3 line-clamp-2">
+                            <a href="/blog/{post['slug']}/" class="hover:text-indigo-600">{escape(post['title'])}</a>
+                        </h2>
+                        <p class="text-gray-600 mb-4 line-clamp-3">{escape(post['description'])}</p>
+                        <a href="/blog/{post['slug']}/" class="inline-flex items-center text-indigo-600 hover:text-indigo-800 font-medium">
+                            Read More →
+                        </a>
+                    </div>
+                </article>"""
+
+
+def render_tabs(categories, active):
+    tabs = [('All Posts', '/blog/', active is None)]
+    tabs += [(category, f'/blog/category/{category_slug(category)}/', category == active) for category in categories]
+    html = ''
+    for label, url, selected in tabs:
+        if selected:
+            css = 'text-indigo-600 font-medium whitespace-nowrap pb-2 border-b-2 border-indigo-600'
+        else:
+            css = 'text-gray-500 hover:text-gray-700 whitespace-nowrap pb-2'
+        html += f'\n                <a href="{url}" class="filter-btn {css}">{escape(label)}</a>'
+    return html
+
+
+def render_pager(spec):
+    if not spec['newer'] and not spec['older']:
+        return ''
+    newer = (f'<a href="{spec["newer"]}" class="text-indigo-600 hover:text-indigo-800 font-medium">← Newer posts</a>'
+             if spec['newer'] else '<span></span>')
+    older = (f'<a href="{spec["older"]}" class="text-indigo-600 hover:text-indigo-800 font-medium">Older posts →</a>'
+             if spec['older'] else '<span></span>')
+    return f"""
+            <nav class="flex justify-between items-center mt-12" aria-label="Pagination">
+                {newer}
+                {older}
+            </nav>"""
+
+
+def render_page(spec, categories, stylesheet):
+    """Full HTML of one listing page (stylesheet is the Tailwind tag for <head>)"""
+    # Archive pages show their number rather than the post count, so they
+    # stay byte-identical as new posts are published
+    summary = f'Page {spec["page"]}' if spec['page'] else f'{spec["count"]} comprehensive guides and articles'
+    category = spec['category']
+    description = f"{spec['subtitle']}." if category else BLOG_DESCRIPTION
+    footer_categories = ''.join(
+        f'\n                        <li><a href="/blog/category/{category_slug(name)}/" class="text-gray-400 hover:text-white text-sm">{escape(name)}</a></li>'
+        for name in categories[:4]
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{escape(spec['title'])} - StableCoin Hub</title>
+    <meta name="description" content="{escape(description)}">
+    <link rel="canonical" href="{SITE_URL}{spec['url']}">
+    {stylesheet}
+    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+    <style>
+        .gradient-bg {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }}
+        .card-hover {{ transition: all 0.3s ease; }}
+        .card-hover:hover {{ transform: translateY(-5px); box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.1); }}
+    </style>
+    <script src="/canonical-handler.js"></script>
+    <script src="/search.js" defer></script>
+</head>
+<body class="bg-gray-50">
+    <!-- Navigation -->
+    <nav class="bg-white shadow-lg sticky top-0 z-50">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
+            <div class="flex justify-between items-center h-16">
+                <div class="flex items-center">
+                    <a href="/" class="text-2xl font-bold text-indigo-600">StableCoin Hub</a>
+                    <div class="hidden md:block ml-10">
+                        <div class="flex items-baseline space-x-4">
+                            <a href="/" class="text-gray-500 hover:text-indigo-600 px-3 py-2 rounded-md text-sm font-medium">Home</a>
+                            <a href="/blog/" class="text-gray-900 hover:text-indigo-600 px-3 py-2 rounded-md text-sm font-medium">Blog</a>
+                            <a href="/#categories" class="text-gray-500 hover:text-indigo-600 px-3 py-2 rounded-md text-sm font-medium">Tools</a>
+                            <a href="/about/" class="text-gray-500 hover:text-indigo-600 px-3 py-2 rounded-md text-sm font-medium">About</a>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </nav>
+
+    <!-- Header -->
+    <div class="gradient-bg py-16">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 text-center">
+            <h1 class="text-4xl md:text-5xl font-bold text-white mb-4">{escape(spec['heading'])}</h1>
+            <p class="text-xl text-white/90 mb-6">{escape(spec['subtitle'])}</p>
+            <div class="text-white/80">
+                <i class="fas fa-book mr-2"></i>
+                {summary}
+            </div>
+            <form id="blog-search" class="max-w-xl mx-auto mt-8" role="search" action="/blog/">
+                <label for="blog-search-input" class="sr-only">Search articles</label>
+                <input id="blog-search-input" type="search" autocomplete="off" placeholder="Search all articles..."
+                       class="w-full px-4 py-3 rounded-lg text-gray-900 shadow-sm focus:outline-none focus:ring-2 focus:ring-indigo-300">
+            </form>
+        </div>
+    </div>
+
+    <!-- Filter Tabs -->
+    <div class="bg-white border-b sticky top-16 z-40">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
+            <div class="flex space-x-8 overflow-x-auto py-4">{render_tabs(categories, category)}
+            </div>
+        </div>
+    </div>
+
+    <!-- Search Results (filled by search.js) -->
+    <div id="search-results" class="hidden py-12">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
+            <p id="search-status" class="text-gray-600 mb-6"></p>
+            <div id="search-list" class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8"></div>
+        </div>
+    </div>
+    <template id="search-result-template">
+        <article class="blog-card bg-white rounded-xl overflow-hidden shadow-sm card-hover">
+            <div class="p-6">
+                <div class="flex items-center mb-3">
+                    <span data-field="category" class="bg-indigo-100 text-indigo-600 text-xs px-2 py-1 rounded-full"></span>
+                    <span data-field="date" class="text-gray-500 text-sm ml-2"></span>
+                </div>
+                <h2 class="text-xl font-bold text-gray-900 mb-3 line-clamp-2">
+                    <a data-field="title" class="hover:text-indigo-600"></a>
+                </h2>
+                <a class="inline-flex items-center text-indigo-600 hover:text-indigo-800 font-medium">
+                    Read More →
+                </a>
+            </div>
+        </article>
+    </template>
+
+    <!-- Blog Grid -->
+    <div id="blog-listing" class="py-12">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
+            <div id="blog-grid" class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">{''.join(render_card(post) for post in spec['posts'])}
+            </div>{render_pager(spec)}
+        </div>
+    </div>
+
+    <!-- Footer -->
+    <footer class="bg-gray-900 text-white py-12">
+        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
+            <div class="grid grid-cols-1 md:grid-cols-4 gap-8">
+                <div>
+                    <h3 class="text-xl font-bold mb-4">StableCoin Hub</h3>
+                    <p class="text-gray-400">The ultimate directory for stablecoin tools and platforms.</p>
+                </div>
+                <div>
+                    <h4 class="text-lg font-semibold mb-4">Quick Links</h4>
+                    <ul class="space-y-2">
+                        <li><a href="/blog/" class="text-gray-400 hover:text-white">Blog</a></li>
+                        <li><a href="/#categories" class="text-gray-400 hover:text-white">Tools</a></li>
+                        <li><a href="/about/" class="text-gray-400 hover:text-white">About</a></li>
+                    </ul>
+                </div>
+                <div>
+                    <h4 class="text-lg font-semibold mb-4">Topics</h4>
+                    <ul class="space-y-2">{footer_categories}
+                    </ul>
+                </div>
+                <div>
+                    <h4 class="text-lg font-semibold mb-4">Legal</h4>
+                    <ul class="space-y-2">
+                        <li><a href="/privacy.html" class="text-gray-400 hover:text-white">Privacy Policy</a></li>
+                        <li><a href="/terms.html" class="text-gray-400 hover:text-white">Terms of Service</a></li>
+                        <li><a href="/disclaimer.html" class="text-gray-400 hover:text-white">Disclaimer</a></li>
+                    </ul>
+                </div>
+            </div>
+            <div class="border-t border-gray-800 mt-8 pt-8 text-center">
+                <p class="text-gray-400">© 2025 StableCoin Hub. All rights reserved.</p>
+            </div>
+        </div>
+    </footer>
+</body>
+</html>"""
+
+
+def listing_posts(index):
+    """Index entries that get a listing card: published pages, newest first"""
+    return [entry for entry in index.posts()
+            if entry['slug'] not in REDIRECT_SLUGS
+            and entry['slug'] not in LISTING_DIRS
+            and os.path.exists(os.path.join(BLOG_DIR, entry['slug'], 'index.html'))]
+
+
+def generated_pages():
+    """Listing pages currently on disk under blog/page and blog/category"""
+    pages = set()
+    for name in LISTING_DIRS:
+        for current, _, files in os.walk(os.path.join(BLOG_DIR, name)):
+            if 'index.html' in files:
+                pages.add(os.path.join(current, 'index.html').replace(os.sep, '/'))
+    return pages
+
+
+def remove_stale_listings(manifest, expected, dry_run=False):
+    """Delete generated listing pages that are no longer produced. Returns their paths."""
+    stale = sorted((generated_pages() | set(manifest.pages)) - expected)
+    for output in stale:
+        if dry_run:
+            continue
+        manifest.forget(output)
+        if os.path.exists(output):
+            os.unlink(output)
+        # Drop directories left empty (blog/page/7/, blog/category/x/page/...)
+        directory = os.path.dirname(output)
+        while directory != BLOG_DIR and os.path.isdir(directory) and not os.listdir(directory):
+            os.rmdir(directory)
+            directory = os.path.dirname(directory)
+    return stale
+
+
+def build_listings(force=False, dry_run=False, manifest_path=LISTING_MANIFEST_FILE,
+                   page_size=PAGE_SIZE, index=None):
+    """Render the listing pages whose posts or navigation changed.
+
+    Each page's input hash covers the cards it shows, its pager links, the
+    category tabs, the stylesheet it links, this renderer and the minifier;
+    pages with an unchanged hash are not rendered at all. Pages are minified
+    like the posts render_pipeline writes. Returns a stats dict.
+    """
+    if index is None:
+        index = load_blog_index()
+    specs, categories = plan_listings(listing_posts(index), page_size)
+    manifest = BuildManifest(manifest_path)
+    renderer = hash_file(__file__)
+    stylesheet = stylesheet_tag()
+    stats = {'pages': len(specs), 'rendered': 0, 'written': 0, 'unchanged': 0, 'removed': 0,
+             'categories': len(categories)}
+
+    for spec in specs:
+        output = spec['output']
+        inputs = {'posts': [post['slug'] for post in spec['posts']], 'renderer': renderer,
+                  'content': hash_bytes(json.dumps({'spec': spec, 'categories': categories}, sort_keys=True)),
+                  'stylesheet': stylesheet, 'minify': MINIFY_CACHE_VERSION}
+        input_hash = hash_bytes(json.dumps(inputs, sort_keys=True))
+        if not force and manifest.is_fresh(output, input_hash):
+            stats['unchanged'] += 1
+            continue
+
+        stats['rendered'] += 1
+        if dry_run:
+            print(f"📝 Would render: {output}")
+            continue
+        html = minify_html(render_page(spec, categories, stylesheet))
+        written = write_if_changed(output, html)
+        if written:
+            stats['written'] += 1
+            print(f"✅ Wrote: {output}")
+        manifest.record(output, inputs, input_hash, hash_bytes(html), modified=written)
+
+    expected = {spec['output'] for spec in specs}
+    for output in remove_stale_listings(manifest, expected, dry_run=dry_run):
+        print(f"🗑️  {'Would remove' if dry_run else 'Removed'}: {output}")
+        stats['removed'] += 1
+
+    if not dry_run:
+        manifest.save()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the paginated blog index and category pages")
+    parser.add_argument('--force', action='store_true', help="re-render every listing page")
+    parser.add_argument('--dry-run', action='store_true', help="only report what would be written")
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE, help="posts per listing page")
+    parser.add_argument('--manifest', default=LISTING_MANIFEST_FILE, help="path of the listing manifest")
+    args = parser.parse_args()
+
+    print("📚 Building blog listing pages...")
+    print("=" * 60)
+    stats = build_listings(force=args.force, dry_run=args.dry_run, manifest_path=args.manifest,
+                           page_size=args.page_size)
+    print("=" * 60)
+    print(f"📊 Summary:")
+    print(f"   Listing pages: {stats['pages']} ({stats['categories']} categories)")
+    print(f"   Rendered: {stats['rendered']}")
+    print(f"   Written: {stats['written']}")
+    print(f"   Up to date: {stats['unchanged']}")
+    if stats['removed']:
+        print(f"   Removed: {stats['removed']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
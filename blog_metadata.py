@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Persistent blog metadata index for StableCoin Hub.
+
+One JSON file keyed by slug holds each post's title, description, category,
+date, word count, tags and related slugs. Posts with a markdown source in
+blog/_posts are described from their front matter; older pages that only
+exist as blog/<slug>/index.html are described from their HTML once.
+
+Each entry remembers the (mtime, size) of the files it was built from, so
+refresh() re-parses only posts whose sources changed and the blog index,
+homepage and sitemap builders can read the whole list without opening any
+rendered page.
+
+Usage:
+    python blog_metadata.py            # refresh the index
+    python blog_metadata.py --show     # refresh and list the posts
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+
+from markdown_renderer import split_front_matter
+from site_build import POSTS_DIR, slug_for_post, write_if_changed
+
+BLOG_INDEX_FILE = '.cache/blog-index.json'
+BLOG_INDEX_VERSION = 1
+BLOG_DIR = 'blog'
+
+DATE_PREFIX_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})-')
+FRONT_MATTER_LINE_RE = re.compile(r'^(\w[\w-]*):\s*(.*)$')
+RELATED_LINK_RE = re.compile(r'href="/blog/([^/"#?]+)/?"')
+CATEGORY_SPAN_RE = re.compile(r'📁\s*([^<]+)</span>')
+HTML_DATE_RE = re.compile(r'(?:"datePublished"\s*:\s*"|article:published_time"?\s+content="?|datetime="?)(\d{4}-\d{2}-\d{2})')
+
+
+def parse_front_matter(text):
+    """Parse the flat `key: value` front matter used by the posts.
+
+    Handles quoted strings and [a, b] lists; nested YAML is not used here.
+    """
+    data = {}
+    for line in text.splitlines():
+        match = FRONT_MATTER_LINE_RE.match(line.strip())
+        if not match:
+            continue
+        key, value = match.group(1), match.group(2).strip()
+        if value.startswith('[') and value.endswith(']'):
+            data[key] = [item.strip().strip('"\'') for item in value[1:-1].split(',') if item.strip()]
+        elif len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+            data[key] = value[1:-1]
+        else:
+            data[key] = value
+    return data
+
+
+def infer_category(title):
+    """Category for the blog index filters, inferred from a post title"""
+    title_lower = title.lower()
+    if "yield" in title_lower or "apy" in title_lower or "interest" in title_lower:
+        return "Yield"
+    elif "defi" in title_lower or "lending" in title_lower:
+        return "DeFi"
+    elif "regulation" in title_lower:
+        return "Regulation"
+    elif "risk" in title_lower or "insurance" in title_lower or "depeg" in title_lower:
+        return "Risk Management"
+    elif "vs" in title_lower or "comparison" in title_lower:
+        return "Comparison"
+    elif any(word in title_lower for word in ["penny", "dollar", "coin", "quarter", "grading"]):
+        return "Traditional Currency"
+    elif "arbitrage" in title_lower or "trading" in title_lower:
+        return "Trading"
+    elif "bridge" in title_lower or "smart contract" in title_lower or "algorithmic" in title_lower:
+        return "Technology"
+    elif "market cap" in title_lower or "analysis" in title_lower:
+        return "Market Analysis"
+    return "Education"
+
+
+def count_words(text):
+    """Words of visible text (tags and markdown punctuation ignored)"""
+    text = re.sub(r'<script\b.*?</script>|<style\b.*?</style>', ' ', text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r'<[^>]+>', ' ', text)
+    return len(re.findall(r"[A-Za-z0-9][A-Za-z0-9'’.-]*", text))
+
+
+def related_slugs(html, slug):
+    """Slugs linked from the page's Related Articles section"""
+    start = html.find('Related Articles')
+    if start == -1:
+        return []
+    related = []
+    for linked in RELATED_LINK_RE.findall(html, start):
+        if linked != slug and linked not in related:
+            related.append(linked)
+    return related
+
+
+def html_title(html, slug):
+    match = re.search(r'<title>(.*?)(?:\s*\||\s+-\s|</title>)', html, re.DOTALL)
+    if match and match.group(1).strip():
+        return match.group(1).strip()
+    h1_match = re.search(r'<h1[^>]*>(.*?)</h1>', html, re.DOTALL)
+    return re.sub(r'<[^>]+>', '', h1_match.group(1)).strip() if h1_match else slug.replace('-', ' ').title()
+
+
+def html_description(html):
+    match = re.search(r'<meta name="?description"? content="(.*?)"', html)
+    return match.group(1) if match else ""
+
+
+def page_category(html, title):
+    match = CATEGORY_SPAN_RE.search(html)
+    return match.group(1).strip() if match else infer_category(title)
+
+
+def describe_post(md_file, html):
+    """Metadata for a post with a markdown source (html may be '' if not rendered yet)"""
+    with open(md_file, 'r', encoding='utf-8') as f:
+        front_matter, body = split_front_matter(f.read())
+    meta = parse_front_matter(front_matter)
+    slug = slug_for_post(md_file)
+    title = meta.get('title') or slug.replace('-', ' ').title()
+    date_match = DATE_PREFIX_RE.match(os.path.basename(md_file))
+    categories = meta.get('categories') or []
+    return {
+        'slug': slug,
+        'title': title,
+        'description': meta.get('description', ''),
+        'category': page_category(html, title),
+        'categories': categories if isinstance(categories, list) else [categories],
+        'tags': meta.get('tags') if isinstance(meta.get('tags'), list) else [],
+        'date': str(meta.get('date') or (date_match.group(1) if date_match else '')) or None,
+        'word_count': count_words(body),
+        'related': related_slugs(html, slug),
+        'source': md_file,
+    }
+
+
+def describe_page(slug, html):
+    """Metadata for a page that only exists as rendered HTML"""
+    title = html_title(html, slug)
+    date_match = HTML_DATE_RE.search(html)
+    body_start = html.find('<body')
+    return {
+        'slug': slug,
+        'title': title,
+        'description': html_description(html),
+        'category': page_category(html, title),
+        'categories': [],
+        'tags': [],
+        'date': date_match.group(1) if date_match else None,
+        'word_count': count_words(html[body_start:] if body_start != -1 else html),
+        'related': related_slugs(html, slug),
+        'source': f'{BLOG_DIR}/{slug}/index.html',
+    }
+
+
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class BlogIndex:
+    """Slug -> metadata index persisted between runs"""
+
+    def __init__(self, path=BLOG_INDEX_FILE, blog_dir=BLOG_DIR, posts_dir=POSTS_DIR):
+        self.path = path
+        self.blog_dir = blog_dir
+        self.posts_dir = posts_dir
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == BLOG_INDEX_VERSION:
+            self.entries = data.get('posts', {})
+
+    def save(self):
+        data = {'version': BLOG_INDEX_VERSION, 'posts': self.entries}
+        return write_if_changed(self.path, json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + '\n')
+
+    def sources(self):
+        """slug -> markdown file (or None) for every post that has a source or a page"""
+        sources = {}
+        if os.path.isdir(self.blog_dir):
+            for name in os.listdir(self.blog_dir):
+                if not name.startswith(('_', '.')) and os.path.exists(os.path.join(self.blog_dir, name, 'index.html')):
+                    sources[name] = None
+        for md_file in sorted(glob.glob(os.path.join(self.posts_dir, '*.md'))):
+            sources[slug_for_post(md_file)] = md_file
+        return sources
+
+    def refresh(self, slugs=None):
+        """Re-describe posts whose markdown or page changed since the last refresh.
+
+        slugs limits the check to those posts (e.g. the ones just rendered);
+        posts whose sources disappeared are dropped. Returns a stats dict.
+        """
+        stats = {'parsed': 0, 'kept': 0, 'removed': 0}
+        sources = self.sources()
+
+        for slug in list(self.entries):
+            if slug not in sources:
+                del self.entries[slug]
+                stats['removed'] += 1
+
+        for slug, md_file in sorted(sources.items()):
+            if slugs is not None and slug not in slugs and slug in self.entries:
+                stats['kept'] += 1
+                continue
+            html_file = os.path.join(self.blog_dir, slug, 'index.html')
+            signature = [md_file and file_signature(md_file), file_signature(html_file)]
+            entry = self.entries.get(slug)
+            if entry and entry.get('signature') == signature:
+                stats['kept'] += 1
+                continue
+
+            html = ''
+            if signature[1] is not None:
+                with open(html_file, 'r', encoding='utf-8') as f:
+                    html = f.read()
+            entry = describe_post(md_file, html) if md_file else describe_page(slug, html)
+            entry['url'] = f'/blog/{slug}/'
+            entry['signature'] = signature
+            self.entries[slug] = entry
+            stats['parsed'] += 1
+
+        return stats
+
+    def get(self, slug):
+        return self.entries.get(slug)
+
+    def posts(self):
+        """All entries, newest first (undated posts last, then by slug)"""
+        return sorted(self.entries.values(), key=lambda e: (e.get('date') or '', e['slug']), reverse=True)
+
+
+def load_blog_index(path=BLOG_INDEX_FILE, save=True):
+    """Open the index, bring it up to date and (optionally) persist it"""
+    index = BlogIndex(path)
+    index.refresh()
+    if save:
+        index.save()
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the blog metadata index")
+    parser.add_argument('--index', default=BLOG_INDEX_FILE, help="path of the metadata index")
+    parser.add_argument('--show', action='store_true', help="list the indexed posts")
+    args = parser.parse_args()
+
+    index = BlogIndex(args.index)
+    stats = index.refresh()
+    written = index.save()
+
+    print(f"📚 Blog index: {len(index.entries)} posts "
+          f"({stats['parsed']} parsed, {stats['kept']} unchanged, {stats['removed']} removed)")
+    if written:
+        print(f"✅ Wrote {args.index}")
+    if args.show:
+        print("=" * 60)
+        for entry in index.posts():
+            print(f"{entry.get('date') or '----------'}  {entry['category']:<20} {entry['slug']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,22 +4,152 @@ Blog Quality Validator - Ensures all blog posts meet minimum quality standards.
 This prevents short, duplicate, or low-quality content from being published.
 """
 
+import hashlib
+import json
+import math
 import os
 import re
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 import sys
 
 # Quality Standards
 MIN_WORD_COUNT = 2500  # Minimum words per blog
-MIN_LINE_COUNT = 300   # Minimum lines of HTML
+MIN_LINE_COUNT = 300   # Minimum lines of HTML (blank and comment-only lines not counted)
 MIN_PARAGRAPHS = 15    # Minimum content paragraphs
 MIN_HEADERS = 5        # Minimum section headers (h2, h3, h4)
 MAX_DUPLICATE_CONTENT = 0.15  # Maximum 15% duplicate content between blogs
 
+# Near-duplicate detection (MinHash + LSH)
+SHINGLE_SIZE = 3             # Words per shingle; short shingles survive light paraphrasing
+LSH_ROWS = 2                 # Signature rows per band
+LSH_RECALL = 0.95            # Chance that a pair right at MAX_DUPLICATE_CONTENT becomes a candidate
+# A pair with similarity s shares at least one band with probability 1 - (1 - s^rows)^bands;
+# take the fewest bands that put that S-curve at LSH_RECALL for the enforced limit (132 bands)
+LSH_BANDS = math.ceil(math.log(1 - LSH_RECALL) / math.log(1 - MAX_DUPLICATE_CONTENT ** LSH_ROWS))
+MINHASH_BINS = LSH_BANDS * LSH_ROWS  # Signature length
+MINHASH_CACHE_FILE = ".cache/minhash.json"
+SHINGLE_VERSION = 2          # Bump when content_shingles changes so cached signatures are recomputed
+
+_EMPTY_SLOT = (1 << 64) - 1
+
+COMMENT_LINE_RE = re.compile(r'\s*<!--.*-->\s*$')
+# Template chrome every page shares: scripts, navigation, page header and footer
+BOILERPLATE_RE = re.compile(r'<(script|style|nav|header|footer|aside)\b.*?</\1>|<!--.*?-->', re.DOTALL | re.IGNORECASE)
+# Sections the templates append after the post body, up to the end of the article
+TRAILER_RE = re.compile(r'<h[23][^>]*>\s*(?:Related Articles|About StableCoin Hub)\b.*?(?=</article>|\Z)', re.DOTALL)
+CONTENT_BLOCK_RE = re.compile(r'<(p|li)\b[^>]*>(.*?)</\1>', re.DOTALL | re.IGNORECASE)
+PLACEHOLDER_PHRASES = ("Content will be added here", "This article provides expert insights")
+
+
+def content_shingles(html: str) -> Set[int]:
+    """Hash the word shingles of a page's paragraph and list text.
+
+    Template boilerplate (navigation, header, footer, related-articles and
+    author boxes) is stripped first so pages are compared by their own text.
+    Words are lowercased with punctuation dropped, so reworded sentences that
+    keep most of their phrasing still share shingles.
+    """
+    html = TRAILER_RE.sub(' ', BOILERPLATE_RE.sub(' ', html))
+    blocks = [block for _, block in CONTENT_BLOCK_RE.findall(html)]
+    text = re.sub(r'<[^>]+>', ' ', ' '.join(blocks)).lower()
+    words = re.findall(r'[a-z0-9]+', text)
+    shingles = set()
+    for i in range(max(len(words) - SHINGLE_SIZE + 1, 0)):
+        shingle = ' '.join(words[i:i + SHINGLE_SIZE]).encode('utf-8')
+        shingles.add(int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), 'big'))
+    return shingles
+
+
+def minhash_signature(shingles: Set[int]) -> List[int]:
+    """One-permutation MinHash: each shingle hash falls into one of
+    MINHASH_BINS bins and the signature keeps each bin's minimum.
+
+    One pass over the shingles instead of one pass per permutation; bins no
+    shingle fell into hold _EMPTY_SLOT.
+    """
+    signature = [_EMPTY_SLOT] * MINHASH_BINS
+    for h in shingles:
+        slot = h % MINHASH_BINS
+        if h < signature[slot]:
+            signature[slot] = h
+    return signature
+
+
+def estimate_similarity(sig1: List[int], sig2: List[int]) -> float:
+    """Estimated Jaccard similarity: the fraction of matching non-empty bins"""
+    matches = used = 0
+    for x, y in zip(sig1, sig2):
+        if x == _EMPTY_SLOT and y == _EMPTY_SLOT:
+            continue
+        used += 1
+        matches += x == y
+    return matches / used if used else 0.0
+
+
+class MinHashLSH:
+    """Locality-sensitive hash index over MinHash signatures.
+
+    Posts land in the same bucket when any band of their signatures matches,
+    so candidate pairs are found without comparing every pair. Bands made up
+    only of empty bins are left out: short pages would all match on them.
+    """
+
+    def __init__(self, bands: int = LSH_BANDS):
+        self.bands = bands
+        self.buckets = defaultdict(list)
+        self.signatures = {}
+
+    def add(self, key: str, signature: List[int]):
+        if all(value == _EMPTY_SLOT for value in signature):
+            return  # nothing to compare
+        rows = len(signature) // self.bands
+        self.signatures[key] = signature
+        for band in range(self.bands):
+            chunk = tuple(signature[band * rows:(band + 1) * rows])
+            if all(value == _EMPTY_SLOT for value in chunk):
+                continue
+            self.buckets[(band, chunk)].append(key)
+
+    def candidate_pairs(self) -> Set[Tuple[str, str]]:
+        pairs = set()
+        for keys in self.buckets.values():
+            if len(keys) > 1:
+                for i, first in enumerate(keys):
+                    for second in keys[i + 1:]:
+                        pairs.add((first, second) if first < second else (second, first))
+        return pairs
+
+
+def check_blog_content(blog_name: str, content: str) -> bool:
+    """Publish gate: validate the HTML of a blog (rendered or on disk) before publishing.
+
+    Takes the (slug, html) arguments publish_planner.publish_plan passes to validate.
+    """
+    # Extract text content
+    text = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL)
+    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL)
+    text = re.sub(r'<[^>]+>', ' ', text)
+    word_count = len(text.split())
+
+    if word_count < MIN_WORD_COUNT:
+        print(f"❌ Blog {blog_name} has only {word_count} words (minimum: {MIN_WORD_COUNT})")
+        print(f"   This blog will NOT be published until it has proper content!")
+        return False
+
+    if any(phrase in content for phrase in PLACEHOLDER_PHRASES):
+        print(f"❌ Blog {blog_name} contains placeholder content!")
+        return False
+
+    print(f"✅ Blog {blog_name} passed quality check ({word_count} words)")
+    return True
+
+
 class BlogQualityValidator:
-    def __init__(self, blog_dir: str = "blog"):
+    def __init__(self, blog_dir: str = "blog", cache_file: str = MINHASH_CACHE_FILE):
         self.blog_dir = Path(blog_dir)
+        self.cache_file = Path(cache_file) if cache_file else None
         self.errors = []
         self.warnings = []
         self.blog_contents = {}
@@ -77,7 +207,8 @@ class BlogQualityValidator:
 
         # Check word count
         word_count = len(text_content.split())
-        line_count = len(content.splitlines())
+        # Minification drops blank and comment-only lines but keeps every other line break
+        line_count = sum(1 for line in content.splitlines() if line.strip() and not COMMENT_LINE_RE.match(line))
 
         # Count content elements
         paragraphs = len(re.findall(r'<p[^>]*>.*?</p>', content, re.DOTALL))
@@ -101,15 +232,15 @@ class BlogQualityValidator:
             self.warnings.append(f"{blog_name}: Only {headers} section headers (recommended: {MIN_HEADERS}+)")
 
         # Check for placeholder content
-        if "Content will be added here" in content or "This article provides expert insights" in content:
+        if any(phrase in content for phrase in PLACEHOLDER_PHRASES):
             self.errors.append(f"{blog_name}: Contains placeholder content!")
             is_valid = False
 
         # Check for proper meta tags
-        if not re.search(r'<meta name="description"[^>]*content="[^"]{50,}"', content):
+        if not re.search(r'<meta name="?description"?[^>]*content="[^"]{50,}"', content):
             self.warnings.append(f"{blog_name}: Meta description too short or missing")
 
-        if not re.search(r'<link rel="canonical"', content):
+        if not re.search(r'<link rel="?canonical\b', content):
             self.errors.append(f"{blog_name}: Missing canonical URL")
             is_valid = False
 
@@ -131,23 +262,63 @@ class BlogQualityValidator:
         return html
 
     def check_duplicate_content(self):
-        """Check for duplicate content between blogs."""
-        blog_names = list(self.blog_contents.keys())
-
-        for i, blog1 in enumerate(blog_names):
-            for blog2 in blog_names[i+1:]:
-                similarity = self.calculate_similarity(
-                    self.blog_contents[blog1],
-                    self.blog_contents[blog2]
+        """Check for near-duplicate content between blogs.
+
+        Each post's MinHash signature is computed once (and cached on disk by
+        content hash), an LSH index proposes candidate pairs, and only those
+        pairs are scored.
+        """
+        cache = self.load_signature_cache()
+        index = MinHashLSH()
+
+        for blog_name in sorted(self.blog_contents):
+            content = self.blog_contents[blog_name]
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            signature = cache.get(digest)
+            if signature is None:
+                signature = cache[digest] = minhash_signature(content_shingles(content))
+            index.add(blog_name, signature)
+
+        for blog1, blog2 in sorted(index.candidate_pairs()):
+            similarity = estimate_similarity(index.signatures[blog1], index.signatures[blog2])
+            if similarity > MAX_DUPLICATE_CONTENT:
+                self.errors.append(
+                    f"High duplicate content ({similarity:.1%}) between {blog1} and {blog2}"
                 )
 
-                if similarity > MAX_DUPLICATE_CONTENT:
-                    self.errors.append(
-                        f"High duplicate content ({similarity:.1%}) between {blog1} and {blog2}"
-                    )
+        self.save_signature_cache(cache)
+
+    def signature_cache_params(self) -> Dict:
+        return {'shingle_size': SHINGLE_SIZE, 'bins': MINHASH_BINS, 'version': SHINGLE_VERSION}
+
+    def load_signature_cache(self) -> Dict[str, List[int]]:
+        """Signatures keyed by sha256 of the page; discarded if the parameters changed"""
+        if not self.cache_file or not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if data.get('params') != self.signature_cache_params():
+            return {}
+        return data.get('signatures', {})
+
+    def save_signature_cache(self, cache: Dict[str, List[int]]):
+        if not self.cache_file:
+            return
+        # Only keep signatures of pages that still exist
+        live = {hashlib.sha256(c.encode('utf-8')).hexdigest() for c in self.blog_contents.values()}
+        data = {
+            'params': self.signature_cache_params(),
+            'signatures': {k: v for k, v in cache.items() if k in live},
+        }
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
 
     def calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two texts."""
+        """Calculate exact-paragraph Jaccard similarity between two texts."""
         # Extract meaningful content blocks
         blocks1 = set(re.findall(r'<p[^>]*>(.*?)</p>', text1, re.DOTALL))
         blocks2 = set(re.findall(r'<p[^>]*>(.*?)</p>', text2, re.DOTALL))
@@ -229,7 +400,7 @@ def integrate_with_auto_publish():
             content = f.read()
 
         # Add quality validation import and check
-        if "BlogQualityValidator" not in content:
+        if "blog_quality_validator" not in content:
             validation_code = '''
 # Import blog quality validator
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Compiled blog publishing schedule for StableCoin Hub.
+
+The schedule comes from two sources:
+
+    ../blog-schedule.md        "## October 2025" headers and "- **Oct 5**: Title" lines;
+                               url, category and description are derived from the title
+    data/blog-schedule.json    {"posts": [{date, url, title, category, description}]},
+                               explicit entries (these win over the markdown for a url)
+
+Both are compiled once into .cache/schedule.json: entries validated, a url
+kept only at its earliest date, and the list sorted by date. The cache is
+keyed by a hash of the sources and this compiler, so it is rebuilt only when
+one of them changes, and every publisher reads the same schedule.
+
+Schedule.due(day), Schedule.on(day) and Schedule.after(day) are binary
+searches over the sorted dates, so a year-long schedule answers "what is
+due on or before today" without walking it.
+
+Usage:
+    python blog_schedule.py                 # compile (if needed) and summarise
+    python blog_schedule.py --show          # list every entry
+    python blog_schedule.py --due 2025-10-05
+"""
+
+import argparse
+import bisect
+import functools
+import json
+import re
+import sys
+from datetime import datetime, timezone
+
+from site_build import hash_bytes, hash_file, write_if_changed
+
+SCHEDULE_MARKDOWN = '../blog-schedule.md'
+SCHEDULE_DATA = 'data/blog-schedule.json'
+SCHEDULE_CACHE_FILE = '.cache/schedule.json'
+SCHEDULE_CACHE_VERSION = 1
+
+MONTH_RE = re.compile(r'## (\w+ \d{4})')
+ENTRY_RE = re.compile(r'- \*\*(\w+ \d+)\*\*: (.+)')
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}$')
+SLUG_RE = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*$')
+
+DESCRIPTIONS = {
+    "stablecoin": "Comprehensive guide to stablecoins, their mechanisms, and practical applications in the cryptocurrency ecosystem.",
+    "bitcoin": "In-depth analysis of Bitcoin, including market trends, valuation, and investment strategies.",
+    "earn": "Discover strategies to generate passive income through cryptocurrency investments and DeFi protocols.",
+    "coin": "Essential information about coins, their value, history, and collection potential.",
+    "invest": "Expert insights on cryptocurrency investments, market analysis, and portfolio strategies.",
+    "usdt": "Complete guide to Tether (USDT), the world's largest stablecoin by market capitalization.",
+    "usdc": "Detailed overview of USD Coin (USDC), focusing on safety, transparency, and use cases."
+}
+DEFAULT_DESCRIPTION = ("Comprehensive guide providing essential insights and practical information for "
+                       "cryptocurrency and stablecoin users.")
+
+
+class ScheduleError(ValueError):
+    """The schedule data file is malformed"""
+
+
+def generate_url_from_title(title):
+    """Generate URL-friendly slug from title"""
+    # Remove special characters and convert to lowercase
+    url = re.sub(r'[^\w\s-]', '', title.lower())
+    # Replace spaces with hyphens
+    url = re.sub(r'[-\s]+', '-', url)
+    # Remove trailing hyphens
+    url = url.strip('-')
+    # Limit length
+    if len(url) > 50:
+        url = url[:50].rsplit('-', 1)[0]
+    return url
+
+
+def determine_category(title):
+    """Determine category based on title keywords"""
+    title_lower = title.lower()
+
+    if any(word in title_lower for word in ['how to', 'guide', 'what is', 'explained']):
+        return "Education"
+    elif any(word in title_lower for word in ['vs', 'versus', 'comparison', 'difference']):
+        return "Comparison"
+    elif any(word in title_lower for word in ['best', 'top', 'invest', 'buy']):
+        return "Investment"
+    elif any(word in title_lower for word in ['earn', 'yield', 'apy', 'interest', 'staking']):
+        return "Yield"
+    elif any(word in title_lower for word in ['bitcoin', 'btc', 'ethereum', 'eth']):
+        return "Crypto"
+    elif any(word in title_lower for word in ['coin', 'dollar', 'cent', 'penny']):
+        return "Currency"
+    elif any(word in title_lower for word in ['trade', 'trading', 'support', 'resistance']):
+        return "Trading"
+    else:
+        return "General"
+
+
+def generate_description(title):
+    """Generate a description based on the title"""
+    title_lower = title.lower()
+    for keyword, description in DESCRIPTIONS.items():
+        if keyword in title_lower:
+            return description
+    return DEFAULT_DESCRIPTION
+
+
+def parse_markdown(text):
+    """Entries of the markdown schedule and warnings for lines that could not be used"""
+    entries, warnings = [], []
+    current_month = None
+    for number, line in enumerate(text.splitlines(), 1):
+        if line.startswith('## '):
+            match = MONTH_RE.match(line)
+            if match:
+                current_month = match.group(1)
+        elif line.startswith('- **'):
+            match = ENTRY_RE.match(line)
+            if not match or not current_month:
+                warnings.append(f"line {number}: not a dated entry under a month header")
+                continue
+            day, title = match.group(1), match.group(2).strip()
+            try:
+                date = datetime.strptime(f"{current_month} {day.split()[-1]}", "%B %Y %d").strftime("%Y-%m-%d")
+            except ValueError:
+                warnings.append(f"line {number}: bad date '{day}' in {current_month}")
+                continue
+            entries.append({
+                'date': date,
+                'title': title,
+                'url': generate_url_from_title(title),
+                'category': determine_category(title),
+                'description': generate_description(title),
+            })
+    return entries, warnings
+
+
+def parse_data(data, path=SCHEDULE_DATA):
+    """Entries of the JSON schedule; raises ScheduleError on a malformed entry"""
+    entries = []
+    for position, post in enumerate(data.get('posts', [])):
+        where = f"{path} entry {position}"
+        if not isinstance(post, dict) or not post.get('title'):
+            raise ScheduleError(f"{where}: needs at least a date and a title")
+        date = str(post.get('date', ''))
+        if not DATE_RE.match(date):
+            raise ScheduleError(f"{where}: bad date '{date}'")
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+        except ValueError:
+            raise ScheduleError(f"{where}: bad date '{date}'") from None
+        url = post.get('url') or generate_url_from_title(post['title'])
+        if not SLUG_RE.match(url):
+            raise ScheduleError(f"{where}: bad url '{url}'")
+        entries.append({
+            'date': date,
+            'title': post['title'],
+            'url': url,
+            'category': post.get('category') or determine_category(post['title']),
+            'description': post.get('description') or generate_description(post['title']),
+        })
+    return entries
+
+
+def compile_entries(markdown_entries, data_entries):
+    """Merge the sources into one list sorted by date, each url once.
+
+    A url in the data file replaces the markdown's entry for it; a url
+    scheduled twice keeps its earliest date. Returns (entries, warnings).
+    """
+    explicit = {entry['url'] for entry in data_entries}
+    merged = [entry for entry in markdown_entries if entry['url'] not in explicit] + data_entries
+    # sorted() is stable, so entries on the same day keep their source order
+    merged.sort(key=lambda entry: entry['date'])
+
+    entries, warnings, seen = [], [], {}
+    for entry in merged:
+        if entry['url'] in seen:
+            if entry['date'] != seen[entry['url']]:
+                warnings.append(f"{entry['url']} is scheduled on {seen[entry['url']]} and {entry['date']}; "
+                                f"keeping {seen[entry['url']]}")
+            continue
+        seen[entry['url']] = entry['date']
+        entries.append(entry)
+    return entries, warnings
+
+
+def read_source(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+class Schedule:
+    """Schedule entries sorted by date, with binary-search lookups by day"""
+
+    def __init__(self, entries, warnings=()):
+        self.entries = entries
+        self.dates = [entry['date'] for entry in entries]
+        self.warnings = list(warnings)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def due(self, day):
+        """Entries scheduled on or before day (YYYY-MM-DD), oldest first"""
+        return self.entries[:bisect.bisect_right(self.dates, day)]
+
+    def on(self, day):
+        """Entries scheduled on day"""
+        return self.entries[bisect.bisect_left(self.dates, day):bisect.bisect_right(self.dates, day)]
+
+    def after(self, day):
+        """Entries scheduled after day"""
+        return self.entries[bisect.bisect_right(self.dates, day):]
+
+
+def load_schedule(markdown_path=SCHEDULE_MARKDOWN, data_path=SCHEDULE_DATA, cache_path=SCHEDULE_CACHE_FILE,
+                  save=True):
+    """The compiled schedule, recompiling and (optionally) caching it when a source changed"""
+    markdown, data = read_source(markdown_path), read_source(data_path)
+    source = hash_bytes(json.dumps([markdown, data, hash_file(__file__)]))
+
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('version') == SCHEDULE_CACHE_VERSION and cached.get('source') == source:
+            return Schedule(cached['entries'], cached.get('warnings', ()))
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    markdown_entries, warnings = parse_markdown(markdown) if markdown is not None else ([], [])
+    try:
+        data_entries = parse_data(json.loads(data), data_path) if data is not None else []
+    except json.JSONDecodeError as e:
+        raise ScheduleError(f"{data_path}: {e}") from None
+    entries, merge_warnings = compile_entries(markdown_entries, data_entries)
+    schedule = Schedule(entries, warnings + merge_warnings)
+    if save:
+        write_if_changed(cache_path, json.dumps({
+            'version': SCHEDULE_CACHE_VERSION,
+            'source': source,
+            'entries': schedule.entries,
+            'warnings': schedule.warnings,
+        }, indent=1, ensure_ascii=False) + '\n')
+    return schedule
+
+
+@functools.lru_cache(maxsize=None)
+def shared_schedule():
+    """One compiled schedule per process"""
+    return load_schedule()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the blog publishing schedule")
+    parser.add_argument('--markdown', default=SCHEDULE_MARKDOWN, help="markdown schedule")
+    parser.add_argument('--data', default=SCHEDULE_DATA, help="JSON schedule")
+    parser.add_argument('--cache', default=SCHEDULE_CACHE_FILE, help="path of the compiled cache")
+    parser.add_argument('--show', action='store_true', help="list every entry")
+    parser.add_argument('--due', metavar='DATE', help="list the entries due on or before DATE")
+    args = parser.parse_args()
+
+    try:
+        schedule = load_schedule(args.markdown, args.data, args.cache)
+    except ScheduleError as e:
+        print(f"❌ {e}")
+        return 1
+
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    print(f"📅 Blog schedule: {len(schedule)} entries "
+          f"({len(schedule.due(today))} due by {today}, {len(schedule.after(today))} upcoming)")
+    for warning in schedule.warnings:
+        print(f"⚠️  {warning}")
+    listed = schedule.due(args.due) if args.due else schedule.entries if args.show else []
+    if listed:
+        print("=" * 60)
+        for entry in listed:
+            print(f"{entry['date']}  /blog/{entry['url']}/  {entry['title']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Build profiler for StableCoin Hub scripts.
+
+While a profile is active every stage records its wall time, CPU time,
+the bytes it read and wrote through open(), and the time spent in the re
+module. The results are written as a Chrome trace (open it in
+chrome://tracing or https://ui.perfetto.dev) and summarised as the slowest
+stages and files.
+
+Scripts mark their stages with stage(), which costs nothing when no profile
+is active:
+
+    with stage('listings'):
+        build_listings(index=blog_index)
+
+Posts rendered through render_pipeline become one 'file' event each, in
+worker processes too (when workers are forked, as on Linux).
+
+Any entry point can be profiled from here; site_build, publish_planner and
+the render_pipeline scripts also take --profile themselves. Patterns
+compiled before the profile started (at import time of an already loaded
+module) are not counted as regex time.
+
+Usage:
+    python build_profiler.py build --force              # site_build.main with its own arguments
+    python build_profiler.py validate --top 20          # BlogQualityValidator.validate_all_blogs
+    python build_profiler.py --trace t.json beautify -j 4
+    python build_profiler.py some_module:function
+    python site_build.py --profile [TRACE]
+"""
+
+import builtins
+import contextlib
+import importlib
+import io
+import json
+import os
+import re
+import sys
+import time
+
+DEFAULT_TRACE = '.cache/profile-trace.json'
+DEFAULT_TOP = 10
+
+# Command name -> "module:function"; a "Class.method" path is called on a new instance
+ENTRY_POINTS = {
+    'build': 'site_build:main',
+    'beautify': 'beautify_blogs:main',
+    'restore': 'restore_all_blogs:main',
+    'render': 'render_pipeline:main',
+    'fix-posts': 'fix_blog_posts:main',
+    'seo': 'fix_all_seo_issues:main',
+    'validate': 'blog_quality_validator:BlogQualityValidator.validate_all_blogs',
+    'publish': 'publish_planner:main',
+    'search': 'search_index:main',
+    'listings': 'blog_listing:main',
+    'css': 'tailwind_build:main',
+    'links': 'link_checker:main',
+    'sitemap': 'sitemap_writer:main',
+}
+
+# re functions timed as regex work; finditer only covers building the iterator
+REGEX_FUNCTIONS = ('match', 'search', 'fullmatch', 'sub', 'subn', 'split', 'findall', 'finditer')
+
+COUNTERS = ('wall', 'cpu', 'read', 'written', 'regex')
+
+ENTRY_POINT_RE = re.compile(r'[A-Za-z_][\w.]*:[A-Za-z_][\w.]*')
+
+_active = None
+
+
+class _CountingFile:
+    """File object wrapper adding what passes through it to the profiler's I/O counters"""
+
+    def __init__(self, f, profiler):
+        self._file = f
+        self._profiler = profiler
+
+    @staticmethod
+    def _size(data):
+        return len(data) if isinstance(data, (bytes, bytearray)) else len(data.encode('utf-8', 'surrogatepass'))
+
+    def read(self, *args):
+        data = self._file.read(*args)
+        self._profiler.read_bytes += self._size(data)
+        return data
+
+    def readline(self, *args):
+        data = self._file.readline(*args)
+        self._profiler.read_bytes += self._size(data)
+        return data
+
+    def readlines(self, *args):
+        lines = self._file.readlines(*args)
+        self._profiler.read_bytes += sum(self._size(line) for line in lines)
+        return lines
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self._file)
+        self._profiler.read_bytes += self._size(line)
+        return line
+
+    def write(self, data):
+        self._profiler.written_bytes += self._size(data)
+        return self._file.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def __enter__(self):
+        self._file.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._file.__exit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+class _TimedPattern:
+    """Compiled pattern whose matching methods count as regex time"""
+
+    def __init__(self, pattern, profiler):
+        self._pattern = pattern
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        attr = getattr(self._pattern, name)
+        if name in REGEX_FUNCTIONS:
+            return self._profiler.timed_regex(attr)
+        return attr
+
+
+class Profiler:
+    """Counters, stage events and the open()/re patches of one profiled run"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events = []
+        self.read_bytes = 0
+        self.written_bytes = 0
+        self.regex_seconds = 0.0
+        self._regex_depth = 0
+        self._originals = []
+
+    def snapshot(self):
+        return {'wall': time.perf_counter(), 'cpu': time.process_time(), 'read': self.read_bytes,
+                'written': self.written_bytes, 'regex': self.regex_seconds}
+
+    def add_event(self, name, category, start, measured, tid=None, **args):
+        """Record a finished stage: start is a perf_counter value, measured the counter deltas"""
+        self.events.append({
+            'name': name, 'cat': category, 'ph': 'X', 'pid': self.pid, 'tid': tid or self.pid,
+            'ts': round((start - self.origin) * 1e6, 1), 'dur': round(measured['wall'] * 1e6, 1),
+            'args': dict(args, cpu_ms=round(measured['cpu'] * 1000, 3), regex_ms=round(measured['regex'] * 1000, 3),
+                         read_bytes=measured['read'], written_bytes=measured['written']),
+        })
+
+    @contextlib.contextmanager
+    def stage(self, name, category='stage', **args):
+        before = self.snapshot()
+        try:
+            yield
+        finally:
+            after = self.snapshot()
+            self.add_event(name, category, before['wall'],
+                           {key: after[key] - before[key] for key in COUNTERS}, **args)
+
+    def timed_regex(self, func):
+        def timed(*args, **kwargs):
+            # Replacement callbacks may use re themselves; only the outermost call is timed
+            if self._regex_depth:
+                return func(*args, **kwargs)
+            self._regex_depth += 1
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.regex_seconds += time.perf_counter() - started
+                self._regex_depth -= 1
+        return timed
+
+    def _patch(self, owner, name, replacement):
+        self._originals.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+
+    def install(self):
+        real_open = io.open
+
+        def counting_open(*args, **kwargs):
+            return _CountingFile(real_open(*args, **kwargs), self)
+
+        self._patch(builtins, 'open', counting_open)
+        self._patch(io, 'open', counting_open)
+
+        for name in REGEX_FUNCTIONS:
+            func = getattr(re, name)
+            self._patch(re, name, self.timed_regex(
+                lambda pattern, *args, _func=func, **kwargs: _func(
+                    pattern._pattern if isinstance(pattern, _TimedPattern) else pattern, *args, **kwargs)))
+
+        real_compile = re.compile
+        self._patch(re, 'compile', lambda pattern, flags=0: _TimedPattern(
+            real_compile(pattern._pattern if isinstance(pattern, _TimedPattern) else pattern, flags), self))
+
+    def uninstall(self):
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+    def trace(self):
+        """The run as a Chrome trace event document"""
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': self.pid,
+                     'args': {'name': ' '.join([os.path.basename(sys.argv[0])] + sys.argv[1:])}}]
+        return {'traceEvents': metadata + self.events, 'displayTimeUnit': 'ms'}
+
+    def slowest(self, category, top):
+        return sorted((event for event in self.events if event['cat'] == category),
+                      key=lambda event: event['dur'], reverse=True)[:top]
+
+
+def stage(name, category='stage', **args):
+    """Context manager recording a stage of the active profile (a no-op when not profiling)"""
+    if _active is None:
+        return contextlib.nullcontext()
+    return _active.stage(name, category, **args)
+
+
+def snapshot():
+    """Counters of the active profile, or None when not profiling"""
+    return _active.snapshot() if _active is not None else None
+
+
+def measured_since(before):
+    """Counter deltas since a snapshot(), plus its start time and this process id.
+
+    A plain dict, so worker processes can hand it back with their results.
+    """
+    after = _active.snapshot()
+    measured = {key: after[key] - before[key] for key in COUNTERS}
+    measured.update(start=before['wall'], pid=os.getpid())
+    return measured
+
+
+def record_results(results):
+    """Add a 'file' event for every render_pipeline result carrying a measurement"""
+    if _active is None:
+        return
+    for result in results:
+        measured = result.get('profile')
+        if measured:
+            _active.add_event(result['slug'], 'file', measured['start'], measured, tid=measured['pid'],
+                              status=result['status'], output_bytes=result['bytes'])
+
+
+def print_summary(profiler, top=DEFAULT_TOP):
+    """Print totals and the slowest stages and files"""
+    def row(event):
+        args = event['args']
+        return (f"   {event['dur'] / 1000:9.1f} ms  cpu {args['cpu_ms']:9.1f} ms  re {args['regex_ms']:8.1f} ms  "
+                f"r {args['read_bytes'] / 1024:8.1f} KB  w {args['written_bytes'] / 1024:8.1f} KB  {event['name']}")
+
+    print("\n" + "=" * 60)
+    print(f"⏱️  Profile: {time.perf_counter() - profiler.origin:.2f}s wall, {time.process_time():.2f}s CPU, "
+          f"{profiler.regex_seconds:.2f}s in re, {profiler.read_bytes / 1024:,.0f} KB read, "
+          f"{profiler.written_bytes / 1024:,.0f} KB written")
+    for category, label in (('stage', 'stages'), ('file', 'files')):
+        slowest = profiler.slowest(category, top)
+        if slowest:
+            print(f"\n🐢 Slowest {len(slowest)} {label}:")
+            for event in slowest:
+                print(row(event))
+
+
+def write_trace(profiler, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(profiler.trace(), f, separators=(',', ':'))
+    print(f"\n📈 Chrome trace: {path} ({len(profiler.events)} events)")
+
+
+@contextlib.contextmanager
+def profiled(trace_path, name, top=DEFAULT_TOP):
+    """Profile the enclosed block as stage name when trace_path is set, then write
+    the trace and print the summary (even if the block fails or exits)"""
+    global _active
+    if not trace_path or _active is not None:
+        yield _active
+        return
+
+    profiler = Profiler()
+    profiler.install()
+    _active = profiler
+    try:
+        with profiler.stage(name):
+            yield profiler
+    finally:
+        _active = None
+        profiler.uninstall()
+        print_summary(profiler, top)
+        write_trace(profiler, trace_path)
+
+
+def add_profile_argument(parser):
+    """Add the --profile [TRACE] option"""
+    parser.add_argument('--profile', nargs='?', const=DEFAULT_TRACE, metavar='TRACE',
+                        help=f"record a Chrome trace and print the slowest stages (default file: {DEFAULT_TRACE})")
+    return parser
+
+
+class EntryPointError(ValueError):
+    """Raised for a command that is neither in ENTRY_POINTS nor a callable "module:function" path"""
+
+
+def resolve_entry_point(target):
+    """Callable for a command name from ENTRY_POINTS or a "module:function" path"""
+    spec = ENTRY_POINTS.get(target, target)
+    if not ENTRY_POINT_RE.fullmatch(spec):
+        raise EntryPointError(f"Unknown command {target!r}: not one of the commands or a module:function path")
+    module_name, path = spec.split(':')
+    try:
+        obj = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name != module_name:
+            raise
+        raise EntryPointError(f"No module named {module_name!r}") from None
+    for part in path.split('.'):
+        if isinstance(obj, type):
+            obj = obj()
+        try:
+            obj = getattr(obj, part)
+        except AttributeError:
+            raise EntryPointError(f"{module_name} has no {path!r}") from None
+    if not callable(obj):
+        raise EntryPointError(f"{spec} is not callable")
+    return obj
+
+
+def print_usage():
+    print(__doc__.strip())
+    print("\nCommands: " + ", ".join(sorted(ENTRY_POINTS)))
+
+
+def main():
+    # Options before the command belong to the profiler, the rest to the command
+    argv = sys.argv[1:]
+    trace_path, top = DEFAULT_TRACE, DEFAULT_TOP
+    while argv and argv[0] in ('--trace', '--top'):
+        if len(argv) < 2:
+            break
+        if argv[0] == '--trace':
+            trace_path = argv[1]
+        else:
+            top = int(argv[1])
+        argv = argv[2:]
+    if not argv or argv[0].startswith('-'):
+        print_usage()
+        return 2
+
+    command, rest = argv[0], argv[1:]
+    if command not in ENTRY_POINTS and not ENTRY_POINT_RE.fullmatch(command):
+        print(f"❌ Unknown command: {command}\n")
+        print_usage()
+        return 2
+
+    sys.argv = [command] + rest
+    with profiled(trace_path, command, top):
+        # Imports happen inside the profile, so module-level patterns are timed as well
+        with stage('import', target=ENTRY_POINTS.get(command, command)):
+            try:
+                entry = resolve_entry_point(command)
+            except EntryPointError as e:
+                entry, error = None, e
+        if entry is not None:
+            try:
+                result = entry()
+            except SystemExit as e:
+                result = e.code
+    if entry is None:
+        print(f"❌ {error}\n")
+        print_usage()
+        return 2
+    if isinstance(result, bool):
+        return 0 if result else 1
+    return result if isinstance(result, int) else 0
+
+
+if __name__ == "__main__":
+    # Run as the importable module so stage() in the profiled code sees the same profile
+    import build_profiler
+    sys.exit(build_profiler.main())
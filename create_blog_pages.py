@@ -3,6 +3,9 @@ import os
 import re
 from datetime import datetime
 
+from related_posts import related_posts
+from tailwind_build import stylesheet_tag
+
 # Blog post data with proper URLs and cross-links
 blog_posts = [
     {
@@ -176,7 +179,7 @@ blog_template = """<!DOCTYPE html>
     <title>{title} - StableCoin Hub</title>
     <meta name="description" content="{description}">
     <link rel="canonical" href="https://www.stablecoinhub.pro/blog/{url}/">
-    <script src="https://cdn.tailwindcss.com"></script>
+    {stylesheet}
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
     <!-- Google tag (gtag.js) -->
     <script async src="https://www.googletagmanager.com/gtag/js?id=G-GX6EB7DSFL"></script>
@@ -328,19 +331,24 @@ blog_template = """<!DOCTYPE html>
 </body>
 </html>"""
 
+# Posts by URL slug, for the hand-picked fallback links
+posts_by_url = {post['url']: post for post in blog_posts}
+
 # Create related articles HTML
-def create_related_articles(related_urls):
+def create_related_articles(post):
+    related = [(p['slug'], p['title'], p['category']) for p in related_posts(post['url'])]
+    if not related:
+        # Not in the related-articles index yet: use the hand-picked links
+        related = [(url, posts_by_url[url]['title'], posts_by_url[url]['category'])
+                   for url in post.get('related', []) if url in posts_by_url]
     html = ""
-    for url in related_urls:
-        # Find the related post
-        related_post = next((p for p in blog_posts if p['url'] == url), None)
-        if related_post:
-            html += f"""
+    for url, title, category in related:
+        html += f"""
                 <a href="/blog/{url}/" class="block bg-white rounded-lg p-4 border hover:shadow-md transition">
                     <h3 class="font-semibold text-gray-900 mb-1 text-sm hover:text-indigo-600">
-                        {related_post['title'].split(':')[0]}
+                        {title.split(':')[0]}
                     </h3>
-                    <p class="text-gray-600 text-xs">{related_post['category']}</p>
+                    <p class="text-gray-600 text-xs">{category}</p>
                 </a>
             """
     return html
@@ -352,13 +360,14 @@ for post in blog_posts:
     os.makedirs(dir_path, exist_ok=True)
 
     # Generate related articles HTML
-    related_html = create_related_articles(post.get('related', []))
+    related_html = create_related_articles(post)
 
     # Generate breadcrumb title (shortened)
     breadcrumb = post['title'].split(':')[0] if ':' in post['title'] else post['title'][:30] + "..."
 
     # Create the HTML content
     html_content = blog_template.format(
+        stylesheet=stylesheet_tag(),
         title=post['title'],
         description=post['description'],
         url=post['url'],
@@ -2,6 +2,12 @@
 import os
 import re
 import glob
+import argparse
+
+from related_posts import related_posts
+from render_errors import SkipPost
+from render_pipeline import add_pipeline_arguments, run
+from tailwind_build import stylesheet_tag
 
 # The beautiful template with all the nice design elements
 BLOG_TEMPLATE = """<!DOCTYPE html>
@@ -12,7 +18,7 @@ BLOG_TEMPLATE = """<!DOCTYPE html>
     <title>{title} - StableCoin Hub</title>
     <meta name="description" content="{description}">
     <link rel="canonical" href="https://www.stablecoinhub.pro/blog/{url}/">
-    <script src="https://cdn.tailwindcss.com"></script>
+    {stylesheet}
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
     <!-- Google tag (gtag.js) -->
     <script async src="https://www.googletagmanager.com/gtag/js?id=G-GX6EB7DSFL"></script>
@@ -233,35 +239,32 @@ BLOG_METADATA = {
     'stablecoin-monthly-recap': {'date': 'August 23, 2025', 'date_iso': '2025-08-23', 'categories': ['News', 'Recap']}
 }
 
-# Related articles mapping
-RELATED_ARTICLES = {
-    'default': [
-        {'url': '/blog/what-is-stablecoin/', 'title': 'What Is a Stablecoin?', 'desc': 'Complete Beginner Guide'},
-        {'url': '/blog/best-stablecoin-wallets/', 'title': 'Best Wallets', 'desc': 'Store Safely'},
-        {'url': '/blog/earn-interest-on-crypto/', 'title': 'Earn Yield', 'desc': 'Passive Income'}
-    ]
-}
+# Shown when the related-articles index has nothing for a post
+DEFAULT_RELATED = [
+    {'url': '/blog/what-is-stablecoin/', 'title': 'What Is a Stablecoin?', 'desc': 'Complete Beginner Guide'},
+    {'url': '/blog/best-stablecoin-wallets/', 'title': 'Best Wallets', 'desc': 'Store Safely'},
+    {'url': '/blog/earn-interest-on-crypto/', 'title': 'Earn Yield', 'desc': 'Passive Income'}
+]
 
 def get_related_articles(url_slug):
     """Get related articles for a blog post"""
-    # Return default for now - can be customized per post
-    return RELATED_ARTICLES['default']
+    related = [
+        {'url': post['url'], 'title': post['title'].split(':')[0], 'desc': post['category']}
+        for post in related_posts(url_slug)
+    ]
+    return related or DEFAULT_RELATED
 
-def create_blog_post(md_file):
-    """Create HTML for a blog post"""
+def render_missing_post(md_file):
+    """Render HTML for a blog post that has no page yet, returning (html_file, html)"""
     # Get URL slug from filename
     filename = os.path.basename(md_file)
     url_slug = re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
 
-    # Create directory if needed
-    blog_dir = f'blog/{url_slug}'
-    os.makedirs(blog_dir, exist_ok=True)
-
-    html_file = f'{blog_dir}/index.html'
+    html_file = f'blog/{url_slug}/index.html'
 
     # Check if already exists
     if os.path.exists(html_file):
-        return False, f"Already exists: {html_file}"
+        raise SkipPost(f"Already exists: {html_file}")
 
     # Read original markdown
     with open(md_file, 'r') as f:
@@ -272,7 +275,7 @@ def create_blog_post(md_file):
     desc_match = re.search(r'description:\s*"([^"]+)"', original_md)
 
     if not title_match:
-        return False, "No title found in markdown"
+        raise SkipPost("No title found in markdown")
 
     title = title_match.group(1)
     description = desc_match.group(1) if desc_match else "Comprehensive guide for the stablecoin ecosystem."
@@ -339,6 +342,7 @@ def create_blog_post(md_file):
 
     # Create final HTML
     final_html = BLOG_TEMPLATE.format(
+        stylesheet=stylesheet_tag(),
         title=title,
         description=description,
         url=url_slug,
@@ -349,21 +353,24 @@ def create_blog_post(md_file):
         content=html_content
     )
 
-    # Write the file
+    return html_file, final_html
+
+def create_blog_post(md_file):
+    """Create HTML for a blog post"""
+    try:
+        html_file, final_html = render_missing_post(md_file)
+    except SkipPost as e:
+        return False, str(e)
+
+    # Write the file (creating the directory if needed)
+    os.makedirs(os.path.dirname(html_file), exist_ok=True)
     with open(html_file, 'w') as f:
         f.write(final_html)
 
     return True, "Created"
 
-# Main execution
-print("Creating missing blog HTML files with EXACT original content...")
-print("=" * 60)
-
-# Get all markdown files
-md_files = glob.glob('blog/_posts/*.md')
-
 # List of blog posts to create
-missing_posts = [
+MISSING_POSTS = [
     'usdc-vs-usdt-complete-guide',
     'are-stablecoins-good-investment',
     'euro-stablecoins',
@@ -406,21 +413,33 @@ missing_posts = [
     'stablecoin-monthly-recap'
 ]
 
-created_count = 0
-for md_file in sorted(md_files):
-    filename = os.path.basename(md_file)
-    url_slug = re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
+def main():
+    parser = argparse.ArgumentParser(description="Create blog pages that are missing for blog/_posts")
+    add_pipeline_arguments(parser)
+    args = parser.parse_args()
 
-    if url_slug in missing_posts:
-        success, message = create_blog_post(md_file)
-        if success:
-            print(f"✅ Created: {url_slug}")
-            created_count += 1
-        else:
-            print(f"⚠️  Skipped {url_slug}: {message}")
+    print("Creating missing blog HTML files with EXACT original content...")
+    print("=" * 60)
+
+    # Get all markdown files
+    md_files = glob.glob('blog/_posts/*.md')
+
+    to_create = []
+    for md_file in sorted(md_files):
+        filename = os.path.basename(md_file)
+        url_slug = re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
+        if url_slug in MISSING_POSTS:
+            to_create.append(md_file)
+
+    results = run(render_missing_post, to_create, jobs=args.jobs, timings=args.timings,
+                  profile=args.profile)
+    created_count = sum(1 for r in results if r['status'] == 'written')
+
+    print("\n" + "=" * 60)
+    print(f"✅ Successfully created {created_count} missing blog posts")
+    print("   - EXACT original content preserved")
+    print("   - Beautiful design elements included")
+    print("   - Proper URLs and navigation")
 
-print("\n" + "=" * 60)
-print(f"✅ Successfully created {created_count} missing blog posts")
-print("   - EXACT original content preserved")
-print("   - Beautiful design elements included")
-print("   - Proper URLs and navigation")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
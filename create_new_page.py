@@ -9,6 +9,8 @@ import os
 import sys
 from pathlib import Path
 
+from tailwind_build import stylesheet_tag
+
 def create_html_template(page_path, title, description):
     """Generate HTML template with all SEO optimizations"""
 
@@ -48,7 +50,7 @@ def create_html_template(page_path, title, description):
     <link rel="canonical" href="{canonical_url}">
 
     <!-- Stylesheets -->
-    <script src="https://cdn.tailwindcss.com"></script>
+    {stylesheet_tag()}
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
 
     <!-- SEO & Redirect Script -->
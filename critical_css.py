@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Critical CSS for StableCoin Hub pages.
+
+Every page links the generated Tailwind stylesheet and Font Awesome from
+<head>, and the browser renders nothing until both have loaded. This stage
+inlines the Tailwind rules the top of each page needs and loads both
+stylesheets without blocking rendering:
+
+    <style data-critical="3f9c0e1a2b4d">...preflight + above-the-fold utilities...</style>
+    <link rel="stylesheet" href="/assets/css/tailwind.<hash>.css" media="print" onload="this.media='all'"><noscript>...</noscript>
+
+The fold is the first FOLD_ELEMENTS start tags of <body>. Its skeleton
+(tag names and class attributes, in order, without text or other
+attributes) is the template fingerprint: blog posts rendered from the same
+layout share it, so the critical CSS is generated once per template, not
+per page, and kept in .cache/critical-css.json until the utility table or
+the generator changes. Font Awesome comes from a CDN and is only deferred;
+icons above the fold appear when it loads.
+
+Re-running is safe: the inlined block and the deferred links are rebuilt
+from the current stylesheet link, also after tailwind_build.py relinked a
+page. Pages without the generated stylesheet (still on the Tailwind CDN
+script) are left alone.
+
+Usage:
+    python critical_css.py              # inline critical CSS into every page
+    python critical_css.py --dry-run    # report what would change
+    python critical_css.py --force      # regenerate cached critical CSS
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+import tailwind_build
+import tailwind_utilities
+from seo_document import find_html_files
+from site_build import LAYOUTS_DIR, hash_bytes, hash_file, write_if_changed
+from tailwind_build import CLASS_ATTR_RE, generate_css
+
+CRITICAL_CACHE_FILE = '.cache/critical-css.json'
+CRITICAL_CACHE_VERSION = 1
+
+# Start tags of <body> counted as above the fold (nav, breadcrumb, header and the first paragraphs of a post)
+FOLD_ELEMENTS = 40
+
+START_TAG_RE = re.compile(r'<([A-Za-z][\w-]*)\b((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>')
+BODY_RE = re.compile(r'<body\b', re.IGNORECASE)
+# Stylesheets loaded asynchronously: the generated Tailwind sheet (covered by the
+# inlined rules) and Font Awesome. A <noscript> fallback written earlier comes along.
+DEFERRED_LINK_RE = re.compile(
+    r'<link\b(?=[^>]*\brel=["\']?stylesheet\b)[^>]*\bhref=(["\']?)'
+    r'(/assets/css/tailwind\.[0-9a-f]+\.css|https://cdnjs\.cloudflare\.com/ajax/libs/font-awesome/[^"\'\s>]+)'
+    r'\1[^>]*>(?:<noscript><link\b[^>]*></noscript>)?'
+)
+CRITICAL_STYLE_RE = re.compile(r'<style\b[^>]*\bdata-critical\b[^>]*>.*?</style>\n?[ \t]*', re.DOTALL)
+
+
+def page_kind(path, root='.'):
+    """Which template family a page belongs to, for the summary"""
+    relative = os.path.relpath(path, root).replace(os.sep, '/')
+    if relative == 'index.html':
+        return 'homepage'
+    if relative == 'blog/index.html' or relative.startswith('blog/page/'):
+        return 'blog index'
+    if relative.startswith('blog/') and relative.count('/') == 2:
+        return 'blog post'
+    return 'static page'
+
+
+def fold_skeleton(content):
+    """Tag names and class lists of the <body> and its first FOLD_ELEMENTS start tags"""
+    body = BODY_RE.search(content)
+    if body is None:
+        return []
+    skeleton = []
+    for match in START_TAG_RE.finditer(content, body.start()):
+        classes = [m.group(2) if m.group(1) else m.group(3) for m in CLASS_ATTR_RE.finditer(match.group(2))]
+        skeleton.append((match.group(1).lower(), ' '.join(' '.join(classes).split())))
+        if len(skeleton) > FOLD_ELEMENTS:
+            break
+    return skeleton
+
+
+def compact_css(css):
+    """generate_css output on one line, without its header comment"""
+    return ''.join(line.strip() for line in css.splitlines() if line.strip() and not line.startswith('/*'))
+
+
+def critical_css(skeleton):
+    """Preflight and the utilities the skeleton's classes use"""
+    classes = {name for _, class_list in skeleton for name in class_list.split()}
+    css, _ = generate_css(classes)
+    return compact_css(css)
+
+
+def deferred_link(href):
+    return (f'<link rel="stylesheet" href="{href}" media="print" onload="this.media=\'all\'">'
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+
+
+def inline_critical(content, css_for):
+    """Page content with critical CSS inlined before its deferred stylesheets.
+
+    css_for(skeleton) returns (fingerprint, css). Returns (content, fingerprint),
+    fingerprint None for pages without the generated stylesheet.
+    """
+    content = CRITICAL_STYLE_RE.sub('', content)
+    links = list(DEFERRED_LINK_RE.finditer(content))
+    if not any(match.group(2).startswith('/assets/') for match in links):
+        return content, None
+
+    fingerprint, css = css_for(fold_skeleton(content))
+    first = links[0]
+    line_start = content.rfind('\n', 0, first.start()) + 1
+    indent = content[line_start:first.start()] if not content[line_start:first.start()].strip() else ''
+    pieces, position = [], 0
+    for match in links:
+        pieces.append(content[position:match.start()])
+        if match is first:
+            pieces.append(f'<style data-critical="{fingerprint}">{css}</style>\n{indent}')
+        pieces.append(deferred_link(match.group(2)))
+        position = match.end()
+    pieces.append(content[position:])
+    return ''.join(pieces), fingerprint
+
+
+def generator_hash():
+    """Hash of the code the critical CSS is generated by"""
+    return hash_bytes(''.join(hash_file(module.__file__) for module in (tailwind_utilities, tailwind_build)) +
+                      hash_file(__file__))
+
+
+class CriticalCache:
+    """Critical CSS per template fingerprint"""
+
+    def __init__(self, path=CRITICAL_CACHE_FILE, force=False):
+        self.path = path
+        self.generator = generator_hash()
+        self.templates = {}
+        self.used = set()
+        self.computed = 0
+        if force:
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == CRITICAL_CACHE_VERSION and data.get('generator') == self.generator:
+            self.templates = data.get('templates', {})
+
+    def css_for(self, skeleton, kind=None):
+        """(fingerprint, css) of a fold skeleton, generated only for a new template"""
+        fingerprint = hash_bytes(json.dumps(skeleton))[:12]
+        if fingerprint not in self.templates:
+            css = critical_css(skeleton)
+            self.templates[fingerprint] = {'css': css, 'kind': kind, 'bytes': len(css.encode('utf-8'))}
+            self.computed += 1
+        self.used.add(fingerprint)
+        return fingerprint, self.templates[fingerprint]['css']
+
+    def save(self):
+        # Templates no page uses any more are dropped
+        templates = {fingerprint: self.templates[fingerprint] for fingerprint in sorted(self.used)}
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        data = {'version': CRITICAL_CACHE_VERSION, 'generator': self.generator, 'templates': templates}
+        return write_if_changed(self.path, json.dumps(data, indent=1, sort_keys=True) + '\n')
+
+
+def build_critical(root='.', dry_run=False, force=False, cache_path=CRITICAL_CACHE_FILE):
+    """Inline critical CSS into every page under root. Returns a stats dict."""
+    stats = {'pages': 0, 'written': 0, 'skipped': 0, 'templates': 0, 'computed': 0, 'kinds': {}, 'updated': []}
+    cache = CriticalCache(cache_path, force=force)
+
+    for page in find_html_files(root, skip=[LAYOUTS_DIR]):
+        with open(page, 'r', encoding='utf-8') as f:
+            content = f.read()
+        kind = page_kind(page, root)
+        updated, fingerprint = inline_critical(content, lambda skeleton: cache.css_for(skeleton, kind))
+        if fingerprint is None:
+            stats['skipped'] += 1
+            continue
+        stats['pages'] += 1
+        stats['kinds'].setdefault(kind, set()).add(fingerprint)
+        if updated == content:
+            continue
+        stats['written'] += 1
+        if dry_run:
+            print(f"📝 Would inline critical CSS: {os.path.relpath(page, root)}")
+        else:
+            write_if_changed(page, updated)
+            stats['updated'].append(os.path.normpath(page))
+
+    stats['templates'] = len(cache.used)
+    stats['computed'] = cache.computed
+    if not dry_run:
+        cache.save()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inline above-the-fold CSS and load the stylesheets asynchronously")
+    parser.add_argument('--root', default='.', help="site root (default: current directory)")
+    parser.add_argument('--dry-run', action='store_true', help="report changes without writing")
+    parser.add_argument('--force', action='store_true', help="regenerate the critical CSS of every template")
+    args = parser.parse_args()
+
+    print("🎯 Inlining critical CSS...")
+    print("=" * 60)
+    stats = build_critical(args.root, dry_run=args.dry_run, force=args.force)
+    if not stats['pages']:
+        print("⚠️  No page links the generated stylesheet; run tailwind_build.py first")
+    print("=" * 60)
+    print(f"📊 Summary:")
+    print(f"   Pages: {stats['pages']} ({stats['written']} {'to update' if args.dry_run else 'updated'})")
+    print(f"   Templates: {stats['templates']} ({stats['computed']} generated, the rest cached)")
+    for kind, fingerprints in sorted(stats['kinds'].items()):
+        print(f"      {kind}: {len(fingerprints)}")
+    if stats['skipped']:
+        print(f"   Without the generated stylesheet: {stats['skipped']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
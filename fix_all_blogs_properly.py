@@ -3,6 +3,9 @@ import os
 import re
 import glob
 
+from related_posts import related_posts
+from tailwind_build import stylesheet_tag
+
 # Clean, beautiful blog template
 BLOG_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
@@ -12,7 +15,7 @@ BLOG_TEMPLATE = """<!DOCTYPE html>
     <title>{title} - StableCoin Hub</title>
     <meta name="description" content="{description}">
     <link rel="canonical" href="https://www.stablecoinhub.pro/blog/{url}/">
-    <script src="https://cdn.tailwindcss.com"></script>
+    {stylesheet}
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
     <!-- Google tag (gtag.js) -->
     <script async src="https://www.googletagmanager.com/gtag/js?id=G-GX6EB7DSFL"></script>
@@ -260,34 +263,20 @@ def clean_and_convert_markdown(md_content):
 
     return html
 
-# Related articles for different posts
-RELATED_ARTICLES = {
-    'default': [
-        ('best-stablecoin-wallets', 'Best Stablecoin Wallets', 'Security & Features Guide', 'wallet', 'indigo'),
-        ('how-to-buy-stablecoins', 'How to Buy Stablecoins', 'Step-by-step Guide', 'shopping-cart', 'green'),
-        ('stablecoin-comparison', 'Stablecoin Comparison', 'USDT vs USDC vs DAI', 'balance-scale', 'purple')
-    ],
-    'wallets': [
-        ('crypto-card', 'Crypto Debit Cards', 'Spend Your Stablecoins', 'credit-card', 'blue'),
-        ('stablecoin-security', 'Stablecoin Security', 'Protection Guide', 'shield-alt', 'red'),
-        ('how-to-buy-stablecoins', 'Buying Guide', 'Get Started Today', 'shopping-cart', 'green')
-    ],
-    'defi': [
-        ('stablecoin-lending', 'Lending Platforms', 'Earn Passive Income', 'coins', 'yellow'),
-        ('defi-protocols', 'DeFi Protocols', 'Yield Farming Guide', 'chart-line', 'indigo'),
-        ('stablecoin-risks', 'Understanding Risks', 'Stay Safe', 'exclamation-triangle', 'red')
-    ]
-}
+# Shown when the related-articles index has nothing for a post; the icons and
+# colours also style the cards related_posts picks, in order
+DEFAULT_RELATED = [
+    ('best-stablecoin-wallets', 'Best Stablecoin Wallets', 'Security & Features Guide', 'wallet', 'indigo'),
+    ('how-to-buy-stablecoins', 'How to Buy Stablecoins', 'Step-by-step Guide', 'shopping-cart', 'green'),
+    ('stablecoin-comparison', 'Stablecoin Comparison', 'USDT vs USDC vs DAI', 'balance-scale', 'purple')
+]
 
 def get_related_cards(url_slug):
     """Generate related article cards"""
-    # Determine category
-    if 'wallet' in url_slug:
-        articles = RELATED_ARTICLES.get('wallets', RELATED_ARTICLES['default'])
-    elif 'defi' in url_slug or 'yield' in url_slug or 'lend' in url_slug:
-        articles = RELATED_ARTICLES.get('defi', RELATED_ARTICLES['default'])
-    else:
-        articles = RELATED_ARTICLES['default']
+    articles = [
+        (post['slug'], post['title'].split(':')[0], post['category'], icon, color)
+        for post, (_, _, _, icon, color) in zip(related_posts(url_slug), DEFAULT_RELATED)
+    ] or DEFAULT_RELATED
 
     cards = []
     for slug, title, desc, icon, color in articles:
@@ -374,6 +363,7 @@ def fix_blog_post(md_file):
 
     # Generate final HTML
     final_html = BLOG_TEMPLATE.format(
+        stylesheet=stylesheet_tag(),
         title=title,
         description=description,
         url=url_slug,
@@ -4,178 +4,17 @@ Comprehensive script to fix all redirect and canonical URL issues
 """
 
 import os
-import re
-import json
-from pathlib import Path
-
-def fix_vercel_json():
-    """Update vercel.json with comprehensive redirect rules"""
-    vercel_config = {
-        "redirects": [
-            # Non-www to www redirects
-            {
-                "source": "/(.*)",
-                "has": [{"type": "host", "value": "stablecoinhub.pro"}],
-                "destination": "https://www.stablecoinhub.pro/$1",
-                "permanent": True
-            },
-            # Blog subdomain redirects
-            {
-                "source": "/(.*)",
-                "has": [{"type": "host", "value": "blog.stablecoinhub.pro"}],
-                "destination": "https://www.stablecoinhub.pro/blog/$1",
-                "permanent": True
-            },
-            # Handle common index patterns
-            {
-                "source": "/index.html",
-                "destination": "/",
-                "permanent": True
-            },
-            {
-                "source": "/:path*/index.html",
-                "destination": "/:path*/",
-                "permanent": True
-            }
-        ],
-        "cleanUrls": True,
-        "trailingSlash": True,
-        "headers": [
-            {
-                "source": "/(.*)",
-                "headers": [
-                    {
-                        "key": "Link",
-                        "value": "<https://www.stablecoinhub.pro/$1>; rel=\"canonical\""
-                    }
-                ]
-            }
-        ]
-    }
-
-    with open('vercel.json', 'w') as f:
-        json.dump(vercel_config, f, indent=2)
-    print("✅ Updated vercel.json with comprehensive redirect rules")
-
-def fix_netlify_toml():
-    """Create comprehensive netlify.toml configuration"""
-    netlify_config = """[[redirects]]
-  from = "https://stablecoinhub.pro/*"
-  to = "https://www.stablecoinhub.pro/:splat"
-  status = 301
-  force = true
-
-[[redirects]]
-  from = "http://stablecoinhub.pro/*"
-  to = "https://www.stablecoinhub.pro/:splat"
-  status = 301
-  force = true
-
-[[redirects]]
-  from = "https://blog.stablecoinhub.pro/*"
-  to = "https://www.stablecoinhub.pro/blog/:splat"
-  status = 301
-  force = true
-
-[[redirects]]
-  from = "http://blog.stablecoinhub.pro/*"
-  to = "https://www.stablecoinhub.pro/blog/:splat"
-  status = 301
-  force = true
-
-# Handle index.html
-[[redirects]]
-  from = "/index.html"
-  to = "/"
-  status = 301
-  force = true
-
-[[redirects]]
-  from = "/*/index.html"
-  to = "/*/"
-  status = 301
-  force = true
-
-[build]
-  publish = "."
-
-[build.processing]
-  skip_processing = false
-
-[build.processing.html]
-  pretty_urls = true
-"""
-
-    with open('netlify.toml', 'w') as f:
-        f.write(netlify_config)
-    print("✅ Updated netlify.toml with comprehensive redirect rules")
-
-def fix_htaccess():
-    """Update .htaccess with comprehensive redirect and parameter handling"""
-    htaccess_content = """# Enable Rewrite Engine
-RewriteEngine On
-
-# Force HTTPS
-RewriteCond %{HTTPS} off
-RewriteRule ^(.*)$ https://www.stablecoinhub.pro/$1 [R=301,L]
-
-# Redirect non-www to www
-RewriteCond %{HTTP_HOST} ^stablecoinhub\.pro$ [NC]
-RewriteRule ^(.*)$ https://www.stablecoinhub.pro/$1 [R=301,L]
-
-# Redirect blog subdomain to main domain blog folder
-RewriteCond %{HTTP_HOST} ^blog\.stablecoinhub\.pro$ [NC]
-RewriteRule ^(.*)$ https://www.stablecoinhub.pro/blog/$1 [R=301,L]
-
-# Remove index.html
-RewriteCond %{THE_REQUEST} ^[A-Z]{3,9}\ /([^/]+/)*index\.html\ HTTP/
-RewriteRule ^(([^/]+/)*)index\.html$ https://www.stablecoinhub.pro/$1 [R=301,L]
-
-# Remove query parameters from URLs (but preserve them internally)
-RewriteCond %{QUERY_STRING} ^utm_source=.*$ [OR]
-RewriteCond %{QUERY_STRING} ^utm_medium=.*$ [OR]
-RewriteCond %{QUERY_STRING} ^utm_campaign=.*$ [OR]
-RewriteCond %{QUERY_STRING} ^utm_term=.*$ [OR]
-RewriteCond %{QUERY_STRING} ^utm_content=.*$ [OR]
-RewriteCond %{QUERY_STRING} ^ref=.*$ [OR]
-RewriteCond %{QUERY_STRING} ^gclid=.*$ [OR]
-RewriteCond %{QUERY_STRING} ^fbclid=.*$
-RewriteRule ^(.*)$ /$1? [R=301,L]
-
-# Add trailing slash to directories
-RewriteCond %{REQUEST_FILENAME} !-f
-RewriteCond %{REQUEST_URI} !(.*)/$
-RewriteRule ^(.*)$ /$1/ [L,R=301]
-"""
 
-    with open('.htaccess', 'w') as f:
-        f.write(htaccess_content)
-    print("✅ Updated .htaccess with comprehensive redirect and parameter handling")
-
-def fix_redirects_file():
-    """Update _redirects file for Netlify"""
-    redirects_content = """# Force www subdomain
-https://stablecoinhub.pro/* https://www.stablecoinhub.pro/:splat 301!
-http://stablecoinhub.pro/* https://www.stablecoinhub.pro/:splat 301!
-
-# Redirect blog subdomain to main domain blog folder
-https://blog.stablecoinhub.pro/* https://www.stablecoinhub.pro/blog/:splat 301!
-http://blog.stablecoinhub.pro/* https://www.stablecoinhub.pro/blog/:splat 301!
-
-# Handle common paths
-/index.html / 301!
-/blog/index.html /blog/ 301!
-/*/index.html /*/ 301!
-
-# Common redirects for SEO
-/blog https://www.stablecoinhub.pro/blog/ 301!
-/about https://www.stablecoinhub.pro/about/ 301!
-/submit https://www.stablecoinhub.pro/submit/ 301!
-"""
+from redirect_rules import canonical_origin, compile_redirects, print_report, write_configs
+from seo_document import HtmlDocument, find_html_files
+from sitemap_writer import generate_sitemap
 
-    with open('_redirects', 'w') as f:
-        f.write(redirects_content)
-    print("✅ Updated _redirects file with comprehensive rules")
+def compile_redirect_configs():
+    """Write vercel.json, netlify.toml, .htaccess and _redirects from data/redirects.json"""
+    compiled = compile_redirects()
+    print_report(compiled)
+    changed = write_configs(compiled)
+    print(f"✅ Compiled redirect rules into {len(changed)} changed config files (see redirect_rules.py)")
 
 def add_canonical_script():
     """Create a JavaScript file for dynamic canonical URL handling"""
@@ -263,131 +102,59 @@ def add_canonical_script():
         f.write(canonical_script)
     print("✅ Created canonical-handler.js for dynamic URL handling")
 
-def fix_html_files():
-    """Update all HTML files with proper canonical tags and scripts"""
-    html_files = []
+def canonical_url_for(rel_path):
+    """Canonical www URL for a page path relative to the site root"""
+    if rel_path.endswith('index.html'):
+        canonical_path = os.path.dirname(rel_path)
+    else:
+        canonical_path = rel_path.replace('.html', '/')
+    return f"{canonical_origin()}/{canonical_path}".rstrip('/') + '/'
+
+def canonical_and_social_pass(doc):
+    """Set the canonical link, og:url and twitter:url and load canonical-handler.js"""
+    canonical_url = canonical_url_for(doc.rel_path)
+    before = doc.content
 
-    # Find all HTML files
-    for root, dirs, files in os.walk('.'):
-        # Skip hidden directories
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
+    # Update or add canonical tag
+    doc.set_canonical(canonical_url)
 
-        for file in files:
-            if file.endswith('.html'):
-                html_files.append(os.path.join(root, file))
+    # Add canonical handler script if not present
+    if 'canonical-handler.js' not in doc.content:
+        doc.insert_before_head_close('    <script src="/canonical-handler.js"></script>\n')
 
-    for file_path in html_files:
+    # Update meta og:url and twitter:url tags
+    doc.set_meta_url('og:url', canonical_url)
+    doc.set_meta_url('twitter:url', canonical_url)
+
+    return doc.content != before
+
+def fix_html_files():
+    """Update all HTML files with proper canonical tags and scripts"""
+    updated_count = 0
+    total_count = 0
+    for file_path in find_html_files('.'):
+        total_count += 1
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Calculate canonical URL
-            rel_path = os.path.relpath(file_path, '.')
-            if rel_path.endswith('index.html'):
-                canonical_path = os.path.dirname(rel_path)
-                if canonical_path == '.':
-                    canonical_path = ''
-            else:
-                canonical_path = rel_path.replace('.html', '/')
-
-            canonical_url = f"https://www.stablecoinhub.pro/{canonical_path}".rstrip('/') + '/'
-            if canonical_url == "https://www.stablecoinhub.pro/":
-                pass  # Keep as is for homepage
-
-            # Update or add canonical tag
-            if '<link rel="canonical"' in content:
-                content = re.sub(
-                    r'<link\s+rel="canonical"\s+href="[^"]*"\s*/?>',
-                    f'<link rel="canonical" href="{canonical_url}">',
-                    content
-                )
-            else:
-                # Add canonical tag after <title> or charset
-                if '</title>' in content:
-                    content = content.replace('</title>', f'</title>\n    <link rel="canonical" href="{canonical_url}">')
-                elif '<meta charset' in content:
-                    content = re.sub(
-                        r'(<meta charset[^>]*>)',
-                        f'\\1\n    <link rel="canonical" href="{canonical_url}">',
-                        content
-                    )
-
-            # Add canonical handler script if not present
-            if 'canonical-handler.js' not in content and '</head>' in content:
-                script_tag = '    <script src="/canonical-handler.js"></script>\n</head>'
-                content = content.replace('</head>', script_tag)
-
-            # Update meta og:url tags
-            if 'property="og:url"' in content:
-                content = re.sub(
-                    r'<meta\s+property="og:url"\s+content="[^"]*"\s*/?>',
-                    f'<meta property="og:url" content="{canonical_url}">',
-                    content
-                )
-
-            # Update twitter:url tags
-            if 'name="twitter:url"' in content:
-                content = re.sub(
-                    r'<meta\s+name="twitter:url"\s+content="[^"]*"\s*/?>',
-                    f'<meta name="twitter:url" content="{canonical_url}">',
-                    content
-                )
-
-            # Write updated content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            print(f"  ✓ Fixed {file_path}")
+            doc = HtmlDocument(file_path)
+            canonical_and_social_pass(doc)
+
+            # Write updated content (untouched pages keep their bytes and mtime)
+            if doc.save():
+                updated_count += 1
+                print(f"  ✓ Fixed {file_path}")
 
         except Exception as e:
             print(f"  ✗ Error fixing {file_path}: {e}")
 
-    print(f"✅ Updated {len(html_files)} HTML files with proper canonical tags")
+    print(f"✅ Updated {updated_count} of {total_count} HTML files with proper canonical tags")
 
 def create_sitemap():
-    """Create an updated sitemap with proper canonical URLs"""
-    sitemap_content = """<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-    <url>
-        <loc>https://www.stablecoinhub.pro/</loc>
-        <changefreq>daily</changefreq>
-        <priority>1.0</priority>
-    </url>
-    <url>
-        <loc>https://www.stablecoinhub.pro/blog/</loc>
-        <changefreq>daily</changefreq>
-        <priority>0.9</priority>
-    </url>
-    <url>
-        <loc>https://www.stablecoinhub.pro/about/</loc>
-        <changefreq>weekly</changefreq>
-        <priority>0.7</priority>
-    </url>
-    <url>
-        <loc>https://www.stablecoinhub.pro/submit/</loc>
-        <changefreq>monthly</changefreq>
-        <priority>0.6</priority>
-    </url>
-"""
-
-    # Add blog posts to sitemap
-    blog_dir = Path('blog')
-    if blog_dir.exists():
-        for blog_path in blog_dir.iterdir():
-            if blog_path.is_dir() and not blog_path.name.startswith('_'):
-                blog_url = f"https://www.stablecoinhub.pro/blog/{blog_path.name}/"
-                sitemap_content += f"""    <url>
-        <loc>{blog_url}</loc>
-        <changefreq>weekly</changefreq>
-        <priority>0.8</priority>
-    </url>
-"""
-
-    sitemap_content += "</urlset>"
-
-    with open('sitemap.xml', 'w') as f:
-        f.write(sitemap_content)
-    print("✅ Created updated sitemap.xml with canonical URLs")
+    """Create an updated sitemap with proper canonical URLs and lastmod dates"""
+    result = generate_sitemap('.')
+    if result['skipped']:
+        print(f"✓ sitemap.xml already up to date ({result['urls']} URLs)")
+    else:
+        print(f"✅ Created updated sitemap.xml with canonical URLs ({result['urls']} URLs)")
 
 def create_robots_txt():
     """Create robots.txt with proper sitemap reference"""
@@ -419,10 +186,7 @@ def main():
     os.chdir('/Users/raymond/Desktop/Stablecoinhub.pro/stablecoinhub-repo')
 
     # Run all fixes
-    fix_vercel_json()
-    fix_netlify_toml()
-    fix_htaccess()
-    fix_redirects_file()
+    compile_redirect_configs()
     add_canonical_script()
     fix_html_files()
     create_sitemap()
@@ -10,7 +10,6 @@ Comprehensive fix for all SEO and blog publishing issues:
 
 import os
 import re
-import json
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 import shutil
@@ -34,6 +33,8 @@ import json
 # Import blog schedule from parent directory
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from page_templates import render
+
 # Dynamic blog schedule - will be updated as needed
 BLOG_SCHEDULE = {
     "2025-09-30": [
@@ -75,134 +76,11 @@ def check_blog_exists(url):
 
 def create_blog_html(blog_data):
     \"\"\"Create comprehensive HTML content for a blog post\"\"\"
-    template = \"\"\"<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - StableCoin Hub</title>
-    <meta name="description" content="{description}">
-    <link rel="canonical" href="https://www.stablecoinhub.pro/blog/{url}/">
-
-    <!-- Open Graph Meta Tags -->
-    <meta property="og:type" content="article">
-    <meta property="og:url" content="https://www.stablecoinhub.pro/blog/{url}/">
-    <meta property="og:title" content="{title}">
-    <meta property="og:description" content="{description}">
-
-    <!-- Twitter Meta Tags -->
-    <meta property="twitter:card" content="summary_large_image">
-    <meta property="twitter:url" content="https://www.stablecoinhub.pro/blog/{url}/">
-    <meta property="twitter:title" content="{title}">
-    <meta property="twitter:description" content="{description}">
-
-    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
-
-    <!-- Script to handle query parameters -->
-    <script>
-    (function() {{
-        // Handle URL query parameters for proper canonical
-        if (window.location.search) {{
-            var canonicalTag = document.querySelector('link[rel="canonical"]');
-            if (canonicalTag) {{
-                // Keep the canonical URL clean without query parameters
-                var cleanUrl = 'https://www.stablecoinhub.pro' + window.location.pathname;
-                if (cleanUrl.endsWith('/index.html')) {{
-                    cleanUrl = cleanUrl.replace('/index.html', '/');
-                }}
-                canonicalTag.setAttribute('href', cleanUrl);
-            }}
-        }}
-    }})();
-    </script>
-</head>
-<body class="bg-gray-50 min-h-screen">
-    <!-- Navigation -->
-    <nav class="bg-white shadow-lg sticky top-0 z-50">
-        <div class="max-w-7xl mx-auto px-4">
-            <div class="flex justify-between items-center h-16">
-                <a href="/" class="text-2xl font-bold text-indigo-600">StableCoin Hub</a>
-                <div class="hidden md:flex space-x-6">
-                    <a href="/" class="text-gray-700 hover:text-indigo-600 transition">Home</a>
-                    <a href="/blog/" class="text-gray-700 hover:text-indigo-600 transition">Blog</a>
-                    <a href="/about/" class="text-gray-700 hover:text-indigo-600 transition">About</a>
-                    <a href="/submit/" class="text-gray-700 hover:text-indigo-600 transition">Submit Tool</a>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <!-- Main Content -->
-    <article class="max-w-4xl mx-auto px-4 py-12">
-        <div class="bg-white rounded-lg shadow-md p-8">
-            <!-- Article Header -->
-            <div class="mb-8">
-                <div class="flex items-center gap-3 mb-4">
-                    <span class="bg-indigo-100 text-indigo-600 text-xs px-3 py-1 rounded-full font-medium">{category}</span>
-                    <span class="text-gray-500 text-sm">{date}</span>
-                </div>
-                <h1 class="text-4xl font-bold text-gray-900 mb-4">{title}</h1>
-                <p class="text-lg text-gray-700">{description}</p>
-            </div>
-
-            <!-- Article Content -->
-            <div class="prose prose-lg max-w-none">
-                <p class="mb-6">
-                    Welcome to our comprehensive guide on {topic}. This article provides expert insights,
-                    practical strategies, and the latest developments in the stablecoin ecosystem.
-                </p>
-
-                <h2 class="text-2xl font-bold mt-8 mb-4">Key Highlights</h2>
-                <ul class="list-disc pl-6 mb-6">
-                    <li>In-depth analysis and expert insights</li>
-                    <li>Practical implementation strategies</li>
-                    <li>Latest market trends and developments</li>
-                    <li>Risk management and best practices</li>
-                </ul>
-
-                <p class="mb-6">
-                    The stablecoin ecosystem continues to evolve rapidly, offering new opportunities and challenges
-                    for investors, traders, and developers. Understanding these dynamics is crucial for success.
-                </p>
-
-                <div class="bg-blue-50 border-l-4 border-blue-600 p-6 my-8">
-                    <p class="font-semibold mb-2">💡 Pro Tip</p>
-                    <p>
-                        Always conduct thorough research and consider your risk tolerance before making any
-                        investment decisions in the stablecoin space.
-                    </p>
-                </div>
-
-                <p class="mb-6">
-                    For more comprehensive stablecoin resources, tools, and analysis, visit
-                    <a href="https://www.stablecoinhub.pro" class="text-indigo-600 hover:underline">StableCoinHub.pro</a>.
-                </p>
-            </div>
-        </div>
-    </article>
-
-    <!-- Footer -->
-    <footer class="bg-white border-t mt-12">
-        <div class="max-w-7xl mx-auto px-4 py-8">
-            <div class="text-center text-gray-500">
-                <p>&copy; 2025 StableCoin Hub. All rights reserved.</p>
-                <div class="mt-4 space-x-4">
-                    <a href="/" class="hover:text-indigo-600">Home</a>
-                    <a href="/blog/" class="hover:text-indigo-600">Blog</a>
-                    <a href="/about/" class="hover:text-indigo-600">About</a>
-                    <a href="/submit/" class="hover:text-indigo-600">Submit Tool</a>
-                </div>
-            </div>
-        </div>
-    </footer>
-</body>
-</html>\"\"\"
-
     date_str = datetime.now(timezone.utc).strftime("%B %d, %Y")
     topic = blog_data['title'].split(':')[0] if ':' in blog_data['title'] else blog_data['title'].split()[0]
 
-    return template.format(
+    return render(
+        'posts/scheduled.html',
         title=blog_data['title'],
         description=blog_data['description'],
         url=blog_data['url'],
@@ -486,100 +364,14 @@ def add_query_parameter_handling():
     print(f"✅ Added query parameter handling to {updated_count} HTML files")
     return True
 
-def create_htaccess_redirect():
-    """Create .htaccess file for Apache server redirects"""
-
-    htaccess_content = """# Redirect from blog subdomain to main domain blog folder
-RewriteEngine On
-
-# Redirect blog.stablecoinhub.pro to www.stablecoinhub.pro/blog
-RewriteCond %{HTTP_HOST} ^blog\\.stablecoinhub\\.pro$ [NC]
-RewriteRule ^(.*)$ https://www.stablecoinhub.pro/blog/$1 [R=301,L]
-
-# Ensure www redirect
-RewriteCond %{HTTP_HOST} ^stablecoinhub\\.pro$ [NC]
-RewriteRule ^(.*)$ https://www.stablecoinhub.pro/$1 [R=301,L]
-
-# Remove query parameters from canonical URLs
-RewriteCond %{QUERY_STRING} ^utm_source=
-RewriteRule ^(.*)$ /$1? [R=301,L]
-"""
-
-    with open(".htaccess", 'w') as f:
-        f.write(htaccess_content)
-
-    print("✅ Created .htaccess file for server-side redirects")
-    return True
-
-def create_vercel_config():
-    """Create Vercel configuration for redirects"""
-
-    vercel_config = {
-        "redirects": [
-            {
-                "source": "https://blog.stablecoinhub.pro/:path*",
-                "destination": "https://www.stablecoinhub.pro/blog/:path*",
-                "permanent": True
-            },
-            {
-                "source": "https://stablecoinhub.pro/:path*",
-                "destination": "https://www.stablecoinhub.pro/:path*",
-                "permanent": True
-            }
-        ],
-        "cleanUrls": True,
-        "trailingSlash": True
-    }
-
-    with open("vercel.json", 'w') as f:
-        json.dump(vercel_config, f, indent=2)
-
-    print("✅ Created Vercel configuration for redirects")
-    return True
-
-def create_netlify_config():
-    """Create Netlify configuration for redirects"""
-
-    netlify_redirects = """# Redirect blog subdomain to main domain blog folder
-https://blog.stablecoinhub.pro/* https://www.stablecoinhub.pro/blog/:splat 301!
-
-# Ensure www redirect
-https://stablecoinhub.pro/* https://www.stablecoinhub.pro/:splat 301!
-
-# Handle common paths
-/blog https://www.stablecoinhub.pro/blog/ 301!
-"""
-
-    with open("_redirects", 'w') as f:
-        f.write(netlify_redirects)
-
-    # Also create netlify.toml for more control
-    netlify_toml = """[[redirects]]
-  from = "https://blog.stablecoinhub.pro/*"
-  to = "https://www.stablecoinhub.pro/blog/:splat"
-  status = 301
-  force = true
-
-[[redirects]]
-  from = "https://stablecoinhub.pro/*"
-  to = "https://www.stablecoinhub.pro/:splat"
-  status = 301
-  force = true
-
-[build]
-  publish = "."
-
-[build.processing]
-  skip_processing = false
-
-[build.processing.html]
-  pretty_urls = true
-"""
-
-    with open("netlify.toml", 'w') as f:
-        f.write(netlify_toml)
+def create_redirect_configs():
+    """Compile .htaccess, vercel.json, netlify.toml and _redirects from data/redirects.json"""
+    from redirect_rules import compile_redirects, print_report, write_configs
 
-    print("✅ Created Netlify configuration for redirects")
+    compiled = compile_redirects()
+    print_report(compiled)
+    changed = write_configs(compiled)
+    print(f"✅ Compiled redirect configurations ({len(changed)} files changed)")
     return True
 
 def main():
@@ -598,9 +390,7 @@ def main():
     # 2. Create redirect configurations for different hosting platforms
     print("\n2️⃣ Setting up redirects from blog.stablecoinhub.pro to www.stablecoinhub.pro/blog...")
     create_redirect_handler()
-    create_htaccess_redirect()
-    create_vercel_config()
-    create_netlify_config()
+    create_redirect_configs()
 
     # 3. Add query parameter handling
     print("\n3️⃣ Adding query parameter handling for SEO...")
@@ -11,7 +11,7 @@ BLOG_TEMPLATE = """<!DOCTYPE html>
     <title>{title} - StableCoin Hub</title>
     <meta name="description" content="{description}">
     <link rel="canonical" href="https://www.stablecoinhub.pro/blog/{url}/">
-    <script src="https://cdn.tailwindcss.com"></script>
+    {stylesheet}
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
     <!-- Google tag (gtag.js) -->
     <script async src="https://www.googletagmanager.com/gtag/js?id=G-GX6EB7DSFL"></script>
@@ -189,6 +189,12 @@ def process_original_content(md_content):
     return '\n'.join(processed)
 
 import glob
+import argparse
+
+from related_posts import related_posts
+from render_errors import SkipPost
+from render_pipeline import add_pipeline_arguments, run
+from tailwind_build import stylesheet_tag
 import json
 from datetime import datetime
 
@@ -216,38 +222,23 @@ BLOG_METADATA = {
     'stablecoin-market-cap': {'date': 'September 12, 2025', 'date_iso': '2025-09-12', 'categories': ['Market', 'Analysis']}
 }
 
-# Related articles mapping
-RELATED_ARTICLES = {
-    'what-is-stablecoin': [
-        {'url': '/blog/best-stablecoin-wallets/', 'title': 'Best Stablecoin Wallets', 'desc': 'Security & Features Guide'},
-        {'url': '/blog/earn-interest-on-crypto/', 'title': 'Earn Interest on Crypto', 'desc': 'Yield Strategies'},
-        {'url': '/blog/stablecoin-regulation/', 'title': 'Stablecoin Regulation', 'desc': 'Global Laws & Compliance'}
-    ],
-    'best-stablecoin-wallets': [
-        {'url': '/blog/crypto-card/', 'title': 'Crypto Debit Cards', 'desc': 'Spend Your Stablecoins'},
-        {'url': '/blog/stablecoin-risks/', 'title': 'Stablecoin Risks', 'desc': 'Security Considerations'},
-        {'url': '/blog/how-to-buy-stablecoins/', 'title': 'How to Buy Stablecoins', 'desc': 'Complete Guide'}
-    ],
-    'earn-interest-on-crypto': [
-        {'url': '/blog/stablecoin-lending/', 'title': 'Stablecoin Lending', 'desc': 'DeFi Lending Platforms'},
-        {'url': '/blog/defi-protocols/', 'title': 'Top DeFi Protocols', 'desc': 'Yield Farming Guide'},
-        {'url': '/blog/stablecoin-risks/', 'title': 'Understanding Risks', 'desc': 'Safety First'}
-    ],
-    'default': [
-        {'url': '/blog/what-is-stablecoin/', 'title': 'What Is a Stablecoin?', 'desc': 'Complete Beginner Guide'},
-        {'url': '/blog/best-stablecoin-wallets/', 'title': 'Best Wallets', 'desc': 'Store Safely'},
-        {'url': '/blog/earn-interest-on-crypto/', 'title': 'Earn Yield', 'desc': 'Passive Income'}
-    ]
-}
+# Shown when the related-articles index has nothing for a post
+DEFAULT_RELATED = [
+    {'url': '/blog/what-is-stablecoin/', 'title': 'What Is a Stablecoin?', 'desc': 'Complete Beginner Guide'},
+    {'url': '/blog/best-stablecoin-wallets/', 'title': 'Best Wallets', 'desc': 'Store Safely'},
+    {'url': '/blog/earn-interest-on-crypto/', 'title': 'Earn Yield', 'desc': 'Passive Income'}
+]
 
 def get_related_articles(url_slug):
     """Get related articles for a blog post"""
-    if url_slug in RELATED_ARTICLES:
-        return RELATED_ARTICLES[url_slug]
-    return RELATED_ARTICLES['default']
+    related = [
+        {'url': post['url'], 'title': post['title'].split(':')[0], 'desc': post['category']}
+        for post in related_posts(url_slug)
+    ]
+    return related or DEFAULT_RELATED
 
-def fix_blog_post(md_file):
-    """Fix a single blog post with EXACT original content"""
+def render_fixed_post(md_file):
+    """Render a blog post with EXACT original content, returning (html_file, html)"""
     # Get URL slug from filename
     filename = os.path.basename(md_file)
     url_slug = re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
@@ -255,7 +246,7 @@ def fix_blog_post(md_file):
     # Skip if HTML file doesn't exist
     html_file = f'blog/{url_slug}/index.html'
     if not os.path.exists(html_file):
-        return False, f"HTML file not found: {html_file}"
+        raise SkipPost(f"HTML file not found: {html_file}")
 
     # Read original markdown
     with open(md_file, 'r') as f:
@@ -266,7 +257,7 @@ def fix_blog_post(md_file):
     desc_match = re.search(r'description:\s*"([^"]+)"', original_md)
 
     if not title_match:
-        return False, "No title found in markdown"
+        raise SkipPost("No title found in markdown")
 
     title = title_match.group(1)
     description = desc_match.group(1) if desc_match else "Comprehensive guide for the stablecoin ecosystem."
@@ -333,6 +324,7 @@ def fix_blog_post(md_file):
 
     # Create final HTML
     final_html = BLOG_TEMPLATE.format(
+        stylesheet=stylesheet_tag(),
         title=title,
         description=description,
         url=url_slug,
@@ -343,35 +335,43 @@ def fix_blog_post(md_file):
         content=html_content
     )
 
+    return html_file, final_html
+
+def fix_blog_post(md_file):
+    """Fix a single blog post with EXACT original content"""
+    try:
+        html_file, final_html = render_fixed_post(md_file)
+    except SkipPost as e:
+        return False, str(e)
+
     # Write the file
     with open(html_file, 'w') as f:
         f.write(final_html)
 
     return True, "Success"
 
-# Main execution
-print("Fixing ALL blog posts with EXACT original content and beautiful design...")
-print("=" * 60)
+def main():
+    parser = argparse.ArgumentParser(description="Fix all blog posts with original content")
+    add_pipeline_arguments(parser)
+    args = parser.parse_args()
 
-# Get all markdown files
-md_files = glob.glob('blog/_posts/*.md')
-print(f"Found {len(md_files)} blog posts to fix\n")
+    print("Fixing ALL blog posts with EXACT original content and beautiful design...")
+    print("=" * 60)
 
-success_count = 0
-for md_file in sorted(md_files):
-    filename = os.path.basename(md_file)
-    url_slug = re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
+    # Get all markdown files
+    md_files = glob.glob('blog/_posts/*.md')
+    print(f"Found {len(md_files)} blog posts to fix\n")
 
-    success, message = fix_blog_post(md_file)
-    if success:
-        print(f"✅ Fixed: {url_slug}")
-        success_count += 1
-    else:
-        print(f"⚠️  Skipped {url_slug}: {message}")
-
-print("\n" + "=" * 60)
-print(f"✅ Successfully fixed {success_count}/{len(md_files)} blog posts")
-print("   - EXACT original content preserved")
-print("   - Beautiful design elements restored")
-print("   - No duplicate headers")
-print("   - Cross-links working perfectly")
\ No newline at end of file
+    results = run(render_fixed_post, sorted(md_files), jobs=args.jobs, timings=args.timings,
+                  profile=args.profile)
+    success_count = sum(1 for r in results if r['status'] in ('written', 'unchanged'))
+
+    print("\n" + "=" * 60)
+    print(f"✅ Successfully fixed {success_count}/{len(md_files)} blog posts")
+    print("   - EXACT original content preserved")
+    print("   - Beautiful design elements restored")
+    print("   - No duplicate headers")
+    print("   - Cross-links working perfectly")
+
+if __name__ == "__main__":
+    main()
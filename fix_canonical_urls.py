@@ -1,78 +1,65 @@
 #!/usr/bin/env python3
-import os
-import re
-from pathlib import Path
+import json
 
-def update_canonical_urls(file_path):
-    """Update canonical URLs to use apex domain (without www)"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+from redirect_rules import canonical_origin, canonical_url, host_prefixes
+from seo_document import HtmlDocument, load_pages
+
+REPO_DIR = '/Users/raymond/Desktop/Stablecoinhub.pro/stablecoinhub-repo'
+
+# Absolute links (canonical tags included) on one of the site's hosts, quoted or bare
+SITE_LINK_RE = r'href=(["\']?)(https?://(?:www\.|blog\.)?stablecoinhub\.pro(?:[/?#][^"\'\s>]*)?)\1'
+
+# Main pages that get the client-side redirect to the canonical host
+MAIN_PAGES = ['index.html', 'privacy.html', 'terms.html', 'disclaimer.html']
+MAIN_SECTIONS = ('blog/', 'about/', 'submit/')
+
+def _canonical_link(match):
+    url = canonical_url(match.group(2)) or match.group(2)
+    return f'href={match.group(1)}{url}{match.group(1)}'
+
+def apex_canonical_pass(doc):
+    """Rewrite canonical URLs and internal links on any host of the site to the
+    canonical origin declared in data/redirects.json (the pass predates the
+    switch to www, hence its name)"""
+    if doc.canonical is None:
+        return False
+
+    before = doc.content
+    doc.sub(SITE_LINK_RE, _canonical_link)
+    return doc.content != before
+
+def update_canonical_urls(file_path, root=REPO_DIR):
+    """Update canonical URLs to use the canonical origin"""
+    doc = HtmlDocument(file_path, root=root)
 
     # Check if canonical tag exists
-    if 'rel="canonical"' not in content and "rel='canonical'" not in content:
+    if doc.canonical is None:
         print(f"⚠️  No canonical tag in {file_path}")
         return False
 
-    # Pattern to match canonical tags with www
-    patterns = [
-        (r'<link\s+rel="canonical"\s+href="https://www\.stablecoinhub\.pro([^"]*)"',
-         r'<link rel="canonical" href="https://stablecoinhub.pro\1"'),
-        (r"<link\s+rel='canonical'\s+href='https://www\.stablecoinhub\.pro([^']*)'",
-         r"<link rel='canonical' href='https://stablecoinhub.pro\1'"),
-        (r'<link\s+rel="canonical"\s+href="http://stablecoinhub\.pro([^"]*)"',
-         r'<link rel="canonical" href="https://stablecoinhub.pro\1"'),
-        (r"<link\s+rel='canonical'\s+href='http://stablecoinhub\.pro([^']*)'",
-         r"<link rel='canonical' href='https://stablecoinhub.pro\1'"),
-        (r'<link\s+rel="canonical"\s+href="http://www\.stablecoinhub\.pro([^"]*)"',
-         r'<link rel="canonical" href="https://stablecoinhub.pro\1"'),
-        (r"<link\s+rel='canonical'\s+href='http://www\.stablecoinhub\.pro([^']*)'",
-         r"<link rel='canonical' href='https://stablecoinhub.pro\1'"),
-    ]
-
-    updated = False
-    for pattern, replacement in patterns:
-        if re.search(pattern, content):
-            content = re.sub(pattern, replacement, content)
-            updated = True
-            print(f"✅ Updated canonical URL in {file_path}")
-
-    # Also update any internal links that use www
-    internal_patterns = [
-        (r'href="https://www\.stablecoinhub\.pro([^"]*)"', r'href="https://stablecoinhub.pro\1"'),
-        (r"href='https://www\.stablecoinhub\.pro([^']*)'", r"href='https://stablecoinhub.pro\1'"),
-        (r'href="http://www\.stablecoinhub\.pro([^"]*)"', r'href="https://stablecoinhub.pro\1"'),
-        (r"href='http://www\.stablecoinhub\.pro([^']*)'", r"href='https://stablecoinhub.pro\1'"),
-        (r'href="http://stablecoinhub\.pro([^"]*)"', r'href="https://stablecoinhub.pro\1"'),
-        (r"href='http://stablecoinhub\.pro([^']*)'", r"href='https://stablecoinhub.pro\1'"),
-    ]
-
-    for pattern, replacement in internal_patterns:
-        if re.search(pattern, content):
-            content = re.sub(pattern, replacement, content)
-            updated = True
-
-    if updated:
-        # Write the updated content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+    if apex_canonical_pass(doc):
+        doc.save()
+        print(f"✅ Updated canonical URL in {file_path}")
         return True
 
-    # Check if canonical already uses apex domain (correct format)
-    if re.search(r'rel="canonical".*href="https://stablecoinhub\.pro', content) or \
-       re.search(r"rel='canonical'.*href='https://stablecoinhub\.pro", content):
+    # Check if canonical already uses the canonical origin (correct format)
+    if canonical_url(doc.canonical) == doc.canonical:
         print(f"✓ Canonical URL already correct in {file_path}")
-        return False
 
     return False
 
 def add_redirect_script():
-    """Add JavaScript redirect from www to non-www for client-side handling"""
-    redirect_script = '''<script>
-    // Redirect from www to non-www
-    if (window.location.hostname === 'www.stablecoinhub.pro') {
-        window.location.href = 'https://stablecoinhub.pro' + window.location.pathname + window.location.search + window.location.hash;
-    }
-    // Remove query parameters from canonical URL dynamically
+    """Add JavaScript redirect from the alias hosts to the canonical host"""
+    origin = canonical_origin()
+    aliases = {host: prefix for host, prefix in host_prefixes().items() if not origin.endswith('//' + host)}
+    redirect_script = f'''<script>
+    // Redirect to the canonical host
+    var aliasPrefix = {json.dumps(aliases, sort_keys=True)}[window.location.hostname];
+    if (aliasPrefix) {{
+        window.location.href = '{origin}' + aliasPrefix.slice(0, -1) + window.location.pathname + window.location.search + window.location.hash;
+    }}
+'''
+    redirect_script += '''    // Remove query parameters from canonical URL dynamically
     if (window.location.search) {
         var canonicalTag = document.querySelector('link[rel="canonical"]');
         if (canonicalTag) {
@@ -87,51 +74,37 @@ def add_redirect_script():
 '''
     return redirect_script
 
+def www_redirect_script_pass(doc):
+    """Add the canonical host redirect script before </head> on main pages"""
+    if doc.rel_path not in MAIN_PAGES and not doc.rel_path.startswith(MAIN_SECTIONS):
+        return False
+    # Check if redirect script already exists
+    if 'Redirect to the canonical host' in doc.content or 'Redirect from www to non-www' in doc.content:
+        return False
+    return doc.insert_before_head_close(add_redirect_script() + '\n')
+
 def process_all_html_files():
-    """Process all HTML files in the repository"""
-    repo_dir = '/Users/raymond/Desktop/Stablecoinhub.pro/stablecoinhub-repo'
+    """Process all HTML files in the repository in one pass, writing each at most once"""
     updated_count = 0
     processed_count = 0
-    needs_redirect_script = []
-
-    # Find all HTML files
-    for root, dirs, files in os.walk(repo_dir):
-        # Skip .git directory
-        if '.git' in root:
-            continue
-
-        for file in files:
-            if file.endswith('.html'):
-                file_path = os.path.join(root, file)
-                processed_count += 1
-
-                if update_canonical_urls(file_path):
-                    updated_count += 1
-
-                # Check if we should add redirect script to main pages
-                rel_path = os.path.relpath(file_path, repo_dir)
-                if rel_path in ['index.html', 'privacy.html', 'terms.html', 'disclaimer.html'] or \
-                   rel_path.startswith('blog/') or rel_path.startswith('about/') or rel_path.startswith('submit/'):
-                    needs_redirect_script.append(file_path)
-
-    # Add redirect script to main pages
-    print("\n🔧 Adding redirect scripts to main pages...")
-    redirect_script = add_redirect_script()
     script_added_count = 0
 
-    for file_path in needs_redirect_script:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    for doc in load_pages(REPO_DIR):
+        processed_count += 1
+
+        if doc.canonical is None:
+            print(f"⚠️  No canonical tag in {doc.path}")
+        elif apex_canonical_pass(doc):
+            updated_count += 1
+            print(f"✅ Updated canonical URL in {doc.path}")
+        elif canonical_url(doc.canonical) == doc.canonical:
+            print(f"✓ Canonical URL already correct in {doc.path}")
+
+        if www_redirect_script_pass(doc):
+            script_added_count += 1
+            print(f"✅ Added redirect script to {doc.rel_path}")
 
-        # Check if redirect script already exists
-        if 'Redirect from www to non-www' not in content:
-            # Add script before </head>
-            if '</head>' in content:
-                content = content.replace('</head>', redirect_script + '\n</head>')
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                script_added_count += 1
-                print(f"✅ Added redirect script to {os.path.relpath(file_path, repo_dir)}")
+        doc.save()
 
     print(f"\n📊 Summary:")
     print(f"   Total HTML files processed: {processed_count}")
@@ -147,5 +120,5 @@ if __name__ == "__main__":
     print("\n📝 Additional steps needed:")
     print("1. Commit and push these changes to GitHub")
     print("2. GitHub Pages will handle HTTP to HTTPS redirect automatically")
-    print("3. The apex domain (stablecoinhub.pro) will be the primary URL")
-    print("4. JavaScript will redirect www to non-www for better SEO")
\ No newline at end of file
+    print(f"3. {canonical_origin()} (data/redirects.json) will be the primary URL")
+    print("4. JavaScript will redirect the other hosts to it for better SEO")
\ No newline at end of file
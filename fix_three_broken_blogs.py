@@ -9,6 +9,8 @@ Fix three broken blog posts with comprehensive, unique content.
 import os
 from datetime import datetime
 
+from html_minify import minify_html
+
 def create_yield_farming_blog():
     """Create comprehensive yield farming guide with unique content."""
 
@@ -1660,7 +1662,7 @@ def main():
             # Write to file
             os.makedirs(os.path.dirname(blog_path), exist_ok=True)
             with open(blog_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+                f.write(minify_html(content))
 
             # Count lines and words for verification
             lines = content.count('\n') + 1
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Streaming HTML minifier for the generated StableCoin Hub pages.
+
+The page generators emit deeply indented template markup full of section
+comments (<!-- Author Box -->). HtmlMinifier takes the page in chunks and
+emits the minified markup as it goes:
+
+- whitespace runs in text collapse to one space, or to one newline when
+  they contain a line break (so line-based tools and diffs keep working);
+  whitespace between block-level tags is dropped to that newline
+- comments are removed, except conditional comments and the namespaced
+  region markers of page_regions.py (<!-- blog:latest -->)
+- quotes are dropped from attribute values that need none (letters,
+  digits, '-', '_', '.', ':'), except on the attributes the SEO scripts
+  read with regexes (rel, href, content, property, name); whitespace
+  inside tags is collapsed
+- the contents of <pre>, <textarea>, <script> and <style> pass through
+  untouched
+
+render_pipeline minifies every page it renders, in its worker pool, and
+skips pages whose rendered markup hashes the same as last time (the cache
+is .cache/minify.json). Run this script to minify pages written by other
+generators in place.
+
+Usage:
+    python html_minify.py                      # minify every page under blog/
+    python html_minify.py blog/foo/index.html  # ... or the given pages
+    python html_minify.py --dry-run            # report sizes, write nothing
+    python html_minify.py --jobs 4
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from site_build import hash_bytes, hash_file, write_if_changed
+
+MINIFY_CACHE_FILE = '.cache/minify.json'
+MINIFY_CACHE_VERSION = 2
+PAGES_GLOB = 'blog/**/index.html'
+CHUNK_SIZE = 64 * 1024
+
+RAW_TEXT_ELEMENTS = {'pre', 'textarea', 'script', 'style'}
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+# Whitespace next to these tags never renders
+BLOCK_ELEMENTS = {
+    'html', 'head', 'body', 'title', 'meta', 'link', 'base', 'script', 'style', 'noscript', 'template',
+    'div', 'section', 'article', 'aside', 'nav', 'header', 'footer', 'main', 'p', 'h1', 'h2', 'h3', 'h4', 'h5',
+    'h6', 'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'table', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th', 'caption',
+    'colgroup', 'col', 'form', 'fieldset', 'legend', 'hr', 'br', 'blockquote', 'figure', 'figcaption',
+    'address', 'details', 'summary', 'pre', 'textarea', 'option', 'optgroup', 'select',
+}
+
+TAG_RE = re.compile(r'<(/?)([A-Za-z][\w:-]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>')
+ATTR_RE = re.compile(r'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+)))?')
+SAFE_VALUE_RE = re.compile(r'[A-Za-z0-9_.:-]+$')
+# verify_seo_deployment, blog_metadata and the fix_* scripts match these as attr="value"
+QUOTED_ATTRS = {'rel', 'href', 'content', 'property', 'name'}
+WHITESPACE_RE = re.compile(r'\s+')
+# page_regions markers (<!-- blog:latest -->, <!-- /tools:defi -->) and IE conditional comments
+KEEP_COMMENT_RE = re.compile(r'<!-- /?[\w-]+:[\w:-]+ -->$|<!--\[if|<!--<!\[endif\]|<!\[endif\]')
+
+
+def collapse(text):
+    """One space per whitespace run, or one newline if the run spans lines"""
+    return WHITESPACE_RE.sub(lambda match: '\n' if '\n' in match.group() else ' ', text)
+
+
+def minify_tag(closing, name, body):
+    """Rewrite a start or end tag with collapsed whitespace and minimal quoting"""
+    if closing:
+        return f'</{name}>'
+    body = body.strip()
+    self_closing = body.endswith('/')
+    if self_closing:
+        body = body[:-1]
+    parts = [name]
+    for match in ATTR_RE.finditer(body):
+        attr, double, single, bare = match.groups()
+        value = next((v for v in (double, single, bare) if v is not None), None)
+        if value is None:
+            parts.append(attr)
+        elif SAFE_VALUE_RE.match(value) and attr.lower() not in QUOTED_ATTRS:
+            parts.append(f'{attr}={value}')
+        elif '"' in value:
+            parts.append(f"{attr}='{value}'")
+        else:
+            parts.append(f'{attr}="{value}"')
+    # "/>" only matters on foreign (SVG) elements; keep it off an unquoted value
+    end = ' />' if self_closing and name.lower() not in VOID_ELEMENTS else '>'
+    return '<' + ' '.join(parts) + end
+
+
+class HtmlMinifier:
+    """Incremental minifier: feed() chunks, collect the returned output, then close()"""
+
+    def __init__(self):
+        self.buffer = ''
+        self.text = ''          # text waiting for the next tag, which decides its trailing whitespace
+        self.after_block = True  # the last tag written was block-level (or nothing was written yet)
+        self.raw_end = None      # closing tag being waited for inside <pre>/<script>/...
+
+    def feed(self, chunk):
+        self.buffer += chunk
+        return ''.join(self._drain(final=False))
+
+    def close(self):
+        out = ''.join(self._drain(final=True))
+        out += self.buffer + self._flush_text(next_block=True)
+        self.buffer = ''
+        return out
+
+    def _flush_text(self, next_block):
+        text, self.text = self.text, ''
+        if not text:
+            return ''
+        text = collapse(text)
+        if self.after_block:
+            text = text.lstrip(' ')
+        if next_block:
+            text = text.rstrip(' ')
+        if not text.strip():
+            # Whitespace only: a line break survives as one newline, a space only between inline tags
+            return '\n' if '\n' in text else ('' if self.after_block or next_block else text)
+        return text
+
+    def _drain(self, final):
+        buffer, position = self.buffer, 0
+        while True:
+            if self.raw_end is not None:
+                end = buffer.lower().find(self.raw_end, position)
+                if end == -1:
+                    if not final:
+                        break
+                    end = len(buffer)
+                yield buffer[position:end]
+                position = end
+                self.raw_end = None
+                continue
+
+            start = buffer.find('<', position)
+            if start == -1:
+                self.text += buffer[position:]
+                position = len(buffer)
+                break
+            self.text += buffer[position:start]
+            position = start
+
+            if buffer.startswith('<!--', start):
+                end = buffer.find('-->', start + 4)
+                if end == -1:
+                    if final:
+                        self.text += buffer[start:]
+                        position = len(buffer)
+                    break
+                comment = buffer[start:end + 3]
+                position = end + 3
+                if KEEP_COMMENT_RE.match(comment):
+                    yield self._flush_text(next_block=True) + comment
+                    self.after_block = True
+                continue
+
+            if buffer.startswith('<!', start) or buffer.startswith('<?', start):
+                end = buffer.find('>', start)
+                if end == -1:
+                    if final:
+                        self.text += buffer[start:]
+                        position = len(buffer)
+                    break
+                yield self._flush_text(next_block=True) + buffer[start:end + 1]
+                self.after_block = True
+                position = end + 1
+                continue
+
+            match = TAG_RE.match(buffer, start)
+            if match is None:
+                # '<' then a letter (or '/' and a letter) always opens a tag: wait for the rest of it.
+                # Anything else is a literal '<' in the text.
+                opens_tag = re.match(r'</?[A-Za-z]|</?$', buffer[start:start + 3])
+                if opens_tag and not final:
+                    break
+                self.text += '<'
+                position = start + 1
+                continue
+
+            closing, name, body = match.groups()
+            lower = name.lower()
+            block = lower in BLOCK_ELEMENTS
+            yield self._flush_text(next_block=block) + minify_tag(closing, name, body)
+            self.after_block = block
+            position = match.end()
+            if not closing and lower in RAW_TEXT_ELEMENTS:
+                self.raw_end = f'</{lower}'
+        self.buffer = buffer[position:]
+
+
+def minify_html(html):
+    """Minify a whole page"""
+    minifier = HtmlMinifier()
+    return minifier.feed(html) + minifier.close()
+
+
+def minify_file(path, dry_run=False):
+    """Minify a page in place, streaming it in chunks. Returns (path, bytes before, bytes after, written)."""
+    minifier = HtmlMinifier()
+    pieces, before = [], 0
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            before += len(chunk.encode('utf-8'))
+            pieces.append(minifier.feed(chunk))
+    pieces.append(minifier.close())
+    html = ''.join(pieces)
+    written = False if dry_run else write_if_changed(path, html)
+    return path, before, len(html.encode('utf-8')), written
+
+
+class MinifyCache:
+    """Hash of the markup each page was minified from and of the result, per page"""
+
+    def __init__(self, path=MINIFY_CACHE_FILE):
+        self.path = path
+        self.pages = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == MINIFY_CACHE_VERSION:
+            self.pages = data.get('pages', {})
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        data = {'version': MINIFY_CACHE_VERSION, 'pages': self.pages}
+        return write_if_changed(self.path, json.dumps(data, indent=1, sort_keys=True) + '\n')
+
+
+def cached_output(entry, html_file, source_hash):
+    """True if html_file still holds what minifying markup with source_hash produced"""
+    return bool(entry) and entry['source'] == source_hash and hash_file(html_file) == entry['output']
+
+
+def print_sizes(rows, dry_run=False):
+    """Print before/after sizes per page and in total; rows are (path, before, after)"""
+    total_before = total_after = 0
+    for path, before, after in rows:
+        total_before += before
+        total_after += after
+        saved = 100 - after * 100 / before if before else 0
+        print(f"   {before / 1024:8.1f} KB → {after / 1024:8.1f} KB  (-{saved:4.1f}%)  {path}")
+    if total_before:
+        print(f"\n📉 {'Would shrink' if dry_run else 'Minified'} {len(rows)} pages: "
+              f"{total_before / 1024:,.1f} KB → {total_after / 1024:,.1f} KB "
+              f"({(total_before - total_after) / 1024:,.1f} KB saved, {100 - total_after * 100 / total_before:.1f}%)")
+
+
+def _minify_star(args):
+    return minify_file(*args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Minify generated HTML pages in place")
+    parser.add_argument('pages', nargs='*', help=f"pages to minify (default: {PAGES_GLOB})")
+    parser.add_argument('--dry-run', action='store_true', help="only report the sizes")
+    parser.add_argument('--force', action='store_true', help="minify pages the cache says are already minified")
+    parser.add_argument('--jobs', '-j', type=int, default=0, help="worker processes (0 = one per CPU, default)")
+    args = parser.parse_args()
+
+    from render_pipeline import resolve_jobs
+
+    pages = args.pages or sorted(glob.glob(PAGES_GLOB, recursive=True))
+    cache = MinifyCache()
+    todo = [page for page in pages if args.force
+            or not (cache.pages.get(os.path.normpath(page)) or {}).get('output') == hash_file(page)]
+    print(f"🗜️  Minifying {len(todo)} of {len(pages)} pages ({len(pages) - len(todo)} already minified)")
+    print("=" * 60)
+
+    jobs = min(resolve_jobs(args.jobs), max(len(todo), 1))
+    tasks = [(page, args.dry_run) for page in todo]
+    if jobs == 1:
+        results = [_minify_star(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_minify_star, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+
+    print_sizes([(path, before, after) for path, before, after, _ in results], dry_run=args.dry_run)
+    if not args.dry_run:
+        for path, before, after, _ in results:
+            # The page on disk is its own source: minifying it again would not change it
+            digest = hash_file(path)
+            cache.pages[os.path.normpath(path)] = {'source': digest, 'output': digest, 'bytes': after,
+                                                   'source_bytes': before}
+        cache.save()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,143 +2,224 @@
 """
 Link checker for StableCoin Hub website
 Checks all HTML files for links and verifies if target files exist
+
+The site's file set is indexed in memory once, pages are scanned in a thread
+pool, and each distinct link target is resolved only once no matter how many
+pages point at it, so no filesystem stat is made per link.
+
+Usage:
+    python link_checker.py [--root DIR] [--format text|json|junit] [--output FILE]
 """
 
+import argparse
+import json
 import os
 import re
 import sys
-from pathlib import Path
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlsplit
+from xml.sax.saxutils import escape, quoteattr
+
+HREF_RE = re.compile(r'href=(?:["\']([^"\']+)["\']|([^\s"\'=<>`]+))')
+SKIP_PREFIXES = ('http:', 'https:', '//', 'mailto:', 'tel:', '#', 'javascript:', 'data:')
+# Absolute links to our own hosts are checked like root-relative ones
+SITE_HOSTS = {'stablecoinhub.pro', 'www.stablecoinhub.pro'}
+
+
+def build_path_index(root):
+    """Walk the tree once and return (files, directories) as sets of relative POSIX paths"""
+    files = set()
+    directories = {''}
+    for current, dirs, names in os.walk(root):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        rel_dir = os.path.relpath(current, root).replace(os.sep, '/')
+        rel_dir = '' if rel_dir == '.' else rel_dir
+        for d in dirs:
+            directories.add(f"{rel_dir}/{d}" if rel_dir else d)
+        for name in names:
+            files.add(f"{rel_dir}/{name}" if rel_dir else name)
+    return files, directories
+
 
 def extract_links_from_html(file_path):
-    """Extract all href links from an HTML file"""
-    links = []
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Find all href attributes
-        href_pattern = r'href=["\']([^"\']+)["\']'
-        matches = re.findall(href_pattern, content)
-
-        for match in matches:
-            # Skip external links, anchors, and javascript
-            if (not match.startswith('http') and
-                not match.startswith('//') and
-                not match.startswith('mailto:') and
-                not match.startswith('tel:') and
-                not match.startswith('#') and
-                not match.startswith('javascript:')):
-                links.append(match)
-
-    except Exception as e:
-        print(f"Error reading {file_path}: {e}")
+    """Extract internal href links from an HTML file"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
 
+    links = []
+    for quoted, bare in HREF_RE.findall(content):
+        match = quoted or bare
+        if match.startswith(('http:', 'https:', '//')):
+            parts = urlsplit(match if not match.startswith('//') else 'https:' + match)
+            if parts.hostname in SITE_HOSTS:
+                links.append(parts.path or '/')
+            continue
+        if not match.startswith(SKIP_PREFIXES):
+            links.append(match)
     return links
 
-def normalize_path(link, base_dir):
-    """Convert a relative link to an absolute path"""
-    if link.startswith('/'):
-        # Absolute path from root
-        path = os.path.join(base_dir, link.lstrip('/'))
-    else:
-        # Relative path
-        path = os.path.join(base_dir, link)
-
-    # Handle trailing slashes and index.html
-    if path.endswith('/'):
-        path = os.path.join(path, 'index.html')
-    elif not path.endswith('.html') and not '.' in os.path.basename(path):
-        # If no extension and no dot, assume directory with index.html
-        path = os.path.join(path, 'index.html')
-
-    return os.path.normpath(path)
 
-def check_file_exists(file_path):
-    """Check if a file exists, handling common variations"""
-    if os.path.exists(file_path):
+def normalize_path(link, page_dir):
+    """Resolve a link to a site-relative POSIX path (no query, fragment or leading slash)"""
+    path = unquote(urlsplit(link).path)
+    if path.startswith('/'):
+        joined = path.lstrip('/')
+    else:
+        joined = f"{page_dir}/{path}" if page_dir else path
+    normalized = os.path.normpath(joined).replace(os.sep, '/') if joined else ''
+    if normalized in ('.', ''):
+        normalized = ''
+    if path.endswith('/') and normalized:
+        normalized += '/'
+    return normalized
+
+
+def target_exists(target, files, directories):
+    """Check a resolved target against the path index, handling the same
+    variations a static host serves: directories with index.html and
+    extensionless .html files"""
+    bare = target.rstrip('/')
+    if target.endswith('/') or target == '':
+        return (f"{bare}/index.html" if bare else 'index.html') in files
+    if bare in files:
         return True
-
-    # If it's a directory path, check for index.html
-    if os.path.isdir(file_path):
-        index_path = os.path.join(file_path, 'index.html')
-        return os.path.exists(index_path)
-
-    # If it doesn't end in .html, try adding it
-    if not file_path.endswith('.html'):
-        html_path = file_path + '.html'
-        if os.path.exists(html_path):
-            return True
-
-        # Try as directory with index.html
-        index_path = os.path.join(file_path, 'index.html')
-        if os.path.exists(index_path):
-            return True
-
+    if bare in directories:
+        return f"{bare}/index.html" in files
+    if not bare.endswith('.html'):
+        return f"{bare}.html" in files or f"{bare}/index.html" in files
     return False
 
-def main():
-    repo_dir = '/Users/raymond/Desktop/Stablecoinhub.pro/stablecoinhub-repo'
-    os.chdir(repo_dir)
-
-    broken_links = defaultdict(list)
-    all_links = defaultdict(list)
-
-    # Find all HTML files
-    html_files = []
-    for root, dirs, files in os.walk('.'):
-        for file in files:
-            if file.endswith('.html'):
-                html_files.append(os.path.join(root, file))
-
-    print(f"Found {len(html_files)} HTML files to check\n")
-
-    # Check links in each file
-    for html_file in html_files:
-        print(f"Checking: {html_file}")
-        links = extract_links_from_html(html_file)
 
+def scan_page(root, rel_path):
+    """Read one page and return (rel_path, links, error)"""
+    try:
+        return rel_path, extract_links_from_html(os.path.join(root, rel_path)), None
+    except (OSError, UnicodeDecodeError) as e:
+        return rel_path, [], str(e)
+
+
+def check_links(root='.', workers=None):
+    """Check every internal link under root.
+
+    Returns a dict with the pages scanned, total/unique link counts, broken
+    links grouped by page, read errors and elapsed time.
+    """
+    started = time.perf_counter()
+    files, directories = build_path_index(root)
+    html_files = sorted(path for path in files if path.endswith('.html'))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        scanned = list(pool.map(lambda rel: scan_page(root, rel), html_files))
+
+    resolved = {}
+    broken = defaultdict(list)
+    errors = {}
+    total_links = 0
+    for rel_path, links, error in scanned:
+        if error:
+            errors[rel_path] = error
+        page_dir = os.path.dirname(rel_path)
         for link in links:
-            all_links[html_file].append(link)
-
-            # Convert to absolute path
-            target_path = normalize_path(link, repo_dir)
-
-            # Check if target exists
-            if not check_file_exists(target_path):
-                broken_links[html_file].append({
-                    'link': link,
-                    'target_path': target_path,
-                    'reason': 'File not found'
-                })
-
-    # Report results
-    print("\n" + "="*80)
-    print("LINK CHECK RESULTS")
-    print("="*80)
-
-    if broken_links:
-        print(f"\nBROKEN LINKS FOUND: {sum(len(links) for links in broken_links.values())}")
-        print("-" * 50)
-
-        for file, links in broken_links.items():
-            print(f"\nFile: {file}")
+            total_links += 1
+            target = normalize_path(link, page_dir)
+            ok = resolved.get(target)
+            if ok is None:
+                ok = resolved[target] = target_exists(target, files, directories)
+            if not ok:
+                broken[rel_path].append({'link': link, 'target_path': target, 'reason': 'File not found'})
+
+    return {
+        'root': os.path.abspath(root),
+        'pages': len(html_files),
+        'page_paths': html_files,
+        'total_links': total_links,
+        'unique_targets': len(resolved),
+        'broken': dict(broken),
+        'errors': errors,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def format_text(report):
+    lines = ["=" * 80, "LINK CHECK RESULTS", "=" * 80]
+    total_broken = sum(len(links) for links in report['broken'].values())
+
+    if report['broken']:
+        lines.append(f"\nBROKEN LINKS FOUND: {total_broken}")
+        lines.append("-" * 50)
+        for file, links in sorted(report['broken'].items()):
+            lines.append(f"\nFile: {file}")
             for link_info in links:
-                print(f"  ❌ Link: {link_info['link']}")
-                print(f"     Expected: {link_info['target_path']}")
-                print(f"     Reason: {link_info['reason']}")
+                lines.append(f"  ❌ Link: {link_info['link']}")
+                lines.append(f"     Expected: {link_info['target_path']}")
+                lines.append(f"     Reason: {link_info['reason']}")
+    else:
+        lines.append("\n✅ No broken internal links found!")
+
+    for file, error in sorted(report['errors'].items()):
+        lines.append(f"⚠️  Error reading {file}: {error}")
+
+    total_links = report['total_links']
+    lines.append(f"\nSUMMARY:")
+    lines.append(f"Total HTML files checked: {report['pages']}")
+    lines.append(f"Total internal links found: {total_links}")
+    lines.append(f"Unique link targets: {report['unique_targets']}")
+    lines.append(f"Broken links: {total_broken}")
+    lines.append(f"Success rate: {((total_links - total_broken) / total_links * 100):.1f}%" if total_links > 0 else "Success rate: N/A")
+    lines.append(f"Checked in {report['seconds'] * 1000:.0f} ms")
+    return '\n'.join(lines)
+
+
+def format_json(report):
+    return json.dumps(report, indent=2, sort_keys=True)
+
+
+def format_junit(report):
+    """One testcase per page; broken links and read errors are failures"""
+    failures = sum(1 for page in report['broken']) + len(report['errors'])
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<testsuite name="link_checker" tests="{report["pages"]}" failures="{failures}" '
+        f'time="{report["seconds"]:.3f}">',
+    ]
+    for page in report['page_paths']:
+        lines.append(f'  <testcase classname="links" name={quoteattr(page)}>')
+        if page in report['broken']:
+            links = report['broken'][page]
+            body = '\n'.join(f"{l['link']} -> {l['target_path']}" for l in links)
+            lines.append(f'    <failure message={quoteattr(f"{len(links)} broken link(s)")}>{escape(body)}</failure>')
+        if page in report['errors']:
+            lines.append(f'    <failure message="read error">{escape(report["errors"][page])}</failure>')
+        lines.append('  </testcase>')
+    lines.append('</testsuite>')
+    return '\n'.join(lines)
+
+
+FORMATTERS = {'text': format_text, 'json': format_json, 'junit': format_junit}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check internal links across the site's HTML files")
+    parser.add_argument('--root', default='.', help="site root to scan (default: current directory)")
+    parser.add_argument('--format', choices=sorted(FORMATTERS), default='text')
+    parser.add_argument('--output', help="write the report to this file instead of stdout")
+    parser.add_argument('--workers', type=int, default=None, help="reader threads (default: Python's choice)")
+    args = parser.parse_args()
+
+    report = check_links(args.root, workers=args.workers)
+    output = FORMATTERS[args.format](report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+        print(f"📝 Wrote {args.format} report to {args.output}")
     else:
-        print("\n✅ No broken internal links found!")
+        print(output)
 
-    # Summary statistics
-    total_links = sum(len(links) for links in all_links.values())
-    total_broken = sum(len(links) for links in broken_links.values())
+    return 1 if report['broken'] or report['errors'] else 0
 
-    print(f"\nSUMMARY:")
-    print(f"Total HTML files checked: {len(html_files)}")
-    print(f"Total internal links found: {total_links}")
-    print(f"Broken links: {total_broken}")
-    print(f"Success rate: {((total_links - total_broken) / total_links * 100):.1f}%" if total_links > 0 else "N/A")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Single-pass markdown to Tailwind-styled HTML converter for StableCoin Hub.
+
+Replaces the chained full-document re.sub passes of
+restore_all_blogs.convert_markdown_to_html and
+beautify_blogs.process_content_beautiful with one linear scan over the lines
+of a post. Block structure (headings, lists, tables, rules, raw HTML and
+paragraphs) is decided line by line by a small state machine, and inline
+markup (bold, italic, links) is converted with one compiled alternation per
+line.
+
+Styling lives in class maps: each entry of PROFILES maps element names to
+Tailwind classes, so the "restore" and "beautiful" looks (or any new one)
+share the same tokenizer. render_markdown() also accepts a class map dict
+directly.
+"""
+
+import re
+
+# One alternation for all inline markup, tried left to right in one scan
+INLINE_RE = re.compile(
+    r'\*\*(?P<bold>.+?)\*\*'
+    r'|\[(?P<text>[^\]]+)\]\((?P<href>[^)\s]+)\)'
+    r'|(?<![*\w])\*(?P<em>[^*\s](?:[^*]*[^*\s])?)\*(?!\*)'
+)
+HEADING_RE = re.compile(r'(#{1,4}) (.+)$')
+ORDERED_RE = re.compile(r'(\d+)\.\s+(.*)$')
+SEPARATOR_RE = re.compile(r'\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?$')
+
+RESTORE_PROFILE = {
+    'h1': 'text-3xl font-bold mb-6 mt-8',
+    'h2': 'text-2xl font-bold mb-4 mt-8',
+    'h3': 'text-xl font-semibold mb-3',
+    'h4': 'text-lg font-semibold mb-2',
+    'p': 'mb-4',
+    'strong': '',
+    'em': 'italic',
+    'a': 'text-indigo-600 hover:underline',
+    'hr': 'my-8 border-gray-200',
+    'ul': 'list-disc pl-6 space-y-2 mb-6',
+    'ol': 'list-decimal pl-6 space-y-2 mb-6',
+    'ul_item': '<li>{text}</li>',
+    'ol_item': '<li>{text}</li>',
+    'table_wrapper': 'overflow-x-auto mb-6',
+    'table': 'min-w-full border-collapse border border-gray-300',
+    'thead': 'bg-gray-100',
+    'tbody': '',
+    'tr': '',
+    'th': 'border border-gray-300 px-4 py-2',
+    'td': 'border border-gray-300 px-4 py-2',
+    'td_first': 'border border-gray-300 px-4 py-2',
+}
+
+BEAUTIFUL_PROFILE = {
+    'h1': 'text-4xl font-bold text-gray-900 mb-6 mt-10',
+    'h2': 'text-3xl font-bold text-gray-900 mb-6 mt-10',
+    'h3': 'text-2xl font-semibold text-gray-800 mb-4 mt-8',
+    'h4': 'text-xl font-semibold text-gray-700 mb-3 mt-6',
+    'p': 'text-gray-700 leading-relaxed mb-4',
+    'strong': 'text-gray-900 font-semibold',
+    'em': 'italic',
+    'a': 'text-indigo-600 hover:text-indigo-700 underline decoration-2 decoration-indigo-200 hover:decoration-indigo-400 transition-all',
+    'hr': 'my-10 border-gray-200',
+    'ul': 'list-none space-y-3 mb-6 ml-4',
+    'ol': 'list-none space-y-3 mb-6 ml-4 counter-reset-list',
+    'ul_item': '''<li class="flex items-start">
+                <span class="text-indigo-500 mr-3 mt-1">
+                    <i class="fas fa-check-circle"></i>
+                </span>
+                <span class="text-gray-700">{text}</span>
+            </li>''',
+    'ol_item': '''<li class="flex items-start">
+                <span class="bg-indigo-600 text-white rounded-full w-7 h-7 flex items-center justify-center mr-3 text-sm font-bold flex-shrink-0">
+                    {number}
+                </span>
+                <span class="text-gray-700">{text}</span>
+            </li>''',
+    'table_wrapper': 'overflow-x-auto mb-8',
+    'table': 'min-w-full divide-y divide-gray-200 border border-gray-200 rounded-lg overflow-hidden',
+    'thead': 'bg-gradient-to-r from-indigo-50 to-purple-50',
+    'tbody': 'bg-white divide-y divide-gray-200',
+    'tr': 'hover:bg-gray-50 transition-colors',
+    'th': 'px-6 py-3 text-left text-xs font-medium text-gray-700 uppercase tracking-wider',
+    'td': 'px-6 py-4 whitespace-nowrap text-gray-600',
+    'td_first': 'px-6 py-4 whitespace-nowrap font-medium text-gray-900',
+}
+
+PROFILES = {
+    'restore': RESTORE_PROFILE,
+    'beautiful': BEAUTIFUL_PROFILE,
+}
+
+
+def split_front_matter(md_content):
+    """Split a post into (front_matter, body); front_matter is '' if absent"""
+    if md_content.startswith('---'):
+        end = md_content.find('\n---', 3)
+        if end != -1:
+            body_start = md_content.find('\n', end + 4)
+            body = md_content[body_start + 1:] if body_start != -1 else ''
+            return md_content[3:end].strip('\n'), body
+    return '', md_content
+
+
+def _open(tag, classes):
+    return f'<{tag} class="{classes}">' if classes else f'<{tag}>'
+
+
+_TAGS = ('h1', 'h2', 'h3', 'h4', 'p', 'strong', 'em', 'hr', 'ul', 'ol',
+         'table', 'thead', 'tbody', 'tr', 'th', 'td')
+_compiled_profiles = {}
+
+
+def compile_profile(profile):
+    """Pre-render the opening tags of a class map once per process"""
+    key = id(profile)
+    compiled = _compiled_profiles.get(key)
+    if compiled is None or compiled['source'] is not profile:
+        compiled = {tag: _open(tag, profile[tag]) for tag in _TAGS}
+        compiled['table_wrapper'] = _open('div', profile['table_wrapper'])
+        compiled['td_first'] = _open('td', profile['td_first'])
+        compiled['a'] = profile['a']
+        compiled['ul_item'] = profile['ul_item']
+        compiled['ol_item'] = profile['ol_item']
+        compiled['source'] = profile
+        _compiled_profiles[key] = compiled
+    return compiled
+
+
+def render_inline(text, tags):
+    """Convert bold, italic and links in one left-to-right scan"""
+    if '*' not in text and '[' not in text:
+        return text
+
+    def replace(match):
+        if match.group('bold') is not None:
+            return tags['strong'] + render_inline(match.group('bold'), tags) + '</strong>'
+        if match.group('href') is not None:
+            inner = render_inline(match.group('text'), tags)
+            return f'<a href="{match.group("href")}" class="{tags["a"]}">{inner}</a>'
+        return tags['em'] + match.group('em') + '</em>'
+
+    return INLINE_RE.sub(replace, text)
+
+
+def _table_cells(line):
+    return [cell.strip() for cell in line.strip('|').split('|')]
+
+
+def render_markdown(md_body, profile='beautiful'):
+    """Convert a markdown post body (no front matter) to styled HTML.
+
+    profile is a PROFILES name or a class map dict with the same keys.
+    """
+    if isinstance(profile, str):
+        profile = PROFILES[profile]
+    tags = compile_profile(profile)
+
+    out = []
+    append = out.append
+    paragraph = []
+    list_type = None
+    in_table = False
+
+    lines = md_body.split('\n')
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        first = stripped[:1]
+
+        # Every block except a table row ends an open table
+        if in_table and first != '|':
+            append('</tbody>')
+            append('</table>')
+            append('</div>')
+            in_table = False
+
+        if not first:
+            if paragraph:
+                append(tags['p'] + render_inline('\n'.join(paragraph), tags) + '</p>')
+                paragraph = []
+            if list_type:
+                append(f'</{list_type}>')
+                list_type = None
+            append('')
+            continue
+
+        # Plain text is by far the most common line: take the short path
+        ordered = heading = None
+        if first == '-':
+            is_block = stripped.startswith('- ') or stripped == '---'
+        elif first == '#':
+            heading = HEADING_RE.match(stripped)
+            is_block = heading is not None
+        elif first.isdigit():
+            ordered = ORDERED_RE.match(stripped)
+            is_block = ordered is not None
+        else:
+            is_block = first in '|<'
+
+        if not is_block:
+            if list_type:
+                append(f'</{list_type}>')
+                list_type = None
+            paragraph.append(line)
+            continue
+
+        if paragraph:
+            append(tags['p'] + render_inline('\n'.join(paragraph), tags) + '</p>')
+            paragraph = []
+
+        if first == '|':
+            if list_type:
+                append(f'</{list_type}>')
+                list_type = None
+            if SEPARATOR_RE.match(stripped):
+                continue
+            cells = _table_cells(stripped)
+            if not in_table:
+                in_table = True
+                append(tags['table_wrapper'])
+                append(tags['table'])
+                next_line = lines[index + 1].strip() if index + 1 < len(lines) else ''
+                if next_line.startswith('|') and SEPARATOR_RE.match(next_line):
+                    append(tags['thead'])
+                    append('<tr>')
+                    for cell in cells:
+                        append(tags['th'] + render_inline(cell, tags) + '</th>')
+                    append('</tr>')
+                    append('</thead>')
+                    append(tags['tbody'])
+                    continue
+                append(tags['tbody'])
+            append(tags['tr'])
+            append(tags['td_first'] + render_inline(cells[0], tags) + '</td>')
+            for cell in cells[1:]:
+                append(tags['td'] + render_inline(cell, tags) + '</td>')
+            append('</tr>')
+            continue
+
+        if first == '-' and stripped != '---':
+            if list_type != 'ul':
+                if list_type:
+                    append(f'</{list_type}>')
+                append(tags['ul'])
+                list_type = 'ul'
+            append(tags['ul_item'].format(text=render_inline(stripped[2:], tags)))
+            continue
+
+        if ordered:
+            if list_type != 'ol':
+                if list_type:
+                    append(f'</{list_type}>')
+                append(tags['ol'])
+                list_type = 'ol'
+            append(tags['ol_item'].format(number=ordered.group(1),
+                                          text=render_inline(ordered.group(2), tags)))
+            continue
+
+        if list_type:
+            append(f'</{list_type}>')
+            list_type = None
+
+        if heading:
+            tag = f'h{len(heading.group(1))}'
+            append(tags[tag] + render_inline(heading.group(2), tags) + f'</{tag}>')
+        elif first == '-':
+            append(tags['hr'])
+        else:
+            # Raw HTML blocks in posts (callouts, FAQ items, styled tables) pass through
+            append(line)
+
+    if paragraph:
+        append(tags['p'] + render_inline('\n'.join(paragraph), tags) + '</p>')
+    if list_type:
+        append(f'</{list_type}>')
+    if in_table:
+        append('</tbody>')
+        append('</table>')
+        append('</div>')
+    return '\n'.join(out)
+
+
+if __name__ == "__main__":
+    import sys
+
+    profile_name = sys.argv[1] if len(sys.argv) > 1 else 'beautiful'
+    _, body = split_front_matter(sys.stdin.read())
+    print(render_markdown(body, profile_name))
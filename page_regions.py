@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Marker-delimited generated regions for StableCoin Hub pages.
+
+A generated section of a hand-maintained page sits between marker comments:
+
+    <!-- blog:latest -->
+    ...generated markup...
+    <!-- /blog:latest -->
+
+RegionStore.update() replaces the bodies of any number of regions of a page
+in one read and one write. Regions are located with plain string searches
+(no regular expressions over the page), starting at the offset recorded for
+each region the last time it was written, so an unchanged page is spliced
+without scanning it.
+
+The store (.cache/regions.json) also keeps a hash of every region body it
+wrote. If a region no longer matches its hash, someone edited the generated
+markup by hand: the region is reported as drifted and left alone unless the
+update is forced, so the edit is not silently thrown away.
+
+Usage:
+    python page_regions.py                # list the regions of index.html and their state
+    python page_regions.py blog/x.html    # ... of other pages
+    python page_regions.py --accept       # keep hand edits: record them as the generated state
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from site_build import hash_bytes, write_if_changed
+
+REGION_STORE_FILE = '.cache/regions.json'
+REGION_STORE_VERSION = 1
+
+
+class RegionError(ValueError):
+    """A region's markers are missing or malformed"""
+
+
+def markers(name):
+    return f'<!-- {name} -->', f'<!-- /{name} -->'
+
+
+def find_region(content, name, hint=None):
+    """(marker offset, body start, body end, indent) of a region.
+
+    The body runs from the line after the opening marker up to the newline
+    before the closing marker's line (empty if the markers are on adjacent
+    lines); indent is the opening marker's. hint is where the opening
+    marker was last seen.
+    """
+    opening, closing = markers(name)
+    if hint is not None and content.startswith(opening, hint):
+        start = hint
+    else:
+        start = content.find(opening)
+        if start == -1:
+            raise RegionError(f"region markers for '{name}' not found")
+        if content.find(opening, start + len(opening)) != -1:
+            raise RegionError(f"region '{name}' is marked more than once")
+
+    body_start = content.find('\n', start) + 1
+    close = content.find(closing, body_start) if body_start else -1
+    if close == -1:
+        raise RegionError(f"region '{name}' is not closed")
+    body_end = max(body_start, content.rfind('\n', body_start, close))
+    indent = content[content.rfind('\n', 0, start) + 1:start]
+    if indent.strip() or content[start + len(opening):body_start].strip() \
+            or content[content.rfind('\n', 0, close) + 1:close].strip():
+        raise RegionError(f"markers of region '{name}' must be on lines of their own")
+    return start, body_start, body_end, indent
+
+
+def region_body(content, name):
+    """Current body of a region, without the indent of its first line"""
+    _, body_start, body_end, indent = find_region(content, name)
+    return content[body_start:body_end].removeprefix(indent)
+
+
+class RegionStore:
+    """Offsets and hashes of the generated regions written so far, per page"""
+
+    def __init__(self, path=REGION_STORE_FILE):
+        self.path = path
+        self.pages = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == REGION_STORE_VERSION:
+            self.pages = data.get('pages', {})
+
+    def save(self):
+        data = {'version': REGION_STORE_VERSION, 'pages': self.pages}
+        return write_if_changed(self.path, json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+    def drifted(self, page, name, body):
+        """True if a region body differs from what was last written to it"""
+        recorded = self.pages.get(os.path.normpath(page), {}).get(name)
+        return bool(recorded) and recorded['hash'] != hash_bytes(body)
+
+    def accept(self, page, content, name):
+        """Take a region's current body (e.g. a hand edit) as what was last written"""
+        start, body_start, body_end, _ = find_region(content, name)
+        self.pages.setdefault(os.path.normpath(page), {})[name] = {
+            'offset': start, 'hash': hash_bytes(content[body_start:body_end])}
+
+    def update(self, page, regions, force=False, dry_run=False):
+        """Replace region bodies of a page in a single write.
+
+        regions maps region name -> markup, or -> a function taking the
+        current body and returning the markup. Drifted regions are skipped
+        unless force is set. Returns a stats dict.
+        """
+        with open(page, 'r', encoding='utf-8') as f:
+            content = f.read()
+        page = os.path.normpath(page)
+        recorded = self.pages.get(page, {})
+        stats = {'changed': False, 'written': False, 'updated': [], 'drifted': []}
+
+        located = sorted(find_region(content, name, recorded.get(name, {}).get('offset')) + (name,)
+                         for name in regions)
+        for previous, current in zip(located, located[1:]):
+            if current[0] < previous[2]:
+                raise RegionError(f"regions '{previous[4]}' and '{current[4]}' overlap")
+
+        pieces, position, shift, written = [], 0, 0, {}
+        for start, body_start, body_end, indent, name in located:
+            body = content[body_start:body_end]
+            new_body = body
+            if self.drifted(page, name, body) and not force:
+                stats['drifted'].append(name)
+            else:
+                markup = regions[name]
+                if callable(markup):
+                    markup = markup(body.removeprefix(indent))
+                # Markers on adjacent lines: the body needs a line of its own
+                new_body = indent + markup + ('\n' if body_start == body_end and content[body_start] != '\n' else '')
+                if new_body != body:
+                    stats['updated'].append(name)
+                written[name] = {'offset': start + shift, 'hash': hash_bytes(new_body)}
+            pieces += [content[position:body_start], new_body]
+            position = body_end
+            shift += len(new_body) - len(body)
+        pieces.append(content[position:])
+        updated = ''.join(pieces)
+
+        stats['changed'] = updated != content
+        if dry_run:
+            return stats
+        if stats['changed']:
+            stats['written'] = write_if_changed(page, updated)
+        self.pages.setdefault(page, {}).update(written)
+        self.save()
+        return stats
+
+
+def list_regions(content):
+    """Names of the regions marked in a page, in page order"""
+    names = []
+    position = content.find('<!-- /')
+    while position != -1:
+        end = content.find(' -->', position)
+        if end == -1:
+            break
+        names.append(content[position + 6:end])
+        position = content.find('<!-- /', end)
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List the generated regions of pages and check them for drift")
+    parser.add_argument('pages', nargs='*', default=['index.html'], help="pages to inspect (default: index.html)")
+    parser.add_argument('--store', default=REGION_STORE_FILE, help="path of the region store")
+    parser.add_argument('--accept', action='store_true',
+                        help="record hand-edited regions as generated, so updates apply to them again")
+    args = parser.parse_args()
+
+    store = RegionStore(args.store)
+    drifted = 0
+    for page in args.pages:
+        with open(page, 'r', encoding='utf-8') as f:
+            content = f.read()
+        print(f"📄 {page}")
+        for name in list_regions(content):
+            try:
+                _, body_start, body_end, _ = find_region(content, name)
+            except RegionError as e:
+                print(f"   ❌ {e}")
+                drifted += 1
+                continue
+            body = content[body_start:body_end]
+            if name not in store.pages.get(os.path.normpath(page), {}):
+                state = "not generated yet"
+            elif store.drifted(page, name, body) and args.accept:
+                store.accept(page, content, name)
+                state = "✅ hand edit accepted"
+            elif store.drifted(page, name, body):
+                state = "⚠️  edited by hand since it was generated"
+                drifted += 1
+            else:
+                state = "up to date"
+            print(f"   {name}: {len(body)} chars, {state}")
+    if args.accept:
+        store.save()
+    return 1 if drifted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
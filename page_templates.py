@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Shared page template layer for StableCoin Hub.
+
+The blog generators used to carry their own copy of the whole page (head,
+nav, footer, author box) as one big str.format string. Their markup now
+lives under templates/ and is rendered through this module:
+
+    {{ title }}                       value from the context (dotted: post.title)
+    {{ title|escape }}                HTML-escaped value
+    {% include "partials/gtag.html" %}
+    {% extends "layouts/base.html" %}
+    {% block content %}...{% endblock %}
+    {% for post in related %}...{% endfor %}
+    {% if category %}...{% else %}...{% endif %}
+
+A tag alone on its line takes the whole line with it, so block structure
+does not leave blank lines in the output. Values are inserted as-is unless
+escaped, exactly like the format strings they replace, and there is no
+need to double the braces of inline scripts and styles.
+
+Each template is compiled once per process. Included partials are rendered
+through a fragment cache keyed by the values of the variables they read, so
+the footer is built once per run and a related-articles list once per
+distinct list, however many pages include them.
+
+Usage:
+    python page_templates.py           # compile every template and list them
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import ChainMap, OrderedDict
+from functools import lru_cache
+from html import escape
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+FRAGMENT_CACHE_SIZE = 4096
+
+# A tag alone on its line (indentation and newline included), an inline tag, or a variable
+TOKEN_RE = re.compile(r'^[ \t]*(\{%[^%}]*%\})[ \t]*\n|(\{%[^%}]*%\})|(\{\{[^{}]*\}\})', re.MULTILINE)
+NAME_RE = re.compile(r'[A-Za-z_]\w*(?:\.\w+)*$')
+FILTERS = {
+    'escape': lambda value: escape(str(value)),
+}
+
+
+class TemplateError(ValueError):
+    """A template could not be compiled or rendered"""
+
+
+def resolve(context, path):
+    """Look up a dotted name in the context (dict keys or attributes)"""
+    first, *rest = path.split('.')
+    try:
+        value = context[first]
+    except KeyError:
+        raise TemplateError(f"undefined variable '{first}'") from None
+    for part in rest:
+        value = value[part] if isinstance(value, dict) else getattr(value, part)
+    return value
+
+
+def parse_name(expression, template_name):
+    if not NAME_RE.match(expression):
+        raise TemplateError(f"{template_name}: bad expression '{expression}'")
+    return expression
+
+
+def parse_path(argument, template_name):
+    """The quoted template name of an include or extends tag"""
+    if len(argument) < 2 or argument[0] not in '"\'' or argument[-1] != argument[0]:
+        raise TemplateError(f"{template_name}: expected a quoted template name, got {argument}")
+    return argument[1:-1]
+
+
+class Template:
+    """A compiled template: a tree of (kind, ...) nodes rendered by a single walk"""
+
+    def __init__(self, source, name='<string>'):
+        self.name = name
+        self.parent = None
+        self.blocks = {}
+        self.nodes = self._parse(source)
+
+    def _parse(self, source):
+        root = []
+        # Open tags: (kind, node, children list being filled)
+        stack = [('root', None, root)]
+        position = 0
+        for match in TOKEN_RE.finditer(source):
+            if match.start() > position:
+                stack[-1][2].append(('text', source[position:match.start()]))
+            position = match.end()
+            tag = match.group(1) or match.group(2)
+            if tag is None:
+                expression, *filters = [part.strip() for part in match.group(3)[2:-2].split('|')]
+                for name in filters:
+                    if name not in FILTERS:
+                        raise TemplateError(f"{self.name}: unknown filter '{name}'")
+                stack[-1][2].append(('var', parse_name(expression, self.name), filters))
+                continue
+
+            keyword, _, argument = tag[2:-2].strip().partition(' ')
+            argument = argument.strip()
+            children = stack[-1][2]
+            if keyword == 'include':
+                children.append(('include', parse_path(argument, self.name)))
+            elif keyword == 'extends':
+                if stack[-1][0] != 'root' or self.parent:
+                    raise TemplateError(f"{self.name}: extends must be a top-level tag used once")
+                self.parent = parse_path(argument, self.name)
+            elif keyword == 'block':
+                node = ['block', parse_name(argument, self.name), []]
+                if node[1] in self.blocks:
+                    raise TemplateError(f"{self.name}: block '{node[1]}' defined twice")
+                self.blocks[node[1]] = node[2]
+                children.append(node)
+                stack.append(('block', node, node[2]))
+            elif keyword == 'for':
+                variable, _, iterable = argument.partition(' in ')
+                node = ['for', parse_name(variable.strip(), self.name), parse_name(iterable.strip(), self.name), []]
+                children.append(node)
+                stack.append(('for', node, node[3]))
+            elif keyword == 'if':
+                node = ['if', parse_name(argument, self.name), [], []]
+                children.append(node)
+                stack.append(('if', node, node[2]))
+            elif keyword == 'else':
+                if stack[-1][0] != 'if':
+                    raise TemplateError(f"{self.name}: else outside of an if")
+                kind, node, _ = stack.pop()
+                stack.append(('else', node, node[3]))
+            elif keyword in ('endblock', 'endfor', 'endif'):
+                expected = {'endblock': ('block',), 'endfor': ('for',), 'endif': ('if', 'else')}[keyword]
+                if stack[-1][0] not in expected:
+                    raise TemplateError(f"{self.name}: unexpected {keyword}")
+                stack.pop()
+            else:
+                raise TemplateError(f"{self.name}: unknown tag '{keyword}'")
+
+        if len(stack) > 1:
+            raise TemplateError(f"{self.name}: unclosed {stack[-1][0]}")
+        if position < len(source):
+            root.append(('text', source[position:]))
+        return root
+
+    @property
+    def names(self):
+        """Top-level context names this template (and everything it includes) reads"""
+        if not hasattr(self, '_names'):
+            names = set()
+            if self.parent:
+                names |= get_template(self.parent).names
+            collect_names(self.nodes, set(), names)
+            self._names = frozenset(names)
+        return self._names
+
+    def render(self, context=None, **values):
+        context = dict(context or {}, **values)
+        # Blocks of the most-derived template win
+        blocks = {}
+        template = self
+        while True:
+            for name, body in template.blocks.items():
+                blocks.setdefault(name, body)
+            if not template.parent:
+                break
+            template = get_template(template.parent)
+        out = []
+        render_nodes(template.nodes, context, blocks, out)
+        return ''.join(out)
+
+
+def collect_names(nodes, bound, names):
+    for node in nodes:
+        kind = node[0]
+        if kind == 'var':
+            first = node[1].split('.')[0]
+            if first not in bound:
+                names.add(first)
+        elif kind == 'include':
+            names |= get_template(node[1]).names - bound
+        elif kind == 'block':
+            collect_names(node[2], bound, names)
+        elif kind == 'for':
+            first = node[2].split('.')[0]
+            if first not in bound:
+                names.add(first)
+            collect_names(node[3], bound | {node[1]}, names)
+        elif kind == 'if':
+            first = node[1].split('.')[0]
+            if first not in bound:
+                names.add(first)
+            collect_names(node[2], bound, names)
+            collect_names(node[3], bound, names)
+
+
+def render_nodes(nodes, context, blocks, out):
+    for node in nodes:
+        kind = node[0]
+        if kind == 'text':
+            out.append(node[1])
+        elif kind == 'var':
+            value = resolve(context, node[1])
+            for name in node[2]:
+                value = FILTERS[name](value)
+            out.append(str(value))
+        elif kind == 'include':
+            out.append(fragments.render(node[1], context))
+        elif kind == 'block':
+            render_nodes(blocks.get(node[1], node[2]), context, blocks, out)
+        elif kind == 'for':
+            for item in resolve(context, node[2]):
+                render_nodes(node[3], ChainMap({node[1]: item}, context), blocks, out)
+        elif kind == 'if':
+            render_nodes(node[2] if resolve(context, node[1]) else node[3], context, blocks, out)
+
+
+class FragmentCache:
+    """LRU cache of rendered partials keyed by template name and the values it reads"""
+
+    def __init__(self, size=FRAGMENT_CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, name, context):
+        template = get_template(name)
+        values = [[n, context.get(n)] for n in sorted(template.names)]
+        data = json.dumps(values, sort_keys=True, default=repr, ensure_ascii=False)
+        return name, hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def render(self, name, context):
+        key = self.key(name, context)
+        html = self.entries.get(key)
+        if html is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return html
+        self.misses += 1
+        html = get_template(name).render(context)
+        self.entries[key] = html
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+        return html
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+
+fragments = FragmentCache()
+
+
+@lru_cache(maxsize=None)
+def get_template(name):
+    """Compile a template under templates/ (once per process)"""
+    path = os.path.join(TEMPLATES_DIR, name)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except FileNotFoundError:
+        raise TemplateError(f"template not found: {name}") from None
+    return Template(source, name)
+
+
+def render(name, **context):
+    """Render a template under templates/ with the given context"""
+    return get_template(name).render(context)
+
+
+def render_fragment(name, **context):
+    """Render a partial through the fragment cache"""
+    return fragments.render(name, context)
+
+
+def main():
+    names = []
+    for current, _, files in os.walk(TEMPLATES_DIR):
+        for filename in sorted(files):
+            if filename.endswith('.html'):
+                names.append(os.path.relpath(os.path.join(current, filename), TEMPLATES_DIR).replace(os.sep, '/'))
+
+    failed = 0
+    for name in sorted(names):
+        try:
+            template = get_template(name)
+            print(f"✅ {name}: {', '.join(sorted(template.names)) or '(no variables)'}")
+        except TemplateError as e:
+            print(f"❌ {e}")
+            failed += 1
+    print("=" * 60)
+    print(f"📊 {len(names)} templates, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
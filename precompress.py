@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Precompressed build artifacts for StableCoin Hub.
+
+Writes a .gz (and, when the brotli package is installed, a .br) sibling
+next to every HTML, JS, CSS, XML and JSON file of the site, at the highest
+compression level, so the web server can send them as they are instead of
+compressing each response:
+
+    blog/usdt-vs-usdc/index.html
+    blog/usdt-vs-usdc/index.html.gz
+    blog/usdt-vs-usdc/index.html.br
+
+Files are compressed in parallel across cores. .cache/precompress.json
+records the hash of every source, so a file whose bytes did not change is
+skipped; a sibling that would not be smaller than its source is not
+written. Siblings of deleted sources are removed.
+
+The rules that serve the siblings (to clients that accept br or gzip, with
+the right Content-Type and Content-Encoding) are kept in a marked block of
+.htaccess. Netlify, Vercel and GitHub Pages compress responses themselves
+and do not serve precompressed siblings, so their configs are unchanged.
+The siblings are build artifacts and are not committed.
+
+Usage:
+    python precompress.py              # compress changed files
+    python precompress.py --force      # recompress everything
+    python precompress.py --dry-run    # report what would be compressed
+    python precompress.py --jobs 4     # worker processes (default: one per CPU)
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from seo_document import SKIP_DIRS
+from site_build import atomic_write, hash_bytes, hash_file, write_if_changed
+
+try:
+    import brotli
+    BROTLI_ENABLED = True
+except ImportError:
+    BROTLI_ENABLED = False
+
+PRECOMPRESS_CACHE_FILE = '.cache/precompress.json'
+PRECOMPRESS_CACHE_VERSION = 1
+HTACCESS_FILE = '.htaccess'
+
+# Compressed extension -> Content-Type the server must keep sending
+CONTENT_TYPES = {
+    '.html': 'text/html',
+    '.js': 'text/javascript',
+    '.css': 'text/css',
+    '.xml': 'application/xml',
+    '.json': 'application/json',
+}
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# (sibling suffix, Accept-Encoding token, Content-Encoding), in order of preference
+ENCODINGS = (('.br', 'br', 'br'), ('.gz', 'gzip', 'gzip'))
+
+HTACCESS_BEGIN = '# BEGIN precompressed files (generated by precompress.py)'
+HTACCESS_END = '# END precompressed files'
+
+
+def find_sources(root='.'):
+    """Relative paths of every file to compress, skipping hidden directories and the page templates"""
+    sources = []
+    for current, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.')
+                         and not (current == root and d in SKIP_DIRS))
+        for name in sorted(files):
+            if os.path.splitext(name)[1] in CONTENT_TYPES:
+                sources.append(os.path.relpath(os.path.join(current, name), root))
+    return sources
+
+
+def compress(data):
+    """Suffix -> compressed bytes of one source"""
+    compressed = {'.gz': gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)}
+    if BROTLI_ENABLED:
+        compressed['.br'] = brotli.compress(data, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+    return compressed
+
+
+def compress_file(path):
+    """Write the siblings of one file. Runs in worker processes; returns its cache entry."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    entry = {'hash': hash_bytes(data), 'bytes': len(data), 'brotli': BROTLI_ENABLED}
+    for suffix, payload in compress(data).items():
+        if len(payload) < len(data):
+            atomic_write(path + suffix, payload)
+            entry[suffix] = len(payload)
+        else:
+            remove_sibling(path + suffix)
+    return path, entry
+
+
+def remove_sibling(path):
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def load_cache(path=PRECOMPRESS_CACHE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return data.get('files', {}) if data.get('version') == PRECOMPRESS_CACHE_VERSION else {}
+
+
+def up_to_date(path, entry, root):
+    """True if the recorded siblings of a source still match it"""
+    if entry is None or entry.get('brotli') != BROTLI_ENABLED:
+        return False
+    if any(not os.path.exists(os.path.join(root, path + suffix)) for suffix, _, _ in ENCODINGS if suffix in entry):
+        return False
+    return hash_file(os.path.join(root, path)) == entry['hash']
+
+
+def htaccess_block():
+    """mod_rewrite/mod_headers rules serving the siblings to clients that accept them"""
+    extensions = '|'.join(ext.lstrip('.') for ext in CONTENT_TYPES)
+    lines = [HTACCESS_BEGIN, '<IfModule mod_rewrite.c>']
+    for suffix, token, _ in ENCODINGS:
+        lines += [
+            f'RewriteCond %{{HTTP:Accept-Encoding}} \\b{token}\\b',
+            f'RewriteCond %{{REQUEST_FILENAME}}index.html{suffix} -s',
+            f'RewriteRule ^(.*/)?$ /$1index.html{suffix} [L]',
+            f'RewriteCond %{{HTTP:Accept-Encoding}} \\b{token}\\b',
+            f'RewriteCond %{{REQUEST_FILENAME}}{suffix} -s',
+            f'RewriteRule ^(.+\\.({extensions}))$ /$1{suffix} [L]',
+        ]
+    # Keep the original type and stop mod_deflate/mod_brotli compressing again
+    for suffix, _, _ in ENCODINGS:
+        for ext, content_type in CONTENT_TYPES.items():
+            lines.append(f'RewriteRule \\{ext}\\{suffix}$ - [T={content_type},E=no-gzip:1,E=no-brotli:1]')
+    lines.append('</IfModule>')
+    lines.append('<IfModule mod_headers.c>')
+    for suffix, _, encoding in ENCODINGS:
+        lines += [
+            f'<FilesMatch "\\.({extensions})\\{suffix}$">',
+            f'Header set Content-Encoding {encoding}',
+            'Header append Vary Accept-Encoding',
+            '</FilesMatch>',
+        ]
+    lines += ['</IfModule>', HTACCESS_END]
+    return '\n'.join(lines)
+
+
+def update_htaccess(path=HTACCESS_FILE, dry_run=False):
+    """Replace (or append) the generated block of .htaccess. Returns True if it changed."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        content = ''
+    block = htaccess_block()
+    start = content.find(HTACCESS_BEGIN)
+    if start != -1:
+        end = content.find(HTACCESS_END, start)
+        if end == -1:
+            raise ValueError(f"{path}: '{HTACCESS_BEGIN}' has no matching end marker")
+        updated = content[:start] + block + content[end + len(HTACCESS_END):]
+    else:
+        # After the redirect rules, which must run first
+        updated = content.rstrip('\n') + ('\n\n' if content.strip() else '') + block + '\n'
+    if updated == content:
+        return False
+    return True if dry_run else write_if_changed(path, updated)
+
+
+def precompress(root='.', force=False, dry_run=False, jobs=0, cache_path=PRECOMPRESS_CACHE_FILE):
+    """Compress every changed source under root and refresh the server config. Returns a stats dict."""
+    from render_pipeline import resolve_jobs
+
+    cache = load_cache(cache_path)
+    sources = find_sources(root)
+    stale = [path for path in sources if force or not up_to_date(path, cache.get(path), root)]
+    stats = {'files': len(sources), 'compressed': 0, 'skipped': len(sources) - len(stale), 'removed': 0,
+             'bytes': 0, 'gz': 0, 'br': 0, 'htaccess': False, 'brotli': BROTLI_ENABLED}
+
+    for path in sorted(set(cache) - set(sources)):
+        for suffix, _, _ in ENCODINGS:
+            if dry_run:
+                stats['removed'] += os.path.exists(os.path.join(root, path + suffix))
+            else:
+                stats['removed'] += remove_sibling(os.path.join(root, path + suffix))
+        if not dry_run:
+            del cache[path]
+
+    if dry_run:
+        for path in stale:
+            print(f"📝 Would compress: {path}")
+        stats['compressed'] = len(stale)
+        stats['htaccess'] = update_htaccess(os.path.join(root, HTACCESS_FILE), dry_run=True)
+        return stats
+
+    targets = [os.path.join(root, path) for path in stale]
+    jobs = min(resolve_jobs(jobs), max(len(targets), 1))
+    if jobs == 1:
+        results = [compress_file(target) for target in targets]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(compress_file, targets, chunksize=max(1, len(targets) // (jobs * 4))))
+    for path, (_, entry) in zip(stale, results):
+        cache[path] = entry
+    stats['compressed'] = len(results)
+
+    # Totals over every source, compressed now or earlier; a missing sibling is served uncompressed
+    for path in sources:
+        entry = cache[path]
+        stats['bytes'] += entry['bytes']
+        stats['gz'] += entry.get('.gz', entry['bytes'])
+        stats['br'] += entry.get('.br', entry.get('.gz', entry['bytes']))
+
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    write_if_changed(cache_path, json.dumps({'version': PRECOMPRESS_CACHE_VERSION, 'files': cache},
+                                            indent=1, sort_keys=True) + '\n')
+    stats['htaccess'] = update_htaccess(os.path.join(root, HTACCESS_FILE))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write .br/.gz siblings of the site's text files")
+    parser.add_argument('--root', default='.', help="site root (default: current directory)")
+    parser.add_argument('--force', action='store_true', help="recompress files even if unchanged")
+    parser.add_argument('--dry-run', action='store_true', help="only report what would be compressed")
+    parser.add_argument('--jobs', '-j', type=int, default=0, help="worker processes (0 = one per CPU, default)")
+    args = parser.parse_args()
+
+    print("🗜️  Precompressing site files...")
+    print("=" * 60)
+    if not BROTLI_ENABLED:
+        print("⚠️  brotli is not installed (pip install brotli); writing .gz siblings only")
+    try:
+        stats = precompress(args.root, force=args.force, dry_run=args.dry_run, jobs=args.jobs)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print("=" * 60)
+    print(f"📊 Summary:")
+    print(f"   Files: {stats['files']}")
+    print(f"   {'To compress' if args.dry_run else 'Compressed'}: {stats['compressed']}")
+    print(f"   Unchanged: {stats['skipped']}")
+    if stats['removed']:
+        print(f"   Stale siblings removed: {stats['removed']}")
+    if not args.dry_run and stats['bytes']:
+        print(f"   Total size: {stats['bytes'] / 1024:,.0f} KB")
+        print(f"   gzip: {stats['gz'] / 1024:,.0f} KB ({(stats['bytes'] - stats['gz']) / 1024:,.0f} KB saved, "
+              f"{100 - stats['gz'] * 100 / stats['bytes']:.1f}%)")
+        if stats['brotli']:
+            print(f"   brotli: {stats['br'] / 1024:,.0f} KB ({(stats['bytes'] - stats['br']) / 1024:,.0f} KB saved, "
+                  f"{100 - stats['br'] * 100 / stats['bytes']:.1f}%)")
+    if stats['htaccess']:
+        print(f"   {HTACCESS_FILE}: precompressed rules {'would be ' if args.dry_run else ''}updated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,65 +1,66 @@
 #!/usr/bin/env python3
 """
 Script to automatically publish all missing blog posts
+
+Posts that fail the quality check (blog_quality_validator.check_blog_content)
+are held back unless --skip-validation is given.
 """
 
+import argparse
 import os
 import sys
-from datetime import datetime
-from pathlib import Path
 
 # Add current directory to path
 sys.path.append('/Users/raymond/Desktop/Stablecoinhub.pro/stablecoinhub-repo')
 os.chdir('/Users/raymond/Desktop/Stablecoinhub.pro/stablecoinhub-repo')
 
 # Import the auto_publish_blogs module
-from auto_publish_blogs import publish_blogs_for_date
-
-def publish_all_missing():
-    """Publish all missing blogs up to today"""
+from auto_publish_blogs import create_blog_html
+from blog_metadata import BlogIndex
+from blog_quality_validator import check_blog_content
+from blog_schedule import load_schedule
+from publish_planner import plan_publish, print_plan, publish_plan
 
-    # List of dates with missing blogs (from the analysis)
-    missing_dates = [
-        "2025-09-21", "2025-09-22", "2025-09-23", "2025-09-25",
-        "2025-09-26", "2025-09-27", "2025-09-28", "2025-09-29", "2025-09-30",
-        "2025-10-01", "2025-10-02", "2025-10-03", "2025-10-04", "2025-10-05",
-        "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-10-10", "2025-10-11"
-    ]
+def publish_all_missing(validate=True):
+    """Publish all missing blogs up to today; validate=False skips the quality check"""
 
     print("=" * 80)
     print("AUTOMATICALLY PUBLISHING ALL MISSING BLOGS")
     print("=" * 80)
-    print(f"Total dates to process: {len(missing_dates)}")
-    print()
 
-    total_published = 0
-
-    for date in missing_dates:
-        print(f"\n📝 Processing date: {date}")
-        print("-" * 40)
-        count = publish_blogs_for_date(date)
-        total_published += count
+    # Every due post without a page, found by one diff against the metadata index
+    index = BlogIndex()
+    plan = plan_publish(load_schedule(), index.sources())
+    print_plan(plan)
+    print()
 
-        if count > 0:
-            print(f"✅ Published {count} blog(s) for {date}")
-        else:
-            print(f"⏭️  No new blogs to publish for {date}")
+    if not validate:
+        print("⚠️  Quality check skipped (--skip-validation)")
+    stats = publish_plan(plan, create_blog_html, validate=check_blog_content if validate else None, index=index)
+    total_published = stats['published']
 
     print("\n" + "=" * 80)
     print(f"🎉 PUBLISHING COMPLETE!")
     print(f"Total blogs published: {total_published}")
+    print(f"Blog listing pages rewritten: {stats['listings']}")
+    if stats['rejected']:
+        print(f"Blogs held back by the quality check: {stats['rejected']}")
     print("=" * 80)
 
     return total_published
 
 if __name__ == "__main__":
-    published = publish_all_missing()
+    parser = argparse.ArgumentParser(description="Publish all missing blog posts up to today")
+    parser.add_argument('--skip-validation', action='store_true',
+                        help="publish posts that fail the quality check (word count, placeholders)")
+    args = parser.parse_args()
+
+    published = publish_all_missing(validate=not args.skip_validation)
 
     if published > 0:
         print("\n📋 Next steps:")
         print("1. Review the published blogs")
-        print("2. Update the blog index page")
-        print("3. Deploy to production")
-        print("4. Verify in Google Search Console")
+        print("2. Deploy to production")
+        print("3. Verify in Google Search Console")
     else:
         print("\n✨ All blogs are already published!")
\ No newline at end of file
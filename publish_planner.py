@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Batch publish planner for StableCoin Hub.
+
+The publishing scripts used to walk the schedule entry by entry, probe the
+filesystem for each post, and rewrite blog/index.html and the homepage once
+per post they published. The planner instead:
+
+1. diffs the compiled schedule (blog_schedule.py) against the slugs in
+   the blog metadata index in one set difference (due slugs minus
+   existing slugs),
+2. renders every missing post in memory, and rejects the whole batch
+   before anything is written if a post fails to render,
+3. holds back every post that fails the quality check
+   (blog_quality_validator.check_blog_content) unless told to skip it,
+4. writes the posts, then refreshes the metadata index for just those
+   slugs and rebuilds the blog listing pages once, and runs an optional
+   homepage update once with all the new posts.
+
+Backfilling thirty missed posts therefore costs one listing rebuild and one
+homepage rewrite, not thirty of each.
+
+Usage:
+    python publish_planner.py                     # publish everything due and missing
+    python publish_planner.py --dry-run           # show the plan as a diff
+    python publish_planner.py --date 2025-10-11   # plan as of another day
+    python publish_planner.py --skip-validation   # publish without the quality check
+    python publish_planner.py --profile           # also record a Chrome trace (see build_profiler.py)
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+
+from blog_metadata import BLOG_DIR, BlogIndex
+from build_profiler import add_profile_argument, profiled, stage
+from html_minify import minify_html
+from site_build import atomic_write
+
+
+def today_utc():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def plan_publish(schedule, existing, today=None):
+    """Split a compiled Schedule against the set of existing slugs.
+
+    Returns {'missing', 'published', 'future'}, each a list of schedule
+    entries oldest first; 'missing' are due posts that do not exist yet.
+    """
+    today = today or today_utc()
+    due = schedule.due(today)
+    missing = {post['url'] for post in due} - set(existing)
+    return {
+        'today': today,
+        'missing': [post for post in due if post['url'] in missing],
+        'published': [post for post in due if post['url'] not in missing],
+        'future': schedule.after(today),
+    }
+
+
+def print_plan(plan, verbose=False):
+    """Print the plan as a diff against the published site"""
+    print(f"📋 Publish plan as of {plan['today']}")
+    print("=" * 60)
+    for post in plan['missing']:
+        print(f"+ {post['date']}  /blog/{post['url']}/  {post['title']}")
+    if verbose:
+        for post in plan['published']:
+            print(f"= {post['date']}  /blog/{post['url']}/")
+        for post in plan['future']:
+            print(f"~ {post['date']}  /blog/{post['url']}/")
+    if not plan['missing']:
+        print("✨ Nothing to publish")
+    print("=" * 60)
+    print(f"   To publish: {len(plan['missing'])}")
+    print(f"   Already published: {len(plan['published'])}")
+    print(f"   Scheduled later: {len(plan['future'])}")
+
+
+def render_missing(posts, render, validate=None):
+    """Render every post in memory. Returns (ready [(post, html)], rejected [post]).
+
+    validate(slug, html) may veto a post (e.g. the quality check); a
+    render error aborts the whole batch before anything is written.
+    """
+    ready, rejected = [], []
+    for post in posts:
+        html = render(post)
+        if validate is not None and not validate(post['url'], html):
+            rejected.append(post)
+            continue
+        ready.append((post, html))
+    return ready, rejected
+
+
+def publish_plan(plan, render, validate=None, update_homepage=None, blog_dir=BLOG_DIR, index=None):
+    """Render, write and index every missing post of a plan in one batch. Returns a stats dict.
+
+    update_homepage, if given, is called once with the published posts,
+    newest first.
+    """
+    stats = {'published': 0, 'rejected': 0, 'listings': 0, 'homepage': False}
+    with stage('render', posts=len(plan['missing'])):
+        ready, rejected = render_missing(plan['missing'], render, validate)
+    stats['rejected'] = len(rejected)
+    if not ready:
+        return stats
+
+    with stage('write', posts=len(ready)):
+        for post, html in ready:
+            atomic_write(os.path.join(blog_dir, post['url'], 'index.html'), minify_html(html).encode('utf-8'))
+            print(f"✅ Published: {post['title']}")
+            print(f"   URL: /blog/{post['url']}/")
+    stats['published'] = len(ready)
+
+    # One metadata refresh and one listing rebuild for the whole batch
+    from blog_listing import build_listings
+    with stage('metadata'):
+        if index is None:
+            index = BlogIndex()
+        index.refresh(slugs={post['url'] for post, _ in ready})
+        index.save()
+    with stage('listings'):
+        stats['listings'] = build_listings(index=index)['written']
+
+    if update_homepage is not None:
+        with stage('homepage'):
+            stats['homepage'] = bool(update_homepage([post for post, _ in reversed(ready)]))
+    return stats
+
+
+def run_plan(args):
+    """Plan and (unless --dry-run) publish for the parsed command line"""
+    from auto_publish_blogs import create_blog_html
+    from blog_quality_validator import check_blog_content
+    from blog_schedule import load_schedule
+
+    index = BlogIndex()
+    plan = plan_publish(load_schedule(), index.sources(), today=args.date)
+    print_plan(plan, verbose=args.verbose or args.dry_run)
+    if args.dry_run:
+        if plan['missing']:
+            print(f"   Would write {len(plan['missing'])} post(s), then rebuild the blog listing pages once")
+        return 0
+
+    if args.skip_validation:
+        print("⚠️  Quality check skipped (--skip-validation)")
+    validate = None if args.skip_validation else check_blog_content
+    stats = publish_plan(plan, create_blog_html, validate=validate, index=index)
+    if stats['published']:
+        print(f"\n🎉 Published {stats['published']} post(s); "
+              f"{stats['listings']} listing page(s) rewritten")
+    if stats['rejected']:
+        print(f"❌ {stats['rejected']} post(s) failed the quality check and were not published")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish every due blog post that is missing, in one batch")
+    parser.add_argument('--dry-run', action='store_true', help="only print the plan")
+    parser.add_argument('--date', help="plan as of this day (YYYY-MM-DD, default: today in UTC)")
+    parser.add_argument('--verbose', '-v', action='store_true', help="also list published and future posts")
+    parser.add_argument('--skip-validation', action='store_true',
+                        help="publish posts that fail the quality check (word count, placeholders)")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiled(args.profile, 'publish_planner'):
+        return run_plan(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
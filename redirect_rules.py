@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+"""
+Redirect rules for StableCoin Hub, compiled from a single source.
+
+data/redirects.json declares the canonical origin, the alias hosts that
+redirect to it, the site-wide policies (https, dropping index.html, adding
+the trailing slash, dropping tracking parameters) and the individual path
+redirects. This compiler writes every server config the site ships from it:
+
+    _redirects      Netlify, including a rule per page for each alias host
+    netlify.toml    Netlify, the marked [[redirects]] block
+    vercel.json     Vercel, "redirects" and "rewrites"
+    .htaccess       Apache, the marked block (before precompress.py's)
+
+While compiling:
+
+- a destination is resolved to where it finally lands: a redirect to
+  another redirect's source, to a path missing its trailing slash or to an
+  index.html points straight at the final URL, so every request takes one hop
+- MERGE_MIN or more redirects moving the children of one directory to
+  another become a single wildcard rule, when no page lives under the old
+  directory
+- a redirect that a wildcard or a site-wide policy already performs is
+  dropped (for a policy, only on the platforms implementing it generically)
+- two redirects from one path to different places, and redirect loops, are
+  errors; a redirect away from an existing page is a warning
+
+Alias hosts apply the path rules themselves, straight to the final URL, so
+http://stablecoinhub.pro/about is one hop too. Apache works out the whole
+canonical form of a request before its single redirect.
+
+Vercel runs cleanUrls and trailingSlash before any configured redirect, so
+an alias URL without its slash would redirect twice; vercel.json sets
+neither and gets redirects doing the same straight to the final URL, plus
+a rewrite serving privacy.html and the other .html pages at /privacy/.
+
+Netlify cannot add a trailing slash in a pattern, so _redirects lists the
+alias URLs of each page: two lines (http and https) for every alias host
+the page lives under, four per blog post, so the file grows linearly with
+the site (about 400 lines for 100 pages). A rule with a literal path is a
+string comparison, and print_report warns once _redirects passes
+NETLIFY_MAX_RULES.
+redirect_simulator.py checks the written configs for chains and loops.
+
+Usage:
+    python redirect_rules.py             # compile and write the configs
+    python redirect_rules.py --check     # exit 1 if a config is out of date
+    python redirect_rules.py --dry-run   # report what would change
+"""
+
+import argparse
+import functools
+import json
+import os
+import re
+import sys
+
+from site_build import write_if_changed
+
+REDIRECTS_FILE = 'data/redirects.json'
+DEFAULT_STATUS = 301
+MERGE_MIN = 3
+NETLIFY_MAX_RULES = 2000
+
+BLOCK_BEGIN = '# BEGIN redirects (generated by redirect_rules.py from data/redirects.json)'
+BLOCK_END = '# END redirects'
+GENERATED_BLOCK_RE = re.compile(r'^# BEGIN .*?^# END [^\n]*', re.MULTILINE | re.DOTALL)
+
+# Site-wide policies each platform implements with one generic rule or setting.
+# Netlify and Vercel serve https themselves; Netlify has no generic index.html
+# rule, adds the trailing slash itself (pretty URLs) and ignores it when matching
+# rules, so /about -> /about/ would loop there. Only Apache drops tracking
+# parameters (the hosted sites keep them for canonical-handler.js).
+PLATFORM_POLICIES = {
+    'netlify': {'trailing_slash'},
+    'vercel': {'strip_index_html', 'trailing_slash'},
+    'htaccess': {'force_https', 'strip_index_html', 'trailing_slash', 'strip_query'},
+}
+POLICIES = ('force_https', 'strip_index_html', 'trailing_slash', 'strip_query')
+
+# Vercel sources (matched strictly: /about does not match /about/) for a path
+# ending in index.html, in .html, and in a segment without an extension
+VERCEL_INDEX_SOURCE = '/:path((?:[^/]+/)*)index.html'
+VERCEL_HTML_SOURCE = '/:path((?:[^/]+/)*[^/]+).html'
+VERCEL_NO_SLASH_SOURCE = '/:path((?:[^/]+/)*[^/.]+)'
+
+# Environment variables the .htaccess rules note the canonical form of a request in
+REDIRECT_ENV = 'CANONICAL_REDIRECT'
+DROP_QUERY_ENV = 'CANONICAL_DROP_QUERY'
+
+ORIGIN_RE = re.compile(r'https?://[A-Za-z0-9.-]+$')
+PATH_RE = re.compile(r'/[^\s*?#]*$')
+DESTINATION_RE = re.compile(r'(?:https?://[A-Za-z0-9.-]+)?/\S*$')
+URL_RE = re.compile(r'https?://([^/?#]+)(.*)$')
+
+
+class RedirectError(ValueError):
+    """The redirect source is malformed or its rules conflict"""
+
+
+def load_source(path=REDIRECTS_FILE):
+    """The redirect source, validated"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = json.load(f)
+    except json.JSONDecodeError as e:
+        raise RedirectError(f"{path}: {e}") from None
+
+    if not ORIGIN_RE.match(source.get('canonical', '')):
+        raise RedirectError(f"{path}: canonical must be an origin like https://www.example.com")
+    canonical_host = source['canonical'].split('://', 1)[1]
+    for host, prefix in source.get('hosts', {}).items():
+        if host == canonical_host:
+            raise RedirectError(f"{path}: the canonical host {host} cannot redirect to itself")
+        if not (prefix.startswith('/') and prefix.endswith('/')):
+            raise RedirectError(f"{path}: host {host} must map to a path starting and ending with '/'")
+
+    for position, redirect in enumerate(source.get('redirects', [])):
+        where = f"{path} redirect {position}"
+        if not isinstance(redirect, dict) or 'from' not in redirect or 'to' not in redirect:
+            raise RedirectError(f"{where}: needs 'from' and 'to'")
+        source_path, to = redirect['from'], redirect['to']
+        wildcard = source_path.endswith('/*')
+        if not PATH_RE.match(source_path[:-1] if wildcard else source_path):
+            raise RedirectError(f"{where}: bad source '{source_path}' (a path, optionally ending in '/*')")
+        if not DESTINATION_RE.match(to):
+            raise RedirectError(f"{where}: bad destination '{to}'")
+        if wildcard != to.endswith(':splat'):
+            raise RedirectError(f"{where}: a '/*' source needs a destination ending in ':splat', and only it")
+        if redirect.get('status', DEFAULT_STATUS) not in (301, 302, 307, 308):
+            raise RedirectError(f"{where}: unsupported status {redirect['status']}")
+    return source
+
+
+@functools.lru_cache(maxsize=None)
+def canonical_origin(path=REDIRECTS_FILE):
+    """The origin every page's canonical URL uses (https://www.stablecoinhub.pro)"""
+    return load_source(path)['canonical']
+
+
+@functools.lru_cache(maxsize=None)
+def host_prefixes(path=REDIRECTS_FILE):
+    """Every host of the site -> the path its pages live under on the canonical origin"""
+    source = load_source(path)
+    return {source['canonical'].split('://', 1)[1]: '/', **source.get('hosts', {})}
+
+
+def canonical_url(url, path=REDIRECTS_FILE):
+    """A URL on any host of the site (http or https) as its canonical URL; None for other sites"""
+    match = URL_RE.match(url)
+    if match is None:
+        return None
+    prefix = host_prefixes(path).get(match.group(1).lower())
+    if prefix is None:
+        return None
+    return canonical_origin(path) + prefix + (match.group(2) or '').lstrip('/')
+
+
+def local_path(url, origin):
+    """url as a path when it points at the canonical origin"""
+    if url == origin:
+        return '/'
+    return url[len(origin):] if url.startswith(origin + '/') else url
+
+
+def final_form(to, policies):
+    """Where a destination path lands once the site-wide policies applied to it"""
+    if not to.startswith('/') or to.endswith(':splat'):
+        return to
+    path, separator, query = to.partition('?')
+    if 'strip_index_html' in policies and path.endswith('/index.html'):
+        path = path[:-len('index.html')]
+    last = path.rsplit('/', 1)[-1]
+    if 'trailing_slash' in policies and last and '.' not in last:
+        path += '/'
+    return path + separator + query
+
+
+def covering_policy(rule, policies):
+    """The site-wide policy performing an exact redirect anyway, if any"""
+    if rule['kind'] != 'exact' or rule['status'] != DEFAULT_STATUS:
+        return None
+    source_path, to = rule['from'], rule['to']
+    if 'trailing_slash' in policies and to == source_path + '/':
+        return 'trailing_slash'
+    if 'strip_index_html' in policies and source_path.endswith('/index.html') \
+            and to == source_path[:-len('index.html')]:
+        return 'strip_index_html'
+    return None
+
+
+def page_exists(root, path):
+    """True if a page of the site is served at path"""
+    relative = path.lstrip('/')
+    if path.endswith('/'):
+        relative += 'index.html'
+    return os.path.isfile(os.path.join(root, relative))
+
+
+def directory_pages(root):
+    """Paths of the pages served from a directory's index.html ('/about/'), the homepage excluded"""
+    from seo_document import find_html_files
+    pages = []
+    for path in find_html_files(root):
+        relative = os.path.relpath(path, root).replace(os.sep, '/')
+        if relative.endswith('/index.html'):
+            pages.append('/' + relative[:-len('index.html')])
+    return sorted(pages)
+
+
+class CompiledRedirects:
+    """The rules compiled from a source, platform-neutral, with what compiling found"""
+
+    def __init__(self, source, root='.'):
+        self.origin = source['canonical']
+        self.hosts = list(source.get('hosts', {}).items())
+        self.policies = {name for name in POLICIES if source.get(name)}
+        self.strip_query = list(source.get('strip_query', [])) if 'strip_query' in self.policies else []
+        self.merged = []
+        self.dropped = []
+        self.collapsed = []
+        self.warnings = []
+        self.rules = self._compile(source.get('redirects', []), root)
+        self.pages = directory_pages(root)
+
+    def _compile(self, redirects, root):
+        exact, wildcards = {}, {}
+        for redirect in redirects:
+            status = redirect.get('status', DEFAULT_STATUS)
+            to = local_path(redirect['to'], self.origin)
+            if redirect['from'].endswith('/*'):
+                rule = {'kind': 'wildcard', 'from': redirect['from'][:-1], 'to': to[:-len(':splat')],
+                        'status': status}
+                rules = wildcards
+            else:
+                rule = {'kind': 'exact', 'from': redirect['from'], 'to': to, 'status': status}
+                rules = exact
+            previous = rules.get(rule['from'])
+            if previous is not None:
+                if (previous['to'], previous['status']) != (rule['to'], rule['status']):
+                    raise RedirectError(f"{redirect['from']} redirects to both {previous['to']} "
+                                        f"({previous['status']}) and {to} ({status})")
+                self.dropped.append((redirect['from'], 'listed twice'))
+                continue
+            rules[rule['from']] = rule
+
+        for rule in exact.values():
+            landing = self._resolve(rule, exact, wildcards)
+            if landing != rule['to']:
+                self.collapsed.append((rule['from'], rule['to'], landing))
+                rule['to'] = landing
+        # A wildcard is followed with a sample page below it
+        for rule in wildcards.values():
+            sample = 'page/'
+            landing = self._resolve({'from': rule['from'] + sample, 'to': rule['to'] + sample}, exact, wildcards)
+            if landing.endswith('/' + sample) and landing[:-len(sample)] != rule['to']:
+                self.collapsed.append((rule['from'] + '*', rule['to'] + ':splat', landing[:-len(sample)] + ':splat'))
+                rule['to'] = landing[:-len(sample)]
+
+        kept = []
+        for rule in exact.values():
+            wildcard = self._wildcard_for(rule['from'], wildcards)
+            if wildcard and wildcard['status'] == rule['status'] \
+                    and wildcard['to'] + rule['from'][len(wildcard['from']):] == rule['to']:
+                self.dropped.append((rule['from'], f"covered by {wildcard['from']}*"))
+                continue
+            rule['covered'] = covering_policy(rule, self.policies)
+            if not rule['covered'] and page_exists(root, rule['from']):
+                self.warnings.append(f"{rule['from']} redirects away from an existing page")
+            kept.append(rule)
+
+        kept = self._merge(kept, wildcards, root)
+        # Exact rules first, then wildcards from the most specific directory down
+        ordered = sorted(wildcards.values(), key=lambda rule: (-len(rule['from']), rule['from']))
+        for rule in ordered:
+            rule['covered'] = None
+        return kept + ordered
+
+    def _wildcard_for(self, path, wildcards):
+        matching = [rule for prefix, rule in wildcards.items() if path.startswith(prefix) and path != prefix]
+        return max(matching, key=lambda rule: len(rule['from'])) if matching else None
+
+    def _resolve(self, rule, exact, wildcards):
+        """Final destination of an exact rule, following other rules; raises on a loop"""
+        seen = [rule['from']]
+        to = final_form(rule['to'], self.policies)
+        while to.startswith('/'):
+            if to in seen:
+                raise RedirectError(f"redirect loop: {' -> '.join(seen + [to])}")
+            if to in exact:
+                seen.append(to)
+                to = final_form(exact[to]['to'], self.policies)
+                continue
+            wildcard = self._wildcard_for(to, wildcards)
+            if wildcard is None:
+                break
+            seen.append(to)
+            to = final_form(wildcard['to'] + to[len(wildcard['from']):], self.policies)
+        return to
+
+    def _merge(self, rules, wildcards, root):
+        """Replace MERGE_MIN or more rules moving one directory's children with a wildcard"""
+        groups = {}
+        for rule in rules:
+            if rule['covered'] or not rule['to'].startswith('/'):
+                continue
+            source_path, to = rule['from'], rule['to']
+            for cut in (i for i, char in enumerate(source_path) if char == '/' and i):
+                prefix, rest = source_path[:cut + 1], source_path[cut + 1:]
+                if rest and to.endswith(rest) and to[:-len(rest)].endswith('/'):
+                    groups.setdefault((prefix, to[:-len(rest)], rule['status']), []).append(rule)
+
+        merged = set()
+        for (prefix, target, status), members in sorted(groups.items(), key=lambda item: -len(item[1])):
+            members = [rule for rule in members if id(rule) not in merged]
+            if len(members) < MERGE_MIN or prefix in wildcards or prefix == target:
+                continue
+            if os.path.exists(os.path.join(root, prefix.strip('/'))):
+                continue
+            wildcards[prefix] = {'kind': 'wildcard', 'from': prefix, 'to': target, 'status': status}
+            merged.update(id(rule) for rule in members)
+            self.merged.append((prefix, target, len(members)))
+        # Rules under a new wildcard that go elsewhere stay, ahead of it, as exceptions
+        return [rule for rule in rules if id(rule) not in merged]
+
+    def rules_for(self, platform):
+        """The path rules a platform needs: those its generic policy rules do not cover"""
+        implemented = PLATFORM_POLICIES[platform] & self.policies
+        return [rule for rule in self.rules if rule['covered'] not in implemented]
+
+
+def compile_redirects(source=None, root='.'):
+    return CompiledRedirects(source if source is not None else load_source(), root)
+
+
+def alias_rules(compiled, platform):
+    """(host, source path on that host, rule) for the path rules under each alias
+    host's prefix; after the host redirect they would be a second hop"""
+    for host, prefix in compiled.hosts:
+        for rule in compiled.rules_for(platform):
+            if rule['from'].startswith(prefix):
+                yield host, '/' + rule['from'][len(prefix):], rule
+
+
+def absolute(compiled, to):
+    return compiled.origin + to if to.startswith('/') else to
+
+
+def netlify_rules(compiled, pages=False):
+    """(from, to, status) lines for Netlify, in match order. With pages, every
+    page's alias URLs go straight to it, slash added (for _redirects)."""
+    rules = []
+    for host, source, rule in alias_rules(compiled, 'netlify'):
+        splat = ('*', ':splat') if rule['kind'] == 'wildcard' else ('', '')
+        for scheme in ('https', 'http'):
+            rules.append((f'{scheme}://{host}{source}{splat[0]}', absolute(compiled, rule['to']) + splat[1],
+                          rule['status']))
+    if pages and 'trailing_slash' in compiled.policies:
+        for host, prefix in compiled.hosts:
+            for page in compiled.pages:
+                if page.startswith(prefix) and page != prefix:
+                    for scheme in ('https', 'http'):
+                        rules.append((f'{scheme}://{host}/{page[len(prefix):-1]}', compiled.origin + page,
+                                      DEFAULT_STATUS))
+    for host, prefix in compiled.hosts:
+        for scheme in ('https', 'http'):
+            rules.append((f'{scheme}://{host}/*', f'{compiled.origin}{prefix}:splat', DEFAULT_STATUS))
+    for rule in compiled.rules_for('netlify'):
+        if rule['kind'] == 'wildcard':
+            rules.append((rule['from'] + '*', rule['to'] + ':splat', rule['status']))
+        else:
+            rules.append((rule['from'], rule['to'], rule['status']))
+    return rules
+
+
+def redirects_file(compiled):
+    lines = ['# Generated by redirect_rules.py from data/redirects.json; do not edit']
+    lines += [f'{source} {to} {status}!' for source, to, status in netlify_rules(compiled, pages=True)]
+    return '\n'.join(lines) + '\n'
+
+
+def netlify_toml_block(compiled):
+    tables = [f'[[redirects]]\n  from = "{source}"\n  to = "{to}"\n  status = {status}\n  force = true'
+              for source, to, status in netlify_rules(compiled)]
+    return '\n'.join([BLOCK_BEGIN, '\n\n'.join(tables), BLOCK_END])
+
+
+def vercel_sources(rule, source):
+    """Vercel sources for a path rule; an exact path without its slash also gets
+    the slashed form, which Netlify and Apache match as the same rule"""
+    if rule['kind'] == 'wildcard':
+        return [source + ':path(.*)']
+    last = source.rsplit('/', 1)[-1]
+    return [source, source + '/'] if last and '.' not in last else [source]
+
+
+def vercel_policy_redirects(compiled, target, has=None):
+    """Redirects to target (an origin and prefix, or '' on the canonical host)
+    for the path forms the site-wide policies rewrite: index.html and .html
+    dropped, the trailing slash added"""
+    slash = '/' if 'trailing_slash' in compiled.policies else ''
+    forms = []
+    if 'strip_index_html' in compiled.policies:
+        forms += [(VERCEL_INDEX_SOURCE, ':path'), (VERCEL_HTML_SOURCE, ':path' + slash)]
+    if slash:
+        forms.append((VERCEL_NO_SLASH_SOURCE, ':path/'))
+    redirects = []
+    for source, to in forms:
+        redirect = {'source': source, 'destination': f'{target}/{to}', 'statusCode': DEFAULT_STATUS}
+        if has:
+            redirect = {'source': source, 'has': has, **redirect}
+        redirects.append(redirect)
+    return redirects
+
+
+def vercel_redirects(compiled):
+    """The "redirects" list of vercel.json, in match order"""
+    redirects = []
+    for host, source, rule in alias_rules(compiled, 'vercel'):
+        destination = absolute(compiled, rule['to']) + (':path' if rule['kind'] == 'wildcard' else '')
+        redirects += [{'source': pattern, 'has': [{'type': 'host', 'value': host}],
+                       'destination': destination, 'statusCode': rule['status']}
+                      for pattern in vercel_sources(rule, source)]
+    for host, prefix in compiled.hosts:
+        has = [{'type': 'host', 'value': host}]
+        redirects += vercel_policy_redirects(compiled, compiled.origin + prefix.rstrip('/'), has)
+        # :path(.*) keeps the trailing slash, which :path* drops
+        redirects.append({'source': '/:path(.*)', 'has': has,
+                          'destination': f'{compiled.origin}{prefix}:path', 'statusCode': DEFAULT_STATUS})
+    for rule in compiled.rules_for('vercel'):
+        destination = rule['to'] + (':path' if rule['kind'] == 'wildcard' else '')
+        redirects += [{'source': pattern, 'destination': destination, 'statusCode': rule['status']}
+                      for pattern in vercel_sources(rule, rule['from'])]
+    return redirects + vercel_policy_redirects(compiled, '')
+
+
+def vercel_rewrites(compiled):
+    """The "rewrites" list of vercel.json: .html pages served at their clean URL"""
+    if 'strip_index_html' not in compiled.policies:
+        return []
+    slash = '/' if 'trailing_slash' in compiled.policies else ''
+    return [{'source': VERCEL_NO_SLASH_SOURCE + slash, 'destination': '/:path.html'}]
+
+
+def htaccess_block(compiled):
+    """mod_rewrite rules noting everything non-canonical about a request (host,
+    https, tracking parameters, path rules, index.html, the trailing slash),
+    then redirecting once to the canonical URL"""
+    origin = compiled.origin
+    mark = f'E={REDIRECT_ENV}:1'
+    lines = [BLOCK_BEGIN, 'RewriteEngine On']
+    for host, prefix in compiled.hosts:
+        lines.append(f'RewriteCond %{{HTTP_HOST}} ^{re.escape(host)}$ [NC]')
+        if prefix == '/':
+            lines.append(f'RewriteRule ^ - [{mark}]')
+        else:
+            lines.append(f'RewriteRule ^(.*)$ {prefix.lstrip("/")}$1 [{mark}]')
+    if 'force_https' in compiled.policies:
+        lines += ['RewriteCond %{HTTPS} off', f'RewriteRule ^ - [{mark}]']
+    if compiled.strip_query:
+        names = '|'.join(re.escape(name) for name in compiled.strip_query)
+        lines += [f'RewriteCond %{{QUERY_STRING}} (^|&)({names})= [NC]',
+                  f'RewriteRule ^ - [{mark},E={DROP_QUERY_ENV}:1]']
+    for rule in compiled.rules_for('htaccess'):
+        pattern = re.escape(rule['from'].lstrip('/'))
+        wildcard = rule['kind'] == 'wildcard'
+        if wildcard:
+            pattern += '(.*)'
+        to = rule['to'].lstrip('/')
+        if rule['to'].startswith('/') and to and rule['status'] == DEFAULT_STATUS:
+            # Rewritten in place; the redirect at the end sends it on
+            lines.append(f'RewriteRule ^{pattern}$ {to}{"$1" if wildcard else ""} [{mark}]')
+        else:
+            lines.append(f'RewriteRule ^{pattern}$ {absolute(compiled, rule["to"])}{"$1" if wildcard else ""} '
+                         f'[R={rule["status"]},L]')
+    # The redirect below drops a trailing index.html the client asked for
+    # (THE_REQUEST), not the one DirectoryIndex serves
+    if 'strip_index_html' in compiled.policies:
+        lines += [r'RewriteCond %{THE_REQUEST} ^[A-Z]{3,9}\ /(?:[^/?\ ]+/)*index\.html[?\ ]',
+                  rf'RewriteRule (?:^|/)index\.html$ - [{mark}]']
+    if 'trailing_slash' in compiled.policies:
+        lines += ['RewriteCond %{DOCUMENT_ROOT}/$1 !-f', f'RewriteRule ^(.*[^/])$ $1/ [{mark}]']
+    target = r'RewriteRule ^(.*?)(?:index\.html)?$ ' if 'strip_index_html' in compiled.policies \
+        else 'RewriteRule ^(.*)$ '
+    if compiled.strip_query:
+        lines += [f'RewriteCond %{{ENV:{REDIRECT_ENV}}} =1', f'RewriteCond %{{ENV:{DROP_QUERY_ENV}}} =1',
+                  f'{target}{origin}/$1? [R={DEFAULT_STATUS},L]']
+    lines += [f'RewriteCond %{{ENV:{REDIRECT_ENV}}} =1', f'{target}{origin}/$1 [R={DEFAULT_STATUS},L]']
+    return '\n'.join(lines + [BLOCK_END])
+
+
+def splice_block(content, block, unmarked):
+    """content with its generated redirect block replaced by block. A config
+    without one (hand-written rules) is reduced to unmarked(content) first and
+    gets the block at the top, where the rules must run."""
+    start = content.find(BLOCK_BEGIN)
+    if start != -1:
+        end = content.find(BLOCK_END, start)
+        if end == -1:
+            raise RedirectError(f"'{BLOCK_BEGIN}' has no matching end marker")
+        return content[:start] + block + content[end + len(BLOCK_END):]
+    rest = unmarked(content).strip('\n')
+    return block + '\n' + ('\n' + rest + '\n' if rest else '')
+
+
+def htaccess_other_blocks(content):
+    """The blocks other generators keep in .htaccess; everything else was the old rules"""
+    return '\n\n'.join(GENERATED_BLOCK_RE.findall(content))
+
+
+def toml_without_redirects(content):
+    """netlify.toml without its [[redirects]] tables (and the comments heading them)"""
+    paragraphs = re.split(r'\n\s*\n', content)
+    kept = [paragraph for paragraph in paragraphs
+            if not any(line.strip() == '[[redirects]]' for line in paragraph.splitlines())]
+    return '\n\n'.join(paragraph.strip('\n') for paragraph in kept)
+
+
+def render_configs(compiled, root='.'):
+    """Path -> compiled content of every config under root"""
+    def current(name):
+        try:
+            with open(os.path.join(root, name), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return ''
+
+    vercel_text = current('vercel.json')
+    vercel = json.loads(vercel_text) if vercel_text.strip() else {}
+    # Vercel applies these before the redirects; the redirects above do their work in one hop
+    vercel.pop('cleanUrls', None)
+    vercel.pop('trailingSlash', None)
+    vercel['redirects'] = vercel_redirects(compiled)
+    vercel['rewrites'] = vercel_rewrites(compiled)
+    if not vercel['rewrites']:
+        del vercel['rewrites']
+
+    return {
+        os.path.join(root, '_redirects'): redirects_file(compiled),
+        os.path.join(root, 'netlify.toml'): splice_block(current('netlify.toml'), netlify_toml_block(compiled),
+                                                         toml_without_redirects),
+        os.path.join(root, 'vercel.json'): json.dumps(vercel, indent=2) + '\n',
+        os.path.join(root, '.htaccess'): splice_block(current('.htaccess'), htaccess_block(compiled),
+                                                      htaccess_other_blocks),
+    }
+
+
+def write_configs(compiled, root='.', dry_run=False):
+    """Write the configs whose content changed. Returns their paths."""
+    changed = []
+    for path, content in render_configs(compiled, root).items():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                unchanged = f.read() == content
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            continue
+        changed.append(path)
+        if not dry_run:
+            write_if_changed(path, content)
+    return changed
+
+
+def print_report(compiled):
+    for source_path, target, count in compiled.merged:
+        print(f"🔀 Merged {count} redirects into {source_path}* -> {target}:splat")
+    for source_path, written, landing in compiled.collapsed:
+        print(f"⏩ {source_path}: {written} -> {landing} (one hop)")
+    for source_path, reason in compiled.dropped:
+        print(f"✂️  Dropped {source_path}: {reason}")
+    for rule in compiled.rules:
+        if rule['covered']:
+            platforms = [name for name, policies in PLATFORM_POLICIES.items() if rule['covered'] in policies]
+            print(f"✂️  {rule['from']}: done by the {rule['covered']} rule on {', '.join(platforms)}")
+    for warning in compiled.warnings:
+        print(f"⚠️  {warning}")
+    netlify_count = len(netlify_rules(compiled, pages=True))
+    if netlify_count > NETLIFY_MAX_RULES:
+        print(f"⚠️  _redirects has {netlify_count} rules (over {NETLIFY_MAX_RULES}); "
+              f"consider dropping an alias host")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile data/redirects.json into every server config")
+    parser.add_argument('--source', default=REDIRECTS_FILE, help="redirect source file")
+    parser.add_argument('--root', default='.', help="site root (default: current directory)")
+    parser.add_argument('--check', action='store_true', help="write nothing; exit 1 if a config is out of date")
+    parser.add_argument('--dry-run', action='store_true', help="report what would change without writing")
+    args = parser.parse_args()
+
+    print("↪️  Compiling redirect rules...")
+    print("=" * 60)
+    try:
+        compiled = compile_redirects(load_source(args.source), args.root)
+        changed = write_configs(compiled, args.root, dry_run=args.check or args.dry_run)
+    except RedirectError as e:
+        print(f"❌ {e}")
+        return 1
+    print_report(compiled)
+
+    print("=" * 60)
+    print(f"📊 Summary:")
+    netlify_count = len(netlify_rules(compiled, pages=True))
+    print(f"   Netlify: {netlify_count} rules ({netlify_count - len(netlify_rules(compiled))} page aliases, "
+          f"bound {NETLIFY_MAX_RULES})")
+    print(f"   Vercel: {len(vercel_redirects(compiled))} rules")
+    print(f"   Apache: {htaccess_block(compiled).count('RewriteRule ')} rules")
+    for path in changed:
+        state = 'out of date' if args.check else 'would change' if args.dry_run else 'written'
+        print(f"   {os.path.relpath(path, args.root)}: {state}")
+    if not changed:
+        print(f"   All configs up to date")
+    return 1 if args.check and changed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+"""
+Offline redirect-chain simulator for StableCoin Hub.
+
+Reads the redirect configs the site ships (_redirects and netlify.toml for
+Netlify, vercel.json for Vercel, the redirect block of .htaccess for Apache)
+and follows every variant of every sitemap URL through each of them the way
+that host evaluates its rules:
+
+    scheme       https, http
+    host         www.stablecoinhub.pro, stablecoinhub.pro, blog.stablecoinhub.pro (for /blog/...)
+    path         /about/, /about, /about/index.html
+    query        none, tracking parameters
+
+Every request should reach its page in at most one redirect: each extra hop
+is another round trip for users and crawlers. A longer chain, a loop, or a
+request ending in a 404 fails the run (exit 1), so CI catches what used to
+show up only against production in verify_seo_deployment.py.
+
+Only the HTTPS upgrade, which a host issues before it looks at any rule,
+is reported but not counted. Every other hop counts, including the ones a
+host setting makes (Vercel's cleanUrls and trailingSlash, Netlify's pretty
+URLs, Apache's DirectorySlash). Everything runs locally against the files
+on disk; a full run takes milliseconds.
+
+Usage:
+    python redirect_simulator.py                        # every sitemap URL on every platform
+    python redirect_simulator.py --platform vercel      # one platform
+    python redirect_simulator.py --verbose              # list every chain that redirects
+    python redirect_simulator.py --url http://stablecoinhub.pro/blog   # trace one URL
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+from urllib.parse import urljoin, urlsplit
+
+from redirect_rules import BLOCK_BEGIN, BLOCK_END, canonical_origin, host_prefixes
+from verify_seo_deployment import parse_sitemap
+
+MAX_HOPS = 10
+TRACKING_QUERY = 'utm_source=newsletter&utm_medium=email'
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# A host's answer to one request: a redirect (location set) or a final status.
+# forced marks the HTTPS upgrade, which the host issues before any configured rule.
+Response = namedtuple('Response', 'status location rule forced')
+Hop = namedtuple('Hop', 'url status location rule forced')
+
+
+class Chain:
+    """The redirects one request goes through"""
+
+    def __init__(self, url):
+        self.url = url
+        self.hops = []
+        self.status = None
+        self.loop = False
+
+    @property
+    def final_url(self):
+        return self.hops[-1].location if self.hops else self.url
+
+    @property
+    def counted(self):
+        """Hops other than the HTTPS upgrade"""
+        return sum(1 for hop in self.hops if not hop.forced)
+
+    def problem(self):
+        """Why this chain fails the run, or None"""
+        if self.loop:
+            return 'redirect loop'
+        if self.counted > 1:
+            return f'{len(self.hops)} hops'
+        if self.status == 404:
+            return 'ends in 404'
+        return None
+
+    def describe(self):
+        steps = [self.url]
+        for hop in self.hops:
+            steps.append(f"--{hop.status}{' (host)' if hop.forced else ''}--> {hop.location}")
+        return ' '.join(steps) + ('' if self.loop else f' [{self.status}]')
+
+
+class StaticHost:
+    """Serving files from the site root; subclasses add the host's redirect rules"""
+
+    def __init__(self, root):
+        self.root = root
+        self.files = set()
+        for current, dirs, names in os.walk(root):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            relative = os.path.relpath(current, root).replace(os.sep, '/')
+            prefix = '' if relative == '.' else relative + '/'
+            self.files.update(prefix + name for name in names)
+        self.responses = {}
+
+    def is_file(self, path):
+        return path.lstrip('/') in self.files
+
+    def is_directory(self, path):
+        return (path.strip('/') + '/index.html').lstrip('/') in self.files
+
+    def serve(self, path):
+        if self.is_file(path) or (path.endswith('/') and self.is_directory(path)):
+            return Response(200, None, None, False)
+        return Response(404, None, None, False)
+
+    def respond(self, url):
+        raise NotImplementedError
+
+    def answer(self, url):
+        """respond(url), remembered: the variants of a page share most of their chains"""
+        if url not in self.responses:
+            self.responses[url] = self.respond(url)
+        return self.responses[url]
+
+
+def with_query(location, query):
+    """Redirect target carrying the request's query string unless it sets its own"""
+    if not query or '?' in location:
+        return location
+    return f'{location}?{query}'
+
+
+# -- Netlify ----------------------------------------------------------------
+
+TOML_TABLE_RE = re.compile(r'^\s*\[\[?([\w.]+)\]\]?\s*$')
+TOML_PAIR_RE = re.compile(r'^\s*([\w-]+)\s*=\s*(.+?)\s*$')
+
+
+def toml_value(text):
+    """A netlify.toml scalar: string, integer or boolean"""
+    if text in ('true', 'false'):
+        return text == 'true'
+    if text.startswith("'"):
+        return text[1:-1]
+    return json.loads(text)
+
+
+def read_netlify_toml(path):
+    """([[redirects]] tables, {"table.key": value} for the other settings)"""
+    redirects, settings = [], {}
+    table = None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return redirects, settings
+    for line in lines:
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        header = TOML_TABLE_RE.match(line)
+        if header:
+            table = header.group(1)
+            if line.strip().startswith('[[') and table == 'redirects':
+                redirects.append({})
+            continue
+        pair = TOML_PAIR_RE.match(line)
+        if pair is None:
+            continue
+        if table == 'redirects' and redirects:
+            redirects[-1][pair.group(1)] = toml_value(pair.group(2))
+        elif table:
+            settings[f'{table}.{pair.group(1)}'] = toml_value(pair.group(2))
+    return redirects, settings
+
+
+def read_redirects_file(path):
+    """Rules of a Netlify _redirects file as netlify.toml-style dicts"""
+    rules = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return rules
+    for line in lines:
+        fields = [field for field in line.split('#', 1)[0].split() if '=' not in field]
+        if len(fields) < 2:
+            continue
+        status = fields[2] if len(fields) > 2 else '301'
+        rules.append({'from': fields[0], 'to': fields[1], 'status': int(status.rstrip('!')),
+                      'force': status.endswith('!')})
+    return rules
+
+
+class NetlifyRule:
+    """One Netlify redirect: an optional scheme and host, a path with :placeholders
+    and a final /* splat. Trailing slashes are ignored when matching."""
+
+    def __init__(self, rule):
+        self.source = rule['from']
+        self.to = rule['to']
+        self.status = int(rule.get('status', 301))
+        self.force = bool(rule.get('force', False))
+        self.scheme = self.host = None
+        path = self.source
+        if '://' in path:
+            parts = urlsplit(path)
+            self.scheme, self.host, path = parts.scheme, parts.hostname, parts.path or '/'
+        # Most rules are one literal path, compared without a regex
+        self.literal = None
+        if path.endswith('/*'):
+            pattern = re.escape(path[:-2]) + r'(?:/(?P<splat>.*))?'
+        else:
+            pattern = re.escape(normalize_slash(path))
+            if ':' not in path:
+                self.literal = normalize_slash(path)
+        pattern = re.sub(r':(\w+)', r'(?P<\1>[^/]+)', pattern)
+        self.pattern = re.compile(pattern + '$')
+
+    def match(self, path):
+        """Destination for a request to path (slash normalized), or None"""
+        if self.literal is not None and self.literal != path:
+            return None
+        match = self.pattern.match(path)
+        if match is None:
+            return None
+        to = self.to
+        for name, value in sorted(match.groupdict().items(), key=lambda item: -len(item[0])):
+            to = to.replace(f':{name}', value or '')
+        return to
+
+
+def normalize_slash(path):
+    return path.rstrip('/') or '/'
+
+
+class Netlify(StaticHost):
+    """_redirects, then netlify.toml, first match wins; then the HTTPS upgrade
+    and (pretty URLs) the trailing slash for a directory"""
+
+
+    def __init__(self, root):
+        super().__init__(root)
+        toml_rules, settings = read_netlify_toml(os.path.join(root, 'netlify.toml'))
+        self.rules = [NetlifyRule(rule) for rule in read_redirects_file(os.path.join(root, '_redirects')) + toml_rules]
+        self.pretty_urls = settings.get('build.processing.html.pretty_urls', False)
+        self.by_host = {}
+
+    def rules_for(self, scheme, host):
+        """The rules that can match a request to scheme://host, in order"""
+        key = (scheme, host)
+        if key not in self.by_host:
+            self.by_host[key] = [rule for rule in self.rules if rule.host is None or (rule.scheme, rule.host) == key]
+        return self.by_host[key]
+
+    def respond(self, url):
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        normalized = normalize_slash(path)
+        for rule in self.rules_for(parts.scheme, parts.hostname):
+            # Without force a rule only applies where no file is served
+            if not rule.force and self.serve(path).status == 200:
+                continue
+            to = rule.match(normalized)
+            if to is None:
+                continue
+            if rule.status in REDIRECT_STATUSES:
+                return Response(rule.status, with_query(to, parts.query), rule.source, False)
+            return self.serve(to) if rule.status == 200 else Response(rule.status, None, rule.source, False)
+        if parts.scheme == 'http':
+            return Response(301, url.replace('http://', 'https://', 1), 'HTTPS upgrade', True)
+        if self.pretty_urls and not path.endswith('/') and self.is_directory(path):
+            return Response(301, with_query(path + '/', parts.query), 'pretty URLs', False)
+        return self.serve(path)
+
+
+# -- Vercel -----------------------------------------------------------------
+
+PARAM_RE = re.compile(r'(/?)(?::(\w+)(\((?:[^()]|\([^()]*\))*\))?|(\((?:[^()]|\([^()]*\))*\)))([*+?]?)')
+
+
+def path_regex(source):
+    """path-to-regexp's reading of a Vercel source: named and unnamed
+    parameters, custom patterns, the * + ? modifiers. Vercel compiles sources
+    strict and case-sensitive, so /about does not match /about/."""
+    regex, position, unnamed = '^', 0, 0
+    for match in PARAM_RE.finditer(source):
+        prefix, name, custom, bare, modifier = match.groups()
+        if name is None and bare is None:
+            continue
+        regex += re.escape(source[position:match.start()])
+        position = match.end()
+        if name is None:
+            unnamed += 1
+            name = f'_{unnamed}'
+        inner = (custom or bare)[1:-1] if (custom or bare) else r'[^/#?]+?'
+        slash = re.escape(prefix)
+        if modifier in ('*', '+'):
+            group = f'(?P<{name}>{inner}(?:{slash}{inner})*)'
+            regex += f'(?:{slash}{group})' + ('?' if modifier == '*' else '')
+        elif modifier == '?':
+            regex += f'(?:{slash}(?P<{name}>{inner}))?'
+        else:
+            regex += f'{slash}(?P<{name}>{inner})'
+    regex += re.escape(source[position:])
+    return re.compile(regex + '$')
+
+
+def fill_destination(destination, params):
+    for name, value in sorted(params.items(), key=lambda item: -len(item[0])):
+        value = value or ''
+        if name.startswith('_'):
+            destination = destination.replace(f'${name[1:]}', value)
+        else:
+            destination = re.sub(rf':{name}(?:\([^)]*\))?[*+?]?(?!\w)', lambda m: value, destination)
+    return destination
+
+
+class Vercel(StaticHost):
+    """The HTTPS upgrade, cleanUrls and trailingSlash (all applied before any
+    rule), then "redirects" in order, then the filesystem and last "rewrites"."""
+
+
+    def __init__(self, root):
+        super().__init__(root)
+        try:
+            with open(os.path.join(root, 'vercel.json'), 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            config = {}
+        self.clean_urls = config.get('cleanUrls', False)
+        self.trailing_slash = config.get('trailingSlash')
+        self.redirects = [(path_regex(rule['source']), rule) for rule in config.get('redirects', [])]
+        self.rewrites = [(path_regex(rule['source']), rule) for rule in config.get('rewrites', [])]
+
+    def builtin_redirect(self, path):
+        """Location of a cleanUrls or trailingSlash redirect, or None"""
+        slash = '/' if self.trailing_slash else ''
+        if self.clean_urls:
+            match = re.match(r'^/(?:(.+)/)?index(?:\.html)?/?$', path)
+            if match:
+                return '/' + (match.group(1) + slash if match.group(1) else '')
+            match = re.match(r'^/(.+)\.html/?$', path)
+            if match:
+                return f'/{match.group(1)}{slash}'
+        if self.trailing_slash is True:
+            match = re.match(r'^/((?:[^/]+/)*[^/.]+)$', path)
+            if match:
+                return f'/{match.group(1)}/'
+            match = re.match(r'^/((?:[^/]+/)*[^/]+\.\w+)/$', path)
+            if match:
+                return f'/{match.group(1)}'
+        elif self.trailing_slash is False and path != '/' and path.endswith('/'):
+            return path.rstrip('/')
+        return None
+
+    def respond(self, url):
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.scheme == 'http':
+            return Response(308, url.replace('http://', 'https://', 1), 'HTTPS upgrade', True)
+        location = self.builtin_redirect(path)
+        if location is not None:
+            return Response(308, with_query(location, parts.query), 'cleanUrls/trailingSlash', False)
+        for regex, rule in self.redirects:
+            hosts = [condition['value'] for condition in rule.get('has', []) if condition.get('type') == 'host']
+            if any(not re.fullmatch(host, parts.hostname or '') for host in hosts):
+                continue
+            match = regex.match(path)
+            if match is None:
+                continue
+            status = rule.get('statusCode', 308 if rule.get('permanent', True) else 307)
+            return Response(status, with_query(fill_destination(rule['destination'], match.groupdict()), parts.query),
+                            rule['source'], False)
+        if self.clean_urls and not path.endswith('/') and self.is_file(path + '.html'):
+            return Response(200, None, None, False)
+        if self.clean_urls and path.endswith('/') and path != '/' and self.is_file(path.rstrip('/') + '.html'):
+            return Response(200, None, None, False)
+        served = self.serve(path)
+        if served.status == 200:
+            return served
+        for regex, rule in self.rewrites:
+            match = regex.match(path)
+            if match is not None:
+                return self.serve(fill_destination(rule['destination'], match.groupdict()))
+        return served
+
+
+# -- Apache -----------------------------------------------------------------
+
+DIRECTIVE_RE = re.compile(r'^\s*(RewriteCond|RewriteRule)\s+((?:\\.|\S)+)\s+((?:\\.|\S)+)(?:\s+\[([^\]]*)\])?\s*$')
+VARIABLE_RE = re.compile(r'%\{(ENV:)?(\w+)\}')
+BACKREFERENCE_RE = re.compile(r'([$%])(\d)')
+
+
+def unescape_argument(text):
+    """A directive argument as mod_rewrite sees it: backslash-space is a space"""
+    return text.replace('\\ ', ' ')
+
+
+def read_htaccess(path):
+    """[(conditions, rule)] of the generated redirect block (the whole file without
+    one), each condition and rule a (test or pattern, argument, flags) triple"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return []
+    start = content.find(BLOCK_BEGIN)
+    if start != -1:
+        content = content[start:content.find(BLOCK_END, start)]
+    rules, conditions = [], []
+    for line in content.splitlines():
+        directive = DIRECTIVE_RE.match(line)
+        if directive is None:
+            continue
+        kind, first, second, flags = directive.groups()
+        flags = [flag.strip() for flag in (flags or '').split(',') if flag.strip()]
+        entry = (unescape_argument(first), unescape_argument(second), flags)
+        if kind == 'RewriteCond':
+            conditions.append(entry)
+        else:
+            rules.append((conditions, entry))
+            conditions = []
+    return rules
+
+
+class Apache(StaticHost):
+    """One per-directory pass of the .htaccess rules in the site root, then
+    DirectorySlash and the filesystem"""
+
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.document_root = os.path.abspath(root)
+        self.rules = read_htaccess(os.path.join(root, '.htaccess'))
+        self.regexes = {}
+
+    def regex(self, pattern, flags):
+        key = (pattern, 'NC' in flags)
+        if key not in self.regexes:
+            self.regexes[key] = re.compile(pattern, re.IGNORECASE if key[1] else 0)
+        return self.regexes[key]
+
+    def expand(self, text, variables, env, rule_groups, cond_groups):
+        def backreference(match):
+            groups = rule_groups if match.group(1) == '$' else cond_groups
+            index = int(match.group(2))
+            return (groups[index] if index < len(groups) else '') or ''
+
+        def variable(match):
+            return env.get(match.group(2), '') if match.group(1) else variables.get(match.group(2), '')
+
+        return BACKREFERENCE_RE.sub(backreference, VARIABLE_RE.sub(variable, text))
+
+    def condition_holds(self, test, pattern, flags, variables, env, rule_groups, cond_groups):
+        """(holds, groups) of one RewriteCond"""
+        value = self.expand(test, variables, env, rule_groups, cond_groups)
+        negate = pattern.startswith('!')
+        if negate:
+            pattern = pattern[1:]
+        groups = None
+        if pattern == '-f':
+            holds = value.startswith(self.document_root + '/') and self.is_file(value[len(self.document_root):])
+        elif pattern == '-d':
+            holds = os.path.isdir(value)
+        elif pattern.startswith('='):
+            holds = value == pattern[1:]
+        else:
+            match = self.regex(pattern, flags).search(value)
+            holds = match is not None
+            if match:
+                groups = (match.group(0),) + match.groups()
+        return holds != negate, groups
+
+    def respond(self, url):
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        query = parts.query
+        variables = {
+            'HTTP_HOST': parts.hostname or '',
+            'HTTPS': 'on' if parts.scheme == 'https' else 'off',
+            'QUERY_STRING': query,
+            'REQUEST_URI': path,
+            'THE_REQUEST': f"GET {path}{'?' + query if query else ''} HTTP/1.1",
+            'DOCUMENT_ROOT': self.document_root,
+            'REQUEST_FILENAME': self.document_root + path,
+        }
+        env = {}
+        current = path.lstrip('/')
+        for conditions, (pattern, substitution, flags) in self.rules:
+            negate = pattern.startswith('!')
+            match = self.regex(pattern.lstrip('!'), flags).search(current)
+            if (match is None) != negate:
+                continue
+            rule_groups = (match.group(0),) + match.groups() if match else ('',)
+            cond_groups, holds, chained = ('',), True, False
+            for test, cond_pattern, cond_flags in conditions:
+                if chained and holds:
+                    # Previous condition was [OR] and held
+                    chained = 'OR' in cond_flags
+                    continue
+                holds, groups = self.condition_holds(test, cond_pattern, cond_flags, variables, env,
+                                                     rule_groups, cond_groups)
+                if groups:
+                    cond_groups = groups
+                chained = 'OR' in cond_flags
+                if not holds and not chained:
+                    break
+            if not holds:
+                continue
+
+            for flag in flags:
+                if flag.startswith('E='):
+                    name, _, value = flag[2:].partition(':')
+                    env[name] = value
+            if substitution != '-':
+                target = self.expand(substitution, variables, env, rule_groups, cond_groups)
+                redirect = next((flag for flag in flags if flag == 'R' or flag.startswith('R=')), None)
+                if redirect is not None:
+                    status = int(redirect[2:]) if '=' in redirect else 302
+                    if '?' in target:
+                        target, _, new_query = target.partition('?')
+                        if 'QSA' in flags and query:
+                            new_query = '&'.join(filter(None, [new_query, query]))
+                    else:
+                        new_query = '' if 'QSD' in flags else query
+                    if '://' not in target:
+                        target = f"{parts.scheme}://{parts.hostname}/{target.lstrip('/')}"
+                    return Response(status, target + ('?' + new_query if new_query else ''),
+                                    f'RewriteRule {pattern}', False)
+                current = target.lstrip('/')
+            if 'L' in flags or 'END' in flags:
+                break
+
+        path = '/' + current
+        if not path.endswith('/') and self.is_directory(path):
+            return Response(301, with_query(path + '/', query), 'DirectorySlash', False)
+        return self.serve(path)
+
+
+PLATFORMS = {'netlify': Netlify, 'vercel': Vercel, 'htaccess': Apache}
+PLATFORM_NAMES = {'netlify': 'Netlify', 'vercel': 'Vercel', 'htaccess': 'Apache'}
+
+
+def follow(host, url):
+    """The Chain of redirects url goes through on host"""
+    chain = Chain(url)
+    seen = {url}
+    while True:
+        response = host.answer(url)
+        if response.location is None:
+            chain.status = response.status
+            return chain
+        location = response.location if '://' in response.location else urljoin(url, response.location)
+        chain.hops.append(Hop(url, response.status, location, response.rule, response.forced))
+        if location in seen or len(chain.hops) >= MAX_HOPS:
+            chain.loop = True
+            return chain
+        seen.add(location)
+        url = location
+
+
+def sitemap_urls(root, sitemap):
+    """Page URLs of a local sitemap, following a sitemap index to its local shards"""
+    pending, urls = [sitemap], []
+    while pending:
+        path = pending.pop(0)
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rb') as f:
+            pages, children = parse_sitemap(f.read())
+        urls.extend(pages)
+        pending.extend(os.path.join(root, urlsplit(child).path.lstrip('/')) for child in children)
+    return urls
+
+
+def url_variants(url, tracking=TRACKING_QUERY):
+    """Every way a visitor or crawler may request a page: scheme, host, path form and query"""
+    path = urlsplit(url).path or '/'
+    for host, prefix in host_prefixes().items():
+        if not path.startswith(prefix):
+            continue
+        relative = '/' + path[len(prefix):]
+        forms = [relative]
+        if relative.endswith('/'):
+            forms.append(relative + 'index.html')
+            if relative != '/':
+                forms.append(relative[:-1])
+        for scheme in ('https', 'http'):
+            for form in forms:
+                for query in ('', tracking):
+                    yield f"{scheme}://{host}{form}{'?' + query if query else ''}"
+
+
+def simulate(root='.', sitemap='sitemap.xml', platforms=tuple(PLATFORMS)):
+    """Follow every variant of every sitemap URL on each platform. Returns a stats dict."""
+    started = time.perf_counter()
+    urls = sitemap_urls(root, sitemap)
+    stats = {'urls': len(urls), 'platforms': {}}
+    for name in platforms:
+        host = PLATFORMS[name](root)
+        result = {'requests': 0, 'longest': 0, 'forced': 0, 'elsewhere': 0, 'failures': [], 'redirected': []}
+        for url in urls:
+            for variant in url_variants(url):
+                chain = follow(host, variant)
+                result['requests'] += 1
+                result['longest'] = max(result['longest'], len(chain.hops))
+                if chain.hops:
+                    result['redirected'].append(chain)
+                if chain.counted < len(chain.hops) and len(chain.hops) > 1:
+                    result['forced'] += 1
+                if chain.status == 200 and chain.final_url.split('?')[0] != url:
+                    result['elsewhere'] += 1
+                if chain.problem():
+                    result['failures'].append(chain)
+        stats['platforms'][name] = result
+    stats['seconds'] = time.perf_counter() - started
+    return stats
+
+
+def trace(root, url, platforms):
+    for name in platforms:
+        chain = follow(PLATFORMS[name](root), url)
+        print(f"{PLATFORM_NAMES[name]}:")
+        for hop in chain.hops:
+            print(f"   {hop.status} {hop.url} -> {hop.location}  ({hop.rule}{', host' if hop.forced else ''})")
+        print(f"   {'🔁 loop' if chain.loop else chain.status} {chain.final_url}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Follow every sitemap URL variant through the redirect configs")
+    parser.add_argument('--root', default='.', help="site root (default: current directory)")
+    parser.add_argument('--sitemap', default=None, help="sitemap or sitemap index (default: <root>/sitemap.xml)")
+    parser.add_argument('--platform', action='append', choices=sorted(PLATFORMS),
+                        help="only simulate this platform (repeatable)")
+    parser.add_argument('--url', help="trace one URL instead of the sitemap")
+    parser.add_argument('--verbose', action='store_true', help="list every chain that redirects")
+    args = parser.parse_args()
+    platforms = args.platform or list(PLATFORMS)
+
+    if args.url:
+        return trace(args.root, args.url, platforms)
+
+    print("🔀 Simulating redirect chains...")
+    print("=" * 60)
+    stats = simulate(args.root, args.sitemap or os.path.join(args.root, 'sitemap.xml'), platforms)
+    failed = 0
+    for name, result in stats['platforms'].items():
+        failed += len(result['failures'])
+        icon = '❌' if result['failures'] else '✅'
+        print(f"{icon} {PLATFORM_NAMES[name]}: {result['requests']:,} requests, longest chain "
+              f"{result['longest']} hop{'s' if result['longest'] != 1 else ''}")
+        shown = result['failures'] if args.verbose else result['failures'][:10]
+        for chain in shown:
+            print(f"   ❌ {chain.problem()}: {chain.describe()}")
+        if len(shown) < len(result['failures']):
+            print(f"   ... and {len(result['failures']) - len(shown)} more (--verbose lists them)")
+        if args.verbose:
+            for chain in result['redirected']:
+                if not chain.problem():
+                    print(f"   ↪️  {chain.describe()}")
+        if result['forced']:
+            print(f"   ℹ️  {result['forced']} chains also take the HTTPS upgrade, the only hop not counted")
+        if result['elsewhere']:
+            print(f"   ℹ️  {result['elsewhere']} requests are served without reaching {canonical_origin()}")
+
+    print("=" * 60)
+    print(f"📊 Summary:")
+    print(f"   Sitemap URLs: {stats['urls']}")
+    print(f"   Requests simulated: {sum(r['requests'] for r in stats['platforms'].values()):,} "
+          f"in {stats['seconds'] * 1000:.0f} ms")
+    print(f"   Chains over one hop, loops or 404s: {failed}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,11 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+from html_minify import minify_html
+from page_templates import render
+from related_posts import related_posts
+from tailwind_build import stylesheet_tag
+
 # Blog topics with comprehensive content templates
 BLOG_CONTENT_TEMPLATES = {
     "usdt-vs-usdc": {
@@ -592,179 +597,31 @@ BLOG_CONTENT_TEMPLATES = {
     }
 }
 
-def get_related_articles():
-    """Return standard related articles section"""
-    return """
-        <!-- Related Articles -->
-        <div class="mt-16 mb-8">
-            <h2 class="text-3xl font-bold text-gray-900 mb-6">Related Articles</h2>
-            <div class="grid grid-cols-1 md:grid-cols-3 gap-6">
-                <a href="/blog/what-is-stablecoin/" class="group">
-                    <div class="bg-white rounded-xl shadow-md hover:shadow-xl transition-all p-6 border border-gray-100 h-full">
-                        <h3 class="font-bold text-lg text-gray-900 group-hover:text-indigo-600 transition-colors mb-2">
-                            What Is a Stablecoin?
-                        </h3>
-                        <p class="text-gray-600 text-sm">Understanding the fundamentals of stablecoins and how they work.</p>
-                    </div>
-                </a>
-                <a href="/blog/stablecoin-beginners-guide/" class="group">
-                    <div class="bg-white rounded-xl shadow-md hover:shadow-xl transition-all p-6 border border-gray-100 h-full">
-                        <h3 class="font-bold text-lg text-gray-900 group-hover:text-indigo-600 transition-colors mb-2">
-                            Stablecoin Beginner's Guide
-                        </h3>
-                        <p class="text-gray-600 text-sm">Complete guide for those new to stablecoins.</p>
-                    </div>
-                </a>
-                <a href="/blog/how-to-buy-stablecoins/" class="group">
-                    <div class="bg-white rounded-xl shadow-md hover:shadow-xl transition-all p-6 border border-gray-100 h-full">
-                        <h3 class="font-bold text-lg text-gray-900 group-hover:text-indigo-600 transition-colors mb-2">
-                            How to Buy Stablecoins
-                        </h3>
-                        <p class="text-gray-600 text-sm">Step-by-step guide to purchasing your first stablecoins.</p>
-                    </div>
-                </a>
-            </div>
-        </div>
-"""
-
-def get_author_box():
-    """Return standard author box"""
-    return """
-        <!-- Author Box -->
-        <div class="bg-gray-100 rounded-lg p-6 mt-12">
-            <h3 class="font-semibold mb-2 text-lg">About StableCoin Hub</h3>
-            <p class="text-gray-600 mb-3">
-                StableCoin Hub is your premier destination for discovering and comparing stablecoin tools, platforms, and resources. Our mission is to make the stablecoin ecosystem accessible to everyone through comprehensive directories, expert analysis, and educational content.
-            </p>
-            <p class="text-gray-600">
-                Explore our directory of 95+ verified platforms at <a href="https://www.stablecoinhub.pro" class="text-indigo-600 hover:underline font-medium">StableCoinHub.pro</a> and join thousands of users making informed decisions in the stablecoin space.
-            </p>
-        </div>
-"""
+# Shown when the related-articles index has nothing for a post
+DEFAULT_RELATED = [
+    {'slug': "what-is-stablecoin", 'title': "What Is a Stablecoin?",
+     'blurb': "Understanding the fundamentals of stablecoins and how they work."},
+    {'slug': "stablecoin-beginners-guide", 'title': "Stablecoin Beginner's Guide",
+     'blurb': "Complete guide for those new to stablecoins."},
+    {'slug': "how-to-buy-stablecoins", 'title': "How to Buy Stablecoins",
+     'blurb': "Step-by-step guide to purchasing your first stablecoins."},
+]
+
+def get_related_articles(url):
+    """Return the related articles for a post (slug, title, blurb), from the related-articles index"""
+    related = [{'slug': post['slug'], 'title': post['title'].split(':')[0],
+                'blurb': post['description'] or post['category']}
+               for post in related_posts(url)]
+    return related or DEFAULT_RELATED
 
 def create_full_blog_html(url, blog_data):
     """Create complete blog HTML with full content"""
-
-    template = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - StableCoin Hub</title>
-    <meta name="description" content="{description}">
-    <link rel="canonical" href="https://www.stablecoinhub.pro/blog/{url}/">
-
-    <!-- Open Graph / Facebook -->
-    <meta property="og:type" content="article">
-    <meta property="og:url" content="https://www.stablecoinhub.pro/blog/{url}/">
-    <meta property="og:title" content="{title}">
-    <meta property="og:description" content="{description}">
-
-    <!-- Twitter -->
-    <meta property="twitter:card" content="summary_large_image">
-    <meta property="twitter:url" content="https://www.stablecoinhub.pro/blog/{url}/">
-    <meta property="twitter:title" content="{title}">
-    <meta property="twitter:description" content="{description}">
-
-    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
-
-    <!-- Google tag (gtag.js) -->
-    <script async src="https://www.googletagmanager.com/gtag/js?id=G-GX6EB7DSFL"></script>
-    <script>
-      window.dataLayer = window.dataLayer || [];
-      function gtag(){{dataLayer.push(arguments);}}
-      gtag('js', new Date());
-      gtag('config', 'G-GX6EB7DSFL');
-    </script>
-
-<!-- Query Parameter Handler for SEO -->
-<script>
-(function() {{
-    // Handle URL query parameters (utm_source, utm_medium, etc.)
-    if (window.location.search) {{
-        // Update canonical tag to exclude query parameters
-        var canonicalTag = document.querySelector('link[rel="canonical"]');
-        if (canonicalTag) {{
-            var cleanUrl = 'https://www.stablecoinhub.pro' + window.location.pathname;
-            if (cleanUrl.endsWith('/index.html')) {{
-                cleanUrl = cleanUrl.replace('/index.html', '/');
-            }}
-            canonicalTag.setAttribute('href', cleanUrl);
-        }}
-
-        // Add meta tag to indicate parameter handling
-        var metaTag = document.createElement('meta');
-        metaTag.name = 'url-parameters-handled';
-        metaTag.content = 'true';
-        document.head.appendChild(metaTag);
-    }}
-}})();
-</script>
-</head>
-<body class="bg-gray-50">
-    <!-- Navigation -->
-    <nav class="bg-white shadow-lg sticky top-0 z-50">
-        <div class="max-w-7xl mx-auto px-4">
-            <div class="flex justify-between items-center py-4">
-                <div class="flex items-center">
-                    <a href="/" class="text-2xl font-bold text-indigo-600">StableCoin Hub</a>
-                </div>
-                <div class="hidden md:flex items-center space-x-8">
-                    <a href="/" class="text-gray-700 hover:text-indigo-600">Home</a>
-                    <a href="/blog/" class="text-indigo-600 bg-indigo-50 px-3 py-2 rounded-md text-sm font-medium">Blog</a>
-                    <a href="/submit/" class="text-gray-700 hover:text-indigo-600">Submit Tool</a>
-                    <a href="/about/" class="text-gray-700 hover:text-indigo-600">About</a>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <article class="max-w-4xl mx-auto px-4 py-12">
-        <header class="mb-8">
-            <h1 class="text-4xl md:text-5xl font-bold text-gray-900 mb-4">{title}</h1>
-            <div class="flex items-center text-gray-600 text-sm">
-                <span>By StableCoin Hub Team</span>
-                <span class="mx-2">•</span>
-                <time datetime="{date}">{formatted_date}</time>
-            </div>
-            <div class="mt-4">
-                <span class="bg-indigo-100 text-indigo-700 px-3 py-1 rounded-full text-sm">{category}</span>
-            </div>
-        </header>
-
-        <div class="prose prose-lg max-w-none">
-            <p class="text-lg text-gray-700 mb-6 leading-relaxed">
-                {description}
-            </p>
-
-{content}
-        </div>
-
-{related_articles}
-    </article>
-
-    <!-- Footer -->
-    <footer class="bg-gray-900 text-white mt-16">
-        <div class="max-w-7xl mx-auto px-4 py-12">
-            <div class="text-center">
-                <p class="mb-4">&copy; 2025 StableCoin Hub. All rights reserved.</p>
-                <div class="mt-4 space-x-4">
-                    <a href="/" class="hover:text-indigo-400">Home</a>
-                    <a href="/blog/" class="hover:text-indigo-400">Blog</a>
-                    <a href="/about/" class="hover:text-indigo-400">About</a>
-                    <a href="/submit/" class="hover:text-indigo-400">Submit Tool</a>
-                </div>
-            </div>
-        </div>
-    </footer>
-</body>
-</html>"""
-
     date = datetime.now().strftime("%Y-%m-%d")
     formatted_date = datetime.now().strftime("%B %d, %Y")
 
-    return template.format(
+    return render(
+        'posts/full.html',
+        stylesheet=stylesheet_tag(),
         title=blog_data['title'],
         description=blog_data['description'],
         url=url,
@@ -772,7 +629,7 @@ def create_full_blog_html(url, blog_data):
         formatted_date=formatted_date,
         category=blog_data['category'],
         content=blog_data['content'],
-        related_articles=get_related_articles() + get_author_box()
+        related=get_related_articles(url)
     )
 
 def identify_broken_blogs():
@@ -820,7 +677,7 @@ def regenerate_blog(blog_url):
         blog_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(blog_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(minify_html(html_content))
 
         return True
     else:
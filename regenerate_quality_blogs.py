@@ -10,6 +10,9 @@ import random
 from datetime import datetime
 from pathlib import Path
 
+from html_minify import minify_html
+from page_templates import render
+
 class QualityBlogGenerator:
     def __init__(self):
         self.blog_templates = {
@@ -582,515 +585,25 @@ Future developments in this space promise to further transform how we think abou
 
     def generate_html_content(self, blog_data, blog_url):
         """Generate complete HTML content for blog"""
-
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{blog_data['title']} | StablecoinHub.pro</title>
-    <meta name="description" content="{blog_data['meta_description']}">
-    <link rel="canonical" href="https://www.stablecoinhub.pro/blog/{blog_url}/">
-
-    <!-- Open Graph -->
-    <meta property="og:title" content="{blog_data['title']}">
-    <meta property="og:description" content="{blog_data['meta_description']}">
-    <meta property="og:type" content="article">
-    <meta property="og:url" content="https://www.stablecoinhub.pro/blog/{blog_url}/">
-    <meta property="og:site_name" content="StablecoinHub.pro">
-
-    <!-- Twitter Card -->
-    <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="{blog_data['title']}">
-    <meta name="twitter:description" content="{blog_data['meta_description']}">
-
-    <!-- Schema.org -->
-    <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "Article",
-        "headline": "{blog_data['title']}",
-        "description": "{blog_data['meta_description']}",
-        "author": {{
-            "@type": "Organization",
-            "name": "StablecoinHub.pro"
-        }},
-        "publisher": {{
-            "@type": "Organization",
-            "name": "StablecoinHub.pro",
-            "logo": {{
-                "@type": "ImageObject",
-                "url": "https://www.stablecoinhub.pro/logo.png"
-            }}
-        }},
-        "datePublished": "{datetime.now().isoformat()}",
-        "dateModified": "{datetime.now().isoformat()}"
-    }}
-    </script>
-
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f8f9fa;
-        }}
-
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 2rem 0;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-
-        .nav {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-
-        .logo {{
-            font-size: 1.5rem;
-            font-weight: bold;
-            text-decoration: none;
-            color: white;
-        }}
-
-        .nav-links {{
-            display: flex;
-            gap: 2rem;
-            list-style: none;
-        }}
-
-        .nav-links a {{
-            color: white;
-            text-decoration: none;
-            transition: opacity 0.3s;
-        }}
-
-        .nav-links a:hover {{
-            opacity: 0.8;
-        }}
-
-        .article-header {{
-            background: white;
-            padding: 3rem 0;
-            margin-bottom: 2rem;
-            border-bottom: 2px solid #e9ecef;
-        }}
-
-        .article-meta {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 0 2rem;
-        }}
-
-        h1 {{
-            font-size: 2.5rem;
-            line-height: 1.2;
-            margin-bottom: 1rem;
-            color: #2c3e50;
-        }}
-
-        .meta-info {{
-            display: flex;
-            gap: 2rem;
-            color: #6c757d;
-            font-size: 0.95rem;
-            margin-bottom: 1rem;
-        }}
-
-        .breadcrumb {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 0 2rem 1rem;
-            color: #6c757d;
-            font-size: 0.9rem;
-        }}
-
-        .breadcrumb a {{
-            color: #667eea;
-            text-decoration: none;
-        }}
-
-        .container {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 0 2rem 4rem;
-        }}
-
-        .key-takeaways {{
-            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-            border-radius: 10px;
-            padding: 2rem;
-            margin: 2rem 0;
-        }}
-
-        .key-takeaways h3 {{
-            color: #2c3e50;
-            margin-bottom: 1rem;
-            font-size: 1.3rem;
-        }}
-
-        .key-takeaways ul {{
-            list-style: none;
-            padding-left: 0;
-        }}
-
-        .key-takeaways li {{
-            padding: 0.5rem 0;
-            padding-left: 2rem;
-            position: relative;
-        }}
-
-        .key-takeaways li:before {{
-            content: "✓";
-            position: absolute;
-            left: 0;
-            color: #28a745;
-            font-weight: bold;
-        }}
-
-        .content-section {{
-            background: white;
-            border-radius: 10px;
-            padding: 2rem;
-            margin: 2rem 0;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        }}
-
-        h2 {{
-            color: #2c3e50;
-            font-size: 2rem;
-            margin-top: 2.5rem;
-            margin-bottom: 1.5rem;
-            padding-bottom: 0.5rem;
-            border-bottom: 3px solid #667eea;
-        }}
-
-        h3 {{
-            color: #495057;
-            font-size: 1.5rem;
-            margin-top: 2rem;
-            margin-bottom: 1rem;
-        }}
-
-        p {{
-            margin-bottom: 1.5rem;
-            text-align: justify;
-            line-height: 1.8;
-        }}
-
-        .comparison-table {{
-            overflow-x: auto;
-            margin: 2rem 0;
-        }}
-
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: white;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        }}
-
-        th {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1rem;
-            text-align: left;
-            font-weight: 600;
-        }}
-
-        td {{
-            padding: 1rem;
-            border-bottom: 1px solid #e9ecef;
-        }}
-
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-
-        .faq-section {{
-            background: #f8f9fa;
-            border-radius: 10px;
-            padding: 2rem;
-            margin: 3rem 0;
-        }}
-
-        .faq-item {{
-            background: white;
-            border-radius: 8px;
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.05);
-        }}
-
-        .faq-question {{
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 0.5rem;
-            font-size: 1.1rem;
-        }}
-
-        .faq-answer {{
-            color: #555;
-            line-height: 1.6;
-        }}
-
-        .cta-section {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 10px;
-            padding: 3rem;
-            margin: 3rem 0;
-            text-align: center;
-        }}
-
-        .cta-section h3 {{
-            color: white;
-            margin-bottom: 1rem;
-        }}
-
-        .cta-button {{
-            display: inline-block;
-            background: white;
-            color: #667eea;
-            padding: 1rem 2rem;
-            border-radius: 5px;
-            text-decoration: none;
-            font-weight: 600;
-            margin-top: 1rem;
-            transition: transform 0.3s;
-        }}
-
-        .cta-button:hover {{
-            transform: translateY(-2px);
-        }}
-
-        .footer {{
-            background: #2c3e50;
-            color: white;
-            padding: 3rem 0;
-            margin-top: 4rem;
-        }}
-
-        .footer-content {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 2rem;
-        }}
-
-        .footer-section h4 {{
-            margin-bottom: 1rem;
-            color: white;
-        }}
-
-        .footer-section ul {{
-            list-style: none;
-        }}
-
-        .footer-section a {{
-            color: #cbd5e0;
-            text-decoration: none;
-            line-height: 2;
-        }}
-
-        .footer-section a:hover {{
-            color: white;
-        }}
-
-        @media (max-width: 768px) {{
-            h1 {{
-                font-size: 1.8rem;
-            }}
-
-            h2 {{
-                font-size: 1.5rem;
-            }}
-
-            .nav-links {{
-                display: none;
-            }}
-
-            .container {{
-                padding: 0 1rem 2rem;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <header class="header">
-        <nav class="nav">
-            <a href="/" class="logo">StablecoinHub.pro</a>
-            <ul class="nav-links">
-                <li><a href="/">Home</a></li>
-                <li><a href="/blog/">Blog</a></li>
-                <li><a href="/about/">About</a></li>
-                <li><a href="/submit/">Submit</a></li>
-            </ul>
-        </nav>
-    </header>
-
-    <div class="article-header">
-        <div class="breadcrumb">
-            <a href="/">Home</a> › <a href="/blog/">Blog</a> › {blog_data['category']}
-        </div>
-        <div class="article-meta">
-            <h1>{blog_data['title']}</h1>
-            <div class="meta-info">
-                <span>📅 {datetime.now().strftime('%B %d, %Y')}</span>
-                <span>📁 {blog_data['category']}</span>
-                <span>⏱️ 15 min read</span>
-            </div>
-        </div>
-    </div>
-
-    <main class="container">
-        <div class="key-takeaways">
-            <h3>🎯 Key Takeaways</h3>
-            <ul>
-"""
-
-        for takeaway in blog_data['key_takeaways']:
-            html += f"                <li>{takeaway}</li>\n"
-
-        html += """            </ul>
-        </div>
-
-        <article>
-"""
-
-        # Add sections
-        for section_title, section_content in blog_data['sections']:
-            paragraphs = "".join(f"<p>{para.strip()}</p>" for para in section_content.split('\n\n') if para.strip())
-            html += f"""
-            <section class="content-section">
-                <h2>{section_title}</h2>
-                {paragraphs}
-            </section>
-"""
-
-        # Add comparison table if exists
-        if blog_data['comparison_table']:
-            table = blog_data['comparison_table']
-            html += """
-            <section class="content-section">
-                <h2>Detailed Comparison</h2>
-                <div class="comparison-table">
-                    <table>
-                        <thead>
-                            <tr>
-"""
-            for header in table['headers']:
-                html += f"                                <th>{header}</th>\n"
-
-            html += """                            </tr>
-                        </thead>
-                        <tbody>
-"""
-            for row in table['rows']:
-                html += "                            <tr>\n"
-                for cell in row:
-                    html += f"                                <td>{cell}</td>\n"
-                html += "                            </tr>\n"
-
-            html += """                        </tbody>
-                    </table>
-                </div>
-            </section>
-"""
-
-        # Add FAQ section
-        if blog_data['faq']:
-            html += """
-            <section class="faq-section">
-                <h2>Frequently Asked Questions</h2>
-"""
-            for faq in blog_data['faq']:
-                question = faq['q']
-                answer = faq['a']
-                html += f"""
-                <div class="faq-item">
-                    <div class="faq-question">❓ {question}</div>
-                    <div class="faq-answer">{answer}</div>
-                </div>
-"""
-            html += """            </section>
-"""
-
-        # Add CTA and conclusion
-        html += """
-            <section class="content-section">
-                <h2>Conclusion</h2>
-                <p>The stablecoin ecosystem continues to evolve rapidly, presenting both opportunities and challenges for participants. Whether you're interested in earning yield, facilitating international transfers, or simply seeking a stable store of value in the crypto ecosystem, understanding the nuances of different stablecoins and platforms is essential.</p>
-
-                <p>As we move through 2025, regulatory clarity, technological innovation, and institutional adoption will continue shaping the landscape. Staying informed about developments, maintaining proper risk management, and choosing platforms aligned with your goals will be key to success.</p>
-
-                <p>Remember that while stablecoins offer relative stability compared to other cryptocurrencies, they still carry risks. Always conduct thorough research, start with small amounts, and never invest more than you can afford to lose. The combination of traditional finance principles and blockchain innovation creates exciting possibilities, but prudent approach remains essential.</p>
-            </section>
-
-            <div class="cta-section">
-                <h3>Ready to Get Started with Stablecoins?</h3>
-                <p>Join thousands of users already benefiting from the stability and utility of digital dollars.</p>
-                <a href="/" class="cta-button">Explore StablecoinHub</a>
-            </div>
-        </article>
-    </main>
-
-    <footer class="footer">
-        <div class="footer-content">
-            <div class="footer-section">
-                <h4>Resources</h4>
-                <ul>
-                    <li><a href="/blog/">Blog</a></li>
-                    <li><a href="/about/">About Us</a></li>
-                    <li><a href="/submit/">Submit Stablecoin</a></li>
-                </ul>
-            </div>
-            <div class="footer-section">
-                <h4>Categories</h4>
-                <ul>
-                    <li><a href="/blog/">Education</a></li>
-                    <li><a href="/blog/">DeFi & Yield</a></li>
-                    <li><a href="/blog/">Regulation</a></li>
-                </ul>
-            </div>
-            <div class="footer-section">
-                <h4>Popular Stablecoins</h4>
-                <ul>
-                    <li><a href="/blog/what-is-usdt/">USDT (Tether)</a></li>
-                    <li><a href="/blog/what-is-usdc/">USDC (USD Coin)</a></li>
-                    <li><a href="/blog/what-is-dai/">DAI</a></li>
-                </ul>
-            </div>
-            <div class="footer-section">
-                <h4>Connect</h4>
-                <ul>
-                    <li><a href="#">Twitter</a></li>
-                    <li><a href="#">Telegram</a></li>
-                    <li><a href="#">Discord</a></li>
-                </ul>
-            </div>
-        </div>
-    </footer>
-
-    <script src="/canonical-handler.js"></script>
-</body>
-</html>"""
-
-        return html
+        now = datetime.now()
+        sections = [
+            {'title': section_title,
+             'paragraphs': "".join(f"<p>{para.strip()}</p>" for para in section_content.split('\n\n') if para.strip())}
+            for section_title, section_content in blog_data['sections']
+        ]
+        return render(
+            'posts/quality.html',
+            url=blog_url,
+            title=blog_data['title'],
+            meta_description=blog_data['meta_description'],
+            category=blog_data['category'],
+            published=now.isoformat(),
+            date=now.strftime('%B %d, %Y'),
+            key_takeaways=blog_data['key_takeaways'],
+            sections=sections,
+            comparison_table=blog_data['comparison_table'],
+            faq=blog_data['faq'],
+        )
 
 def main():
     """Regenerate all blogs with quality content"""
@@ -1152,7 +665,7 @@ def main():
             blog_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(blog_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                f.write(minify_html(html_content))
 
             # Calculate word count
             text_content = re.sub('<[^<]+?>', '', html_content)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Related-articles engine for StableCoin Hub.
+
+Every post in the blog metadata index (blog_metadata.BlogIndex, keyed by
+slug) is turned into a term vector built from its title, description, tags,
+categories and body text. Related posts are the top-k by TF-IDF cosine
+similarity, where a shared tag or category counts like several shared words.
+
+The term counts of each post are cached in .cache/related.json under the
+hash of the text they came from, so a build only re-tokenizes posts whose
+content changed. Scoring walks an inverted index of each post's strongest
+terms instead of comparing every pair of posts, and a heap keeps the top k,
+so computing related links for the whole blog stays close to linear in the
+number of posts.
+
+Generators get related posts through related_posts(slug), which returns
+BlogIndex entries (slug, url, title, description, category, ...).
+
+Usage:
+    python related_posts.py             # refresh the cache
+    python related_posts.py --show      # refresh and list related posts
+"""
+
+import argparse
+import functools
+import heapq
+import json
+import math
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+
+from blog_listing import REDIRECT_SLUGS
+from blog_metadata import BlogIndex
+from markdown_renderer import split_front_matter
+from site_build import hash_bytes, write_if_changed
+
+RELATED_CACHE_FILE = '.cache/related.json'
+RELATED_CACHE_VERSION = 1
+TOP_K = 3
+
+# A post is matched through its strongest terms only (keeps scoring near-linear)
+MAX_QUERY_TERMS = 40
+# Terms kept per post in the cache (by count)
+MAX_STORED_TERMS = 150
+# A shared tag or category weighs as much as this many occurrences of a word
+TAG_WEIGHT = 5
+# Title words count this many times
+TITLE_WEIGHT = 3
+
+WORD_RE = re.compile(r"[a-z0-9][a-z0-9'-]*[a-z0-9]")
+STOPWORDS = frozenset('''
+    about above after again against all also and any are as at be because been before being below between both
+    but by can could did do does doing down during each few for from further had has have having here how if
+    in into is it its just like may more most much must no nor not now of off on once one only or other our
+    out over own same should so some such than that the their them then there these they this those through
+    to too under until up use used using very was way we well were what when where which while who why will
+    with within without would you your
+'''.split())
+
+
+def tokenize(text):
+    """Lowercase words of three or more characters, stopwords removed"""
+    return [word for word in WORD_RE.findall(text.lower()) if len(word) > 2 and word not in STOPWORDS]
+
+
+def visible_text(html):
+    """Body text of a rendered page (scripts, styles and tags stripped)"""
+    body_start = html.find('<body')
+    html = html[body_start:] if body_start != -1 else html
+    html = re.sub(r'<script\b.*?</script>|<style\b.*?</style>', ' ', html, flags=re.DOTALL | re.IGNORECASE)
+    return re.sub(r'<[^>]+>', ' ', html)
+
+
+def post_text(entry, blog_dir):
+    """The text a post is compared by: its markdown body, or the page text for HTML-only posts"""
+    source = entry.get('source') or ''
+    if source.endswith('.md'):
+        with open(source, 'r', encoding='utf-8') as f:
+            return split_front_matter(f.read())[1]
+    try:
+        with open(os.path.join(blog_dir, entry['slug'], 'index.html'), 'r', encoding='utf-8') as f:
+            return visible_text(f.read())
+    except FileNotFoundError:
+        return ''
+
+
+def post_features(entry, body):
+    """Text and labels of a post, the input its term counts are derived from"""
+    labels = [entry.get('category') or ''] + list(entry.get('categories') or []) + list(entry.get('tags') or [])
+    return {
+        'title': entry.get('title') or '',
+        'description': entry.get('description') or '',
+        'labels': sorted({label.strip().lower() for label in labels if label.strip()}),
+        'body': body,
+    }
+
+
+def term_counts(features):
+    """Weighted term counts of a post, limited to its MAX_STORED_TERMS most frequent terms"""
+    counts = Counter(tokenize(features['body']))
+    counts.update(tokenize(features['description']))
+    for word in tokenize(features['title']):
+        counts[word] += TITLE_WEIGHT
+    for label in features['labels']:
+        counts['#' + label] += TAG_WEIGHT
+    return dict(counts.most_common(MAX_STORED_TERMS))
+
+
+def tfidf_vectors(counts_by_slug):
+    """slug -> {term: weight}, L2-normalised, keeping each post's MAX_QUERY_TERMS strongest terms"""
+    total = len(counts_by_slug)
+    document_frequency = Counter()
+    for counts in counts_by_slug.values():
+        document_frequency.update(counts.keys())
+
+    vectors = {}
+    for slug, counts in counts_by_slug.items():
+        weights = {term: (1 + math.log(count)) * math.log(total / document_frequency[term])
+                   for term, count in counts.items()}
+        strongest = heapq.nlargest(MAX_QUERY_TERMS, weights.items(), key=lambda item: (item[1], item[0]))
+        norm = math.sqrt(sum(weight * weight for _, weight in strongest)) or 1.0
+        vectors[slug] = {term: weight / norm for term, weight in strongest if weight > 0}
+    return vectors
+
+
+def top_related(vectors, k=TOP_K):
+    """slug -> up to k most similar slugs, best first"""
+    postings = defaultdict(list)
+    for slug, vector in vectors.items():
+        for term, weight in vector.items():
+            postings[term].append((slug, weight))
+
+    related = {}
+    for slug, vector in vectors.items():
+        scores = defaultdict(float)
+        for term, weight in vector.items():
+            for other, other_weight in postings[term]:
+                if other != slug:
+                    scores[other] += weight * other_weight
+        # Ties go to the alphabetically first slug so the output is stable
+        best = heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+        related[slug] = [other for other, _ in best]
+    return related
+
+
+class RelatedIndex:
+    """Cached term counts per post and the related slugs computed from them"""
+
+    def __init__(self, path=RELATED_CACHE_FILE, blog_index=None, top_k=TOP_K):
+        self.path = path
+        self.blog_index = blog_index if blog_index is not None else BlogIndex()
+        self.top_k = top_k
+        self.posts = {}
+        self.related = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == RELATED_CACHE_VERSION and data.get('top_k') == self.top_k:
+            self.posts = data.get('posts', {})
+            self.related = data.get('related', {})
+
+    def save(self):
+        data = {'version': RELATED_CACHE_VERSION, 'top_k': self.top_k, 'posts': self.posts, 'related': self.related}
+        return write_if_changed(self.path, json.dumps(data, indent=1, sort_keys=True, ensure_ascii=False) + '\n')
+
+    def refresh(self):
+        """Re-count posts whose metadata or text changed, then recompute related slugs.
+
+        Returns a stats dict.
+        """
+        stats = {'counted': 0, 'cached': 0, 'removed': 0}
+        entries = {slug: entry for slug, entry in self.blog_index.entries.items() if slug not in REDIRECT_SLUGS}
+
+        for slug in list(self.posts):
+            if slug not in entries:
+                del self.posts[slug]
+                stats['removed'] += 1
+
+        for slug, entry in entries.items():
+            cached = self.posts.get(slug)
+            # The blog index signature changes whenever the post's files do
+            if cached and cached.get('signature') == entry.get('signature'):
+                stats['cached'] += 1
+                continue
+            features = post_features(entry, post_text(entry, self.blog_index.blog_dir))
+            content_hash = hash_bytes(json.dumps(features, sort_keys=True))
+            if cached and cached.get('hash') == content_hash:
+                stats['cached'] += 1
+            else:
+                cached = {'hash': content_hash, 'terms': term_counts(features)}
+                stats['counted'] += 1
+            cached['signature'] = entry.get('signature')
+            self.posts[slug] = cached
+
+        if stats['counted'] or stats['removed'] or set(self.related) != set(self.posts):
+            vectors = tfidf_vectors({slug: post['terms'] for slug, post in self.posts.items()})
+            self.related = top_related(vectors, self.top_k)
+        return stats
+
+    def related_slugs(self, slug, k=None):
+        return self.related.get(slug, [])[:k or self.top_k]
+
+    def related_posts(self, slug, k=None):
+        """BlogIndex entries of the posts related to slug, best first"""
+        posts = (self.blog_index.get(other) for other in self.related_slugs(slug, k))
+        return [post for post in posts if post]
+
+
+def load_related_index(path=RELATED_CACHE_FILE, blog_index=None, save=True):
+    """Open the cache, bring it up to date with the blog index and (optionally) persist it"""
+    if blog_index is None:
+        blog_index = BlogIndex()
+        blog_index.refresh()
+    index = RelatedIndex(path, blog_index=blog_index)
+    index.refresh()
+    if save:
+        index.save()
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def shared_index():
+    """One refreshed index per process for generators that render post by post"""
+    return load_related_index(save=False)
+
+
+def related_posts(slug, k=TOP_K):
+    """BlogIndex entries of the k posts most related to slug"""
+    return shared_index().related_posts(slug, k)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute related articles for every blog post")
+    parser.add_argument('--cache', default=RELATED_CACHE_FILE, help="path of the related-articles cache")
+    parser.add_argument('--show', action='store_true', help="list each post's related posts")
+    args = parser.parse_args()
+
+    blog_index = BlogIndex()
+    blog_index.refresh()
+    blog_index.save()
+    index = RelatedIndex(args.cache, blog_index=blog_index)
+    stats = index.refresh()
+    written = index.save()
+
+    print(f"🔗 Related articles: {len(index.posts)} posts "
+          f"({stats['counted']} counted, {stats['cached']} cached, {stats['removed']} removed)")
+    if written:
+        print(f"✅ Wrote {args.cache}")
+    if args.show:
+        print("=" * 60)
+        for slug in sorted(index.related):
+            print(f"{slug}")
+            for other in index.related_slugs(slug):
+                print(f"    → {other}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
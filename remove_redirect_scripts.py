@@ -3,34 +3,25 @@
 Remove the problematic redirect scripts that are causing infinite loops
 """
 
-import os
-import re
-from pathlib import Path
+from seo_document import HtmlDocument, load_pages
 
-def remove_redirect_script(file_path):
-    """Remove the redirect script from an HTML file"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Pattern to find and remove the redirect script
-    # This matches the entire script block that contains the redirect
-    pattern = r'<script>\s*\(function\(\)\s*\{[^}]*// Redirect from www to non-www[^}]*window\.location\.href = \'https://stablecoinhub\.pro\'[^}]*\}\)\(\);\s*</script>'
-
-    # Also check for a simpler pattern
-    pattern2 = r'// Redirect from www to non-www\s*if \(window\.location\.hostname === \'www\.stablecoinhub\.pro\'\) \{\s*window\.location\.href = \'https://stablecoinhub\.pro\' \+ window\.location\.pathname \+ window\.location\.search \+ window\.location\.hash;\s*\}'
+# The whole IIFE script block that contains the redirect
+REDIRECT_SCRIPT_PATTERN = r'<script>\s*\(function\(\)\s*\{[^}]*// Redirect from www to non-www[^}]*window\.location\.href = \'https://stablecoinhub\.pro\'[^}]*\}\)\(\);\s*</script>'
 
-    # Count matches before removal
-    matches = len(re.findall(pattern, content)) + len(re.findall(pattern2, content))
+# The bare redirect statement added by fix_canonical_urls
+REDIRECT_STATEMENT_PATTERN = r'// Redirect from www to non-www\s*if \(window\.location\.hostname === \'www\.stablecoinhub\.pro\'\) \{\s*window\.location\.href = \'https://stablecoinhub\.pro\' \+ window\.location\.pathname \+ window\.location\.search \+ window\.location\.hash;\s*\}'
 
-    if matches > 0:
-        # Remove the redirect scripts
-        content = re.sub(pattern, '', content)
-        content = re.sub(pattern2, '', content)
-
-        # Write back
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+def remove_redirect_script_pass(doc):
+    """Remove the www -> apex redirect scripts from a page"""
+    removed = doc.sub(REDIRECT_SCRIPT_PATTERN, '')
+    removed += doc.sub(REDIRECT_STATEMENT_PATTERN, '')
+    return removed > 0
 
+def remove_redirect_script(file_path):
+    """Remove the redirect script from an HTML file"""
+    doc = HtmlDocument(file_path)
+    if remove_redirect_script_pass(doc):
+        doc.save()
         return True
     return False
 
@@ -42,11 +33,12 @@ def main():
     total_count = 0
 
     # Find all HTML files
-    for html_file in Path('.').rglob('*.html'):
+    for doc in load_pages('.'):
         total_count += 1
-        if remove_redirect_script(html_file):
+        if remove_redirect_script_pass(doc):
+            doc.save()
             fixed_count += 1
-            print(f"✅ Fixed: {html_file}")
+            print(f"✅ Fixed: {doc.rel_path}")
 
     print(f"\n📊 Summary:")
     print(f"   Total HTML files scanned: {total_count}")
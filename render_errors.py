@@ -0,0 +1,11 @@
+"""
+Exceptions shared by the blog render scripts and render_pipeline.
+
+They live in a module no one runs as a script: when render_pipeline.py is
+run directly it is __main__, and a class defined there would not be the one
+the render functions import and raise.
+"""
+
+
+class SkipPost(ValueError):
+    """Raised by a render function to skip a post, with the reason as message"""
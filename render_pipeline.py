@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Shared rendering pipeline for blog/_posts markdown -> blog/<slug>/index.html.
+
+Each blog script supplies a render function that maps one markdown file to
+(html_file, html), raising SkipPost when the post should be left alone. The
+pipeline runs that function serially or across a process pool (--jobs N),
+minifies the markup (html_minify.py), writes every result atomically (and
+only when it changed) and reports per-file timings and sizes.
+
+Usage:
+    python render_pipeline.py beautify --jobs 8
+    python render_pipeline.py restore --jobs 0 --timings 20
+    python render_pipeline.py beautify --profile    # Chrome trace of the batch (see build_profiler.py)
+"""
+
+import argparse
+import glob
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from build_profiler import add_profile_argument, measured_since, profiled, record_results, snapshot, stage
+from html_minify import MinifyCache, cached_output, minify_html
+from render_errors import SkipPost
+from site_build import hash_bytes, slug_for_post, write_if_changed
+
+POSTS_GLOB = 'blog/_posts/*.md'
+
+# Renderer name -> "module:function" taking a markdown path, returning (html_file, html)
+RENDERERS = {
+    'beautify': 'beautify_blogs:render_blog_post',
+    'restore': 'restore_all_blogs:render_restored_post',
+    'fix': 'fix_blog_posts:render_fixed_post',
+    'create': 'create_missing_blogs:render_missing_post',
+}
+
+
+def load_renderer(name):
+    """Resolve a renderer name from RENDERERS to its function"""
+    module_name, func_name = RENDERERS[name].split(':')
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def resolve_jobs(jobs):
+    """0 or a negative value means one worker per CPU"""
+    if jobs is None or jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def render_one(render_func, md_file, write=True, minify_cache=None):
+    """Render, minify and (optionally) write a single post, returning a result dict.
+
+    minify_cache maps html_file -> html_minify cache entry; a page whose
+    rendered markup hashes the same as its entry and is still on disk as
+    written is left alone without minifying it again. None turns
+    minification off.
+
+    Runs inside worker processes, so it never raises: failures are reported
+    through the 'status' and 'message' fields.
+    """
+    result = {
+        'md_file': md_file,
+        'slug': slug_for_post(md_file),
+        'html_file': None,
+        'status': 'failed',
+        'message': '',
+        'output_hash': None,
+        'bytes': 0,
+        'source_bytes': 0,
+    }
+    started = time.perf_counter()
+    before = snapshot()
+    try:
+        html_file, html = render_func(md_file)
+        result['html_file'] = html_file
+        result['source_bytes'] = len(html.encode('utf-8'))
+        if minify_cache is not None:
+            source_hash = hash_bytes(html)
+            entry = minify_cache.get(os.path.normpath(html_file))
+            if write and cached_output(entry, html_file, source_hash):
+                result.update(status='unchanged', output_hash=entry['output'], bytes=entry['bytes'])
+                return finish(result, started, before)
+            html = minify_html(html)
+            result['minified'] = {'source': source_hash, 'output': hash_bytes(html),
+                                  'bytes': len(html.encode('utf-8')), 'source_bytes': result['source_bytes']}
+        result['output_hash'] = hash_bytes(html)
+        result['bytes'] = len(html.encode('utf-8'))
+        if write:
+            result['status'] = 'written' if write_if_changed(html_file, html) else 'unchanged'
+        else:
+            result['status'] = 'rendered'
+            result['html'] = html
+    except SkipPost as e:
+        result['status'] = 'skipped'
+        result['message'] = str(e)
+    except Exception as e:
+        result['message'] = f"{type(e).__name__}: {e}"
+    return finish(result, started, before)
+
+
+def finish(result, started, before):
+    """Add the timing (and, when profiling, the measurements) to a result"""
+    result['seconds'] = time.perf_counter() - started
+    if before is not None:
+        result['profile'] = measured_since(before)
+    return result
+
+
+def _render_star(args):
+    return render_one(*args)
+
+
+def render_posts(render_func, md_files, jobs=1, write=True, minify=True):
+    """Render (and minify) many posts, in a process pool when jobs != 1.
+
+    Results come back in the same order as md_files.
+    """
+    md_files = list(md_files)
+    jobs = min(resolve_jobs(jobs), max(len(md_files), 1))
+    cache = MinifyCache() if minify else None
+    tasks = [(render_func, md_file, write, cache.pages if cache else None) for md_file in md_files]
+
+    with stage('render', posts=len(tasks), jobs=jobs):
+        if jobs == 1:
+            results = [_render_star(task) for task in tasks]
+        else:
+            chunksize = max(1, len(tasks) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(_render_star, tasks, chunksize=chunksize))
+    record_results(results)
+
+    if cache is not None and write:
+        for result in results:
+            if result.get('minified') and result['status'] in ('written', 'unchanged'):
+                cache.pages[os.path.normpath(result['html_file'])] = result['minified']
+        cache.save()
+    return results
+
+
+def print_timings(results, elapsed, top=10):
+    """Print per-status counts and the slowest files"""
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+
+    print(f"\n⏱️  Rendered {len(results)} posts in {elapsed:.2f}s")
+    for status in ('written', 'unchanged', 'rendered', 'skipped', 'failed'):
+        if counts.get(status):
+            print(f"   {status.capitalize()}: {counts[status]}")
+
+    source_bytes = sum(r['source_bytes'] for r in results if r['bytes'])
+    output_bytes = sum(r['bytes'] for r in results)
+    if source_bytes > output_bytes:
+        print(f"   Minified: {source_bytes / 1024:,.1f} KB → {output_bytes / 1024:,.1f} KB "
+              f"({100 - output_bytes * 100 / source_bytes:.1f}% smaller)")
+
+    if top:
+        slowest = sorted(results, key=lambda r: r['seconds'], reverse=True)[:top]
+        print(f"\n🐢 Slowest {len(slowest)} posts:")
+        for result in slowest:
+            print(f"   {result['seconds'] * 1000:8.1f} ms  {result['bytes']:>8,} B  {result['slug']}")
+
+
+def page_size(result):
+    """Size of a written page, and of the markup it was minified from"""
+    if result['source_bytes'] > result['bytes']:
+        return f"{result['source_bytes'] / 1024:.1f} → {result['bytes'] / 1024:.1f} KB"
+    return f"{result['bytes'] / 1024:.1f} KB"
+
+
+def report_results(results):
+    """Print one line per post, matching the blog scripts' output style"""
+    for result in results:
+        if result['status'] == 'written':
+            print(f"✅ Wrote: {result['slug']} ({result['seconds'] * 1000:.1f} ms, {page_size(result)})")
+        elif result['status'] == 'unchanged':
+            print(f"✓ Unchanged: {result['slug']} ({result['seconds'] * 1000:.1f} ms, {page_size(result)})")
+        elif result['status'] == 'skipped':
+            print(f"⚠️  Skipped {result['slug']}: {result['message']}")
+        elif result['status'] == 'failed':
+            print(f"❌ Failed {result['slug']}: {result['message']}")
+
+
+def add_pipeline_arguments(parser):
+    """Add the --jobs/--timings/--profile options shared by every blog render script"""
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="worker processes (0 = one per CPU, default 1)")
+    parser.add_argument('--timings', type=int, default=10, metavar='N',
+                        help="show the N slowest posts (0 to hide)")
+    add_profile_argument(parser)
+    return parser
+
+
+def run(render_func, md_files, jobs=1, timings=10, profile=None):
+    """Render, write and report a batch of posts. Returns the result list.
+
+    profile is a trace path (the --profile option) to profile the batch.
+    """
+    with profiled(profile, os.path.splitext(os.path.basename(sys.argv[0]))[0]):
+        started = time.perf_counter()
+        results = render_posts(render_func, md_files, jobs=jobs)
+        elapsed = time.perf_counter() - started
+        report_results(results)
+        print_timings(results, elapsed, top=timings)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render blog/_posts markdown to blog/<slug>/index.html")
+    parser.add_argument('renderer', choices=sorted(RENDERERS), help="which blog template to render with")
+    parser.add_argument('posts', nargs='*', help=f"markdown files (default: {POSTS_GLOB})")
+    add_pipeline_arguments(parser)
+    args = parser.parse_args()
+
+    md_files = args.posts or sorted(glob.glob(POSTS_GLOB))
+    print(f"🔨 Rendering {len(md_files)} posts with '{args.renderer}' using {resolve_jobs(args.jobs)} job(s)")
+    print("=" * 60)
+    results = run(load_renderer(args.renderer), md_files, jobs=args.jobs, timings=args.timings,
+                  profile=args.profile)
+    return 1 if any(r['status'] == 'failed' for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,18 @@
 import os
 import re
 import glob
+import argparse
+
+from markdown_renderer import render_markdown
+from render_errors import SkipPost
+from render_pipeline import add_pipeline_arguments, run
 
 def convert_markdown_to_html(content):
-    """Convert markdown content to HTML while preserving structure"""
+    """Convert markdown content to HTML while preserving structure.
+
+    Legacy multi-pass converter, superseded by markdown_renderer and kept as
+    the baseline for bench_markdown.py.
+    """
     # Basic conversions
     html = content
 
@@ -106,8 +115,12 @@ def process_table_row(row):
         # Data row
         return '<tr>' + ''.join(f'<td class="border border-gray-300 px-4 py-2">{cell.strip()}</td>' for cell in cells) + '</tr>'
 
-def restore_blog_post(md_file, blog_dir):
-    """Restore a single blog post with original content"""
+def render_restored_post(md_file, blog_dir='blog'):
+    """Render a blog post with its original content spliced in.
+
+    Returns (html_file, html); raises SkipPost if the page does not exist yet
+    or its markup has no description-to-Related-Articles section to replace.
+    """
     # Extract URL from filename
     filename = os.path.basename(md_file)
     # Remove date prefix and .md extension
@@ -116,8 +129,7 @@ def restore_blog_post(md_file, blog_dir):
     # Check if corresponding HTML file exists
     html_file = f"{blog_dir}/{url_part}/index.html"
     if not os.path.exists(html_file):
-        print(f"  ⚠️  HTML file not found: {html_file}")
-        return False
+        raise SkipPost(f"HTML file not found: {html_file}")
 
     # Read original markdown content
     with open(md_file, 'r') as f:
@@ -135,7 +147,7 @@ def restore_blog_post(md_file, blog_dir):
         content = md_content
 
     # Convert markdown to HTML
-    html_content = convert_markdown_to_html(content)
+    html_content = render_markdown(content, 'restore')
 
     # Read current HTML template
     with open(html_file, 'r') as f:
@@ -170,12 +182,24 @@ def restore_blog_post(md_file, blog_dir):
             <h2 class="text-2xl font-bold mb-4 mt-8">Related Articles</h2>'''
 
     # Replace the content
-    new_html = re.sub(
+    new_html, replaced = re.subn(
         pattern,
         new_content_section + r'\3',
         current_html,
         flags=re.DOTALL
     )
+    if not replaced:
+        raise SkipPost(f"No content section to restore in {html_file}")
+
+    return html_file, new_html
+
+def restore_blog_post(md_file, blog_dir):
+    """Restore a single blog post with original content"""
+    try:
+        html_file, new_html = render_restored_post(md_file, blog_dir)
+    except SkipPost as e:
+        print(f"  ⚠️  {e}")
+        return False
 
     # Write the updated file
     with open(html_file, 'w') as f:
@@ -183,26 +207,26 @@ def restore_blog_post(md_file, blog_dir):
 
     return True
 
-# Main execution
-blog_dir = 'blog'
-posts_dir = 'blog/_posts'
+def main():
+    parser = argparse.ArgumentParser(description="Restore original content into all blog posts")
+    add_pipeline_arguments(parser)
+    args = parser.parse_args()
 
-# Get all markdown files
-md_files = glob.glob(f"{posts_dir}/*.md")
+    posts_dir = 'blog/_posts'
 
-print(f"Found {len(md_files)} original blog posts to restore")
-print("=" * 50)
+    # Get all markdown files
+    md_files = glob.glob(f"{posts_dir}/*.md")
 
-restored = 0
-for md_file in sorted(md_files):
-    filename = os.path.basename(md_file)
-    print(f"\nProcessing: {filename}")
-    if restore_blog_post(md_file, blog_dir):
-        restored += 1
-        print(f"  ✅ Restored full content")
-    else:
-        print(f"  ⏭️  Skipped")
+    print(f"Found {len(md_files)} original blog posts to restore")
+    print("=" * 50)
+
+    results = run(render_restored_post, sorted(md_files), jobs=args.jobs, timings=args.timings,
+                  profile=args.profile)
+    restored = sum(1 for r in results if r['status'] in ('written', 'unchanged'))
+
+    print("\n" + "=" * 50)
+    print(f"✅ Successfully restored {restored} blog posts with original content")
+    print("✅ All formatting, colors, and cross-links preserved")
 
-print("\n" + "=" * 50)
-print(f"✅ Successfully restored {restored} blog posts with original content")
-print("✅ All formatting, colors, and cross-links preserved")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+// Blog search widget
+// Queries the sharded index written by search_index.py: the manifest first,
+// then only the term shards for the words typed and the document shards of
+// the results shown.
+(function() {
+    'use strict';
+
+    var BASE = '/search/';
+    var manifest = null;
+    var stopwords = {};
+    var requests = {};
+    var latest = 0;
+
+    function load(path) {
+        var url = BASE + path + '?v=' + manifest.build;
+        if (!requests[url]) {
+            requests[url] = fetch(url).then(function(response) {
+                if (!response.ok) {
+                    throw new Error(url + ': ' + response.status);
+                }
+                return response.json();
+            });
+        }
+        return requests[url];
+    }
+
+    function loadManifest() {
+        if (manifest) {
+            return Promise.resolve(manifest);
+        }
+        return fetch(BASE + 'manifest.json', { cache: 'no-cache' }).then(function(response) {
+            if (!response.ok) {
+                throw new Error('search index unavailable');
+            }
+            return response.json();
+        }).then(function(data) {
+            manifest = data;
+            data.stopwords.forEach(function(word) { stopwords[word] = true; });
+            return data;
+        });
+    }
+
+    // Same split as search_index.terms()
+    function terms(text) {
+        return (text.toLowerCase().match(/[a-z0-9]+/g) || []).filter(function(term) {
+            return term.length >= 2 && !stopwords[term];
+        });
+    }
+
+    // Index of the last entry of sorted that is <= value
+    function floorIndex(sorted, value) {
+        var low = 0, high = sorted.length - 1, found = 0;
+        while (low <= high) {
+            var middle = (low + high) >> 1;
+            if (sorted[middle] <= value) {
+                found = middle;
+                low = middle + 1;
+            } else {
+                high = middle - 1;
+            }
+        }
+        return found;
+    }
+
+    // Term shards to open: one per word, plus the neighbours holding the
+    // completions of a word still being typed, within the shard limit
+    function plan(words, prefix) {
+        var shards = manifest.shards;
+        var picked = [];
+        words.forEach(function(word, position) {
+            var index = floorIndex(shards, word);
+            if (picked.indexOf(index) === -1 && picked.length < manifest.limits.shards) {
+                picked.push(index);
+            }
+            if (prefix && position === words.length - 1) {
+                for (var next = index + 1; next < shards.length && shards[next].indexOf(word) === 0 &&
+                        picked.length < manifest.limits.shards; next++) {
+                    picked.push(next);
+                }
+            }
+        });
+        return picked.map(function(index) { return 'terms/' + shards[index] + '.json'; });
+    }
+
+    // doc id -> score for one word (best matching term when completing a prefix)
+    function scoreWord(word, isPrefix, shards) {
+        var scores = {};
+        shards.forEach(function(shard) {
+            Object.keys(shard).forEach(function(term) {
+                var exact = term === word;
+                if (!exact && !(isPrefix && term.indexOf(word) === 0)) {
+                    return;
+                }
+                var postings = shard[term];
+                var idf = Math.log(1 + manifest.documents / postings[0]) * (exact ? 1 : 0.7);
+                var id = 0;
+                for (var i = 1; i < postings.length; i += 2) {
+                    id += postings[i];
+                    var score = postings[i + 1] * idf;
+                    if (!(scores[id] >= score)) {
+                        scores[id] = score;
+                    }
+                }
+            });
+        });
+        return scores;
+    }
+
+    function rank(words, prefix, shards) {
+        var totals = {};
+        words.forEach(function(word, position) {
+            var scores = scoreWord(word, prefix && position === words.length - 1, shards);
+            Object.keys(scores).forEach(function(id) {
+                var total = totals[id] || (totals[id] = { id: +id, matched: 0, score: 0 });
+                total.matched += 1;
+                total.score += scores[id];
+            });
+        });
+        // Posts matching every word first, then by score; newer posts win ties
+        return Object.keys(totals).map(function(id) { return totals[id]; }).sort(function(a, b) {
+            return b.matched - a.matched || b.score - a.score || b.id - a.id;
+        }).slice(0, manifest.limits.results);
+    }
+
+    function fetchDocuments(hits) {
+        return Promise.all(hits.map(function(hit) {
+            var start = manifest.docs[floorIndex(manifest.docs, hit.id)];
+            return load('docs/' + start + '.json').then(function(shard) { return shard[hit.id - start]; });
+        }));
+    }
+
+    function showResults(container, documents, query) {
+        var list = container.querySelector('#search-list');
+        var template = document.getElementById('search-result-template');
+        list.textContent = '';
+        documents.forEach(function(doc) {
+            var card = template.content.cloneNode(true);
+            var url = '/blog/' + doc[0] + '/';
+            card.querySelectorAll('a').forEach(function(link) { link.href = url; });
+            card.querySelector('[data-field="title"]').textContent = doc[1];
+            card.querySelector('[data-field="category"]').textContent = doc[2];
+            card.querySelector('[data-field="date"]').textContent = doc[3];
+            list.appendChild(card);
+        });
+        container.querySelector('#search-status').textContent = documents.length
+            ? 'Top results for "' + query + '"'
+            : 'No articles match "' + query + '"';
+    }
+
+    function search(query, listing, container) {
+        var ticket = ++latest;
+        var text = query.trim();
+        if (!text) {
+            container.classList.add('hidden');
+            listing.classList.remove('hidden');
+            return;
+        }
+        loadManifest().then(function() {
+            var words = terms(text);
+            // The last word is still being typed unless followed by a space
+            var prefix = !/\s$/.test(query);
+            if (!words.length) {
+                return [];
+            }
+            return Promise.all(plan(words, prefix).map(load)).then(function(shards) {
+                return fetchDocuments(rank(words, prefix, shards));
+            });
+        }).then(function(documents) {
+            if (ticket !== latest) {
+                return;
+            }
+            showResults(container, documents, text);
+            listing.classList.add('hidden');
+            container.classList.remove('hidden');
+        }).catch(function(error) {
+            if (ticket === latest) {
+                container.querySelector('#search-status').textContent = 'Search is unavailable right now.';
+                container.classList.remove('hidden');
+            }
+            console.error(error);
+        });
+    }
+
+    document.addEventListener('DOMContentLoaded', function() {
+        var input = document.getElementById('blog-search-input');
+        var listing = document.getElementById('blog-listing');
+        var container = document.getElementById('search-results');
+        if (!input || !listing || !container) {
+            return;
+        }
+        var timer = null;
+        input.addEventListener('input', function() {
+            clearTimeout(timer);
+            timer = setTimeout(function() { search(input.value, listing, container); }, 150);
+        });
+        document.getElementById('blog-search').addEventListener('submit', function(event) {
+            event.preventDefault();
+            search(input.value, listing, container);
+        });
+    });
+})();
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Client-side full-text search for the StableCoin Hub blog.
+
+At publish time every listed post (title, description, tags and categories
+from the blog metadata index, plus its body text) is turned into an
+inverted index, which is written as many small static files instead of one
+big one:
+
+    search/manifest.json        first term of each shard, document shard starts, stopwords
+    search/terms/<term>.json    {term: [df, id delta, tf, id delta, tf, ...]} from <term> on
+    search/docs/<n>.json        [[slug, title, category, date], ...] from id n
+
+The sorted vocabulary is cut into runs of at most SHARD_BYTES, so all the
+terms sharing a prefix sit in one shard or a few neighbouring ones, found
+by binary search over the shard names in the manifest. Each term keeps only
+its MAX_POSTINGS strongest posts and documents are cut into shards of at
+most DOC_SHARD_BYTES, so no file grows with the corpus. Postings carry the
+term's document frequency rather than a final score (search.js applies the
+idf), so publishing a post rewrites only the shards of the terms it uses.
+
+search.js (the widget on the blog listing pages) loads the manifest, then
+only the term shards for the words typed and the document shards of the
+results it shows. A query reads at most MAX_QUERY_SHARDS term shards and
+MAX_RESULTS document shards; the build checks that the worst case of that
+stays under QUERY_BUDGET_BYTES and fails if it does not.
+
+Usage:
+    python search_index.py              # rebuild the index if posts changed
+    python search_index.py --force      # rebuild regardless
+    python search_index.py --dry-run    # report what would be written
+"""
+
+import argparse
+import glob
+import heapq
+import json
+import math
+import os
+import re
+import sys
+import zlib
+from collections import Counter, defaultdict
+
+from blog_listing import display_date, listing_posts
+from blog_metadata import load_blog_index
+from related_posts import STOPWORDS, post_text
+from site_build import hash_bytes, hash_file, write_if_changed
+
+SEARCH_DIR = 'search'
+SEARCH_INDEX_VERSION = 1
+
+# Per-query download budget (uncompressed bytes) and what a query may load
+QUERY_BUDGET_BYTES = 128 * 1024
+MAX_QUERY_SHARDS = 6
+MAX_RESULTS = 8
+MANIFEST_BYTES = 16 * 1024
+SHARD_BYTES = 14 * 1024
+DOC_SHARD_BYTES = 4 * 1024
+# One term in this many starts a new shard once a shard is a quarter full
+SHARD_CUT_ODDS = 24
+
+# Strongest posts kept per term
+MAX_POSTINGS = 64
+MIN_TERM_LENGTH = 2
+
+# Field weights: one occurrence in a field counts as this many body words
+FIELD_WEIGHTS = (('title', 4), ('labels', 3), ('description', 2), ('body', 1))
+
+TERM_RE = re.compile(r'[a-z0-9]+')
+
+
+class SearchBudgetError(ValueError):
+    """The built index would make a query download more than the budget allows"""
+
+
+def terms(text):
+    """Search terms of a text: lowercase letter/digit runs of two or more characters, stopwords removed.
+
+    search.js splits queries the same way.
+    """
+    return [term for term in TERM_RE.findall(text.lower()) if len(term) >= MIN_TERM_LENGTH and term not in STOPWORDS]
+
+
+def document_terms(entry, body):
+    """Weighted term frequencies of one post"""
+    fields = {
+        'title': entry.get('title') or '',
+        'labels': ' '.join([entry.get('category') or ''] + list(entry.get('categories') or [])
+                           + list(entry.get('tags') or [])),
+        'description': entry.get('description') or '',
+        'body': body,
+    }
+    counts = Counter()
+    for field, weight in FIELD_WEIGHTS:
+        for term in terms(fields[field]):
+            counts[term] += weight
+    return counts
+
+
+def postings(counts_by_doc):
+    """term -> (document frequency, [(doc id, tf)] sorted by id).
+
+    tf is the log-scaled weighted frequency as a small integer so the shards
+    stay compact; only the MAX_POSTINGS highest are kept.
+    """
+    by_term = defaultdict(list)
+    for doc_id, counts in enumerate(counts_by_doc):
+        for term, count in counts.items():
+            by_term[term].append((doc_id, round((1 + math.log(count)) * 10)))
+
+    return {term: (len(docs), sorted(heapq.nlargest(MAX_POSTINGS, docs, key=lambda doc: (doc[1], -doc[0]))))
+            for term, docs in by_term.items()}
+
+
+def encode_postings(df, docs):
+    """Flatten into [df, id delta, tf, id delta, tf, ...]"""
+    flat = [df]
+    previous = 0
+    for doc_id, tf in docs:
+        flat += [doc_id - previous, tf]
+        previous = doc_id
+    return flat
+
+
+def dump(data):
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, sort_keys=True) + '\n'
+
+
+def shard_terms(encoded):
+    """Cut the sorted vocabulary into runs of at most SHARD_BYTES. Returns {first term: {term: postings}}.
+
+    Past SHARD_BYTES / 4 a shard also ends before any term whose checksum
+    picks it as a cut point, so boundaries depend on the terms around them
+    and a new term does not shift every later shard.
+    """
+    shards = {}
+    current, size = {}, 0
+    for term in sorted(encoded):
+        length = len(dump({term: encoded[term]}).encode('utf-8'))
+        cut_point = size >= SHARD_BYTES // 4 and zlib.crc32(term.encode('utf-8')) % SHARD_CUT_ODDS == 0
+        if current and (size + length > SHARD_BYTES or cut_point):
+            shards[next(iter(current))] = current
+            current, size = {}, 0
+        current[term] = encoded[term]
+        size += length
+    if current:
+        shards[next(iter(current))] = current
+    return shards
+
+
+def shard_documents(documents):
+    """Cut the document list into runs of at most DOC_SHARD_BYTES. Returns [(start id, docs)]."""
+    shards = []
+    current, size = [], 0
+    for doc_id, document in enumerate(documents):
+        length = len(dump(document).encode('utf-8'))
+        if current and size + length > DOC_SHARD_BYTES:
+            shards.append((doc_id - len(current), current))
+            current, size = [], 0
+        current.append(document)
+        size += length
+    if current:
+        shards.append((len(documents) - len(current), current))
+    return shards
+
+
+def build_files(posts, blog_dir):
+    """Relative path -> content of every file of the search index.
+
+    posts are oldest first: a post's id is its position, so publishing a
+    new post appends to the last document shard.
+    """
+    documents = [[post['slug'], post['title'], post.get('category') or '', display_date(post.get('date'))]
+                 for post in posts]
+    encoded = {term: encode_postings(df, docs)
+               for term, (df, docs) in postings([document_terms(post, post_text(post, blog_dir)) for post in posts]).items()}
+
+    files = {}
+    term_shards = shard_terms(encoded)
+    for first, members in term_shards.items():
+        files[f'terms/{first}.json'] = dump(members)
+    doc_shards = shard_documents(documents)
+    for start, docs in doc_shards:
+        files[f'docs/{start}.json'] = dump(docs)
+
+    manifest = {
+        'version': SEARCH_INDEX_VERSION,
+        'build': hash_bytes(''.join(files[path] for path in sorted(files)))[:12],
+        'documents': len(documents),
+        'terms': len(encoded),
+        'shards': sorted(term_shards),
+        'docs': [start for start, _ in doc_shards],
+        'stopwords': sorted(STOPWORDS),
+        'limits': {'shards': MAX_QUERY_SHARDS, 'results': MAX_RESULTS},
+    }
+    files['manifest.json'] = dump(manifest)
+    return files
+
+
+def query_cost(files):
+    """Worst-case bytes one query downloads: the manifest, the largest term
+    shards it may open and the largest document shards its results may hit"""
+    def sizes(directory):
+        return sorted((len(content.encode('utf-8')) for path, content in files.items()
+                       if path.startswith(directory)), reverse=True)
+    return (len(files['manifest.json'].encode('utf-8'))
+            + sum(sizes('terms/')[:MAX_QUERY_SHARDS]) + sum(sizes('docs/')[:MAX_RESULTS]))
+
+
+def source_hash(posts):
+    """Changes whenever a listed post, the listing order or this builder changes"""
+    return hash_bytes(json.dumps([[post['slug'], post.get('signature')] for post in posts]
+                                 + [SEARCH_INDEX_VERSION, hash_file(__file__)]))
+
+
+def current_source(search_dir):
+    try:
+        with open(os.path.join(search_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+            return json.load(f).get('source')
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def build_search_index(force=False, dry_run=False, search_dir=SEARCH_DIR, index=None):
+    """Rewrite the search index when the listed posts changed. Returns a stats dict."""
+    if index is None:
+        index = load_blog_index()
+    posts = listing_posts(index)[::-1]
+    source = source_hash(posts)
+    stats = {'documents': len(posts), 'terms': 0, 'files': 0, 'written': 0, 'removed': 0,
+             'query_bytes': 0, 'skipped': False}
+    if not force and current_source(search_dir) == source:
+        stats['skipped'] = True
+        return stats
+
+    files = build_files(posts, index.blog_dir)
+    manifest = json.loads(files['manifest.json'])
+    manifest['source'] = source
+    files['manifest.json'] = dump(manifest)
+    stats.update(terms=manifest['terms'], files=len(files), query_bytes=query_cost(files))
+
+    manifest_bytes = len(files['manifest.json'].encode('utf-8'))
+    if manifest_bytes > MANIFEST_BYTES or stats['query_bytes'] > QUERY_BUDGET_BYTES:
+        raise SearchBudgetError(f"search index over budget: manifest {manifest_bytes} bytes, "
+                                f"worst-case query {stats['query_bytes']} bytes (limit {QUERY_BUDGET_BYTES})")
+
+    existing = {os.path.relpath(path, search_dir).replace(os.sep, '/')
+                for path in glob.glob(os.path.join(search_dir, '*', '*.json'))}
+    for path in sorted(existing - set(files)):
+        stats['removed'] += 1
+        if dry_run:
+            print(f"🗑️  Would remove: {search_dir}/{path}")
+        else:
+            os.unlink(os.path.join(search_dir, path))
+
+    # The manifest goes last so a reader never sees it point at missing shards
+    for path in sorted(files, key=lambda path: path == 'manifest.json'):
+        target = os.path.join(search_dir, path)
+        if dry_run:
+            try:
+                with open(target, 'r', encoding='utf-8') as f:
+                    changed = f.read() != files[path]
+            except FileNotFoundError:
+                changed = True
+            if changed:
+                stats['written'] += 1
+                print(f"📝 Would write: {search_dir}/{path}")
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if write_if_changed(target, files[path]):
+            stats['written'] += 1
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the sharded client-side blog search index")
+    parser.add_argument('--force', action='store_true', help="rebuild even if no post changed")
+    parser.add_argument('--dry-run', action='store_true', help="only report what would be written")
+    parser.add_argument('--output', default=SEARCH_DIR, help="index directory (default: search)")
+    args = parser.parse_args()
+
+    print("🔎 Building search index...")
+    print("=" * 60)
+    try:
+        stats = build_search_index(force=args.force, dry_run=args.dry_run, search_dir=args.output)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if stats['skipped']:
+        print(f"✓ {args.output}/ is up to date ({stats['documents']} posts)")
+        return 0
+    print("=" * 60)
+    print(f"📊 Summary:")
+    print(f"   Posts indexed: {stats['documents']}")
+    print(f"   Terms: {stats['terms']}")
+    print(f"   Files: {stats['files']} ({stats['written']} {'to write' if args.dry_run else 'written'})")
+    if stats['removed']:
+        print(f"   Removed: {stats['removed']}")
+    print(f"   Worst-case query download: {stats['query_bytes'] / 1024:.1f} KB "
+          f"(budget {QUERY_BUDGET_BYTES // 1024} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Shared parsed-document model for the SEO fixer scripts.
+
+Each page is read once into an HtmlDocument, which exposes the head elements
+the fixers care about (canonical link, og:url, twitter:url, scripts) as
+structured fields and offers small editing helpers. The fixers
+(add_canonical_tags, fix_canonical_urls, update_canonical_to_www,
+add_url_normalization, remove_redirect_scripts and
+fix_all_redirects_and_canonical) each provide a pass function taking an
+HtmlDocument; this module runs any sequence of passes over the tree in a
+single traversal and writes each page at most once, only if it changed.
+
+Usage:
+    python seo_document.py                          # default passes
+    python seo_document.py www-canonical remove-redirect-scripts --dry-run
+    python seo_document.py --list
+"""
+
+import argparse
+import importlib
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+from site_build import write_if_changed
+
+# Pass name -> "module:function" taking an HtmlDocument and returning True if it changed it
+PASSES = {
+    'add-canonical': 'add_canonical_tags:add_canonical_pass',
+    'apex-canonical': 'fix_canonical_urls:apex_canonical_pass',
+    'www-redirect-script': 'fix_canonical_urls:www_redirect_script_pass',
+    'www-canonical': 'update_canonical_to_www:www_canonical_pass',
+    'url-normalization': 'add_url_normalization:url_normalization_pass',
+    'remove-redirect-scripts': 'remove_redirect_scripts:remove_redirect_script_pass',
+    'canonical-and-social': 'fix_all_redirects_and_canonical:canonical_and_social_pass',
+}
+
+# Top-level directories holding HTML that is not a page (page_templates sources)
+SKIP_DIRS = {'templates'}
+
+# The site standardised on https://www. (the canonical origin in
+# data/redirects.json); the legacy fix_canonical_urls passes follow it too but
+# are not part of the default run.
+DEFAULT_PASSES = [
+    'add-canonical',
+    'www-canonical',
+    'remove-redirect-scripts',
+    'url-normalization',
+    'canonical-and-social',
+]
+
+HEAD_ELEMENT_RE = re.compile(
+    r'<title\b[^>]*>.*?</title>|<script\b[^>]*>.*?</script>|<link\b[^>]*>|<meta\b[^>]*>',
+    re.IGNORECASE | re.DOTALL,
+)
+# Quoted or (as html_minify writes simple values) bare
+ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+))')
+HEAD_CLOSE_RE = re.compile(r'</head>', re.IGNORECASE)
+
+
+class HeadElement:
+    """One <title>, <script>, <link> or <meta> element in the page head"""
+
+    def __init__(self, match):
+        self.html = match.group(0)
+        self.start = match.start()
+        self.end = match.end()
+        self.tag = re.match(r'<(\w+)', self.html).group(1).lower()
+        open_tag = self.html[:self.html.index('>') + 1]
+        self.attrs = {name.lower(): a or b or c for name, a, b, c in ATTR_RE.findall(open_tag)}
+        self.text = self.html[len(open_tag):self.html.rfind('<')] if self.tag in ('script', 'title') else ''
+
+    def __repr__(self):
+        return f"<HeadElement {self.tag} {self.attrs}>"
+
+
+class HtmlDocument:
+    """An HTML page loaded once, with structured access to its head"""
+
+    def __init__(self, path, root='.'):
+        self.path = str(path)
+        self.rel_path = os.path.relpath(self.path, root).replace(os.sep, '/')
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.original = f.read()
+        self._content = self.original
+        self._head = None
+
+    @property
+    def content(self):
+        return self._content
+
+    @content.setter
+    def content(self, value):
+        if value != self._content:
+            self._content = value
+            self._head = None
+
+    @property
+    def changed(self):
+        return self._content != self.original
+
+    @property
+    def head_elements(self):
+        """Head elements in document order (re-scanned lazily after edits)"""
+        if self._head is None:
+            close = HEAD_CLOSE_RE.search(self._content)
+            end = close.start() if close else len(self._content)
+            self._head = [HeadElement(m) for m in HEAD_ELEMENT_RE.finditer(self._content, 0, end)]
+        return self._head
+
+    def links(self, rel):
+        return [e for e in self.head_elements if e.tag == 'link' and e.attrs.get('rel', '').lower() == rel]
+
+    def metas(self, key):
+        """<meta> elements whose name or property is key (pages use both for twitter:*)"""
+        return [e for e in self.head_elements
+                if e.tag == 'meta' and key in (e.attrs.get('name'), e.attrs.get('property'))]
+
+    @property
+    def canonical(self):
+        """href of the first canonical link, or None"""
+        links = self.links('canonical')
+        return links[0].attrs.get('href') if links else None
+
+    @property
+    def og_url(self):
+        metas = self.metas('og:url')
+        return metas[0].attrs.get('content') if metas else None
+
+    @property
+    def twitter_url(self):
+        metas = self.metas('twitter:url')
+        return metas[0].attrs.get('content') if metas else None
+
+    @property
+    def scripts(self):
+        return [e for e in self.head_elements if e.tag == 'script']
+
+    def replace_elements(self, elements, html):
+        """Replace each element with html (elements from the current head scan)"""
+        content = self._content
+        for element in sorted(elements, key=lambda e: e.start, reverse=True):
+            content = content[:element.start] + html + content[element.end:]
+        self.content = content
+
+    def insert_before_head_close(self, html):
+        """Insert html right before </head>; False if the page has no </head>"""
+        close = HEAD_CLOSE_RE.search(self._content)
+        if not close:
+            return False
+        self.content = self._content[:close.start()] + html + self._content[close.start():]
+        return True
+
+    def insert_after(self, pattern, html):
+        """Insert html after the first match of pattern; False if there is none"""
+        match = re.search(pattern, self._content)
+        if not match:
+            return False
+        self.content = self._content[:match.end()] + html + self._content[match.end():]
+        return True
+
+    def set_canonical(self, url):
+        """Point every canonical link at url, adding one after <title> (or the
+        charset meta, or before </head>) if the page has none. Links already
+        pointing at url are left as written (minified pages drop the quotes).
+        Returns True if changed."""
+        before = self._content
+        tag = f'<link rel="canonical" href="{url}">'
+        existing = self.links('canonical')
+        if existing:
+            self.replace_elements([e for e in existing if e.attrs.get('href') != url], tag)
+        elif not (self.insert_after(r'</title>', f'\n    {tag}')
+                  or self.insert_after(r'<meta charset[^>]*>', f'\n    {tag}')):
+            self.insert_before_head_close(f'    {tag}\n')
+        return self._content != before
+
+    def set_meta_url(self, key, url):
+        """Set the content of existing meta elements named key (e.g. og:url),
+        leaving those whose content already is url alone. Returns True if changed."""
+        before = self._content
+        for element in reversed(self.metas(key)):
+            if element.attrs.get('content') == url:
+                continue
+            attr = 'property' if element.attrs.get('property') == key else 'name'
+            self.replace_elements([element], f'<meta {attr}="{key}" content="{url}">')
+        return self._content != before
+
+    def sub(self, pattern, replacement, flags=0):
+        """re.sub over the whole document; returns the number of replacements"""
+        content, count = re.subn(pattern, replacement, self._content, flags=flags)
+        self.content = content
+        return count
+
+    def save(self):
+        """Write the page if any pass changed it; returns True if written"""
+        if not self.changed:
+            return False
+        written = write_if_changed(self.path, self._content)
+        self.original = self._content
+        return written
+
+
+def find_html_files(root='.', skip=()):
+    """All .html files under root, skipping hidden directories, the page templates
+    and the directories in skip (paths relative to root)"""
+    skipped = {os.path.normpath(os.path.join(root, path)) for path in skip}
+    html_files = []
+    for current, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.')
+                         and not (current == root and d in SKIP_DIRS)
+                         and os.path.normpath(os.path.join(current, d)) not in skipped)
+        for name in sorted(files):
+            if name.endswith('.html'):
+                html_files.append(os.path.join(current, name))
+    return html_files
+
+
+def load_pages(root='.'):
+    """Yield an HtmlDocument for every page under root"""
+    for path in find_html_files(root):
+        yield HtmlDocument(path, root=root)
+
+
+def load_pass(name):
+    """Resolve a pass name from PASSES to its function"""
+    module_name, func_name = PASSES[name].split(':')
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def run_passes(pass_names, root='.', dry_run=False):
+    """Run the named passes over every page in one traversal.
+
+    Returns a stats dict: pages scanned, pages written, per-pass change counts
+    and read errors.
+    """
+    passes = [(name, load_pass(name)) for name in pass_names]
+    stats = {'pages': 0, 'written': 0, 'changed_by': Counter(), 'errors': {}}
+
+    for path in find_html_files(root):
+        try:
+            doc = HtmlDocument(path, root=root)
+        except (OSError, UnicodeDecodeError) as e:
+            stats['errors'][path] = str(e)
+            continue
+        stats['pages'] += 1
+
+        changed_by = [name for name, fix in passes if fix(doc)]
+        stats['changed_by'].update(changed_by)
+        if not doc.changed:
+            continue
+        if dry_run:
+            print(f"📝 Would update {doc.rel_path} ({', '.join(changed_by)})")
+        elif doc.save():
+            stats['written'] += 1
+            print(f"✅ Updated {doc.rel_path} ({', '.join(changed_by)})")
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run SEO fixer passes over every HTML page in one traversal")
+    parser.add_argument('passes', nargs='*', metavar='PASS',
+                        help=f"passes to run in order (default: {' '.join(DEFAULT_PASSES)})")
+    parser.add_argument('--root', default='.', help="site root (default: current directory)")
+    parser.add_argument('--dry-run', action='store_true', help="report changes without writing")
+    parser.add_argument('--list', action='store_true', help="list available passes and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, target in PASSES.items():
+            marker = '*' if name in DEFAULT_PASSES else ' '
+            print(f" {marker} {name:<26}{target}")
+        return 0
+
+    unknown = [name for name in args.passes if name not in PASSES]
+    if unknown:
+        parser.error(f"unknown pass(es): {', '.join(unknown)} (see --list)")
+
+    pass_names = args.passes or DEFAULT_PASSES
+    print(f"🔧 Running {len(pass_names)} SEO passes: {', '.join(pass_names)}")
+    print("=" * 60)
+    started = time.perf_counter()
+    stats = run_passes(pass_names, root=args.root, dry_run=args.dry_run)
+    elapsed = time.perf_counter() - started
+
+    print("=" * 60)
+    print(f"📊 Summary:")
+    print(f"   Pages scanned: {stats['pages']}")
+    print(f"   Pages written: {stats['written']}")
+    for name in pass_names:
+        print(f"   {name}: {stats['changed_by'][name]} pages changed")
+    for path, error in sorted(stats['errors'].items()):
+        print(f"⚠️  Error reading {path}: {error}")
+    print(f"   Finished in {elapsed:.2f}s")
+    return 1 if stats['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Incremental site build engine for StableCoin Hub.
+
+Keeps a manifest mapping each rendered page to the hashes of its inputs
+(the markdown post, its related posts, the shared layouts, the blog schedule
+and the renderer itself) and the hash of the output it produced. On each run
+only pages whose inputs changed are re-rendered, and a page is only written
+when its bytes actually differ, so the daily publish job touches a handful of
+files instead of the whole tree.
+
+A page that already exists but has no manifest entry (a first build, or a
+hand-maintained post) is adopted: its current hashes are recorded and it is
+left as it is. It is rendered again once its markdown or a shared input
+changes, or with --force.
+
+Run with --profile to record where the build spends its time (see
+build_profiler.py).
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+from build_profiler import add_profile_argument, profiled, stage
+
+MANIFEST_FILE = '.cache/build-manifest.json'
+MANIFEST_VERSION = 1
+
+POSTS_DIR = 'blog/_posts'
+LAYOUTS_DIR = 'blog/_layouts'
+SCHEDULE_FILE = '../blog-schedule.md'
+
+# The blog template and markdown conversion live in code, so the renderer
+# source is an input of every page just like the layouts are.
+RENDERER_SOURCES = ['beautify_blogs.py', 'markdown_renderer.py', 'render_pipeline.py', 'site_build.py']
+
+
+def hash_bytes(data):
+    """Return the hex sha256 of bytes or text"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    """Return the hex sha256 of a file, or None if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def atomic_write(path, data):
+    """Write bytes to path via a temp file and rename, so readers never see a partial page"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates 0600 files; keep pages world-readable for the web server
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_if_changed(path, content):
+    """Atomically write text content to path only if it differs from what is on disk.
+
+    Returns True if the file was written.
+    """
+    data = content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+
+    atomic_write(path, data)
+    return True
+
+
+def slug_for_post(md_file):
+    """Blog slug for a post file (date prefix and extension removed)"""
+    filename = os.path.basename(md_file)
+    return re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename).replace('.md', '')
+
+
+class BuildManifest:
+    """Input/output hash manifest persisted between builds"""
+
+    def __init__(self, path=MANIFEST_FILE):
+        self.path = path
+        self.pages = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == MANIFEST_VERSION:
+            self.pages = data.get('pages', {})
+
+    def save(self):
+        data = {'version': MANIFEST_VERSION, 'pages': self.pages}
+        return write_if_changed(self.path, json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+    def is_fresh(self, output, input_hash):
+        """True if output was built from input_hash and is untouched on disk"""
+        entry = self.pages.get(output)
+        if not entry or entry.get('input_hash') != input_hash:
+            return False
+        return hash_file(output) == entry.get('output_hash')
+
+    def record(self, output, inputs, input_hash, output_hash, modified=False):
+        """Record a build of output; modified means its bytes on disk just changed"""
+        updated = self.pages.get(output, {}).get('updated')
+        if modified:
+            updated = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+        self.pages[output] = {
+            'inputs': inputs,
+            'input_hash': input_hash,
+            'output_hash': output_hash,
+            'updated': updated,
+        }
+
+    def refresh_outputs(self, outputs):
+        """Take the current bytes of built pages that a later stage rewrote as
+        their build output. Returns the number of pages refreshed."""
+        refreshed = 0
+        for output in outputs:
+            if output in self.pages:
+                self.pages[output]['output_hash'] = hash_file(output)
+                refreshed += 1
+        return refreshed
+
+    def refresh_inputs(self, updates):
+        """Set shared inputs that a later stage changed on the built pages
+        themselves (the stylesheet they link) and rehash every entry.
+        Returns the number of entries updated."""
+        refreshed = 0
+        for entry in self.pages.values():
+            inputs = dict(entry['inputs'], **updates)
+            input_hash = hash_bytes(json.dumps(inputs, sort_keys=True))
+            if input_hash != entry['input_hash']:
+                entry['inputs'] = inputs
+                entry['input_hash'] = input_hash
+                refreshed += 1
+        return refreshed
+
+    def last_modified(self, output):
+        """ISO timestamp of the last build that changed output, or None if unknown"""
+        return self.pages.get(output, {}).get('updated')
+
+    def forget(self, output):
+        self.pages.pop(output, None)
+
+
+def shared_inputs():
+    """Hashes of the inputs every blog page depends on"""
+    inputs = {}
+    for path in sorted(glob.glob(f"{LAYOUTS_DIR}/*.html")) + [SCHEDULE_FILE] + RENDERER_SOURCES:
+        digest = hash_file(path)
+        if digest is not None:
+            inputs[path] = digest
+
+    # Pages link the content-hashed Tailwind stylesheet by name
+    from tailwind_build import current_stylesheet
+    stylesheet = current_stylesheet()
+    if stylesheet is not None:
+        inputs['stylesheet'] = os.path.basename(stylesheet)
+    return inputs
+
+
+def plan_build(manifest, force=False, related=None):
+    """Work out which posts need rendering.
+
+    related is a related_posts.RelatedIndex; each page's related slugs are one
+    of its inputs, so a page is re-rendered when its related list changes.
+
+    Returns (stale, fresh, adopted) where stale is a list of
+    (md_file, html_file, inputs, input_hash), fresh is a list of html files
+    that are already up to date and adopted lists, in the same form as stale,
+    the existing pages the manifest has no entry for.
+    """
+    shared = shared_inputs()
+    stale = []
+    fresh = []
+    adopted = []
+
+    for md_file in sorted(glob.glob(f"{POSTS_DIR}/*.md")):
+        slug = slug_for_post(md_file)
+        html_file = f"blog/{slug}/index.html"
+        inputs = dict(shared)
+        inputs[md_file] = hash_file(md_file)
+        if related is not None:
+            inputs['related'] = related.related_slugs(slug)
+        input_hash = hash_bytes(json.dumps(inputs, sort_keys=True))
+
+        if not force and manifest.is_fresh(html_file, input_hash):
+            fresh.append(html_file)
+        elif not force and html_file not in manifest.pages and os.path.exists(html_file):
+            adopted.append((md_file, html_file, inputs, input_hash))
+        else:
+            stale.append((md_file, html_file, inputs, input_hash))
+
+    return stale, fresh, adopted
+
+
+def build(force=False, dry_run=False, manifest_path=MANIFEST_FILE, jobs=1):
+    """Render stale posts and update the manifest. Returns a stats dict."""
+    from beautify_blogs import render_blog_post
+    from blog_metadata import BlogIndex
+    from related_posts import load_related_index
+    from render_pipeline import render_posts
+
+    # Related lists are rendered into the pages, so they are worked out first
+    with stage('related'):
+        blog_index = BlogIndex()
+        blog_index.refresh()
+        if not dry_run:
+            blog_index.save()
+        related = load_related_index(blog_index=blog_index, save=not dry_run)
+
+    with stage('plan'):
+        manifest = BuildManifest(manifest_path)
+        stale, fresh, adopted = plan_build(manifest, force=force, related=related)
+    stats = {'rendered': 0, 'written': 0, 'unchanged': len(fresh), 'adopted': len(adopted), 'skipped': 0,
+             'failed': 0, 'orphaned': 0, 'indexed': 0, 'listings': 0, 'searched': False, 'directory': False, 'relinked': 0,
+             'critical': 0}
+
+    expected = {html_file for _, html_file, _, _ in stale + adopted} | set(fresh)
+    for output in sorted(set(manifest.pages) - expected):
+        print(f"🗑️  Source removed, dropping from manifest: {output}")
+        stats['orphaned'] += 1
+        if not dry_run:
+            manifest.forget(output)
+
+    if dry_run:
+        for _, html_file, _, _ in adopted:
+            print(f"📌 Would adopt: {html_file}")
+        for _, html_file, _, _ in stale:
+            print(f"📝 Would render: {html_file}")
+        stats['rendered'] = len(stale)
+        return stats
+
+    # Existing pages the manifest does not know yet are taken as built, not rendered over
+    for _, html_file, inputs, input_hash in adopted:
+        print(f"📌 Adopted: {html_file}")
+        manifest.record(html_file, inputs, input_hash, hash_file(html_file))
+
+    results = render_posts(render_blog_post, [md_file for md_file, _, _, _ in stale], jobs=jobs)
+    for (md_file, _, inputs, input_hash), result in zip(stale, results):
+        if result['status'] == 'skipped':
+            print(f"⏭️  Skipped {md_file}: {result['message']}")
+            stats['skipped'] += 1
+            continue
+        if result['status'] == 'failed':
+            print(f"❌ Failed to render {md_file}: {result['message']}")
+            stats['failed'] += 1
+            continue
+
+        stats['rendered'] += 1
+        if result['status'] == 'written':
+            stats['written'] += 1
+            print(f"✅ Wrote: {result['html_file']} ({result['seconds'] * 1000:.1f} ms)")
+        manifest.record(result['html_file'], inputs, input_hash, result['output_hash'],
+                        modified=result['status'] == 'written')
+
+    manifest.save()
+
+    # Bring the blog metadata index up to date (only changed posts are re-parsed)
+    with stage('metadata'):
+        stats['indexed'] = blog_index.refresh()['parsed']
+        blog_index.save()
+
+    # Rebuild the client-side search index when a listed post changed
+    with stage('search'):
+        from search_index import SearchBudgetError, build_search_index
+        try:
+            stats['searched'] = not build_search_index(index=blog_index)['skipped']
+        except SearchBudgetError as e:
+            print(f"❌ Search index not rebuilt: {e}")
+            stats['failed'] += 1
+
+    # Rewrite only the blog listing pages the new or changed posts land on
+    with stage('listings'):
+        from blog_listing import build_listings
+        stats['listings'] = build_listings(index=blog_index)['written']
+
+    # Re-render the homepage tools directory from data/tools.json
+    with stage('directory'):
+        from tools_directory import build_directory
+        stats['directory'] = build_directory()['written']
+
+    # Regenerate the purged stylesheet; if its hash changed every page is relinked
+    with stage('css'):
+        from tailwind_build import build_css
+        css = build_css()
+        stats['relinked'] = css['relinked']
+
+    # Inline the above-the-fold CSS of each page template and defer the stylesheets
+    with stage('critical'):
+        from critical_css import build_critical
+        critical = build_critical()
+        stats['critical'] = critical['written']
+
+    # Posts and listing pages now differ from what was rendered: record their
+    # current bytes, and the stylesheet they now link as an input, so the next
+    # build still finds them fresh
+    from blog_listing import LISTING_MANIFEST_FILE
+    from tailwind_build import stylesheet_tag
+    rewritten = set(css['updated']) | set(critical['updated'])
+    for built, updates in ((manifest, shared_inputs()),
+                           (BuildManifest(LISTING_MANIFEST_FILE), {'stylesheet': stylesheet_tag()})):
+        if built.refresh_outputs(rewritten) + built.refresh_inputs(updates):
+            built.save()
+    return stats
+
+
+def report_build(args):
+    """Run the build for the parsed command line and print its summary"""
+    print("🔨 Building blog pages...")
+    print("=" * 60)
+    stats = build(force=args.force, dry_run=args.dry_run, manifest_path=args.manifest, jobs=args.jobs)
+    print("=" * 60)
+    print(f"📊 Summary:")
+    print(f"   Rendered: {stats['rendered']}")
+    print(f"   Written: {stats['written']}")
+    print(f"   Up to date: {stats['unchanged']}")
+    if stats['adopted']:
+        print(f"   Adopted as they are: {stats['adopted']}")
+    if stats['indexed']:
+        print(f"   Metadata re-indexed: {stats['indexed']}")
+    if stats['searched']:
+        print(f"   Search index rebuilt: search/")
+    if stats['listings']:
+        print(f"   Listing pages rewritten: {stats['listings']}")
+    if stats['directory']:
+        print(f"   Tools directory re-rendered: index.html")
+    if stats['relinked']:
+        print(f"   Pages relinked to new stylesheet: {stats['relinked']}")
+    if stats['critical']:
+        print(f"   Critical CSS inlined: {stats['critical']} pages")
+    if not args.dry_run and not stats['failed']:
+        from sitemap_writer import generate_sitemap
+        with stage('sitemap'):
+            sitemap = generate_sitemap('.', manifest_path=args.manifest)
+        print(f"   Sitemap: {'up to date' if sitemap['skipped'] else 'regenerated'} ({sitemap['urls']} URLs)")
+    if args.precompress and not args.dry_run and not stats['failed']:
+        from precompress import precompress
+        with stage('precompress'):
+            compressed = precompress()
+        print(f"   Precompressed: {compressed['compressed']} changed of {compressed['files']} files "
+              f"({(compressed['bytes'] - compressed['gz']) / 1024:,.0f} KB saved with gzip)")
+    if stats['orphaned']:
+        print(f"   Orphaned: {stats['orphaned']}")
+    if stats['skipped']:
+        print(f"   Skipped by the renderer: {stats['skipped']}")
+    if stats['failed']:
+        print(f"   Failed: {stats['failed']}")
+    return 1 if stats['failed'] else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally build blog pages from blog/_posts")
+    parser.add_argument('--force', action='store_true', help="re-render every post regardless of the manifest")
+    parser.add_argument('--dry-run', action='store_true', help="only report what would be rendered")
+    parser.add_argument('--manifest', default=MANIFEST_FILE, help="path of the build manifest")
+    parser.add_argument('--jobs', '-j', type=int, default=1, help="worker processes (0 = one per CPU)")
+    parser.add_argument('--precompress', action='store_true',
+                        help="then write .br/.gz siblings of changed files for the web server (see precompress.py)")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiled(args.profile, 'site_build'):
+        return report_build(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
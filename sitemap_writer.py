@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Streaming sitemap generator for StableCoin Hub.
+
+Entries are written to disk one at a time as <url> elements, never built up
+as one big string. lastmod comes from the build manifests (when site_build
+or blog_listing last changed the page), falling back to the page's last git
+commit and then its file mtime. Once a shard approaches the protocol limits (50,000 URLs or
+50 MB uncompressed) a new shard is started and sitemap.xml becomes a sitemap
+index; --gzip writes compressed shards behind an index as well.
+
+The top-level sitemap.xml carries a fingerprint of its entries, so an
+unchanged page set (same URLs and lastmod values) is not rewritten.
+
+Usage:
+    python sitemap_writer.py [--gzip] [--force] [--max-urls N]
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import os
+import re
+import subprocess
+import sys
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from blog_listing import LISTING_MANIFEST_FILE
+from blog_metadata import BLOG_DIR, BLOG_INDEX_FILE, BlogIndex
+from site_build import MANIFEST_FILE, POSTS_DIR, BuildManifest, atomic_write
+
+SITE_URL = 'https://www.stablecoinhub.pro'
+SITEMAP_FILE = 'sitemap.xml'
+SHARD_PATTERN = 'sitemap-{}.xml'
+
+# Protocol limits are 50,000 URLs and 50 MB per file; keep a little headroom
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024 - 64 * 1024
+
+# (site path, source file, changefreq, priority)
+STATIC_PAGES = [
+    ('/', 'index.html', 'daily', '1.0'),
+    ('/blog/', 'blog/index.html', 'daily', '0.9'),
+    ('/about/', 'about/index.html', 'weekly', '0.7'),
+    ('/submit/', 'submit/index.html', 'monthly', '0.6'),
+]
+POST_CHANGEFREQ = 'weekly'
+POST_PRIORITY = '0.8'
+CATEGORY_CHANGEFREQ = 'weekly'
+CATEGORY_PRIORITY = '0.7'
+
+URLSET_OPEN = '<?xml version="1.0" encoding="UTF-8"?>\n{comment}<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+URLSET_CLOSE = '</urlset>\n'
+FINGERPRINT_RE = re.compile(rb'<!-- fingerprint: ([0-9a-f]+) -->')
+
+
+def git_last_modified(root='.'):
+    """Map each tracked path to the ISO date of the last commit touching it (one git call)"""
+    try:
+        log = subprocess.run(
+            ['git', 'log', '--format=%x00%cI', '--name-only', '--relative', '--', '*.html'],
+            cwd=root, capture_output=True, text=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    dates = {}
+    current = None
+    for line in log.splitlines():
+        if line.startswith('\x00'):
+            current = line[1:]
+        elif line and current:
+            # Newest commits come first
+            dates.setdefault(line, current)
+    return dates
+
+
+def collect_pages(root='.', manifest_path=MANIFEST_FILE):
+    """Yield (url, lastmod, changefreq, priority) for every published page, sorted by path"""
+    manifest = BuildManifest(os.path.join(root, manifest_path))
+    listings = BuildManifest(os.path.join(root, LISTING_MANIFEST_FILE))
+    git_dates = None
+
+    pages = [page for page in STATIC_PAGES if os.path.exists(os.path.join(root, page[1]))]
+    blog_index = BlogIndex(os.path.join(root, BLOG_INDEX_FILE), blog_dir=os.path.join(root, BLOG_DIR),
+                           posts_dir=os.path.join(root, POSTS_DIR))
+    blog_index.refresh()
+    blog_index.save()
+    for slug in sorted(blog_index.entries):
+        source = f'blog/{slug}/index.html'
+        if os.path.exists(os.path.join(root, source)):
+            pages.append((f'/blog/{slug}/', source, POST_CHANGEFREQ, POST_PRIORITY))
+    # Category landing pages (their /page/N/ archives are reached by links)
+    for path in sorted(glob.glob(os.path.join(root, BLOG_DIR, 'category', '*', 'index.html'))):
+        source = os.path.relpath(path, root).replace(os.sep, '/')
+        pages.append((f'/{os.path.dirname(source)}/', source, CATEGORY_CHANGEFREQ, CATEGORY_PRIORITY))
+
+    for path, source, changefreq, priority in pages:
+        lastmod = manifest.last_modified(source) or listings.last_modified(source)
+        if lastmod is None:
+            if git_dates is None:
+                git_dates = git_last_modified(root)
+            lastmod = git_dates.get(source)
+        if lastmod is None:
+            mtime = os.path.getmtime(os.path.join(root, source))
+            lastmod = datetime.fromtimestamp(mtime, timezone.utc).replace(microsecond=0).isoformat()
+        yield SITE_URL + path, lastmod, changefreq, priority
+
+
+def url_entry(url, lastmod=None, changefreq=None, priority=None):
+    lines = ['    <url>', f'        <loc>{escape(url)}</loc>']
+    if lastmod:
+        lines.append(f'        <lastmod>{lastmod}</lastmod>')
+    if changefreq:
+        lines.append(f'        <changefreq>{changefreq}</changefreq>')
+    if priority:
+        lines.append(f'        <priority>{priority}</priority>')
+    lines.append('    </url>\n')
+    return '\n'.join(lines)
+
+
+def fingerprint(entries, *options):
+    """Hash of the entries and the output options they are written with"""
+    digest = hashlib.sha256(repr(options).encode('utf-8') + b'\n')
+    for entry in entries:
+        digest.update('\t'.join(entry).encode('utf-8') + b'\n')
+    return digest.hexdigest()
+
+
+def existing_fingerprint(path):
+    try:
+        with open(path, 'rb') as f:
+            match = FINGERPRINT_RE.search(f.read(512))
+    except FileNotFoundError:
+        return None
+    return match.group(1).decode('ascii') if match else None
+
+
+class SitemapWriter:
+    """Stream <url> entries into one or more shard files, rolling over before the limits"""
+
+    def __init__(self, directory='.', gzip_output=False, max_urls=MAX_URLS, max_bytes=MAX_BYTES, comment=''):
+        self.directory = directory
+        self.gzip_output = gzip_output
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.comment = comment
+        self.shards = []  # (temp path, final name, lastmod of newest entry)
+        self._file = None
+
+    def _open_shard(self):
+        name = SHARD_PATTERN.format(len(self.shards) + 1) + ('.gz' if self.gzip_output else '')
+        tmp_path = os.path.join(self.directory, f'.tmp-{name}')
+        raw = open(tmp_path, 'wb')
+        self._file = gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) if self.gzip_output else raw
+        self._raw = raw
+        self.shards.append([tmp_path, name, None])
+        header = URLSET_OPEN.format(comment=self.comment).encode('utf-8')
+        self._file.write(header)
+        self._count = 0
+        self._bytes = len(header) + len(URLSET_CLOSE)
+
+    def _close_shard(self):
+        self._file.write(URLSET_CLOSE.encode('utf-8'))
+        if self.gzip_output:
+            self._file.close()
+        self._raw.close()
+        os.chmod(self.shards[-1][0], 0o644)
+        self._file = None
+
+    def add(self, url, lastmod=None, changefreq=None, priority=None):
+        data = url_entry(url, lastmod, changefreq, priority).encode('utf-8')
+        if self._file is not None and (self._count + 1 > self.max_urls
+                                       or self._bytes + len(data) > self.max_bytes):
+            self._close_shard()
+        if self._file is None:
+            self._open_shard()
+        self._file.write(data)
+        self._count += 1
+        self._bytes += len(data)
+        shard = self.shards[-1]
+        if lastmod and (shard[2] is None or lastmod > shard[2]):
+            shard[2] = lastmod
+
+    def close(self):
+        """Finish the last shard. Returns the list of (temp path, final name, newest lastmod)."""
+        if self._file is not None:
+            self._close_shard()
+        return self.shards
+
+    def abort(self):
+        if self._file is not None:
+            self._file.close()
+            self._raw.close()
+        for tmp_path, _, _ in self.shards:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def sitemap_index(shards, comment=''):
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>']
+    if comment:
+        lines.append(comment.rstrip('\n'))
+    lines.append('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+    for _, name, lastmod in shards:
+        lines.append('    <sitemap>')
+        lines.append(f'        <loc>{SITE_URL}/{name}</loc>')
+        if lastmod:
+            lines.append(f'        <lastmod>{lastmod}</lastmod>')
+        lines.append('    </sitemap>')
+    lines.append('</sitemapindex>\n')
+    return '\n'.join(lines)
+
+
+def remove_stale_shards(directory, keep):
+    for name in os.listdir(directory):
+        if re.fullmatch(r'sitemap-\d+\.xml(\.gz)?', name) and name not in keep:
+            os.unlink(os.path.join(directory, name))
+
+
+def generate_sitemap(root='.', gzip_output=False, force=False, max_urls=MAX_URLS,
+                     max_bytes=MAX_BYTES, manifest_path=MANIFEST_FILE):
+    """Write sitemap.xml (and shards if needed) under root.
+
+    Returns a dict with the url count, the files written, or skipped=True
+    when the page set and lastmod values are unchanged.
+    """
+    entries = list(collect_pages(root, manifest_path))
+    digest = fingerprint(entries, gzip_output, max_urls, max_bytes)
+    sitemap_path = os.path.join(root, SITEMAP_FILE)
+    if not force and existing_fingerprint(sitemap_path) == digest:
+        return {'urls': len(entries), 'files': [], 'skipped': True}
+
+    comment = f'<!-- fingerprint: {digest} -->\n'
+    writer = SitemapWriter(root, gzip_output=gzip_output, max_urls=max_urls, max_bytes=max_bytes,
+                           comment=comment)
+    try:
+        for entry in entries:
+            writer.add(*entry)
+        shards = writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+
+    if len(shards) == 1 and not gzip_output:
+        # Small plain sitemap: the single shard is sitemap.xml itself
+        os.replace(shards[0][0], sitemap_path)
+        remove_stale_shards(root, keep=set())
+        return {'urls': len(entries), 'files': [SITEMAP_FILE], 'skipped': False}
+
+    for tmp_path, name, _ in shards:
+        os.replace(tmp_path, os.path.join(root, name))
+    remove_stale_shards(root, keep={name for _, name, _ in shards})
+    atomic_write(sitemap_path, sitemap_index(shards, comment).encode('utf-8'))
+    return {'urls': len(entries), 'files': [SITEMAP_FILE] + [name for _, name, _ in shards], 'skipped': False}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate sitemap.xml with lastmod dates")
+    parser.add_argument('--root', default='.', help="site root (default: current directory)")
+    parser.add_argument('--gzip', action='store_true', help="write gzipped shards behind a sitemap index")
+    parser.add_argument('--force', action='store_true', help="rewrite even if the page set is unchanged")
+    parser.add_argument('--max-urls', type=int, default=MAX_URLS, help="URLs per shard before splitting")
+    parser.add_argument('--manifest', default=MANIFEST_FILE, help="build manifest to take lastmod from")
+    args = parser.parse_args()
+
+    result = generate_sitemap(args.root, gzip_output=args.gzip, force=args.force,
+                              max_urls=args.max_urls, manifest_path=args.manifest)
+    if result['skipped']:
+        print(f"✓ sitemap.xml is up to date ({result['urls']} URLs)")
+    else:
+        print(f"✅ Wrote {', '.join(result['files'])} ({result['urls']} URLs)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Build-time Tailwind CSS for StableCoin Hub.
+
+Pages used to load either the Tailwind Play CDN script (which compiles CSS
+in the browser on every page view and blocks rendering) or the full 3 MB
+Tailwind 2 stylesheet from jsdelivr. This stage scans the class attributes
+actually used by the rendered pages and the page templates, generates only
+those utilities from the vendored table in tailwind_utilities.py, and
+writes one content-hashed stylesheet:
+
+    assets/css/tailwind.<hash>.css
+
+Every page is then rewritten to link it in place of the CDN tag. Because
+the file name changes whenever the CSS does, the stylesheet can be cached
+forever. Works offline; no Node or network access needed.
+
+Usage:
+    python tailwind_build.py              # build the stylesheet and relink pages
+    python tailwind_build.py --dry-run    # report what would change
+    python tailwind_build.py --unknown    # list class names with no utility
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+
+from seo_document import find_html_files
+from site_build import LAYOUTS_DIR, atomic_write, hash_bytes, write_if_changed
+from tailwind_utilities import (COLORS, GROUP_VARIANTS, OPACITY, PREFLIGHT, PSEUDO_VARIANTS, SCREENS,
+                                UTILITIES)
+
+CSS_DIR = 'assets/css'
+STYLESHEET_PATTERN = 'tailwind.{}.css'
+TAILWIND_CDN_TAG = '<script src="https://cdn.tailwindcss.com"></script>'
+
+# Page templates live in the generator scripts; scanning them too keeps the
+# class set (and so the stylesheet hash) stable when a new post is rendered
+TEMPLATE_SOURCES = ['*.py', '.github/scripts/*.py', 'templates/*/*.html']
+
+# Classes built at runtime from pieces (beautify_blogs' category tag colors)
+SAFELIST = {f'{kind}-{color}-{shade}'
+            for color in ('indigo', 'purple', 'green', 'blue', 'pink')
+            for kind, shade in (('bg', '100'), ('text', '700'))}
+
+# Utilities that accept a leading '-' for negative values
+NEGATABLE = {'m', 'mx', 'my', 'mt', 'mr', 'mb', 'ml', 'inset', 'inset-x', 'inset-y', 'top', 'right',
+             'bottom', 'left', 'translate-x', 'translate-y', 'rotate', 'space-x', 'space-y'}
+
+CLASS_ATTR_RE = re.compile(r'\bclass(?:Name)?\s*=\s*(?:(["\'])(.*?)\1|([^\s"\'=<>`]+))', re.DOTALL)
+SCRIPT_RE = re.compile(r'<script\b[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+STRING_LITERAL_RE = re.compile(r'(["\'`])([^"\'`\n]*)\1')
+CANDIDATE_RE = re.compile(r'[a-z0-9:/.%-]+')
+TAILWIND_TAG_RE = re.compile(
+    r'<script\s+src="https://cdn\.tailwindcss\.com[^"]*"\s*>\s*</script>'
+    r'|(?<!<noscript>)<link\b[^>]*href="(?:https://cdn\.jsdelivr\.net/npm/tailwindcss@[^"]*|/assets/css/tailwind\.[0-9a-f]+\.css)"[^>]*>'
+)
+GENERATED_HREF_RE = re.compile(r'/assets/css/tailwind\.[0-9a-f]+\.css')
+
+
+def candidates_in(text, scripts=True):
+    """Possible class names in a page or template: class attributes, and
+    string literals in inline scripts (class lists assembled by JS)"""
+    chunks = [match.group(2) if match.group(1) else match.group(3) for match in CLASS_ATTR_RE.finditer(text)]
+    if scripts:
+        for script in SCRIPT_RE.findall(text):
+            chunks.extend(match.group(2) for match in STRING_LITERAL_RE.finditer(script))
+    found = set()
+    for chunk in chunks:
+        for token in chunk.split():
+            if CANDIDATE_RE.fullmatch(token):
+                found.add(token)
+    return found
+
+
+def collect_classes(root='.', scripts=True):
+    """Every candidate class name used by the pages and templates under root"""
+    classes = set(SAFELIST)
+    for path in find_html_files(root):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            classes |= candidates_in(f.read(), scripts=scripts)
+    for pattern in TEMPLATE_SOURCES:
+        for path in sorted(glob.glob(os.path.join(root, pattern))):
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                classes |= candidates_in(f.read(), scripts=False)
+    return classes
+
+
+def hex_to_rgb(value):
+    value = value.lstrip('#')
+    return ' '.join(str(int(value[i:i + 2], 16)) for i in (0, 2, 4))
+
+
+def color_declarations(prop, opacity_var, name):
+    """Declarations for a color utility value like 'blue-500' or 'white/80'"""
+    name, _, alpha_key = name.partition('/')
+    value = COLORS.get(name)
+    if value is None or (alpha_key and alpha_key not in OPACITY):
+        return None
+    if not value.startswith('#'):
+        if alpha_key:
+            return None
+        color = value
+        transparent = 'rgb(255 255 255 / 0)'
+    else:
+        rgb = hex_to_rgb(value)
+        transparent = f'rgb({rgb} / 0)'
+        if alpha_key:
+            color = f'rgb({rgb} / {OPACITY[alpha_key]})'
+        elif opacity_var:
+            return f'{opacity_var}:1;{prop}:rgb({rgb} / var({opacity_var}))'
+        else:
+            color = value
+
+    if prop == '--tw-gradient-from':
+        return (f'--tw-gradient-from:{color};--tw-gradient-to:{transparent};'
+                f'--tw-gradient-stops:var(--tw-gradient-from), var(--tw-gradient-to)')
+    if prop == '--tw-gradient-via':
+        return (f'--tw-gradient-to:{transparent};'
+                f'--tw-gradient-stops:var(--tw-gradient-from), {color}, var(--tw-gradient-to)')
+    return f'{prop}:{color}'
+
+
+def resolve_utility(utility):
+    """(table position, declarations, child selector) for a bare utility, or None"""
+    negative = utility.startswith('-')
+    if negative:
+        utility = utility[1:]
+
+    for position, row in enumerate(UTILITIES):
+        name, scale, template = row[:3]
+        children = row[3][1] if len(row) > 3 else ''
+        if negative and name not in NEGATABLE:
+            continue
+        if scale is None:
+            if utility == name:
+                return position, template, children
+            continue
+        if utility == name:
+            key = ''
+        elif utility.startswith(name + '-'):
+            key = utility[len(name) + 1:]
+        else:
+            continue
+
+        if scale == 'color':
+            declarations = color_declarations(*template, key) if key else None
+        elif key in scale:
+            value = scale[key]
+            if negative:
+                value = value[1:] if value.startswith('-') else f'-{value}'
+            declarations = template.replace('{0}', value).replace('{}', value)
+        else:
+            continue
+        if declarations is not None:
+            return position, declarations, children
+    return None
+
+
+def css_escape(class_name):
+    escaped = re.sub(r'([^a-zA-Z0-9_-])', r'\\\1', class_name)
+    if escaped[0].isdigit():
+        escaped = f'\\3{escaped[0]} {escaped[1:]}'
+    return escaped
+
+
+def resolve_class(class_name):
+    """Sort key and CSS rule for a class name with variants, or None if unknown"""
+    *variants, utility = class_name.split(':')
+    resolved = resolve_utility(utility)
+    if resolved is None:
+        return None
+    position, declarations, children = resolved
+
+    screens = [name for name, _ in SCREENS]
+    variant_order = list(PSEUDO_VARIANTS) + list(GROUP_VARIANTS)
+    screen = 0
+    pseudo = ''
+    group = ''
+    order = []
+    for variant in variants:
+        if variant in screens and not screen:
+            screen = screens.index(variant) + 1
+        elif variant in PSEUDO_VARIANTS:
+            pseudo += PSEUDO_VARIANTS[variant]
+            order.append(variant_order.index(variant))
+        elif variant in GROUP_VARIANTS and not group:
+            group = f'.group{GROUP_VARIANTS[variant]} '
+            order.append(variant_order.index(variant))
+        else:
+            return None
+
+    selector = f'{group}.{css_escape(class_name)}{pseudo}{children}'
+    return (screen, tuple(sorted(order)), position, class_name), f'{selector}{{{declarations}}}'
+
+
+def generate_css(classes):
+    """Return (css text, sorted list of the class names it covers)"""
+    rules = sorted(filter(None, (resolve_class(name) for name in classes)))
+    used = sorted(key[3] for key, _ in rules)
+    uses_container = any(name.split(':')[-1] == 'container' for name in used)
+
+    lines = ['/* Generated by tailwind_build.py from tailwind_utilities.py; do not edit */', PREFLIGHT.rstrip('\n')]
+    for screen in range(len(SCREENS) + 1):
+        block = [rule for key, rule in rules if key[0] == screen]
+        if screen and uses_container:
+            block.insert(0, f'.container{{max-width:{SCREENS[screen - 1][1]}}}')
+        if not block:
+            continue
+        if screen:
+            lines.append(f'@media (min-width:{SCREENS[screen - 1][1]}){{')
+            lines.extend(f'  {rule}' for rule in block)
+            lines.append('}')
+        else:
+            lines.extend(block)
+    return '\n'.join(lines) + '\n', used
+
+
+def current_stylesheet(root='.'):
+    """Path of the generated stylesheet under root, or None before the first build"""
+    paths = sorted(glob.glob(os.path.join(root, CSS_DIR, STYLESHEET_PATTERN.format('*'))),
+                   key=os.path.getmtime)
+    return paths[-1] if paths else None
+
+
+def stylesheet_tag(root='.'):
+    """The tag page templates put in <head> for Tailwind styles"""
+    path = current_stylesheet(root)
+    if path is None:
+        return TAILWIND_CDN_TAG
+    return f'<link rel="stylesheet" href="/{CSS_DIR}/{os.path.basename(path)}">'
+
+
+def link_stylesheet(content, tag):
+    """Point a page at tag, replacing whichever Tailwind tag it has. Pages
+    without one are returned unchanged. A link to an earlier generated
+    stylesheet only has its href updated (with its <noscript> fallback), so
+    the attributes critical_css.py adds to load it asynchronously stay."""
+    matches = list(TAILWIND_TAG_RE.finditer(content))
+    if not matches:
+        return content
+    for match in reversed(matches[1:]):
+        start = content.rfind('\n', 0, match.start())
+        start = start if content[start:match.start()].strip() == '' else match.start()
+        content = content[:start] + content[match.end():]
+    first = matches[0]
+    href = GENERATED_HREF_RE.search(tag)
+    if href and GENERATED_HREF_RE.search(first.group()):
+        return GENERATED_HREF_RE.sub(href.group(), content)
+    return content[:first.start()] + tag + content[first.end():]
+
+
+def build_css(root='.', dry_run=False):
+    """Generate the stylesheet and relink every page. Returns a stats dict."""
+    css, used = generate_css(collect_classes(root))
+    name = STYLESHEET_PATTERN.format(hash_bytes(css)[:10])
+    path = os.path.join(root, CSS_DIR, name)
+    stats = {'classes': len(used), 'bytes': len(css.encode('utf-8')), 'stylesheet': f'/{CSS_DIR}/{name}',
+             'css_written': not os.path.exists(path), 'removed': [], 'pages': 0, 'relinked': 0, 'updated': []}
+
+    if not dry_run:
+        if stats['css_written']:
+            atomic_write(path, css.encode('utf-8'))
+        for old in glob.glob(os.path.join(root, CSS_DIR, STYLESHEET_PATTERN.format('*'))):
+            if os.path.basename(old) != name:
+                os.unlink(old)
+                stats['removed'].append(os.path.basename(old))
+
+    tag = f'<link rel="stylesheet" href="{stats["stylesheet"]}">'
+    # The blog layouts are render inputs, not pages: rewriting them would make
+    # every post stale on the next build
+    for page in find_html_files(root, skip=[LAYOUTS_DIR]):
+        with open(page, 'r', encoding='utf-8') as f:
+            content = f.read()
+        updated = link_stylesheet(content, tag)
+        if updated is content:
+            continue
+        stats['pages'] += 1
+        if updated == content:
+            continue
+        stats['relinked'] += 1
+        if dry_run:
+            print(f"📝 Would relink: {os.path.relpath(page, root)}")
+        else:
+            write_if_changed(page, updated)
+            stats['updated'].append(os.path.normpath(page))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the purged Tailwind stylesheet and link it from every page")
+    parser.add_argument('--root', default='.', help="site root (default: current directory)")
+    parser.add_argument('--dry-run', action='store_true', help="report changes without writing")
+    parser.add_argument('--unknown', action='store_true', help="list class names the utility table does not cover")
+    args = parser.parse_args()
+
+    if args.unknown:
+        # Script string literals are mostly not class names; only report attributes
+        for name in sorted(collect_classes(args.root, scripts=False)):
+            if resolve_class(name) is None:
+                print(name)
+        return 0
+
+    print("🎨 Building Tailwind stylesheet...")
+    print("=" * 60)
+    stats = build_css(args.root, dry_run=args.dry_run)
+    print("=" * 60)
+    print(f"📊 Summary:")
+    print(f"   Utilities: {stats['classes']}")
+    print(f"   Stylesheet: {stats['stylesheet']} ({stats['bytes'] / 1024:.1f} KB)"
+          f"{'' if stats['css_written'] else ' - unchanged'}")
+    print(f"   Pages using Tailwind: {stats['pages']}")
+    print(f"   Pages relinked: {stats['relinked']}")
+    for name in stats['removed']:
+        print(f"   Removed old stylesheet: {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Vendored Tailwind CSS v3 utility definitions for tailwind_build.py.
+
+A trimmed copy of Tailwind's default theme (colors, spacing, type scale,
+shadows, breakpoints) and an ordered table of the core utilities the site's
+templates use, so the stylesheet can be generated offline without Node or
+the Play CDN. Order matters: utilities are emitted in table order, so later
+rows win over earlier ones exactly as in Tailwind (p-* before px-* before
+pt-*, border widths before border colors, and so on).
+
+To support a new utility, add its scale value or a row to UTILITIES.
+"""
+
+SCREENS = [
+    ('sm', '640px'),
+    ('md', '768px'),
+    ('lg', '1024px'),
+    ('xl', '1280px'),
+    ('2xl', '1536px'),
+]
+
+# Pseudo-class variants in the order Tailwind emits them
+PSEUDO_VARIANTS = {
+    'first': ':first-child',
+    'last': ':last-child',
+    'odd': ':nth-child(odd)',
+    'even': ':nth-child(even)',
+    'focus-within': ':focus-within',
+    'hover': ':hover',
+    'focus': ':focus',
+    'focus-visible': ':focus-visible',
+    'active': ':active',
+    'disabled': ':disabled',
+}
+# group-hover:x applies when an ancestor .group is hovered
+GROUP_VARIANTS = {
+    'group-hover': ':hover',
+    'group-focus': ':focus',
+}
+
+PALETTE = {
+    'gray': ['#f9fafb', '#f3f4f6', '#e5e7eb', '#d1d5db', '#9ca3af', '#6b7280',
+             '#4b5563', '#374151', '#1f2937', '#111827', '#030712'],
+    'red': ['#fef2f2', '#fee2e2', '#fecaca', '#fca5a5', '#f87171', '#ef4444',
+            '#dc2626', '#b91c1c', '#991b1b', '#7f1d1d', '#450a0a'],
+    'orange': ['#fff7ed', '#ffedd5', '#fed7aa', '#fdba74', '#fb923c', '#f97316',
+               '#ea580c', '#c2410c', '#9a3412', '#7c2d12', '#431407'],
+    'yellow': ['#fefce8', '#fef9c3', '#fef08a', '#fde047', '#facc15', '#eab308',
+               '#ca8a04', '#a16207', '#854d0e', '#713f12', '#422006'],
+    'green': ['#f0fdf4', '#dcfce7', '#bbf7d0', '#86efac', '#4ade80', '#22c55e',
+              '#16a34a', '#15803d', '#166534', '#14532d', '#052e16'],
+    'blue': ['#eff6ff', '#dbeafe', '#bfdbfe', '#93c5fd', '#60a5fa', '#3b82f6',
+             '#2563eb', '#1d4ed8', '#1e40af', '#1e3a8a', '#172554'],
+    'indigo': ['#eef2ff', '#e0e7ff', '#c7d2fe', '#a5b4fc', '#818cf8', '#6366f1',
+               '#4f46e5', '#4338ca', '#3730a3', '#312e81', '#1e1b4b'],
+    'purple': ['#faf5ff', '#f3e8ff', '#e9d5ff', '#d8b4fe', '#c084fc', '#a855f7',
+               '#9333ea', '#7e22ce', '#6b21a8', '#581c87', '#3b0764'],
+    'pink': ['#fdf2f8', '#fce7f3', '#fbcfe8', '#f9a8d4', '#f472b6', '#ec4899',
+             '#db2777', '#be185d', '#9d174d', '#831843', '#500724'],
+}
+SHADES = ['50', '100', '200', '300', '400', '500', '600', '700', '800', '900', '950']
+
+COLORS = {'white': '#ffffff', 'black': '#000000', 'transparent': 'transparent', 'current': 'currentColor',
+          'inherit': 'inherit'}
+for _family, _values in PALETTE.items():
+    for _shade, _value in zip(SHADES, _values):
+        COLORS[f'{_family}-{_shade}'] = _value
+
+SPACING = {
+    '0': '0px', 'px': '1px', '0.5': '0.125rem', '1': '0.25rem', '1.5': '0.375rem', '2': '0.5rem',
+    '2.5': '0.625rem', '3': '0.75rem', '3.5': '0.875rem', '4': '1rem', '5': '1.25rem', '6': '1.5rem',
+    '7': '1.75rem', '8': '2rem', '9': '2.25rem', '10': '2.5rem', '11': '2.75rem', '12': '3rem',
+    '14': '3.5rem', '16': '4rem', '20': '5rem', '24': '6rem', '28': '7rem', '32': '8rem', '36': '9rem',
+    '40': '10rem', '44': '11rem', '48': '12rem', '52': '13rem', '56': '14rem', '60': '15rem',
+    '64': '16rem', '72': '18rem', '80': '20rem', '96': '24rem',
+}
+FRACTIONS = {
+    '1/2': '50%', '1/3': '33.333333%', '2/3': '66.666667%', '1/4': '25%', '3/4': '75%',
+    '1/5': '20%', '2/5': '40%', '3/5': '60%', '4/5': '80%', '1/6': '16.666667%', '5/6': '83.333333%',
+}
+MARGIN = dict(SPACING, auto='auto')
+INSET = dict(SPACING, auto='auto', full='100%', **FRACTIONS)
+WIDTH = dict(SPACING, auto='auto', full='100%', screen='100vw', min='min-content', max='max-content',
+             fit='fit-content', **FRACTIONS)
+HEIGHT = dict(SPACING, auto='auto', full='100%', screen='100vh', min='min-content', max='max-content',
+              fit='fit-content', **FRACTIONS)
+MIN_WIDTH = {'0': '0px', 'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content'}
+MIN_HEIGHT = {'0': '0px', 'full': '100%', 'screen': '100vh', 'min': 'min-content', 'max': 'max-content',
+              'fit': 'fit-content'}
+MAX_HEIGHT = dict(SPACING, none='none', full='100%', screen='100vh', min='min-content', max='max-content',
+                  fit='fit-content')
+MAX_WIDTH = {
+    '0': '0rem', 'none': 'none', 'xs': '20rem', 'sm': '24rem', 'md': '28rem', 'lg': '32rem', 'xl': '36rem',
+    '2xl': '42rem', '3xl': '48rem', '4xl': '56rem', '5xl': '64rem', '6xl': '72rem', '7xl': '80rem',
+    'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content', 'prose': '65ch',
+    'screen-sm': '640px', 'screen-md': '768px', 'screen-lg': '1024px', 'screen-xl': '1280px',
+    'screen-2xl': '1536px',
+}
+
+Z_INDEX = {'0': '0', '10': '10', '20': '20', '30': '30', '40': '40', '50': '50', 'auto': 'auto'}
+OPACITY = {str(n): str(n / 100).rstrip('0').rstrip('.') if n % 100 else str(n // 100) for n in range(0, 101, 5)}
+SCALE = {'0': '0', '50': '.5', '75': '.75', '90': '.9', '95': '.95', '100': '1', '105': '1.05',
+         '110': '1.1', '125': '1.25', '150': '1.5'}
+TRANSLATE = dict(SPACING, full='100%', **FRACTIONS)
+ROTATE = {'0': '0deg', '1': '1deg', '2': '2deg', '3': '3deg', '6': '6deg', '12': '12deg', '45': '45deg',
+          '90': '90deg', '180': '180deg'}
+GRID_COLUMNS = {str(n): f'repeat({n}, minmax(0, 1fr))' for n in range(1, 13)}
+GRID_COLUMNS['none'] = 'none'
+COL_SPAN = {str(n): f'span {n} / span {n}' for n in range(1, 13)}
+COL_SPAN['full'] = '1 / -1'
+ORDER = {str(n): str(n) for n in range(1, 13)}
+ORDER.update(first='-9999', last='9999', none='0')
+LINE_CLAMP = {str(n): str(n) for n in range(1, 7)}
+
+RADIUS = {'none': '0px', 'sm': '0.125rem', '': '0.25rem', 'md': '0.375rem', 'lg': '0.5rem',
+          'xl': '0.75rem', '2xl': '1rem', '3xl': '1.5rem', 'full': '9999px'}
+BORDER_WIDTH = {'': '1px', '0': '0px', '2': '2px', '4': '4px', '8': '8px'}
+RING_WIDTH = {'': '3px', '0': '0px', '1': '1px', '2': '2px', '4': '4px', '8': '8px'}
+DIVIDE_WIDTH = BORDER_WIDTH
+DECORATION_THICKNESS = {'auto': 'auto', 'from-font': 'from-font', '0': '0px', '1': '1px', '2': '2px',
+                        '4': '4px', '8': '8px'}
+UNDERLINE_OFFSET = {'auto': 'auto', '0': '0px', '1': '1px', '2': '2px', '4': '4px', '8': '8px'}
+
+FONT_SIZE = {
+    'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+    'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+    '3xl': ('1.875rem', '2.25rem'), '4xl': ('2.25rem', '2.5rem'), '5xl': ('3rem', '1'),
+    '6xl': ('3.75rem', '1'), '7xl': ('4.5rem', '1'), '8xl': ('6rem', '1'), '9xl': ('8rem', '1'),
+}
+FONT_SIZE_DECLARATIONS = {key: f'font-size:{size};line-height:{height}' for key, (size, height) in FONT_SIZE.items()}
+FONT_WEIGHT = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500',
+               'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
+LINE_HEIGHT = {'none': '1', 'tight': '1.25', 'snug': '1.375', 'normal': '1.5', 'relaxed': '1.625', 'loose': '2',
+               '3': '.75rem', '4': '1rem', '5': '1.25rem', '6': '1.5rem', '7': '1.75rem', '8': '2rem',
+               '9': '2.25rem', '10': '2.5rem'}
+TRACKING = {'tighter': '-0.05em', 'tight': '-0.025em', 'normal': '0em', 'wide': '0.025em',
+            'wider': '0.05em', 'widest': '0.1em'}
+
+SHADOW_VALUES = {
+    'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+    '': '0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+    'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+    'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+    'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+    '2xl': '0 25px 50px -12px rgb(0 0 0 / 0.25)',
+    'inner': 'inset 0 2px 4px 0 rgb(0 0 0 / 0.05)',
+    'none': '0 0 #0000',
+}
+SHADOW = {key: (f'--tw-shadow:{value};box-shadow:var(--tw-ring-offset-shadow, 0 0 #0000),'
+                f'var(--tw-ring-shadow, 0 0 #0000),var(--tw-shadow)')
+          for key, value in SHADOW_VALUES.items()}
+BLUR = {'none': '0', 'sm': '4px', '': '8px', 'md': '12px', 'lg': '16px', 'xl': '24px', '2xl': '40px',
+        '3xl': '64px'}
+
+TRANSITION_TIMING = 'transition-timing-function:cubic-bezier(0.4, 0, 0.2, 1);transition-duration:150ms'
+TRANSITION = {
+    '': ('color, background-color, border-color, text-decoration-color, fill, stroke, opacity, '
+         'box-shadow, transform, filter, backdrop-filter'),
+    'none': 'none',
+    'all': 'all',
+    'colors': 'color, background-color, border-color, text-decoration-color, fill, stroke',
+    'opacity': 'opacity',
+    'shadow': 'box-shadow',
+    'transform': 'transform',
+}
+TRANSITION_DECLARATIONS = {key: f'transition-property:{value};{TRANSITION_TIMING}' if value != 'none'
+                           else 'transition-property:none' for key, value in TRANSITION.items()}
+DURATION = {n: f'{n}ms' for n in ('0', '75', '100', '150', '200', '300', '500', '700', '1000')}
+EASE = {'linear': 'linear', 'in': 'cubic-bezier(0.4, 0, 1, 1)', 'out': 'cubic-bezier(0, 0, 0.2, 1)',
+        'in-out': 'cubic-bezier(0.4, 0, 0.2, 1)'}
+
+TRANSFORM = ('transform:translate(var(--tw-translate-x), var(--tw-translate-y)) rotate(var(--tw-rotate)) '
+             'skewX(var(--tw-skew-x)) skewY(var(--tw-skew-y)) scaleX(var(--tw-scale-x)) scaleY(var(--tw-scale-y))')
+
+GRADIENT_DIRECTIONS = {'t': 'to top', 'tr': 'to top right', 'r': 'to right', 'br': 'to bottom right',
+                       'b': 'to bottom', 'bl': 'to bottom left', 'l': 'to left', 'tl': 'to top left'}
+
+# Child combinator used by space-* and divide-* utilities
+BETWEEN_CHILDREN = ' > :not([hidden]) ~ :not([hidden])'
+
+
+def _static(pairs):
+    return [(name, None, declarations) for name, declarations in pairs]
+
+
+# Ordered utility table. Each row is (name or prefix, scale, declarations):
+#   scale None   -> the class is exactly `name`
+#   scale dict   -> `name-<key>` for each key ('' means bare `name`); '{}' in
+#                   the declarations is replaced by the scale value
+#   scale 'color'-> `name-<color>[/<opacity>]`; declarations is
+#                   (css property, opacity variable or None)
+# A trailing ('children', selector) in a row applies the declarations to
+# the element's children instead (space-x-4, divide-y, ...).
+UTILITIES = [
+    ('container', None, 'width:100%'),
+    ('sr-only', None, 'position:absolute;width:1px;height:1px;padding:0;margin:-1px;overflow:hidden;'
+                      'clip:rect(0, 0, 0, 0);white-space:nowrap;border-width:0'),
+    *_static([('visible', 'visibility:visible'), ('invisible', 'visibility:hidden'),
+              ('static', 'position:static'), ('fixed', 'position:fixed'), ('absolute', 'position:absolute'),
+              ('relative', 'position:relative'), ('sticky', 'position:sticky')]),
+    ('inset', INSET, 'inset:{}'),
+    ('inset-x', INSET, 'left:{0};right:{0}'),
+    ('inset-y', INSET, 'top:{0};bottom:{0}'),
+    ('top', INSET, 'top:{}'),
+    ('right', INSET, 'right:{}'),
+    ('bottom', INSET, 'bottom:{}'),
+    ('left', INSET, 'left:{}'),
+    ('z', Z_INDEX, 'z-index:{}'),
+    ('order', ORDER, 'order:{}'),
+    ('col-span', COL_SPAN, 'grid-column:{}'),
+    ('m', MARGIN, 'margin:{}'),
+    ('mx', MARGIN, 'margin-left:{0};margin-right:{0}'),
+    ('my', MARGIN, 'margin-top:{0};margin-bottom:{0}'),
+    ('mt', MARGIN, 'margin-top:{}'),
+    ('mr', MARGIN, 'margin-right:{}'),
+    ('mb', MARGIN, 'margin-bottom:{}'),
+    ('ml', MARGIN, 'margin-left:{}'),
+    ('line-clamp', LINE_CLAMP, 'overflow:hidden;display:-webkit-box;-webkit-box-orient:vertical;'
+                               '-webkit-line-clamp:{}'),
+    *_static([('block', 'display:block'), ('inline-block', 'display:inline-block'),
+              ('inline', 'display:inline'), ('flex', 'display:flex'), ('inline-flex', 'display:inline-flex'),
+              ('table', 'display:table'), ('table-row', 'display:table-row'),
+              ('table-cell', 'display:table-cell'), ('grid', 'display:grid'),
+              ('inline-grid', 'display:inline-grid'), ('contents', 'display:contents'),
+              ('list-item', 'display:list-item'), ('hidden', 'display:none')]),
+    ('h', HEIGHT, 'height:{}'),
+    ('max-h', MAX_HEIGHT, 'max-height:{}'),
+    ('min-h', MIN_HEIGHT, 'min-height:{}'),
+    ('w', WIDTH, 'width:{}'),
+    ('min-w', MIN_WIDTH, 'min-width:{}'),
+    ('max-w', MAX_WIDTH, 'max-width:{}'),
+    *_static([('flex-1', 'flex:1 1 0%'), ('flex-auto', 'flex:1 1 auto'), ('flex-initial', 'flex:0 1 auto'),
+              ('flex-none', 'flex:none'), ('flex-shrink', 'flex-shrink:1'), ('flex-shrink-0', 'flex-shrink:0'),
+              ('shrink', 'flex-shrink:1'), ('shrink-0', 'flex-shrink:0'), ('flex-grow', 'flex-grow:1'),
+              ('flex-grow-0', 'flex-grow:0'), ('grow', 'flex-grow:1'), ('grow-0', 'flex-grow:0'),
+              ('table-auto', 'table-layout:auto'), ('table-fixed', 'table-layout:fixed'),
+              ('border-collapse', 'border-collapse:collapse'), ('border-separate', 'border-collapse:separate')]),
+    ('translate-x', TRANSLATE, f'--tw-translate-x:{{}};{TRANSFORM}'),
+    ('translate-y', TRANSLATE, f'--tw-translate-y:{{}};{TRANSFORM}'),
+    ('rotate', ROTATE, f'--tw-rotate:{{}};{TRANSFORM}'),
+    ('scale', SCALE, f'--tw-scale-x:{{0}};--tw-scale-y:{{0}};{TRANSFORM}'),
+    ('transform', None, TRANSFORM),
+    ('transform-none', None, 'transform:none'),
+    *_static([('cursor-pointer', 'cursor:pointer'), ('cursor-default', 'cursor:default'),
+              ('cursor-not-allowed', 'cursor:not-allowed'), ('select-none', 'user-select:none'),
+              ('resize', 'resize:both'), ('resize-none', 'resize:none'),
+              ('list-inside', 'list-style-position:inside'), ('list-outside', 'list-style-position:outside'),
+              ('list-none', 'list-style-type:none'), ('list-disc', 'list-style-type:disc'),
+              ('list-decimal', 'list-style-type:decimal'), ('appearance-none', 'appearance:none')]),
+    ('grid-cols', GRID_COLUMNS, 'grid-template-columns:{}'),
+    *_static([('flex-row', 'flex-direction:row'), ('flex-row-reverse', 'flex-direction:row-reverse'),
+              ('flex-col', 'flex-direction:column'), ('flex-col-reverse', 'flex-direction:column-reverse'),
+              ('flex-wrap', 'flex-wrap:wrap'), ('flex-nowrap', 'flex-wrap:nowrap'),
+              ('items-start', 'align-items:flex-start'), ('items-end', 'align-items:flex-end'),
+              ('items-center', 'align-items:center'), ('items-baseline', 'align-items:baseline'),
+              ('items-stretch', 'align-items:stretch'),
+              ('justify-start', 'justify-content:flex-start'), ('justify-end', 'justify-content:flex-end'),
+              ('justify-center', 'justify-content:center'), ('justify-between', 'justify-content:space-between'),
+              ('justify-around', 'justify-content:space-around'),
+              ('justify-evenly', 'justify-content:space-evenly')]),
+    ('gap', SPACING, 'gap:{}'),
+    ('gap-x', SPACING, 'column-gap:{}'),
+    ('gap-y', SPACING, 'row-gap:{}'),
+    ('space-x', SPACING, 'margin-left:{}', ('children', BETWEEN_CHILDREN)),
+    ('space-y', SPACING, 'margin-top:{}', ('children', BETWEEN_CHILDREN)),
+    ('divide-x', DIVIDE_WIDTH, 'border-left-width:{};border-right-width:0', ('children', BETWEEN_CHILDREN)),
+    ('divide-y', DIVIDE_WIDTH, 'border-top-width:{};border-bottom-width:0', ('children', BETWEEN_CHILDREN)),
+    ('divide', 'color', ('border-color', '--tw-divide-opacity'), ('children', BETWEEN_CHILDREN)),
+    ('self-start', None, 'align-self:flex-start'),
+    ('self-center', None, 'align-self:center'),
+    ('self-end', None, 'align-self:flex-end'),
+    *_static([('overflow-auto', 'overflow:auto'), ('overflow-hidden', 'overflow:hidden'),
+              ('overflow-visible', 'overflow:visible'), ('overflow-scroll', 'overflow:scroll'),
+              ('overflow-x-auto', 'overflow-x:auto'), ('overflow-y-auto', 'overflow-y:auto'),
+              ('overflow-x-hidden', 'overflow-x:hidden'), ('overflow-y-hidden', 'overflow-y:hidden'),
+              ('truncate', 'overflow:hidden;text-overflow:ellipsis;white-space:nowrap'),
+              ('whitespace-normal', 'white-space:normal'), ('whitespace-nowrap', 'white-space:nowrap'),
+              ('whitespace-pre', 'white-space:pre'), ('whitespace-pre-line', 'white-space:pre-line'),
+              ('whitespace-pre-wrap', 'white-space:pre-wrap'), ('break-words', 'overflow-wrap:break-word'),
+              ('break-all', 'word-break:break-all')]),
+    ('rounded', RADIUS, 'border-radius:{}'),
+    ('rounded-t', RADIUS, 'border-top-left-radius:{0};border-top-right-radius:{0}'),
+    ('rounded-r', RADIUS, 'border-top-right-radius:{0};border-bottom-right-radius:{0}'),
+    ('rounded-b', RADIUS, 'border-bottom-right-radius:{0};border-bottom-left-radius:{0}'),
+    ('rounded-l', RADIUS, 'border-top-left-radius:{0};border-bottom-left-radius:{0}'),
+    ('border', BORDER_WIDTH, 'border-width:{}'),
+    ('border-x', BORDER_WIDTH, 'border-left-width:{0};border-right-width:{0}'),
+    ('border-y', BORDER_WIDTH, 'border-top-width:{0};border-bottom-width:{0}'),
+    ('border-t', BORDER_WIDTH, 'border-top-width:{}'),
+    ('border-r', BORDER_WIDTH, 'border-right-width:{}'),
+    ('border-b', BORDER_WIDTH, 'border-bottom-width:{}'),
+    ('border-l', BORDER_WIDTH, 'border-left-width:{}'),
+    *_static([('border-solid', 'border-style:solid'), ('border-dashed', 'border-style:dashed'),
+              ('border-dotted', 'border-style:dotted'), ('border-none', 'border-style:none')]),
+    ('border', 'color', ('border-color', '--tw-border-opacity')),
+    ('border-t', 'color', ('border-top-color', '--tw-border-opacity')),
+    ('border-b', 'color', ('border-bottom-color', '--tw-border-opacity')),
+    ('border-l', 'color', ('border-left-color', '--tw-border-opacity')),
+    ('border-opacity', OPACITY, '--tw-border-opacity:{}'),
+    ('bg', 'color', ('background-color', '--tw-bg-opacity')),
+    ('bg-opacity', OPACITY, '--tw-bg-opacity:{}'),
+    ('bg-gradient-to', GRADIENT_DIRECTIONS, 'background-image:linear-gradient({}, var(--tw-gradient-stops))'),
+    ('from', 'color', ('--tw-gradient-from', None)),
+    ('via', 'color', ('--tw-gradient-via', None)),
+    ('to', 'color', ('--tw-gradient-to', None)),
+    *_static([('bg-cover', 'background-size:cover'), ('bg-contain', 'background-size:contain'),
+              ('bg-center', 'background-position:center'), ('bg-no-repeat', 'background-repeat:no-repeat'),
+              ('object-cover', 'object-fit:cover'), ('object-contain', 'object-fit:contain')]),
+    ('p', SPACING, 'padding:{}'),
+    ('px', SPACING, 'padding-left:{0};padding-right:{0}'),
+    ('py', SPACING, 'padding-top:{0};padding-bottom:{0}'),
+    ('pt', SPACING, 'padding-top:{}'),
+    ('pr', SPACING, 'padding-right:{}'),
+    ('pb', SPACING, 'padding-bottom:{}'),
+    ('pl', SPACING, 'padding-left:{}'),
+    *_static([('text-left', 'text-align:left'), ('text-center', 'text-align:center'),
+              ('text-right', 'text-align:right'), ('text-justify', 'text-align:justify'),
+              ('align-middle', 'vertical-align:middle'), ('align-top', 'vertical-align:top'),
+              ('font-sans', 'font-family:ui-sans-serif, system-ui, sans-serif, "Apple Color Emoji", '
+                            '"Segoe UI Emoji", "Segoe UI Symbol", "Noto Color Emoji"'),
+              ('font-serif', 'font-family:ui-serif, Georgia, Cambria, "Times New Roman", Times, serif'),
+              ('font-mono', 'font-family:ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, '
+                            '"Liberation Mono", "Courier New", monospace')]),
+    ('text', FONT_SIZE_DECLARATIONS, '{}'),
+    ('font', FONT_WEIGHT, 'font-weight:{}'),
+    *_static([('uppercase', 'text-transform:uppercase'), ('lowercase', 'text-transform:lowercase'),
+              ('capitalize', 'text-transform:capitalize'), ('normal-case', 'text-transform:none'),
+              ('italic', 'font-style:italic'), ('not-italic', 'font-style:normal')]),
+    ('leading', LINE_HEIGHT, 'line-height:{}'),
+    ('tracking', TRACKING, 'letter-spacing:{}'),
+    ('text', 'color', ('color', '--tw-text-opacity')),
+    ('text-opacity', OPACITY, '--tw-text-opacity:{}'),
+    *_static([('underline', 'text-decoration-line:underline'), ('line-through', 'text-decoration-line:line-through'),
+              ('no-underline', 'text-decoration-line:none')]),
+    ('decoration', 'color', ('text-decoration-color', None)),
+    ('decoration', DECORATION_THICKNESS, 'text-decoration-thickness:{}'),
+    ('underline-offset', UNDERLINE_OFFSET, 'text-underline-offset:{}'),
+    ('antialiased', None, '-webkit-font-smoothing:antialiased;-moz-osx-font-smoothing:grayscale'),
+    ('opacity', OPACITY, 'opacity:{}'),
+    ('shadow', SHADOW, '{}'),
+    ('outline-none', None, 'outline:2px solid transparent;outline-offset:2px'),
+    ('ring', RING_WIDTH, ('--tw-ring-offset-shadow:var(--tw-ring-inset,) 0 0 0 var(--tw-ring-offset-width) '
+                          'var(--tw-ring-offset-color);--tw-ring-shadow:var(--tw-ring-inset,) 0 0 0 '
+                          'calc({} + var(--tw-ring-offset-width)) var(--tw-ring-color);'
+                          'box-shadow:var(--tw-ring-offset-shadow),var(--tw-ring-shadow),var(--tw-shadow, 0 0 #0000)')),
+    ('ring', 'color', ('--tw-ring-color', '--tw-ring-opacity')),
+    ('ring-offset', BORDER_WIDTH, '--tw-ring-offset-width:{}'),
+    ('blur', BLUR, 'filter:blur({})'),
+    ('backdrop-blur', BLUR, '-webkit-backdrop-filter:blur({0});backdrop-filter:blur({0})'),
+    ('transition', TRANSITION_DECLARATIONS, '{}'),
+    ('duration', DURATION, 'transition-duration:{}'),
+    ('ease', EASE, 'transition-timing-function:{}'),
+]
+
+# Tailwind's base layer (preflight) plus the defaults of the variables the
+# transform, ring and shadow utilities compose with
+PREFLIGHT = """*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}
+::before,::after{--tw-content:''}
+html{line-height:1.5;-webkit-text-size-adjust:100%;-moz-tab-size:4;tab-size:4;font-family:ui-sans-serif,system-ui,-apple-system,BlinkMacSystemFont,"Segoe UI",Roboto,"Helvetica Neue",Arial,"Noto Sans",sans-serif,"Apple Color Emoji","Segoe UI Emoji","Segoe UI Symbol","Noto Color Emoji"}
+body{margin:0;line-height:inherit}
+hr{height:0;color:inherit;border-top-width:1px}
+abbr:where([title]){text-decoration:underline dotted}
+h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}
+a{color:inherit;text-decoration:inherit}
+b,strong{font-weight:bolder}
+code,kbd,samp,pre{font-family:ui-monospace,SFMono-Regular,Menlo,Monaco,Consolas,"Liberation Mono","Courier New",monospace;font-size:1em}
+small{font-size:80%}
+sub,sup{font-size:75%;line-height:0;position:relative;vertical-align:baseline}
+sub{bottom:-0.25em}
+sup{top:-0.5em}
+table{text-indent:0;border-color:inherit;border-collapse:collapse}
+button,input,optgroup,select,textarea{font-family:inherit;font-size:100%;font-weight:inherit;line-height:inherit;color:inherit;margin:0;padding:0}
+button,select{text-transform:none}
+button,[type='button'],[type='reset'],[type='submit']{-webkit-appearance:button;background-color:transparent;background-image:none}
+:-moz-focusring{outline:auto}
+:-moz-ui-invalid{box-shadow:none}
+progress{vertical-align:baseline}
+::-webkit-inner-spin-button,::-webkit-outer-spin-button{height:auto}
+[type='search']{-webkit-appearance:textfield;outline-offset:-2px}
+::-webkit-search-decoration{-webkit-appearance:none}
+::-webkit-file-upload-button{-webkit-appearance:button;font:inherit}
+summary{display:list-item}
+blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{margin:0}
+fieldset{margin:0;padding:0}
+legend{padding:0}
+ol,ul,menu{list-style:none;margin:0;padding:0}
+textarea{resize:vertical}
+input::placeholder,textarea::placeholder{opacity:1;color:#9ca3af}
+button,[role="button"]{cursor:pointer}
+:disabled{cursor:default}
+img,svg,video,canvas,audio,iframe,embed,object{display:block;vertical-align:middle}
+img,video{max-width:100%;height:auto}
+[hidden]{display:none}
+*,::before,::after{--tw-translate-x:0;--tw-translate-y:0;--tw-rotate:0;--tw-skew-x:0;--tw-skew-y:0;--tw-scale-x:1;--tw-scale-y:1;--tw-ring-offset-width:0px;--tw-ring-offset-color:#fff;--tw-ring-color:rgb(59 130 246 / 0.5);--tw-ring-offset-shadow:0 0 #0000;--tw-ring-shadow:0 0 #0000;--tw-shadow:0 0 #0000}
+"""
@@ -0,0 +1,82 @@
+"""
+Near-duplicate detection in blog_quality_validator, checked against exact
+Jaccard similarity of the shingle sets.
+"""
+
+import itertools
+import random
+
+from blog_quality_validator import (MAX_DUPLICATE_CONTENT, BlogQualityValidator, MinHashLSH, content_shingles,
+                                    estimate_similarity, minhash_signature)
+
+TEMPLATE = '''<html><head><script>var page = "chrome";</script></head><body>
+<nav><ul><li>Home</li><li>Blog</li><li>Directory</li></ul></nav>
+<article><header><p>Published by StableCoin Hub in the guides section</p></header>
+{body}
+<h2>Related Articles</h2><p>Best stablecoin wallets compared for security and fees</p>
+<h3>About StableCoin Hub</h3><p>StableCoin Hub is your premier destination for stablecoin tools</p>
+</article><footer><p>&copy; 2025 StableCoin Hub. All rights reserved.</p></footer></body></html>'''
+
+
+def page(words):
+    return TEMPLATE.format(body=f"<p>{' '.join(words)}</p>")
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+
+def test_template_boilerplate_is_not_shingled():
+    rng = random.Random(5)
+    first = content_shingles(page(f'alpha{rng.randrange(10 ** 6)}' for _ in range(40)))
+    second = content_shingles(page(f'beta{rng.randrange(10 ** 6)}' for _ in range(40)))
+
+    assert len(first) == 38
+    assert not first & second
+
+
+def test_short_pages_do_not_match_on_empty_bands():
+    index = MinHashLSH()
+    index.add('one', minhash_signature(content_shingles(page('stablecoins hold a peg to the dollar'.split()))))
+    index.add('two', minhash_signature(content_shingles(page('yield farming moves liquidity between pools'.split()))))
+
+    assert index.candidate_pairs() == set()
+
+
+def test_flags_every_pair_exact_jaccard_puts_clearly_over_the_limit():
+    rng = random.Random(7)
+
+    def sentences(count):
+        return [' '.join(f'w{rng.randrange(10 ** 6)}' for _ in range(20)) for _ in range(count)]
+
+    base = sentences(100)
+    pages = {'base': content_shingles(page(base))}
+    # Pages that reuse a share of the base sentences, from near copies to unrelated posts
+    for shared in (95, 70, 50, 35, 25, 15, 5, 0):
+        pages[f'shares-{shared}'] = content_shingles(page(rng.sample(base, shared) + sentences(100 - shared)))
+
+    index = MinHashLSH()
+    for name, shingles in pages.items():
+        index.add(name, minhash_signature(shingles))
+    flagged = {pair for pair in index.candidate_pairs()
+               if estimate_similarity(index.signatures[pair[0]], index.signatures[pair[1]]) > MAX_DUPLICATE_CONTENT}
+
+    exact = {tuple(sorted(pair)): jaccard(pages[pair[0]], pages[pair[1]]) for pair in itertools.combinations(pages, 2)}
+    above = {pair for pair, similarity in exact.items() if similarity > MAX_DUPLICATE_CONTENT + 0.05}
+    below = {pair for pair, similarity in exact.items() if similarity < MAX_DUPLICATE_CONTENT - 0.05}
+    # Pairs near the limit may land either side of it; well clear of it the estimate must agree
+    assert len(above) >= 5
+    assert above <= flagged
+    assert not below & flagged
+
+
+def test_validator_reports_duplicate_pages(tmp_path):
+    words = [f'term{i}' for i in range(300)]
+    validator = BlogQualityValidator(blog_dir=str(tmp_path), cache_file=None)
+    validator.blog_contents = {'original': page(words), 'duplicate': page(words[:280] + ['other'] * 20),
+                               'unrelated': page(f'other{i}' for i in range(300))}
+
+    validator.check_duplicate_content()
+
+    assert len(validator.errors) == 1
+    assert 'between duplicate and original' in validator.errors[0]
@@ -0,0 +1,35 @@
+"""
+render_pipeline.py run as a script, in a scratch site directory.
+
+A SkipPost raised by a renderer must be reported as a skip, not a failure,
+also when render_pipeline is __main__.
+"""
+
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_pipeline(cwd, *args):
+    return subprocess.run([sys.executable, os.path.join(REPO_ROOT, 'render_pipeline.py'), *args],
+                          cwd=cwd, capture_output=True, text=True, env={**os.environ, 'PYTHONPATH': REPO_ROOT})
+
+
+def test_create_skips_existing_and_untitled_posts(tmp_path):
+    posts = tmp_path / 'blog' / '_posts'
+    posts.mkdir(parents=True)
+    (posts / '2025-01-01-existing.md').write_text('---\ntitle: "Existing"\n---\nBody\n')
+    (posts / '2025-01-02-untitled.md').write_text('---\ndescription: "No title"\n---\nBody\n')
+    page = tmp_path / 'blog' / 'existing' / 'index.html'
+    page.parent.mkdir()
+    page.write_text('<html>curated</html>')
+
+    result = run_pipeline(tmp_path, 'create')
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert 'Skipped: 2' in result.stdout
+    assert 'Failed' not in result.stdout
+    assert page.read_text() == '<html>curated</html>'
+    assert not (tmp_path / 'blog' / 'untitled').exists()
@@ -0,0 +1,49 @@
+"""
+site_build.plan_build in a scratch site directory.
+
+The related slugs rendered into a page are one of its inputs, so a page goes
+stale when its related list changes even if its markdown did not.
+"""
+
+import pytest
+
+from site_build import BuildManifest, hash_file, plan_build
+
+
+class FakeRelated:
+    def __init__(self, related):
+        self.related = related
+
+    def related_slugs(self, slug):
+        return self.related.get(slug, [])
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    posts = tmp_path / 'blog' / '_posts'
+    posts.mkdir(parents=True)
+    for slug in ('alpha', 'beta'):
+        (posts / f'2025-01-01-{slug}.md').write_text(f'---\ntitle: "{slug}"\n---\nBody\n')
+        page = tmp_path / 'blog' / slug / 'index.html'
+        page.parent.mkdir()
+        page.write_text(f'<html>{slug}</html>')
+    return tmp_path
+
+
+def built_manifest(related):
+    manifest = BuildManifest('.cache/build-manifest.json')
+    _, _, adopted = plan_build(manifest, related=related)
+    for _, html_file, inputs, input_hash in adopted:
+        manifest.record(html_file, inputs, input_hash, hash_file(html_file))
+    return manifest
+
+
+def test_changed_related_list_makes_a_page_stale(site):
+    manifest = built_manifest(FakeRelated({'alpha': ['beta'], 'beta': ['alpha']}))
+
+    stale, fresh, adopted = plan_build(manifest, related=FakeRelated({'alpha': ['gamma'], 'beta': ['alpha']}))
+
+    assert [html_file for _, html_file, _, _ in stale] == ['blog/alpha/index.html']
+    assert fresh == ['blog/beta/index.html']
+    assert adopted == []
@@ -0,0 +1,187 @@
+"""
+AsyncHTTPClient and verify_seo_deployment against a local stand-in server.
+
+The stand-in speaks just enough HTTP/1.1 (keep-alive, Content-Length or
+chunked bodies, redirects) to exercise the client the way production does,
+on 127.0.0.1 and without any network access.
+"""
+
+import asyncio
+import threading
+from collections import Counter
+
+import pytest
+
+import verify_seo_deployment
+from async_http import AsyncHTTPClient, HTTPError
+from html_minify import minify_html
+
+GOOD_PAGE = (
+    '<html><head><link rel="canonical" href="https://www.stablecoinhub.pro/good/">'
+    '<script>// Query Parameter Handler for SEO</script></head><body>ok</body></html>'
+)
+BAD_PAGE = '<html><head><link rel="canonical" href="https://stablecoinhub.pro/bad/?ref=x"></head></html>'
+SITEMAP = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    '<url><loc>https://www.stablecoinhub.pro/good/</loc></url>'
+    '<url><loc>https://www.stablecoinhub.pro/bad/</loc></url>'
+    '<url><loc>https://www.stablecoinhub.pro/minified/</loc></url>'
+    '<url><loc>https://www.stablecoinhub.pro/gone/</loc></url>'
+    '</urlset>'
+)
+# The page as the build writes it: minified, with bare attribute values where allowed
+MINIFIED_PAGE = minify_html(
+    '<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n'
+    '    <link rel="canonical" href="https://www.stablecoinhub.pro/minified/">\n'
+    '    <meta property="og:url" content="https://www.stablecoinhub.pro/minified/">\n'
+    '    <script>// Query Parameter Handler for SEO</script>\n</head>\n'
+    '<body class="bg-white">\n    <p>ok</p>\n</body>\n</html>\n'
+)
+
+
+def response(status, body=b'', headers=None, chunked=False):
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    lines = [f'HTTP/1.1 {status} X']
+    for name, value in (headers or {}).items():
+        lines.append(f'{name}: {value}')
+    if chunked:
+        lines.append('Transfer-Encoding: chunked')
+        payload = b''.join(b'%x\r\n%s\r\n' % (len(piece), piece) for piece in (body[:5], body[5:]) if piece)
+        payload += b'0\r\n\r\n'
+    else:
+        lines.append(f'Content-Length: {len(body)}')
+        payload = body
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + payload
+
+
+class StandIn:
+    """A keep-alive HTTP server on 127.0.0.1, run on its own thread"""
+
+    def __init__(self):
+        self.hits = Counter()
+        self.connections = 0
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(asyncio.start_server(self.handle, '127.0.0.1', 0))
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.base_url = f'http://127.0.0.1:{self.port}'
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+    def route(self, target):
+        path = target.split('?', 1)[0]
+        self.hits[path] += 1
+        if path == '/ok':
+            return response(200, 'hello')
+        if path == '/chunked':
+            return response(200, 'hello chunked world', chunked=True)
+        if path == '/flaky':
+            return response(503) if self.hits[path] == 1 else response(200, 'recovered')
+        if path == '/loop':
+            return response(302, headers={'Location': '/loop'})
+        if path == '/moved':
+            return response(301, headers={'Location': '/ok'})
+        if path == '/sitemap.xml':
+            return response(200, SITEMAP)
+        if path == '/good/' or path == f'/blog/{verify_seo_deployment.TODAYS_BLOG}/':
+            return response(200, GOOD_PAGE)
+        if path == '/bad/':
+            return response(200, BAD_PAGE)
+        if path == '/minified/':
+            return response(200, MINIFIED_PAGE)
+        return response(404, 'not found')
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request = await reader.readuntil(b'\r\n\r\n')
+                target = request.split(b' ', 2)[1].decode('latin-1')
+                writer.write(self.route(target))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+def server():
+    stand_in = StandIn()
+    yield stand_in
+    stand_in.stop()
+
+
+def fetch(server, *paths, **options):
+    async def run():
+        async with AsyncHTTPClient(backoff=0.01, **options) as client:
+            return [await client.get(server.base_url + path) for path in paths]
+    return asyncio.run(run())
+
+
+def test_keep_alive_reuses_one_connection(server):
+    first, second = fetch(server, '/ok', '/ok')
+    assert (first.status, first.text) == (200, 'hello')
+    assert second.text == 'hello'
+    assert server.connections == 1
+
+
+def test_chunked_body_is_decoded(server):
+    [chunked] = fetch(server, '/chunked')
+    assert chunked.status == 200
+    assert chunked.text == 'hello chunked world'
+
+
+def test_503_is_retried_until_200(server):
+    [flaky] = fetch(server, '/flaky', retries=2)
+    assert (flaky.status, flaky.text) == (200, 'recovered')
+    assert server.hits['/flaky'] == 2
+
+
+def test_503_is_returned_when_retries_run_out(server):
+    [flaky] = fetch(server, '/flaky', retries=0)
+    assert flaky.status == 503
+
+
+def test_redirect_is_followed(server):
+    [moved] = fetch(server, '/moved')
+    assert moved.status == 200
+    assert [hop.status for hop in moved.history] == [301]
+
+
+def test_redirect_loop_stops_at_the_limit(server):
+    with pytest.raises(HTTPError, match='Too many redirects'):
+        fetch(server, '/loop', max_redirects=3)
+    assert server.hits['/loop'] == 4
+
+
+def test_verify_sitemap_passes_and_fails_pages(server):
+    results = asyncio.run(verify_seo_deployment.verify(
+        server.base_url, sitemap=server.base_url + '/sitemap.xml', retries=0, external=False))
+    pages = {page['name']: page for page in results['pages']}
+
+    assert pages['/good/']['accessible'] and pages['/good/']['canonical'] and pages['/good/']['handler']
+    assert pages['/bad/']['accessible'] and not pages['/bad/']['canonical'] and not pages['/bad/']['handler']
+    assert not pages['/gone/']['accessible']
+    assert pages['/minified/']['canonical'] and pages['/minified/']['handler']
+    assert results['blog_published'] is True
+
+
+def test_main_exits_1_when_a_sitemap_page_fails(server, monkeypatch, capsys):
+    monkeypatch.setattr('sys.argv', ['verify_seo_deployment.py', '--base-url', server.base_url,
+                                     '--sitemap', server.base_url + '/sitemap.xml', '--retries', '0'])
+    assert verify_seo_deployment.main() == 1
+    output = capsys.readouterr().out
+    assert '/gone/: not accessible' in output
+    assert 'Checked 4 pages' in output
+
+
+def test_minified_page_keeps_a_matchable_canonical():
+    assert 'class=bg-white' in MINIFIED_PAGE
+    assert '<link rel="canonical" href="https://www.stablecoinhub.pro/minified/">' in MINIFIED_PAGE
+    assert verify_seo_deployment.canonical_is_clean(MINIFIED_PAGE)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Pre-rendered tools directory for the StableCoin Hub homepage.
+
+The tool and category data lives in data/tools.json instead of a JavaScript
+literal inside index.html. At build time this script renders the category
+grid, the trending section and the full tools grid straight into index.html,
+so the directory is visible on first paint without waiting for any script.
+
+Alongside the cards it writes a compact filter index as an application/json
+script block: a bitset of tool ids for every facet value and the ids
+pre-sorted by name, newest and popularity. filterTools() intersects the
+bitsets of the selected values, toggles only the cards whose visibility
+changed and reorders the grid only when the sort option changes; it never
+scans the tool list or rebuilds the grid's markup.
+
+The generated markup sits between marker comments in index.html:
+
+    <!-- tools:categories --> ... <!-- /tools:categories -->
+
+All four regions are spliced in one write through page_regions, which
+leaves everything outside the markers untouched, only writes the page when
+the rendered bytes change, and refuses to overwrite a region that was
+edited by hand unless --force is given.
+
+Usage:
+    python tools_directory.py             # re-render the directory regions
+    python tools_directory.py --dry-run   # report what would change
+    python tools_directory.py --force     # overwrite hand-edited regions
+"""
+
+import argparse
+import json
+import os
+import sys
+from html import escape
+
+from page_regions import REGION_STORE_FILE, RegionStore
+
+TOOLS_FILE = 'data/tools.json'
+PAGE_FILE = 'index.html'
+TRENDING_COUNT = 12
+
+# Filter <select> ids are '<facet>-filter'
+FACETS = ('category', 'pricing', 'level', 'blockchain')
+
+
+def load_directory(path=TOOLS_FILE):
+    """Return (categories, tools) from the data file; a tool's id is its position in the list"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    categories, tools = data['categories'], data['tools']
+    known = {category['id'] for category in categories}
+    for tool in tools:
+        if tool['category'] not in known:
+            raise ValueError(f"{tool['name']}: unknown category '{tool['category']}'")
+    return categories, tools
+
+
+def trending_tools(tools, count=TRENDING_COUNT):
+    """Featured tools first, then the rest, in popularity (data file) order"""
+    ranked = [tool_id for tool_id, tool in enumerate(tools) if tool.get('featured')]
+    ranked += [tool_id for tool_id, tool in enumerate(tools) if not tool.get('featured')]
+    return ranked[:count]
+
+
+def render_category_card(category, count):
+    return f'''<div class="card-hover bg-white rounded-xl p-4 sm:p-6 shadow-sm border cursor-pointer" onclick="filterByCategory('{escape(category['id'])}')">
+                        <div class="flex items-center mb-4">
+                            <div class="{escape(category['color'])} text-white p-2 sm:p-3 rounded-lg mr-3 sm:mr-4">
+                                <i class="{escape(category['icon'])} text-lg sm:text-xl"></i>
+                            </div>
+                            <div>
+                                <h3 class="font-semibold text-base sm:text-lg">{escape(category['name'])}</h3>
+                                <p class="text-gray-500 text-xs sm:text-sm">{count} tools</p>
+                            </div>
+                        </div>
+                        <p class="text-gray-600 text-xs sm:text-sm">{escape(category['description'])}</p>
+                    </div>'''
+
+
+def render_tool_card(tool, tool_id):
+    """One directory card. The modal is filled from the card's data attributes and text."""
+    tags = ''.join(f'<span class="tool-tag bg-gray-100 text-gray-600 text-xs px-2 py-1 rounded">{escape(tag)}</span>'
+                   for tag in tool['tags'])
+    return f'''<div class="tool-card rounded-xl p-4 sm:p-6 shadow-sm border card-hover cursor-pointer" data-id="{tool_id}" data-name="{escape(tool['name'])}" data-blockchain="{escape(tool['blockchain'])}" data-website="{escape(tool['website'])}" onclick="openToolModal(this)">
+                        <div class="flex items-start justify-between mb-4">
+                            <div class="flex items-center">
+                                <div class="tool-logo text-xl sm:text-2xl mr-2 sm:mr-3">{escape(tool['logo'])}</div>
+                                <div>
+                                    <h3 class="font-semibold text-base sm:text-lg">{escape(tool['name'])}</h3>
+                                    <span class="category-badge text-white text-xs px-2 py-1 rounded-full">{escape(tool['category'])}</span>
+                                </div>
+                            </div>
+                            <div class="text-right">
+                                <div class="tool-pricing text-xs text-gray-500 uppercase">{escape(tool['pricing'])}</div>
+                                <div class="tool-level text-xs text-gray-500">{escape(tool['level'])}</div>
+                            </div>
+                        </div>
+                        <p class="tool-description text-gray-600 text-xs sm:text-sm mb-4 line-clamp-2">{escape(tool['description'])}</p>
+                        <div class="flex flex-wrap gap-1 mb-4">
+                            {tags}
+                        </div>
+                        <button class="w-full bg-indigo-50 text-indigo-600 py-2 rounded-lg hover:bg-indigo-100 transition text-xs sm:text-sm font-medium">
+                            View Details
+                        </button>
+                    </div>'''
+
+
+def bitset(ids):
+    """Encode tool ids as a list of 32-bit words (bit i of word w is id 32*w + i), trailing zeros trimmed"""
+    words = []
+    for tool_id in ids:
+        word, bit = divmod(tool_id, 32)
+        if word >= len(words):
+            words.extend([0] * (word + 1 - len(words)))
+        words[word] |= 1 << bit
+    return words
+
+
+def sort_orders(tools):
+    """Tool ids pre-sorted for each option of the Sort By select"""
+    ids = range(len(tools))
+    return {
+        # The data file is kept in popularity order
+        'popularity': list(ids),
+        'name': sorted(ids, key=lambda tool_id: (tools[tool_id]['name'].casefold(), tool_id)),
+        # There is no date on the entries; featured tools count as the newest additions
+        'newest': sorted(ids, key=lambda tool_id: not tools[tool_id].get('featured')),
+    }
+
+
+def filter_index(tools):
+    """Compact index for filterTools.
+
+    For every facet value a bitset of the tools that have it, so a filter is
+    a word-wise AND of at most one bitset per facet, plus the tool ids
+    pre-sorted for each sort option.
+    """
+    members = {facet: {} for facet in FACETS}
+    for tool_id, tool in enumerate(tools):
+        for facet in FACETS:
+            members[facet].setdefault(tool[facet], []).append(tool_id)
+
+    return {
+        'size': len(tools),
+        'facets': {facet: {value: bitset(ids) for value, ids in values.items()}
+                   for facet, values in members.items()},
+        'order': sort_orders(tools),
+    }
+
+
+def render_index_script(index):
+    data = json.dumps(index, separators=(',', ':'), ensure_ascii=False).replace('</', '<\\/')
+    return f'<script type="application/json" id="tools-index">{data}</script>'
+
+
+def render_regions(categories, tools):
+    """Map region name -> generated markup"""
+    counts = {}
+    for tool in tools:
+        counts[tool['category']] = counts.get(tool['category'], 0) + 1
+
+    joiner = '\n                    '
+    return {
+        'categories': joiner.join(render_category_card(category, counts.get(category['id'], 0))
+                                  for category in categories),
+        'trending': joiner.join(render_tool_card(tools[tool_id], tool_id) for tool_id in trending_tools(tools)),
+        'grid': joiner.join(render_tool_card(tool, tool_id) for tool_id, tool in enumerate(tools)),
+        'index': render_index_script(filter_index(tools)),
+    }
+
+
+def build_directory(root='.', dry_run=False, force=False, data_path=TOOLS_FILE, page_path=PAGE_FILE):
+    """Render the directory regions into the homepage. Returns a stats dict."""
+    categories, tools = load_directory(os.path.join(root, data_path))
+    store = RegionStore(os.path.join(root, REGION_STORE_FILE))
+    regions = {f'tools:{name}': markup for name, markup in render_regions(categories, tools).items()}
+    result = store.update(os.path.join(root, page_path), regions, force=force, dry_run=dry_run)
+    return {'tools': len(tools), 'categories': len(categories), 'changed': result['changed'],
+            'written': result['written'], 'drifted': result['drifted']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the homepage tools directory from data/tools.json")
+    parser.add_argument('--root', default='.', help="site root (default: current directory)")
+    parser.add_argument('--dry-run', action='store_true', help="only report whether index.html would change")
+    parser.add_argument('--force', action='store_true', help="overwrite regions that were edited by hand")
+    args = parser.parse_args()
+
+    print("🧰 Rendering tools directory...")
+    print("=" * 60)
+    try:
+        stats = build_directory(args.root, dry_run=args.dry_run, force=args.force)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    for name in stats['drifted']:
+        print(f"⚠️  {name} was edited by hand since it was generated; left alone (use --force to overwrite)")
+    if stats['written']:
+        print(f"✅ Wrote: {PAGE_FILE}")
+    elif stats['changed']:
+        print(f"📝 Would rewrite: {PAGE_FILE}")
+    else:
+        print(f"✓ {PAGE_FILE} is up to date")
+    print("=" * 60)
+    print(f"📊 Summary:")
+    print(f"   Tools: {stats['tools']}")
+    print(f"   Categories: {stats['categories']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,30 +3,25 @@
 Update all canonical URLs to use https://www.stablecoinhub.pro format
 """
 
-import os
-import re
-from pathlib import Path
+from redirect_rules import canonical_origin, canonical_url
+from seo_document import HtmlDocument, load_pages
+
+def www_canonical_pass(doc):
+    """Point a canonical URL on another host of the site (the apex, http://, the
+    blog subdomain) at the canonical origin declared in data/redirects.json"""
+    canonical = doc.canonical
+    if canonical is None:
+        return False
+    target = canonical_url(canonical)
+    if target is None or target == canonical:
+        return False
+    return doc.set_canonical(target)
 
 def update_canonical_url(file_path):
     """Update canonical URL in an HTML file to use www prefix"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Pattern to find canonical tags without www
-    pattern = r'<link rel="canonical" href="https://stablecoinhub\.pro([^"]*)"'
-    replacement = r'<link rel="canonical" href="https://www.stablecoinhub.pro\1"'
-
-    # Count matches before replacement
-    matches = len(re.findall(pattern, content))
-
-    if matches > 0:
-        # Replace canonical URLs
-        content = re.sub(pattern, replacement, content)
-
-        # Write back
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
+    doc = HtmlDocument(file_path)
+    if www_canonical_pass(doc):
+        doc.save()
         return True
     return False
 
@@ -39,19 +34,17 @@ def main():
     total_count = 0
 
     # Find all HTML files
-    for html_file in Path('.').rglob('*.html'):
+    for doc in load_pages('.'):
         total_count += 1
 
         # Check if file has canonical tag
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        if '<link rel="canonical"' in content:
-            if 'href="https://www.stablecoinhub.pro' in content:
+        if doc.canonical is not None:
+            if canonical_url(doc.canonical) == doc.canonical:
                 already_correct += 1
-            elif update_canonical_url(html_file):
+            elif www_canonical_pass(doc):
+                doc.save()
                 fixed_count += 1
-                print(f"✅ Updated: {html_file}")
+                print(f"✅ Updated: {doc.rel_path}")
 
     print(f"\n📊 Summary:")
     print(f"   Total HTML files scanned: {total_count}")
@@ -60,7 +53,7 @@ def main():
 
     if fixed_count > 0:
         print("\n✨ Canonical URLs updated successfully!")
-        print("All pages now use https://www.stablecoinhub.pro format")
+        print(f"All pages now use {canonical_origin()} format")
     else:
         print("\n✓ All canonical URLs are already using the correct format.")
 
@@ -2,13 +2,29 @@
 """
 Comprehensive verification script for SEO deployment
 Checks all aspects of the SEO fixes to ensure they're working correctly
+
+All requests go through one pooled asyncio client (async_http), so every
+page check runs concurrently with bounded parallelism and retries. By default
+the four key pages are checked; pass --sitemap to check every page listed in
+a sitemap, and --base-url to point the run at a staging or local server:
+
+    python verify_seo_deployment.py --sitemap sitemap.xml
+    python -m http.server 8000 &
+    python verify_seo_deployment.py --base-url http://127.0.0.1:8000 --sitemap sitemap.xml
 """
 
-import requests
-import sys
-from urllib.parse import urlparse
+import argparse
+import asyncio
+import json
+import os
 import re
+import sys
+import time
+import xml.etree.ElementTree as ET
 from datetime import datetime
+from urllib.parse import urljoin, urlsplit
+
+from async_http import AsyncHTTPClient, HTTPError
 
 # Color codes for output
 GREEN = '\033[92m'
@@ -17,152 +33,256 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
-def check_url_status(url, expected_status=200):
-    """Check if a URL returns the expected status code"""
-    try:
-        response = requests.get(url, allow_redirects=True, timeout=10)
-        return response.status_code == expected_status
-    except:
-        return False
+PRODUCTION_URL = "https://www.stablecoinhub.pro"
+APEX_URL = "https://stablecoinhub.pro"
+WORKFLOWS_API = "https://api.github.com/repos/gummybearsk/stablecoinhub.pro/actions/workflows"
+TRACKING_PARAMS = "utm_source=test&utm_medium=email"
+TODAYS_BLOG = "stablecoin-defi-lending"
 
-def check_canonical_tag(url, with_params=None):
-    """Check if canonical tag is correctly set without query parameters"""
-    try:
-        test_url = url
-        if with_params:
-            test_url = f"{url}?{with_params}"
-
-        response = requests.get(test_url, timeout=10)
-        content = response.text
-
-        # Extract canonical URL
-        canonical_match = re.search(r'<link[^>]*rel="canonical"[^>]*href="([^"]*)"', content)
-        if not canonical_match:
-            canonical_match = re.search(r'<link[^>]*href="([^"]*)"[^>]*rel="canonical"', content)
-
-        if canonical_match:
-            canonical_url = canonical_match.group(1)
-            # Canonical should be clean without query parameters
-            return '?' not in canonical_url and canonical_url.startswith('https://www.')
-        return False
-    except:
+DEFAULT_PAGES = [
+    ("/", "Homepage"),
+    ("/blog", "Blog Index"),
+    ("/blog/stablecoin-education", "Sample Blog Post"),
+    ("/blog/usdt-vs-usdc", "USDT vs USDC Blog"),
+]
+
+REDIRECT_FILES = ['/.htaccess', '/_redirects', '/netlify.toml', '/vercel.json']
+
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+CANONICAL_RE = re.compile(r'<link[^>]*rel="canonical"[^>]*href="([^"]*)"')
+CANONICAL_RE_REVERSED = re.compile(r'<link[^>]*href="([^"]*)"[^>]*rel="canonical"')
+
+
+def canonical_is_clean(html):
+    """True if the page's canonical URL is absolute www and has no query parameters"""
+    match = CANONICAL_RE.search(html) or CANONICAL_RE_REVERSED.search(html)
+    if not match:
         return False
+    canonical_url = match.group(1)
+    return '?' not in canonical_url and canonical_url.startswith('https://www.')
+
+
+def has_query_handler(html):
+    """True if the query parameter handler script is present"""
+    return 'Query Parameter Handler for SEO' in html
+
+
+def rebase_url(url, base_url):
+    """Point a production URL (e.g. from the sitemap) at base_url, keeping path and query"""
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    return base_url.rstrip('/') + path
+
+
+def parse_sitemap(data):
+    """Return (page_urls, child_sitemap_urls) from sitemap or sitemap index XML"""
+    root = ET.fromstring(data)
+    locs = [loc.text.strip() for loc in root.iter(f'{SITEMAP_NS}loc') if loc.text]
+    if root.tag == f'{SITEMAP_NS}sitemapindex':
+        return [], locs
+    return locs, []
+
+
+async def load_sitemap_urls(client, source, base_url):
+    """Page URLs from a local sitemap file or a sitemap URL, following sitemap indexes"""
+    pending = [source]
+    urls = []
+    while pending:
+        current = pending.pop(0)
+        if os.path.exists(current):
+            with open(current, 'rb') as f:
+                data = f.read()
+        else:
+            if not urlsplit(current).scheme:
+                current = urljoin(base_url.rstrip('/') + '/', current)
+            response = await client.get(rebase_url(current, base_url))
+            if response.status != 200:
+                raise HTTPError(f"Sitemap {current} returned HTTP {response.status}")
+            data = response.body
+        pages, children = parse_sitemap(data)
+        urls.extend(pages)
+        pending.extend(children)
+    return urls
+
+
+async def check_page(client, url, name):
+    """Run the status, canonical and query-handler checks for one page"""
+    result = {'name': name, 'url': url, 'accessible': False, 'canonical': False,
+              'handler': False, 'error': None}
+    try:
+        plain, tracked = await asyncio.gather(
+            client.get(url),
+            client.get(f"{url}?{TRACKING_PARAMS}"),
+        )
+    except HTTPError as e:
+        result['error'] = str(e)
+        return result
+
+    result['accessible'] = plain.status == 200
+    result['handler'] = plain.status == 200 and has_query_handler(plain.text)
+    result['canonical'] = tracked.status == 200 and canonical_is_clean(tracked.text)
+    return result
+
 
-def check_query_handler_script(url):
-    """Check if the query parameter handler script is present"""
+async def check_url_status(client, url, expected_status=200):
+    """Check if a URL returns the expected status code"""
     try:
-        response = requests.get(url, timeout=10)
-        return 'Query Parameter Handler for SEO' in response.text
-    except:
+        return (await client.get(url)).status == expected_status
+    except HTTPError:
         return False
 
-def check_redirect_files():
-    """Check if redirect configuration files exist"""
-    base_url = "https://www.stablecoinhub.pro"
-    redirect_files = [
-        '/.htaccess',
-        '/_redirects',
-        '/netlify.toml',
-        '/vercel.json'
-    ]
-
-    results = {}
-    for file in redirect_files:
-        url = base_url + file
+
+async def check_redirect_files(client, base_url):
+    """Check if redirect configuration files are reachable (404/403 means not exposed, which is fine)"""
+    async def one(path):
         try:
-            response = requests.get(url, timeout=5)
-            # These files might return 404 if not exposed, which is fine
-            results[file] = response.status_code in [200, 403, 404]
-        except:
-            results[file] = False
+            response = await client.get(base_url.rstrip('/') + path)
+            return path, response.status in (200, 403, 404)
+        except HTTPError:
+            return path, False
+    return dict(await asyncio.gather(*(one(path) for path in REDIRECT_FILES)))
+
+
+async def check_workflow_active(client):
+    """True/False for the Auto-Publish workflow state, None if it can't be determined"""
+    try:
+        response = await client.get(WORKFLOWS_API)
+        if response.status != 200:
+            return None
+        for workflow in json.loads(response.text).get('workflows', []):
+            if 'Auto-Publish' in workflow.get('name', ''):
+                return workflow.get('state') == 'active'
+    except (HTTPError, ValueError):
+        pass
+    return None
+
+
+async def check_www_redirect(client):
+    """'ok' if the apex redirects to www, 'missing' if not, None if unreachable"""
+    try:
+        response = await client.get(APEX_URL, follow_redirects=False)
+    except HTTPError:
+        return None
+    if response.status in (301, 302) and 'www.stablecoinhub.pro' in response.headers.get('location', ''):
+        return 'ok'
+    return 'missing'
+
+
+async def verify(base_url, sitemap=None, concurrency=32, timeout=10.0, retries=2, external=True):
+    """Run every check concurrently and return the collected results"""
+    async with AsyncHTTPClient(concurrency=concurrency, timeout=timeout, retries=retries) as client:
+        if sitemap:
+            urls = await load_sitemap_urls(client, sitemap, base_url)
+            pages = [(rebase_url(url, base_url), urlsplit(url).path or '/') for url in urls]
+        else:
+            pages = [(base_url.rstrip('/') + path, name) for path, name in DEFAULT_PAGES]
+
+        async def skipped():
+            return None
 
-    return results
+        page_results, blog_published, redirect_files, workflow, www = await asyncio.gather(
+            asyncio.gather(*(check_page(client, url, name) for url, name in pages)),
+            check_url_status(client, f"{base_url.rstrip('/')}/blog/{TODAYS_BLOG}/"),
+            check_redirect_files(client, base_url),
+            check_workflow_active(client) if external else skipped(),
+            check_www_redirect(client) if external else skipped(),
+        )
+
+    return {
+        'pages': page_results,
+        'blog_published': blog_published,
+        'redirect_files': redirect_files,
+        'workflow': workflow,
+        'www': www,
+    }
+
+
+def print_page_checks(pages, key, ok_message, fail_message, verbose):
+    """Print one line per page (or only failures for large runs); returns True if all passed"""
+    passed = 0
+    for page in pages:
+        if page[key]:
+            passed += 1
+            if verbose:
+                print(f"  ✅ {page['name']}: {ok_message}")
+        else:
+            detail = f" ({page['error']})" if page['error'] else ''
+            print(f"  ❌ {page['name']}: {fail_message}{detail}")
+    if not verbose:
+        print(f"  {'✅' if passed == len(pages) else '⚠️ '} {passed}/{len(pages)} pages: {ok_message}")
+    return passed == len(pages)
 
-def check_blog_exists(blog_path):
-    """Check if a specific blog post exists"""
-    url = f"https://www.stablecoinhub.pro/blog/{blog_path}/"
-    return check_url_status(url)
 
 def main():
+    parser = argparse.ArgumentParser(description="Verify the SEO deployment of StableCoin Hub")
+    parser.add_argument('--base-url', default=PRODUCTION_URL,
+                        help=f"site to check (default: {PRODUCTION_URL})")
+    parser.add_argument('--sitemap', help="sitemap file or URL; check every page it lists")
+    parser.add_argument('--concurrency', type=int, default=32, help="maximum requests in flight")
+    parser.add_argument('--timeout', type=float, default=10.0, help="per-request timeout in seconds")
+    parser.add_argument('--retries', type=int, default=2, help="retries per request with exponential backoff")
+    parser.add_argument('--verbose', action='store_true', help="list passing pages in sitemap mode too")
+    args = parser.parse_args()
+
+    # The GitHub and apex checks only make sense against production
+    external = args.base_url.rstrip('/') == PRODUCTION_URL
+
     print(f"\n{BLUE}═══════════════════════════════════════════════════════{RESET}")
     print(f"{BLUE}     SEO Deployment Verification Report{RESET}")
     print(f"{BLUE}     Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{RESET}")
+    print(f"{BLUE}     Target: {args.base_url}{RESET}")
     print(f"{BLUE}═══════════════════════════════════════════════════════{RESET}\n")
 
+    started = time.perf_counter()
+    try:
+        results = asyncio.run(verify(args.base_url, sitemap=args.sitemap, concurrency=args.concurrency,
+                                     timeout=args.timeout, retries=args.retries, external=external))
+    except (HTTPError, ET.ParseError, OSError) as e:
+        print(f"{RED}❌ Could not load the page list: {e}{RESET}")
+        return 1
+    elapsed = time.perf_counter() - started
+
+    pages = results['pages']
+    verbose = args.verbose or not args.sitemap
     all_checks_passed = True
 
     # 1. Check canonical tags with query parameters
     print(f"{YELLOW}1. CANONICAL URL CHECKS{RESET}")
     print("-" * 40)
-
-    test_urls = [
-        ("https://www.stablecoinhub.pro", "Homepage"),
-        ("https://www.stablecoinhub.pro/blog", "Blog Index"),
-        ("https://www.stablecoinhub.pro/blog/stablecoin-education", "Sample Blog Post"),
-        ("https://www.stablecoinhub.pro/blog/usdt-vs-usdc", "USDT vs USDC Blog")
-    ]
-
-    for url, name in test_urls:
-        canonical_ok = check_canonical_tag(url, "utm_source=test&utm_medium=email")
-        if canonical_ok:
-            print(f"  ✅ {name}: Canonical URL is clean (no query params)")
-        else:
-            print(f"  ❌ {name}: Canonical URL issue detected")
-            all_checks_passed = False
+    all_checks_passed &= print_page_checks(pages, 'canonical', "Canonical URL is clean (no query params)",
+                                           "Canonical URL issue detected", verbose)
 
     # 2. Check query parameter handler
     print(f"\n{YELLOW}2. QUERY PARAMETER HANDLER{RESET}")
     print("-" * 40)
-
-    for url, name in test_urls[:3]:  # Check first 3 URLs
-        has_handler = check_query_handler_script(url)
-        if has_handler:
-            print(f"  ✅ {name}: Query handler script present")
-        else:
-            print(f"  ❌ {name}: Query handler script missing")
-            all_checks_passed = False
+    all_checks_passed &= print_page_checks(pages, 'handler', "Query handler script present",
+                                           "Query handler script missing", verbose)
 
     # 3. Check blog auto-publishing
     print(f"\n{YELLOW}3. BLOG AUTO-PUBLISHING{RESET}")
     print("-" * 40)
-
-    # Check if today's blog was published
-    todays_blog = "stablecoin-defi-lending"
-    if check_blog_exists(todays_blog):
-        print(f"  ✅ Today's blog published: {todays_blog}")
+    if results['blog_published']:
+        print(f"  ✅ Today's blog published: {TODAYS_BLOG}")
     else:
-        print(f"  ❌ Today's blog not found: {todays_blog}")
+        print(f"  ❌ Today's blog not found: {TODAYS_BLOG}")
         all_checks_passed = False
 
-    # Check GitHub Actions workflow status
-    try:
-        workflow_response = requests.get(
-            "https://api.github.com/repos/gummybearsk/stablecoinhub.pro/actions/workflows",
-            timeout=10
-        )
-        if workflow_response.status_code == 200:
-            workflows = workflow_response.json()
-            for workflow in workflows.get('workflows', []):
-                if 'Auto-Publish' in workflow.get('name', ''):
-                    if workflow.get('state') == 'active':
-                        print(f"  ✅ GitHub Actions workflow is active")
-                    else:
-                        print(f"  ❌ GitHub Actions workflow is not active")
-                        all_checks_passed = False
-                    break
-    except:
+    if not external:
+        print(f"  ⏭️  GitHub Actions check skipped (non-production base URL)")
+    elif results['workflow'] is None:
         print(f"  ⚠️  Could not verify GitHub Actions status")
+    elif results['workflow']:
+        print(f"  ✅ GitHub Actions workflow is active")
+    else:
+        print(f"  ❌ GitHub Actions workflow is not active")
+        all_checks_passed = False
 
     # 4. Check redirect configurations
     print(f"\n{YELLOW}4. REDIRECT CONFIGURATIONS{RESET}")
     print("-" * 40)
-
-    redirect_results = check_redirect_files()
-    redirect_files_found = 0
-    for file, exists in redirect_results.items():
-        if exists:
-            redirect_files_found += 1
-
+    redirect_files_found = sum(1 for exists in results['redirect_files'].values() if exists)
     if redirect_files_found > 0:
         print(f"  ✅ Redirect configuration files deployed ({redirect_files_found} files)")
     else:
@@ -171,40 +291,24 @@ def main():
     # 5. Check www enforcement
     print(f"\n{YELLOW}5. WWW ENFORCEMENT{RESET}")
     print("-" * 40)
-
-    # Check if non-www redirects to www
-    try:
-        response = requests.get("https://stablecoinhub.pro", allow_redirects=False, timeout=10)
-        if response.status_code in [301, 302]:
-            location = response.headers.get('Location', '')
-            if 'www.stablecoinhub.pro' in location:
-                print(f"  ✅ Non-www redirects to www")
-            else:
-                print(f"  ⚠️  Non-www redirect not configured (DNS level)")
-        else:
-            print(f"  ⚠️  Non-www redirect not configured (may need DNS setup)")
-    except:
+    if not external:
+        print(f"  ⏭️  Skipped (non-production base URL)")
+    elif results['www'] == 'ok':
+        print(f"  ✅ Non-www redirects to www")
+    elif results['www'] == 'missing':
+        print(f"  ⚠️  Non-www redirect not configured (may need DNS setup)")
+    else:
         print(f"  ⚠️  Could not verify www redirect")
 
     # 6. Check page load and performance
     print(f"\n{YELLOW}6. WEBSITE ACCESSIBILITY{RESET}")
     print("-" * 40)
-
-    critical_pages = [
-        ("https://www.stablecoinhub.pro", "Homepage"),
-        ("https://www.stablecoinhub.pro/blog", "Blog"),
-        ("https://www.stablecoinhub.pro/blog/stablecoin-education", "Blog Post")
-    ]
-
-    for url, name in critical_pages:
-        if check_url_status(url):
-            print(f"  ✅ {name} is accessible (200 OK)")
-        else:
-            print(f"  ❌ {name} is not accessible")
-            all_checks_passed = False
+    all_checks_passed &= print_page_checks(pages, 'accessible', "accessible (200 OK)",
+                                           "not accessible", verbose)
 
     # Summary
     print(f"\n{BLUE}═══════════════════════════════════════════════════════{RESET}")
+    print(f"⏱️  Checked {len(pages)} pages in {elapsed:.1f}s")
     if all_checks_passed:
         print(f"{GREEN}✅ ALL CRITICAL CHECKS PASSED!{RESET}")
         print(f"\n{GREEN}The SEO fixes have been successfully deployed.{RESET}")
@@ -222,4 +326,4 @@ def main():
     return 0 if all_checks_passed else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())